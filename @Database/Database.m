@@ -11,12 +11,21 @@ classdef Database < handle
 		y			% List of resulting Y values (row-wise)
 		valid		% List of resulting Y value validity (bools)
 		call		% Tracks what call-set each value was part of
+		archive		% Pareto front of the valid Y values (ParetoArchive)
+		index		% Spatial index of the X values (SpatialIndex)
+		store		% Run store the calls are recorded in (RunStore, or empty)
+		pendingX	% X values submitted but not yet collected (row-wise)
+		nPendingSets	% Number of call sets submitted but not yet collected
 		LB			% Lower bounds for X values
 		UB			% Upper bounds for X values
 	end
 	properties (SetAccess = private, GetAccess = private)
 		currentCall
 		fHandle
+		pendingFutures
+		pendingSetX
+		asyncSubmit
+		asyncCollect
 	end
 	methods
 		function obj = Database(functionHandle, lengthX, lengthY, lowerBound, upperBound)
@@ -53,6 +62,15 @@ classdef Database < handle
 			obj.y = zeros(0, obj.lenY);
 			obj.valid = true(0, 1);
 			obj.call = zeros(0, 1);
+			obj.archive = ParetoArchive(obj.lenY);
+			obj.index = SpatialIndex(lowerBound, upperBound);
+			obj.store = [];
+			obj.pendingX = zeros(0, obj.lenX);
+			obj.nPendingSets = 0;
+			obj.pendingFutures = [];
+			obj.pendingSetX = cell(1, 0);
+			obj.asyncSubmit = [];
+			obj.asyncCollect = [];
 
 			obj.LB = lowerBound;
 			obj.UB = upperBound;
@@ -68,5 +86,17 @@ classdef Database < handle
 		[iNeighbors] = nearest_neighbors(obj, kx, n, validOnly);
 		[obj, iNew] = add_new(obj, kx, ky, kvalid);
 		[] = remove_call(obj, indices);
+		[obj] = submit_call(obj, kx);
+		[] = check_async(obj);
+		[] = set_async_calls(obj, submitHandle, collectHandle);
+		[obj, iCalled] = collect_calls(obj, waitBool);
+		[] = set_store(obj, store);
+		[] = restore(obj, x, y, valid, call);
+	end
+	methods (Access = private)
+		[] = remove_pending(obj, k);
+	end
+	methods (Static = true)
+		[obj] = loadobj(obj);
 	end
 end
\ No newline at end of file
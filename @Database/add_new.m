@@ -43,4 +43,15 @@ obj.valid = [obj.valid; logical(kvalid)];
 obj.currentCall = obj.currentCall + 1;
 obj.call = [obj.call; obj.currentCall*ones(nkx, 1)];
 
+% Update pareto front with the valid results
+obj.archive.insert(ky(logical(kvalid),:), iNew(logical(kvalid)));
+
+% Add to the spatial index
+obj.index.insert(kx, iNew);
+
+% Record in the run store
+if ~isempty(obj.store)
+	obj.store.append_calls(kx, ky, kvalid, obj.call(iNew));
+end
+
 end
@@ -46,4 +46,15 @@ obj.valid = [obj.valid; logical(tempValid)];
 obj.currentCall = obj.currentCall + 1;
 obj.call = [obj.call; obj.currentCall*ones(nkx, 1)];
 
+% Update pareto front with the valid results
+obj.archive.insert(tempY(logical(tempValid),:), iCalled(logical(tempValid)));
+
+% Add to the spatial index
+obj.index.insert(kx, iCalled);
+
+% Record in the run store
+if ~isempty(obj.store)
+	obj.store.append_calls(kx, tempY, tempValid, obj.call(iCalled));
+end
+
 end
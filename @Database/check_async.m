@@ -0,0 +1,43 @@
+function [] = check_async(obj)
+%CHECK_ASYNC Errors if the function cannot be called asynchronously
+%	Asynchronous calls (submit_call) run the function on parallel pool
+%	workers, each with its own copy of the function handle and of the
+%	variables it captured. A WBpackage or WBinstance keeps the design
+%	point list of its Workbench project on the client, so the copies
+%	would simulate in the same project with colliding design point
+%	indices, and the updates made on the workers would be lost. Such
+%	functions need handles that start and collect each call set
+%	themselves (set_async_calls), e.g. WBpackage.async_handles, which
+%	runs each set on its own copy of the project.
+%
+%	Part of the Database class.
+
+% Functions with their own submit and collect handles are safe
+if ~isempty(obj.asyncSubmit)
+	return
+end
+
+tempInfo = functions(obj.fHandle);
+tempValues = {};
+if isfield(tempInfo, 'workspace') && ~isempty(tempInfo.workspace)
+	for i = 1:numel(tempInfo.workspace)
+		tempValues = [tempValues, struct2cell(tempInfo.workspace{i})'];
+	end
+end
+
+for i = 1:numel(tempValues)
+	if isa(tempValues{i}, 'WBpackage') || isa(tempValues{i}, 'WBinstance')
+		error('Database:UnsafeAsync', ['The function uses a %s, which cannot be called asynchronously ' ...
+			'by itself: run its sets on project copies (WBpackage.set_async_projects, then ' ...
+			'set_async_calls with WBpackage.async_handles), or set BayesAsync to false.'], class(tempValues{i}));
+	end
+end
+
+% Handles to the class methods themselves
+if isfield(tempInfo, 'file') && ~isempty(regexp(tempInfo.file, '[\\/]@(WBpackage|WBinstance)[\\/]', 'once'))
+	error('Database:UnsafeAsync', ['The function is a Workbench method, which cannot be called asynchronously ' ...
+		'by itself: run its sets on project copies (WBpackage.set_async_projects, then ' ...
+		'set_async_calls with WBpackage.async_handles), or set BayesAsync to false.']);
+end
+
+end
@@ -17,13 +17,7 @@ if size(kx, 2) ~= obj.lenX
 	return
 end
 
-% Get indices of existing x values
-for i = 1:nkx
-	%temp = all(kx(i,:) == obj.x, 2);
-	temp = sum((obj.x - kx(i,:)).^2, 2) < minDistance;
-	if any(temp)
-		iExists(i) = find(temp, 1, 'first');
-	end
-end
+% Get indices of existing x values, all kx at once through the index
+iExists = obj.index.find_existing(kx, minDistance);
 
 end
@@ -0,0 +1,58 @@
+function [obj, iCalled] = collect_calls(obj, waitBool)
+%COLLECT_CALLS Adds the results of finished calls started by submit_call
+%
+%	[OBJ, ICALLED] = COLLECT_CALLS(OBJ, WAITBOOL)
+%		Adds the results of every pending call set that has finished, in
+%		the order they finish. If WAITBOOL is true and none has finished,
+%		waits for the next one. ICALLED are the indices of the added
+%		results. If a call set failed it is dropped and its error is
+%		rethrown. The results are taken through the collect handle given
+%		to set_async_calls, if any.
+%
+%	Part of the Database class.
+
+if nargin < 2
+	waitBool = false;
+end
+
+iCalled = zeros(0, 1);
+while obj.nPendingSets > 0
+	try
+		if waitBool && isempty(iCalled)
+			k = fetchNext(obj.pendingFutures);
+		else
+			k = fetchNext(obj.pendingFutures, 0);
+		end
+	catch tempME
+		% Drop the failed call set(s) before passing on the error
+		tempFailed = ~cellfun(@isempty, {obj.pendingFutures.Error});
+		if ~isempty(obj.asyncCollect)
+			for tempFuture = obj.pendingFutures(tempFailed)
+				try
+					obj.asyncCollect(tempFuture); % Releases what the set used
+				catch
+				end
+			end
+		end
+		obj.remove_pending(tempFailed);
+		rethrow(tempME);
+	end
+	if isempty(k)
+		break
+	end
+	
+	% Take the results of set k
+	tempFuture = obj.pendingFutures(k);
+	kx = obj.pendingSetX{k};
+	obj.remove_pending(k);
+	if isempty(obj.asyncCollect)
+		[tempY, tempValid] = fetchOutputs(tempFuture);
+	else
+		[tempY, tempValid] = obj.asyncCollect(tempFuture);
+	end
+	
+	[obj, tempI] = obj.add_new(kx, tempY, tempValid);
+	iCalled = [iCalled; tempI];
+end
+
+end
@@ -0,0 +1,35 @@
+function [obj] = loadobj(obj)
+%LOADOBJ Completes a Database loaded from a MAT-file
+%	A Database saved before it kept a pareto archive, spatial index and
+%	pending calls loads with these empty, so they are created here and
+%	the archive and index are rebuilt from x, y and valid. Pending calls
+%	do not survive a save (their futures are lost), so none are kept.
+%
+%	Part of the Database class. Static method.
+
+% Loading as an object failed, construct from the saved values
+if isstruct(obj)
+	tempSaved = obj;
+	obj = Database(tempSaved.fHandle, tempSaved.lenX, tempSaved.lenY, tempSaved.LB, tempSaved.UB);
+	obj.restore(tempSaved.x, tempSaved.y, tempSaved.valid, tempSaved.call);
+	if isfield(tempSaved, 'store')
+		obj.store = tempSaved.store;
+	end
+	return
+end
+
+if isempty(obj.archive)
+	obj.archive = ParetoArchive(obj.lenY);
+	obj.archive.rebuild(obj.y(obj.valid,:), find(obj.valid));
+end
+if isempty(obj.index)
+	obj.index = SpatialIndex(obj.LB, obj.UB);
+	obj.index.rebuild(obj.x);
+end
+
+obj.pendingX = zeros(0, obj.lenX);
+obj.nPendingSets = 0;
+obj.pendingFutures = [];
+obj.pendingSetX = cell(1, 0);
+
+end
@@ -17,13 +17,6 @@ if nargin < 4
 end
 
 iNeighbors = [];
-rangeX = obj.UB - obj.LB;
-tempDistances = sum(((obj.x - kx)./rangeX).^2, 2);
-
-% Set invalid to NaN if required
-if validOnly
-	tempDistances(~obj.valid) = NaN;
-end
 
 % Check kx is the correct shape
 if any(size(kx) ~= [1, obj.lenX])
@@ -31,8 +24,17 @@ if any(size(kx) ~= [1, obj.lenX])
 	return
 end
 
-% Sort and select indices
-[~, iTemp] = sort(tempDistances, 'ascend');
-iNeighbors = iTemp(1:min(n, end));
+% Search the index (distances are normalized by UB - LB)
+if validOnly
+	iNeighbors = obj.index.nearest(kx, n, obj.valid);
+	
+	% Fill up with invalid x, in index order, if there are too few valid
+	if length(iNeighbors) < n
+		tempInvalid = find(~obj.valid);
+		iNeighbors = [iNeighbors; tempInvalid(1:min(n - length(iNeighbors), end))];
+	end
+else
+	iNeighbors = obj.index.nearest(kx, n);
+end
 
 end
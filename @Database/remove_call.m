@@ -7,6 +7,15 @@ if any(indices <= 0) || any(indices > obj.callAmount)
 	error('Database:badInd', 'Invalid ind passed to remove_call()');
 end
 
+% Remove from pareto front and spatial index (indices after the removed
+% ones shift down)
+tempRemoved = indices(obj.valid(indices));
+rebuildBool = obj.archive.remove(indices, obj.y(tempRemoved,:));
+obj.index.remove(indices);
+if ~isempty(obj.store)
+	obj.store.append_removal(indices);
+end
+
 % Remove from database
 obj.x(indices,:) = [];
 obj.y(indices,:) = [];
@@ -14,4 +23,9 @@ obj.valid(indices) = [];
 obj.call(indices) = [];
 obj.callAmount = obj.callAmount - length(indices);
 
+% Points only a removed one dominated are back on the front
+if rebuildBool
+	obj.archive.rebuild(obj.y(obj.valid,:), find(obj.valid));
+end
+
 end
@@ -0,0 +1,11 @@
+function [] = remove_pending(obj, k)
+%REMOVE_PENDING Removes pending call set(s) K (index or logical)
+%
+%	Part of the Database class. Private method.
+
+obj.pendingFutures(k) = [];
+obj.pendingSetX(k) = [];
+obj.pendingX = vertcat(zeros(0, obj.lenX), obj.pendingSetX{:});
+obj.nPendingSets = numel(obj.pendingSetX);
+
+end
@@ -0,0 +1,21 @@
+function [] = restore(obj, x, y, valid, call)
+%RESTORE Replaces the contents of the Database with recorded calls
+%	X, Y, VALID, CALL	Calls in Database order, e.g. from
+%						RunStore.read_calls
+%
+%	The pareto archive and spatial index are rebuilt, and call sets
+%	added afterwards are numbered after the highest one in CALL.
+%
+%	Part of the Database class.
+
+obj.callAmount = size(x, 1);
+obj.x = reshape(x, [], obj.lenX);
+obj.y = reshape(y, [], obj.lenY);
+obj.valid = logical(valid(:));
+obj.call = call(:);
+obj.currentCall = max([0; obj.call]);
+
+obj.archive.rebuild(obj.y(obj.valid,:), find(obj.valid));
+obj.index.rebuild(obj.x);
+
+end
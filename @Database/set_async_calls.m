@@ -0,0 +1,30 @@
+function [] = set_async_calls(obj, submitHandle, collectHandle)
+%SET_ASYNC_CALLS Sets how asynchronous call sets are started and collected
+%	SUBMITHANDLE	Called as FUTURE = SUBMITHANDLE(KX) by submit_call, on
+%					the client, to start the calls of KX (e.g. with
+%					parfeval). Empty to call the function with parfeval.
+%	COLLECTHANDLE	Called as [KY, KVALID] = COLLECTHANDLE(FUTURE) by
+%					collect_calls, on the client, for each finished FUTURE.
+%					It is also called for a failed one (so that it can
+%					release what the set used) and should then rethrow its
+%					error.
+%
+%	For functions that keep state on the client, which the workers
+%	would only change on their copies, e.g. WBpackage.async_handles.
+%
+%	Part of the Database class.
+
+if nargin < 3
+	collectHandle = [];
+end
+if xor(isempty(submitHandle), isempty(collectHandle))
+	error('Database:BadAsyncCalls', 'Give both the submit and the collect handle, or neither.');
+end
+if obj.nPendingSets > 0
+	error('Database:BadAsyncCalls', 'Cannot change the asynchronous calls while call sets are pending.');
+end
+
+obj.asyncSubmit = submitHandle;
+obj.asyncCollect = collectHandle;
+
+end
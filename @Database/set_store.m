@@ -0,0 +1,21 @@
+function [] = set_store(obj, store)
+%SET_STORE Records the calls of the Database in a run store
+%	STORE	A created RunStore, or empty to stop recording. If the store
+%			has no calls yet, the calls already in the Database are
+%			written to it first.
+%
+%	Part of the Database class.
+
+if ~isempty(store)
+	if store.lenX ~= obj.lenX || store.lenY ~= obj.lenY
+		error('Database:BadStore', 'Run store sizes (%d, %d) do not match the Database (%d, %d).', ...
+			store.lenX, store.lenY, obj.lenX, obj.lenY);
+	end
+	if store.nRecords == 0 && obj.callAmount > 0
+		store.append_calls(obj.x, obj.y, obj.valid, obj.call);
+	end
+end
+
+obj.store = store;
+
+end
@@ -0,0 +1,42 @@
+function [obj] = submit_call(obj, kx)
+%SUBMIT_CALL Starts calling the function without waiting for the results
+%
+%	[OBJ] = SUBMIT_CALL(OBJ, KX)
+%		Calls the function with KX on a parallel pool worker (parfeval),
+%		or through the submit handle given to set_async_calls. KX is
+%		added to pendingX until collect_calls adds its results. Without
+%		a submit handle the function must be safe to run alongside the
+%		other pending calls on a copy of its captured variables (see
+%		check_async).
+%
+%	Part of the Database class.
+
+% Check kx is the correct shape
+if size(kx, 2) ~= obj.lenX
+	warning('kx value(s) are not the correct length');
+	return
+end
+
+% Check kx is within bounds
+if ~all(obj.check_bounds(kx))
+	warning('kx value(s) are not within the bounds');
+	return
+end
+
+% Start the call set
+if isempty(obj.asyncSubmit)
+	obj.check_async();
+	tempFuture = parfeval(obj.fHandle, 2, kx);
+else
+	tempFuture = obj.asyncSubmit(kx);
+end
+if isempty(obj.pendingFutures)
+	obj.pendingFutures = tempFuture;
+else
+	obj.pendingFutures(end+1) = tempFuture;
+end
+obj.pendingSetX{end+1} = kx;
+obj.pendingX = [obj.pendingX; kx];
+obj.nPendingSets = obj.nPendingSets + 1;
+
+end
@@ -0,0 +1,111 @@
+classdef GPsurrogate < matlab.mixin.Copyable
+	%GPSURROGATE Exact gaussian process regression with fixed hyperparameters
+	%   Predicts like a RegressionGP fit with 'Standardize' true and
+	%	'PredictMethod' 'exact', but keeps the Cholesky factor of the
+	%	kernel matrix so that calls appended to the data are added with a
+	%	rank-k update, O(n^2 k) instead of the O(n^3) of a refit. The
+	%	hyperparameters (kernel parameters, Beta, Sigma) and the predictor
+	%	standardization stay those of the fit it was made from.
+	%
+	%	Predictions are batched: the scaled training inputs and their norms
+	%	are kept, so the cross-kernel with many points is one matrix
+	%	product and one triangular solve per block of points.
+	%
+	%	copy() gives an independent model, e.g. to add fantasized results
+	%	to without changing the original.
+	%
+	%	Supports the kernels of fitrgp ('squaredexponential',
+	%	'ardsquaredexponential', 'matern52', ...) with the 'none' or
+	%	'constant' basis.
+
+	properties (SetAccess = private, GetAccess = public)
+		X					% Training inputs (row-wise)
+		Y					% Training responses
+		KernelFunction		% Name of the kernel, as for fitrgp
+		KernelInformation	% Struct with Name and KernelParameters
+		BasisFunction		% 'none' or 'constant'
+		Beta				% Basis coefficients
+		Sigma				% Noise standard deviation
+	end
+	properties (SetAccess = private, GetAccess = private)
+		family		% Kernel family, without 'ard'
+		lengthScale	% Length scale(s), in standardized units
+		alphaRQ		% Shape parameter of the rational quadratic kernel
+		sigmaF		% Signal standard deviation
+		mu			% Predictor standardization location
+		scale		% Predictor standardization scale
+		Z			% Standardized inputs divided by the length scales
+		zz			% Squared norms of the rows of Z
+		L			% Lower Cholesky factor of K(X, X) + Sigma^2*I
+		alpha		% (K + Sigma^2*I) \ (Y - H*Beta)
+		blockSize	% Number of points predicted per block
+		cacheX		% Points of the cached prediction (see predict_samples)
+		cacheMean	% Cached predicted mean
+		cacheSd		% Cached predicted standard deviation
+	end
+	methods
+		function obj = GPsurrogate(X, Y, kernelFunction, kernelParameters, basisFunction, beta, sigma)
+		%GPSURROGATE Class constructor for GPsurrogate
+		%	X, Y				Training data, rows with a NaN Y are not used
+		%	KERNELFUNCTION		Kernel name, as for fitrgp
+		%	KERNELPARAMETERS	Kernel parameters, as in
+		%						RegressionGP.KernelInformation (length
+		%						scale(s) for the standardized X, then
+		%						alpha for rational quadratic, then sigmaF)
+		%	BASISFUNCTION		'none' or 'constant'
+		%	BETA				Basis coefficients
+		%	SIGMA				Noise standard deviation
+
+			if ~GPsurrogate.is_supported(kernelFunction, basisFunction)
+				error('GPsurrogate:Unsupported', 'Unsupported kernel (%s) or basis (%s)', kernelFunction, basisFunction);
+			end
+
+			used = ~isnan(Y(:));
+			obj.X = X(used,:);
+			obj.Y = Y(used);
+			obj.KernelFunction = lower(kernelFunction);
+			obj.KernelInformation = struct( ...
+				'Name', obj.KernelFunction, ...
+				'KernelParameters', kernelParameters(:) );
+			obj.BasisFunction = lower(basisFunction);
+			obj.Beta = beta(:);
+			obj.Sigma = sigma;
+			obj.blockSize = 2000;
+
+			% Split kernel parameters
+			obj.family = regexprep(obj.KernelFunction, '^ard', '');
+			[obj.lengthScale, obj.alphaRQ, obj.sigmaF] = ...
+				GPsurrogate.split_parameters(obj.KernelFunction, reshape(kernelParameters, 1, []), size(obj.X, 2));
+
+			% Standardize as fitrgp does, by the training columns
+			obj.mu = mean(obj.X, 1);
+			obj.scale = std(obj.X, 0, 1);
+			obj.scale(obj.scale == 0) = 1;
+
+			obj.factorize();
+			obj.solve_alpha();
+		end
+
+		% Public methods
+		[ypred, ysd] = predict(obj, Xnew);
+		[] = update(obj, X, Y);
+	end
+	methods (Access = private)
+		[Z, zz] = scale_inputs(obj, X);
+		[K] = kernel_matrix(obj, Za, zza, Zb, zzb);
+		[] = factorize(obj);
+		[] = append_rows(obj, Xnew);
+		[] = solve_alpha(obj);
+	end
+	methods (Static = true)
+		[isSupported] = is_supported(kernelFunction, basisFunction);
+		[surrogate] = from_fitrgp(model);
+		[D2] = distance_tensor(Xa, Xb, mu, scale);
+		[logL] = log_likelihood(D2, Y, kernelFunction, basisFunction, kernelParameters, beta, sigma, nWorkers);
+		[ypred, ysd] = predict_samples(models, Xnew);
+	end
+	methods (Static = true, Access = private)
+		[lengthScale, alphaRQ, sigmaF] = split_parameters(kernelFunction, kernelParameters, nX);
+		[K] = kernel_function(family, r2, alphaRQ, sigmaF);
+	end
+end
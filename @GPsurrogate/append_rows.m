@@ -0,0 +1,28 @@
+function [] = append_rows(obj, Xnew)
+%APPEND_ROWS Adds training inputs with a rank-k update of the factor
+%	With K = [K11, K12; K12', K22] and K11 = L11*L11', the new rows of the
+%	factor are L21 = (L11 \ K12)' and L22 = chol(K22 - L21*L21').
+%	Refactorizes everything if the update is not positive definite.
+%
+%	Part of the GPsurrogate class. Private method.
+
+[Znew, zzNew] = obj.scale_inputs(Xnew);
+k = size(Znew, 1);
+n = size(obj.Z, 1);
+
+K12 = obj.kernel_matrix(obj.Z, obj.zz, Znew, zzNew);
+K22 = obj.kernel_matrix(Znew, zzNew, Znew, zzNew) + obj.Sigma^2*eye(k);
+L21 = linsolve(obj.L, K12, struct('LT', true))';
+S = K22 - L21*L21';
+[L22, p] = chol((S + S')/2, 'lower');
+
+obj.X = [obj.X; Xnew];
+if p > 0
+	obj.factorize();
+	return
+end
+obj.Z = [obj.Z; Znew];
+obj.zz = [obj.zz; zzNew];
+obj.L = [obj.L, zeros(n, k); L21, L22];
+
+end
@@ -0,0 +1,13 @@
+function [D2] = distance_tensor(Xa, Xb, mu, scale)
+%DISTANCE_TENSOR Squared differences of standardized inputs, per input
+%	Returns a size(Xa, 1) x size(Xb, 1) x nX array. The squared scaled
+%	distances for any length scales are then one matrix product with
+%	1./lengthScale.^2, without recomputing the differences.
+%
+%	Part of the GPsurrogate class. Static method.
+
+Za = (Xa - mu)./scale;
+Zb = (Xb - mu)./scale;
+D2 = (permute(Za, [1 3 2]) - permute(Zb, [3 1 2])).^2;
+
+end
@@ -0,0 +1,26 @@
+function [] = factorize(obj)
+%FACTORIZE Cholesky factor of the kernel matrix of all training inputs
+%	Adds jitter to the diagonal if the matrix is not numerically positive
+%	definite (e.g. repeated inputs with a tiny Sigma).
+%
+%	Part of the GPsurrogate class. Private method.
+
+[obj.Z, obj.zz] = obj.scale_inputs(obj.X);
+n = size(obj.Z, 1);
+K = obj.kernel_matrix(obj.Z, obj.zz, obj.Z, obj.zz) + obj.Sigma^2*eye(n);
+
+jitter = 0;
+[obj.L, p] = chol(K, 'lower');
+while p > 0
+	if jitter == 0
+		jitter = 1e-10*obj.sigmaF^2;
+	else
+		jitter = 10*jitter;
+	end
+	if jitter > 1e-4*obj.sigmaF^2
+		error('GPsurrogate:NotPositiveDefinite', 'Kernel matrix is not positive definite');
+	end
+	[obj.L, p] = chol(K + jitter*eye(n), 'lower');
+end
+
+end
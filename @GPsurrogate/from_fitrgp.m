@@ -0,0 +1,16 @@
+function [surrogate] = from_fitrgp(model)
+%FROM_FITRGP Creates a GPsurrogate with the hyperparameters of a RegressionGP
+%	MODEL	RegressionGP fit with 'Standardize' true
+%
+%	Part of the GPsurrogate class. Static method.
+
+surrogate = GPsurrogate( ...
+	model.X, ...
+	model.Y, ...
+	model.KernelFunction, ...
+	model.KernelInformation.KernelParameters, ...
+	model.BasisFunction, ...
+	model.Beta, ...
+	model.Sigma );
+
+end
@@ -0,0 +1,11 @@
+function [isSupported] = is_supported(kernelFunction, basisFunction)
+%IS_SUPPORTED Indicates if a kernel and basis can be used by GPsurrogate
+%
+%	Part of the GPsurrogate class. Static method.
+
+isSupported = ...
+	any(strcmpi(regexprep(kernelFunction, '^ard', '', 'ignorecase'), ...
+		{'exponential', 'squaredexponential', 'matern32', 'matern52', 'rationalquadratic'})) && ...
+	any(strcmpi(basisFunction, {'none', 'constant'}));
+
+end
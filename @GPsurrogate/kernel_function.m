@@ -0,0 +1,25 @@
+function [K] = kernel_function(family, r2, alphaRQ, sigmaF)
+%KERNEL_FUNCTION Kernel values from squared scaled distances R2
+%	FAMILY is the kernel name without 'ard'.
+%
+%	Part of the GPsurrogate class. Private static method.
+
+switch family
+	case 'squaredexponential'
+		K = exp(-r2/2);
+	case 'exponential'
+		K = exp(-sqrt(r2));
+	case 'matern32'
+		r = sqrt(3*r2);
+		K = (1 + r).*exp(-r);
+	case 'matern52'
+		r = sqrt(5*r2);
+		K = (1 + r + r.^2/3).*exp(-r);
+	case 'rationalquadratic'
+		K = (1 + r2/(2*alphaRQ)).^(-alphaRQ);
+	otherwise
+		error('GPsurrogate:Unsupported', 'Unsupported kernel (%s)', family);
+end
+K = sigmaF^2*K;
+
+end
@@ -0,0 +1,11 @@
+function [K] = kernel_matrix(obj, Za, zza, Zb, zzb)
+%KERNEL_MATRIX Kernel between the scaled inputs Za and Zb
+%	The squared distances are found from the cached squared norms and one
+%	matrix product.
+%
+%	Part of the GPsurrogate class. Private method.
+
+r2 = max(zza + zzb' - 2*(Za*Zb'), 0);
+K = GPsurrogate.kernel_function(obj.family, r2, obj.alphaRQ, obj.sigmaF);
+
+end
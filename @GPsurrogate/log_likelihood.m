@@ -0,0 +1,49 @@
+function [logL] = log_likelihood(D2, Y, kernelFunction, basisFunction, kernelParameters, beta, sigma, nWorkers)
+%LOG_LIKELIHOOD Exact log marginal likelihood for a batch of hyperparameters
+%	D2					Distance tensor of the training inputs with
+%						themselves (see distance_tensor)
+%	Y					Training responses
+%	KERNELFUNCTION		Kernel name, as for fitrgp
+%	BASISFUNCTION		'none' or 'constant'
+%	KERNELPARAMETERS	One set of kernel parameters per row
+%	BETA				Basis coefficients, one row per set
+%	SIGMA				Noise standard deviation of each set
+%	NWORKERS			(optional) Maximum number of parallel pool
+%						workers for the factorizations, default 0 (run in
+%						this process)
+%
+%	Returns a column with the log likelihood of each set, as
+%	computeLogLikelihoodExact of a RegressionGP with those parameters,
+%	or -Inf if its kernel matrix is not positive definite. The scaled
+%	distances of all sets are found with one matrix product.
+%
+%	Part of the GPsurrogate class. Static method.
+
+if nargin < 8
+	nWorkers = 0;
+end
+
+n = size(D2, 1);
+nX = size(D2, 3);
+nSets = size(kernelParameters, 1);
+family = regexprep(lower(kernelFunction), '^ard', '');
+[lengthScale, alphaRQ, sigmaF] = GPsurrogate.split_parameters(kernelFunction, kernelParameters, nX);
+
+R2 = reshape(reshape(D2, n*n, nX) * (1./lengthScale.^2)', n, n, nSets);
+if strcmpi(basisFunction, 'constant')
+	basisMean = beta(:,1);
+else
+	basisMean = zeros(nSets, 1);
+end
+
+logL = -Inf(nSets, 1);
+parfor (k = 1:nSets, nWorkers)
+	K = GPsurrogate.kernel_function(family, R2(:,:,k), alphaRQ(k), sigmaF(k)) + sigma(k)^2*eye(n);
+	[L, p] = chol(K, 'lower');
+	if p == 0
+		a = linsolve(L, Y(:) - basisMean(k), struct('LT', true));
+		logL(k) = -(a'*a)/2 - sum(log(diag(L))) - n/2*log(2*pi);
+	end
+end
+
+end
@@ -0,0 +1,39 @@
+function [ypred, ysd] = predict(obj, Xnew)
+%PREDICT Predicted mean and standard deviation at Xnew (row-wise)
+%	Same outputs as predict for a RegressionGP: YSD is the standard
+%	deviation of a new response, including the noise Sigma. Points are
+%	predicted in blocks, each with one cross-kernel and one triangular
+%	solve. A prediction made by predict_samples at the same Xnew is
+%	returned as is.
+%
+%	Part of the GPsurrogate class.
+
+if ~isempty(obj.cacheX) && isequal(Xnew, obj.cacheX)
+	ypred = obj.cacheMean;
+	ysd = obj.cacheSd;
+	return
+end
+
+nNew = size(Xnew, 1);
+ypred = zeros(nNew, 1);
+if nargout > 1
+	ysd = zeros(nNew, 1);
+end
+
+for first = 1:obj.blockSize:nNew
+	ind = first:min(first + obj.blockSize - 1, nNew);
+	[Znew, zzNew] = obj.scale_inputs(Xnew(ind,:));
+	Kcross = obj.kernel_matrix(Znew, zzNew, obj.Z, obj.zz);
+
+	ypred(ind) = Kcross*obj.alpha;
+	if strcmp(obj.BasisFunction, 'constant')
+		ypred(ind) = ypred(ind) + obj.Beta(1);
+	end
+
+	if nargout > 1
+		V = linsolve(obj.L, Kcross', struct('LT', true));
+		ysd(ind) = sqrt(max(obj.sigmaF^2 - sum(V.^2, 1)', 0) + obj.Sigma^2);
+	end
+end
+
+end
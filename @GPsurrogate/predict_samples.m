@@ -0,0 +1,68 @@
+function [ypred, ysd] = predict_samples(models, Xnew)
+%PREDICT_SAMPLES Predicts with several models sharing one training set
+%	MODELS	Cell array of GPsurrogate models, e.g. hyperparameter samples
+%			with the same training inputs and kernel
+%	XNEW	Points, row-wise
+%
+%	Returns the predicted mean and standard deviation with one column
+%	per model. The differences between XNEW and the training inputs are
+%	found once for all models (see distance_tensor). Each model also
+%	keeps its prediction, so predict at the same XNEW returns it.
+%
+%	Part of the GPsurrogate class. Static method.
+
+nModels = numel(models);
+nNew = size(Xnew, 1);
+ypred = zeros(nNew, nModels);
+ysd = zeros(nNew, nModels);
+if nModels == 0
+	return
+end
+
+% Models must share the training inputs and their scaling
+first = models{1};
+sharedBool = true;
+for k = 2:nModels
+	sharedBool = sharedBool && strcmp(models{k}.family, first.family) && ...
+		isequal(models{k}.mu, first.mu) && isequal(models{k}.scale, first.scale) && ...
+		isequal(models{k}.X, first.X);
+end
+if ~sharedBool
+	for k = 1:nModels
+		models{k}.cacheX = [];
+		[ypred(:,k), ysd(:,k)] = models{k}.predict(Xnew);
+	end
+	return
+end
+
+[n, nX] = size(first.X);
+lengthScale = zeros(nModels, nX);
+for k = 1:nModels
+	lengthScale(k,:) = models{k}.lengthScale;
+end
+
+% Blocks of points, to keep the distance tensor to a few million values
+blockRows = max(1, floor(4e6/(n*max(nX, nModels))));
+for iFirst = 1:blockRows:nNew
+	ind = iFirst:min(iFirst + blockRows - 1, nNew);
+	D2 = GPsurrogate.distance_tensor(Xnew(ind,:), first.X, first.mu, first.scale);
+	R2 = reshape(reshape(D2, [], nX) * (1./lengthScale.^2)', length(ind), n, nModels);
+	for k = 1:nModels
+		model = models{k};
+		Kcross = GPsurrogate.kernel_function(model.family, R2(:,:,k), model.alphaRQ, model.sigmaF);
+		ypred(ind,k) = Kcross*model.alpha;
+		if strcmp(model.BasisFunction, 'constant')
+			ypred(ind,k) = ypred(ind,k) + model.Beta(1);
+		end
+		V = linsolve(model.L, Kcross', struct('LT', true));
+		ysd(ind,k) = sqrt(max(model.sigmaF^2 - sum(V.^2, 1)', 0) + model.Sigma^2);
+	end
+end
+
+for k = 1:nModels
+	models{k}.cacheX = Xnew;
+	models{k}.cacheMean = ypred(:,k);
+	models{k}.cacheSd = ysd(:,k);
+end
+
+end
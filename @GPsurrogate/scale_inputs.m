@@ -0,0 +1,10 @@
+function [Z, zz] = scale_inputs(obj, X)
+%SCALE_INPUTS Standardizes X and divides it by the length scales
+%	Returns the scaled rows Z and their squared norms ZZ.
+%
+%	Part of the GPsurrogate class. Private method.
+
+Z = (X - obj.mu)./(obj.scale.*obj.lengthScale);
+zz = sum(Z.^2, 2);
+
+end
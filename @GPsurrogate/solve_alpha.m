@@ -0,0 +1,18 @@
+function [] = solve_alpha(obj)
+%SOLVE_ALPHA Weights of the training points for the predicted mean
+%
+%	Part of the GPsurrogate class. Private method.
+
+residual = obj.Y - basis_mean(obj.BasisFunction, obj.Beta, size(obj.Y, 1));
+obj.alpha = linsolve(obj.L', linsolve(obj.L, residual, struct('LT', true)), struct('UT', true));
+
+end
+
+function [m] = basis_mean(basisFunction, beta, n)
+% Mean of the basis for n points ('none' or 'constant')
+if strcmp(basisFunction, 'constant')
+	m = beta(1)*ones(n, 1);
+else
+	m = zeros(n, 1);
+end
+end
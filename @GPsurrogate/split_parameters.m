@@ -0,0 +1,23 @@
+function [lengthScale, alphaRQ, sigmaF] = split_parameters(kernelFunction, kernelParameters, nX)
+%SPLIT_PARAMETERS Splits fitrgp kernel parameters (one set per row)
+%	Returns the length scales (one column per input), the rational
+%	quadratic alpha (NaN for other kernels) and sigmaF.
+%
+%	Part of the GPsurrogate class. Private static method.
+
+kernelFunction = lower(kernelFunction);
+nSets = size(kernelParameters, 1);
+
+if strncmp(kernelFunction, 'ard', 3)
+	lengthScale = kernelParameters(:,1:nX);
+else
+	lengthScale = repmat(kernelParameters(:,1), 1, nX);
+end
+
+alphaRQ = NaN(nSets, 1);
+if strcmp(regexprep(kernelFunction, '^ard', ''), 'rationalquadratic')
+	alphaRQ = kernelParameters(:,end-1);
+end
+sigmaF = kernelParameters(:,end);
+
+end
@@ -0,0 +1,31 @@
+function [] = update(obj, X, Y)
+%UPDATE Sets the training data, keeping the hyperparameters
+%	X, Y	All training data (rows with a NaN Y are not used). If the
+%			rows used start with the current training inputs, only the
+%			rows after them are added to the Cholesky factor. Otherwise
+%			the factor is recomputed.
+%
+%	The responses can all change (e.g. when invalid results are set to
+%	the mean), only the O(n^2) solve for the weights is redone.
+%
+%	Part of the GPsurrogate class.
+
+used = ~isnan(Y(:));
+X = X(used,:);
+Y = Y(used);
+n = size(obj.X, 1);
+
+if (size(X, 1) >= n) && isequal(X(1:n,:), obj.X)
+	if size(X, 1) > n
+		obj.append_rows(X(n+1:end,:));
+	end
+else
+	obj.X = X;
+	obj.factorize();
+end
+
+obj.Y = Y;
+obj.solve_alpha();
+obj.cacheX = [];
+
+end
@@ -97,6 +97,7 @@ classdef MOSAO < handle
 		[obj] = initialize(obj, initialX); % Runs initial set of X values
 		[obj, X, data] = local_search(obj, initialX); % Performs a local search
 		[obj] = remove_iteration(obj, iteration); % Removes iteration(s)
+		[obj] = open_store(obj, folderPath); % Records the run in a run store
 	end
 	
 	methods(Access = private)
@@ -105,10 +106,14 @@ classdef MOSAO < handle
 		[obj] = run_MO_bayesian(obj, initialX, continueBool);
 		[obj] = run_SO_bayesian(obj, initialX, continueBool);
 		[obj] = organize_run_outputs(obj, runningCallAmountList, timeGenList, nParetoList, HVList);
+		[acquisitionFunction] = build_acquisition(obj, models, acqMargin, Yextra, acqName);
+		[x, fval, exitflag, output, solutions] = minimize_acquisition(obj, objective, seedX);
+		[X, solutions] = propose_batch(obj, nBatch, acqMargin, classifier, seedX);
 	end
 	
 	methods(Static = true) % Static methods
 		[validOptions, validBool] = validate_options(options);
+		[obj] = from_store(functionHandle, folderPath);
 		
 		[PoV] = classification_probability(X, model);
 		[mean] = mean_prediction(X, model);
@@ -117,22 +122,29 @@ classdef MOSAO < handle
 		
 		[outI, sortI] = filtered_sort(X, value, n, minDistance, rangeX);
 		[outI] = filter_unique(X, minDistance, rangeX);
+		[x, fval, exitflag, output, solutions] = optimize_acquisition(objective, LB, UB, nPool, nPolish, seedX, fminconOptions, useParallel);
 		
 		[outY] = y_transform_mean(Y, valid);
 		[outY] = y_transform_worst(Y, valid);
 		[outY] = y_transform_remove(Y, valid);
+		
+		[models] = to_gp_surrogates(models);
+		[updatedBool] = update_gp_surrogates(models, X, Y);
 
 		[P, Pind] = pareto_front(Y);
 		[volume] = get_hypervolume(P, Yref);
+		[gain] = hypervolume_gain(P, Yref, Ynew);
 		[P, Yref, volume, Pind] = pareto_front_hypervolume(Y, Yref);
 		[change] = change_of_hypervolume(P, Yref, HVprev, models, Xnew, type);
 		[prob] = get_dominated_probability(P, Y, s);
 		[PoPI] = probability_of_pareto_improvement(P, models, Xnew);
-		[EHVI] = expected_hypervolume_improvement(P, Yref, HVprev, models, Xnew);
+		[EHVI] = expected_hypervolume_improvement(P, Yref, HVprev, models, Xnew, boxes);
+		[lowerB, upperB] = nondominated_boxes(P, Yref);
+		[EHVI] = exact_ehvi(lowerB, upperB, y, s);
 		[y] = get_2D_attainment_points(P, Yref);
 		[y] = get_2D_summary_attainment_surface(Pset, Yref, method, nSamples);
 		
 		[meanOutput] = acquisition_mean(x, models, acqFunc);
-		[modelArray] = slice_sample_models(initModel, nSamples, nBurnin, nThin);
+		[modelArray] = slice_sample_models(initModel, nSamples, nBurnin, nThin, useParallel, nChains);
 	end	
 end
@@ -11,6 +11,14 @@ nX = size(x, 1);
 
 outputList = NaN(nX, nModels);
 
+% Predict with all the models of each objective at once (they share the
+% training data), the acquisition function then gets the cached results
+for i = 1:size(models, 2)
+	if all(cellfun(@(m) isa(m, 'GPsurrogate'), models(:,i)))
+		GPsurrogate.predict_samples(models(:,i), x);
+	end
+end
+
 % Evaluate acqusition function for each model
 for ind = 1:nModels
 	outputList(:,ind) = acqFunc(x, models(ind,:));
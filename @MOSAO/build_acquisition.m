@@ -0,0 +1,65 @@
+function [acquisitionFunction] = build_acquisition(obj, models, acqMargin, Yextra, acqName)
+%BUILD_ACQUISITION Returns the acquisition function (to be minimized)
+%	MODELS		Models to use, in the form of obj.model
+%	ACQMARGIN	Function handle (x, models, acqFunc) that marginalizes the
+%				acquisition function over the rows of MODELS
+%	YEXTRA		(optional) Fantasized results (row-wise) of calls not yet
+%				made, added to the best result or to the pareto front
+%	ACQNAME		(optional) Acquisition function, default opt.BayesAcqFunc
+%				for one objective and opt.BayesMOAcqFunc for more
+%
+%	Part of the MOSAO class. Private method.
+
+if nargin < 4
+	Yextra = zeros(0, obj.db.lenY);
+end
+
+% Single objective
+if obj.db.lenY == 1
+	if nargin < 5
+		acqName = obj.opt.BayesAcqFunc;
+	end
+	fmin = min([obj.db.y(obj.db.valid); Yextra]);
+	switch acqName
+		case 'fitness'
+			acquisitionFunction = @(kX) acqMargin(kX, models, @MOSAO.mean_prediction);
+		case 'PoI'
+			acquisitionFunction = @(kX) -1*acqMargin(kX, models, @(x, mod) MOSAO.probability_of_improvement(x, mod, fmin));
+		case 'EI'
+			acquisitionFunction = @(kX) -1*acqMargin(kX, models, @(x, mod) MOSAO.expected_improvement(x, mod, fmin));
+		otherwise
+			error('MOSAO:UnrecognizedGAcriteria', 'Unrecognized MOSAO.opt.GAcriteria');
+	end
+	return
+end
+
+% Multi-objective, on the pareto front with any fantasized results
+if nargin < 5
+	acqName = obj.opt.BayesMOAcqFunc;
+end
+[P, Yref, HV] = obj.db.archive.front_hypervolume();
+if ~isempty(Yextra)
+	P = MOSAO.pareto_front([P; Yextra]);
+	HV = MOSAO.get_hypervolume(P, Yref);
+end
+switch acqName
+	case 'HVIncreaseMean'
+		acquisitionFunction = @(kX) -1*acqMargin(kX, models, @(x, mod) MOSAO.change_of_hypervolume(P, Yref, HV, mod, x, 'meanValue'));
+	case 'HVIncreaseLCB'
+		acquisitionFunction = @(kX) -1*acqMargin(kX, models, @(x, mod) MOSAO.change_of_hypervolume(P, Yref, HV, mod, x, 'LCB'));
+	case 'PoPI'
+		acquisitionFunction = @(kX) -1*acqMargin(kX, models, @(x, mod) MOSAO.probability_of_pareto_improvement(P, mod, x));
+	case 'EHVI'
+		% Box decomposition of the region P does not dominate, for the
+		% closed form EHVI (2 or 3 objectives)
+		boxes = {};
+		if length(Yref) == 2 || length(Yref) == 3
+			[lowerB, upperB] = MOSAO.nondominated_boxes(P, Yref);
+			boxes = {lowerB, upperB};
+		end
+		acquisitionFunction = @(kX) -1*acqMargin(kX, models, @(x, mod) MOSAO.expected_hypervolume_improvement(P, Yref, HV, mod, x, boxes));
+	otherwise
+		error('MOSAO:UnrecognizedGAcriteria', 'Unrecognized obj.opt.GAcriteria');
+end
+
+end
@@ -1,5 +1,8 @@
 function [obj] = continue_run(obj)
 %CONTINUE_RUN Picks up a previous MOSAO run
+%	A run recorded in a run store (opt.storePath) can be recreated with
+%	MOSAO.from_store, after MATLAB was closed or the run was interrupted,
+%	and then continued with this method.
 %
 %	Part of the MOSAO class.
 
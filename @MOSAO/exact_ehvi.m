@@ -0,0 +1,42 @@
+function [EHVI] = exact_ehvi(lowerB, upperB, y, s)
+%EXACT_EHVI Expected hypervolume improvement in closed form.
+%	LOWERB	Lower corners of the boxes from nondominated_boxes.
+%	UPPERB	Upper corners of the boxes from nondominated_boxes.
+%	Y		Predicted means, one candidate per row.
+%	S		Predicted standard deviations, one candidate per row.
+%
+%	With independent normal objectives Y, the expected improvement is the
+%	sum over the boxes of the product over the objectives of
+%		E[max(u - max(Y, l), 0)] = (u - l)*Phi((l - y)/s)
+%									+ psi(u, u) - psi(u, l)
+%		psi(a, b) = (a - y)*Phi((b - y)/s) + s*phi((b - y)/s)
+%	for the box bounds l and u. All candidates and boxes are evaluated at
+%	once.
+%
+%	Part of the MOSAO class.
+
+nPoints = size(y, 1);
+EHVI = zeros(nPoints, 1);
+if isempty(lowerB)
+	return
+end
+
+% A zero deviation gives the improvement at y
+s = max(s, realmin);
+
+terms = ones(nPoints, size(lowerB, 1));
+for d = 1:size(y, 2)
+	l = lowerB(:,d)';
+	u = upperB(:,d)';
+	zl = (l - y(:,d))./s(:,d);
+	zu = (u - y(:,d))./s(:,d);
+	cdfL = normcdf(zl);
+	below = (u - l).*cdfL;
+	below(:, isinf(l)) = 0;
+	psiU = (u - y(:,d)).*normcdf(zu) + s(:,d).*normpdf(zu);
+	psiL = (u - y(:,d)).*cdfL + s(:,d).*normpdf(zl);
+	terms = terms.*(below + psiU - psiL);
+end
+EHVI = sum(terms, 2);
+
+end
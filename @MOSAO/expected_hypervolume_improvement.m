@@ -1,13 +1,17 @@
-function [EHVI] = expected_hypervolume_improvement(P, Yref, HVprev, models, Xnew)
+function [EHVI] = expected_hypervolume_improvement(P, Yref, HVprev, models, Xnew, boxes)
 %EXPECTED_HYPERVOLUME_IMPROVEMENT Expected improvement of hypervolume
 %   Expected improvement of the hypervolume for Ynew = model_func(Xnew).
-%   Uses a Monte Carlo integral approximation, error scales with 1/sqrt(N)
+%   Exact for 2 or 3 objectives (exact_ehvi, on the boxes of the region
+%   not dominated by P). For more objectives uses a Monte Carlo integral
+%   approximation, error scales with 1/sqrt(N).
 %
 %	P		Set of current pareto points.
 %	MODELS	Cell array of gaussian regression models, one for each
 %			objective (Y) dimension.
 %	Yref	The reference point for the upper bounds of the hypervolume.
 %	XNEW	Point(s), row-wise, to have the probability calculated at.
+%	BOXES	(optional) {lowerB, upperB} from nondominated_boxes(P, Yref),
+%			to reuse for every call with the same P and Yref.
 %
 %	Part of the MOSAO class.
 
@@ -23,25 +27,24 @@ for j = 1:nObjectives
 	[y(:,j), s(:,j)]  = predict(models{j}, Xnew);
 end
 
+% Closed form, for all points at once
+if nObjectives == 2 || nObjectives == 3
+	if nargin < 6 || isempty(boxes)
+		[lowerB, upperB] = MOSAO.nondominated_boxes(P, Yref);
+		boxes = {lowerB, upperB};
+	end
+	EHVI = MOSAO.exact_ehvi(boxes{1}, boxes{2}, y, s);
+	return
+end
+
 % Monte Carlo integration
 for i = 1:nPoints
-	sum = 0;
-	
-	% Create random test point samples
+	% Create random test point samples (one per row)
 	Ytest = normrnd(repmat(y(i,:), 1, 1, N), repmat(s(i,:), 1, 1, N));
+	Ytest = permute(Ytest, [3, 2, 1]);
 	
-	% Check if P dominates the new point
-	YtestIsDominated = any(all(Ytest >= P, 2), 1);
-		
-	for k = 1:N
-		% Get change in hypervolume
-		if ~YtestIsDominated(k)
-			HVnew = MOSAO.get_hypervolume([P; Ytest(1,:,k)], Yref);
-			sum = sum + (HVnew - HVprev);
-		end
-	end
-	EHVI(i) = sum / N;
+	% Get change in hypervolume of each sample (zero if P dominates it)
+	EHVI(i) = mean(MOSAO.hypervolume_gain(P, Yref, Ytest));
 end
 
-
 end
@@ -0,0 +1,30 @@
+function [obj] = from_store(functionHandle, folderPath)
+%FROM_STORE Recreates a MOSAO run from its run store
+%	FUNCTIONHANDLE	Function to optimize (function handles are not
+%					stored)
+%	FOLDERPATH		Folder of the run store (opt.storePath of the run)
+%
+%	The Database, options and completed iterations are read back from the
+%	store, which keeps recording the run. Pick up the run with
+%	continue_run.
+%
+%	Part of the MOSAO class. Static method.
+
+store = RunStore(folderPath);
+if ~store.exists()
+	error('MOSAO:NoStore', 'No run store found in:\n\t%s', folderPath);
+end
+
+% Drop a record left incomplete by the interrupted run before appending
+store.repair();
+
+header = store.read_header();
+header.opt.storePath = folderPath;
+obj = MOSAO(functionHandle, header.lenX, header.lenY, header.LB, header.UB, header.opt);
+
+[x, y, valid, call] = store.read_calls();
+obj.db.restore(x, y, valid, call);
+obj.db.set_store(store);
+obj.iter = store.read_iterations();
+
+end
@@ -1,149 +1,180 @@
 function [volume] = get_hypervolume(P, Yref)
 %GET_HYPERVOLUME Gets the hypervolume of a pareto set P.
-%	P		The pareto set
+%	P		The pareto set (dominated points are allowed, they add nothing)
 %	Yref	A reference point for the upper bounds of the hypervolume.
+%			Points that are not below Yref in every objective add nothing.
 %
-%	Algorithm from:
-%		Seyedali Mirjalili, 2017, Multi-Objective Multi-Verse Optimization
-%		(MOMVO) algorithm, MATLAB Package
-%		https://www.mathworks.com/matlabcentral/fileexchange/63796-multi-objective-multi-verse-optimization--momvo--algorithm
+%	Exact algorithms, for n non-dominated points:
+%		2 objectives	Sweep along objective 1, O(n log n)
+%		3 objectives	Sweep along objective 3, adding each point to the
+%						2D front of the points swept so far and updating
+%						its area (Beume et al., 2009)
+%		4+ objectives	WFG (While et al., 2012), with the points sorted
+%						so that each limit set is a slice computed one
+%						objective lower, down to the 3 objective sweep
 %
 %	Part of the MOSAO class.
 
-% Get number of objectives
-nObjectives = size(P, 2);
+% Keep the non-dominated points inside the reference box
+P = P(all(P < Yref, 2), :);
+if isempty(P)
+	volume = 0;
+	return
+end
+P = MOSAO.pareto_front(P);
 
 % Get hypervolume
-volume = hypeIndicatorExact8(P, Yref, nObjectives);
-
-end
-
-function [hv, nrW] = hypeIndicatorExact8(A, bounds, dim)
-
-hv  = 0; nrW = 0;
-nrA = size(A, 1);
-if nrA == 0 % No points
-    return;
-elseif nrA == 1 % Single point
-    hv = prod(bounds - A(1,:));
-    nrW = 0;
-elseif nrA == 2 % 2 points
-    w = max(A(1,:), A(2,:));       
-    hv = prod(bounds - A(1,:)) + prod(bounds - A(2,:)) - prod(bounds - w);
-%     nrW = 1;   
-elseif nrA == 3
-    w1 = max(A(1,:), A(2,:));       
-    w2 = max(A(1,:), A(3,:));
-    w3 = max(A(2,:), A(3,:));
-    w4 = max(w1, A(3,:));
-    hv = prod(bounds - A(1,:)) ...
-		+ prod(bounds - A(2,:)) ...
-		+ prod(bounds - A(3,:)) ...
-		- prod(bounds - w1) ...
-		- prod(bounds - w2) ...
-		- prod(bounds - w3) ...
-		+ prod(bounds - w4);
-elseif dim == 2
-        %the points are slice to 2d, same values in other dimensions
-        hv = hypervolume2(A(:,1:2), bounds(1:2));
-        for i = 3:size(A,2)
-            hv = hv * (bounds(i) - A(1,i));
-        end
-        nrW = 0;
-else    
-    A = sortrows(A, dim);
-    while A(nrA, dim) == A(1, dim)
-%         fprintf('s');
-        dim = dim - 1;
-        A = sortrows(A, dim);
-    end
-    if dim == 2
-        %the points are slice to 2d, same values in other dimensions
-        hv = hypervolume2(A(:,1:2), bounds(1:2));
-        for i = 3:size(A,2)
-            hv = hv * (bounds(i) - A(1,i));
-        end
-        nrW = 0;
-        %     nrW = nrA - 1;
-    else
-        hv = hv + prod(bounds - A(1,:));
-        for i = nrA:-1:2
-            v = prod(bounds - A(i,:));
-            if v > 0
-                W = worse(A(i,:), A(1:i-1,:));
-                [hv1, nrW1] = hypeIndicatorExact8(W, bounds, dim - 1);
-                hv = hv + v - hv1;
-                nrW = nrW + size(W,1) +nrW1;
-            end
-        end
-    end
-end
-
-end
-
-function [W] = worse(A1, A2) 
-%how to quickly get the worse set
-
-[nrA1, dim] = size(A1);
-nrA2 = size(A2,1);
-W = zeros(nrA1 * nrA2, dim);
-nrW = 0;
-for i = 1:nrA1
-    worse = max(repmat(A1(i,:), nrA2, 1), A2);    
-    %find the non-dominated points in worse    
-    for j = nrA2:-1:1  
-        %the index (nrA2:-1:1) is important, because the last one is alwasys better (nondominated) than others
-        [W, nrW] = insertPoint(worse(j,:), W, nrW);
-    end
-end
-%find the non-equal, and non-dominated points in W
-W = W(1:nrW,:);
-
-end
-
-function [W, nrW] = insertPoint(p, W, nrW)
-
-if nrW == 0
-    W(1,:) = p;
-    nrW = 1;
-else
-    dim = size(p,2);
-    i = 1;
-    while i <= nrW
-        diff = p - W(i,:);
-        if sum(diff >=0, 2) == dim
-            %same point, or p is dominated
-%             fprintf('%c', '1');  
-            return;
-        end
-        if sum(diff <=0, 2) == dim
-            %some points in W are dominated by p
-            W(i, :) = W(nrW, :);
-%             fprintf('%c', '2'); 
-            i = i - 1;
-            nrW = nrW - 1;
-        end
-        i = i + 1;
-    end
-    %non-dominated each other, add this point
-    nrW = nrW + 1;
-    W(nrW,:) = p;    
-end
-    
-end
-
-function [hv] = hypervolume2(A, bounds)
-%%get hypervolume for 2D
+volume = hypervolume(P, Yref);
+
+end
+
+function [hv] = hypervolume(P, Yref)
+% Hypervolume of the non-dominated points P, all inside Yref
+
+switch size(P, 2)
+	case 1
+		hv = Yref - min(P);
+	case 2
+		hv = hypervolume2(P, Yref);
+	case 3
+		hv = hypervolume3(P, Yref);
+	otherwise
+		hv = hypervolumeWFG(P, Yref);
+end
+
+end
+
+function [hv] = hypervolume2(P, Yref)
+% Sweep along objective 1 (objective 2 decreases along a 2D front)
+
+P = sortrows(P, 1);
+widths = [P(2:end,1); Yref(1)] - P(:,1);
+hv = sum(widths .* (Yref(2) - P(:,2)));
+
+end
+
+function [hv] = hypervolume3(P, Yref)
+% Sweep along objective 3: the volume of each slab between successive
+% points is the area of the 2D front of the points below it
+
+P = sortrows(P, 3);
+n = size(P, 1);
+z = [P(:,3); Yref(3)];
 
+% 2D front (x ascending, y descending) of the points swept so far
+x = zeros(n, 1);
+y = zeros(n, 1);
+m = 0;
+
+area = 0;
 hv = 0;
-[nrA, dim] = size(A);
-if nrA == 0
-    return;
+for i = 1:n
+	[gain, x, y, m] = insert2(x, y, m, P(i,1), P(i,2), Yref);
+	area = area + gain;
+	hv = hv + area*(z(i+1) - z(i));
+end
+
+end
+
+function [gain, x, y, m] = insert2(x, y, m, px, py, Yref)
+% Adds (px,py) to the 2D front in x(1:m), y(1:m), returns the area gained
+
+gain = 0;
+
+% Last front point with x <= px (the point is dominated if it is also lower)
+k = last_at_most(x, m, px);
+if k > 0 && y(k) <= py
+	return
+end
+
+% Front points j1:j2 are dominated by the new point
+if k > 0 && x(k) == px
+	j1 = k;
+else
+	j1 = k + 1;
+end
+j2 = last_at_least(y, m, py);
+
+% Area of the new point's box left of the next point and below the
+% previous one, less what the dominated points already covered
+if j1 > 1
+	yLeft = y(j1-1);
+else
+	yLeft = Yref(2);
+end
+if j2 < m
+	xRight = x(j2+1);
+else
+	xRight = Yref(1);
+end
+gain = (xRight - px)*(yLeft - py);
+if j2 >= j1
+	widths = [x(j1+1:j2); xRight] - x(j1:j2);
+	gain = gain - sum(widths .* (yLeft - y(j1:j2)));
+end
+
+% Replace the dominated points by the new point
+tail = j2+1:m;
+x(j1+1:j1+length(tail)) = x(tail);
+y(j1+1:j1+length(tail)) = y(tail);
+x(j1) = px;
+y(j1) = py;
+m = j1 + length(tail);
+
+end
+
+function [k] = last_at_most(v, m, value)
+% Binary search, last index k <= m with v(k) <= value (v ascending), or 0
+
+lo = 0;
+hi = m;
+while lo < hi
+	mid = ceil((lo + hi)/2);
+	if v(mid) <= value
+		lo = mid;
+	else
+		hi = mid - 1;
+	end
+end
+k = lo;
+
+end
+
+function [k] = last_at_least(v, m, value)
+% Binary search, last index k <= m with v(k) >= value (v descending), or 0
+
+lo = 0;
+hi = m;
+while lo < hi
+	mid = ceil((lo + hi)/2);
+	if v(mid) >= value
+		lo = mid;
+	else
+		hi = mid - 1;
+	end
 end
-A = sortrows(A, dim);
-for i=1:nrA-1
-    hv = hv + (A(i+1, 2) - A(i, 2)) * (bounds(1) - A(i,1));
+k = lo;
+
+end
+
+function [hv] = hypervolumeWFG(P, Yref)
+% WFG: the sum of each point's volume exclusive of the points after it.
+% Sorted by the last objective, descending, the points after point k are
+% all lower in it, so limiting them by point k gives a slice at its level
+% whose volume is computed one objective lower.
+
+d = size(P, 2);
+n = size(P, 1);
+P = sortrows(P, -d);
+
+hv = 0;
+for k = 1:n
+	exclusive = prod(Yref - P(k,:));
+	if k < n
+		limitSet = MOSAO.pareto_front(max(P(k+1:n,1:d-1), P(k,1:d-1)));
+		exclusive = exclusive - (Yref(d) - P(k,d))*hypervolume(limitSet, Yref(1:d-1));
+	end
+	hv = hv + exclusive;
 end
-hv = hv + (bounds(2) - A(nrA, 2)) * (bounds(1) - A(nrA,1));
 
 end
@@ -0,0 +1,64 @@
+function [gain] = hypervolume_gain(P, Yref, Ynew)
+%HYPERVOLUME_GAIN Gets the hypervolume gained by adding a point to P.
+%	P		The pareto set, fixed.
+%	Yref	The reference point for the upper bounds of the hypervolume.
+%	YNEW	Point(s), row-wise, each added to P on its own.
+%
+%	Returns a column with get_hypervolume([P; Ynew(i,:)], Yref) less
+%	get_hypervolume(P, Yref) for each row i. For 2 objectives P is
+%	prepared once (sorted, with the running integral of its attainment
+%	line), then every gain is found by a binary search, O(log n) each. For
+%	more objectives each gain is the volume of the point's box less the
+%	hypervolume of P limited to that box.
+%
+%	Part of the MOSAO class.
+
+gain = zeros(size(Ynew, 1), 1);
+
+% Keep the non-dominated points inside the reference box
+P = P(all(P < Yref, 2), :);
+if ~isempty(P)
+	P = MOSAO.pareto_front(P);
+end
+inBox = all(Ynew < Yref, 2);
+if ~any(inBox)
+	return
+end
+
+if size(Yref, 2) == 2
+	gain(inBox) = gain2(P, Yref, Ynew(inBox,:));
+else
+	for i = find(inBox)'
+		limitedP = max(P, Ynew(i,:));
+		gain(i) = prod(Yref - Ynew(i,:)) - MOSAO.get_hypervolume(limitedP, Yref);
+	end
+	gain = max(gain, 0); % Dominated points, up to rounding
+end
+
+end
+
+function [gain] = gain2(P, Yref, Ynew)
+% Gains for 2 objectives. The front covers the points above its attainment
+% line g(a) (Yref(2) left of the front, then the y of the last front point
+% at or left of a). The area a new point adds is the integral of g(a) - py
+% from px to the first front point at or below py, found from the running
+% integral G of g.
+
+P = sortrows(P, 1);
+n = size(P, 1);
+px = Ynew(:,1);
+py = Ynew(:,2);
+
+% Running integral of g, piecewise linear between the knots
+knots = [min([px; P(:,1)]) - 1; P(:,1); Yref(1)];
+G = [0; cumsum([Yref(2); P(:,2)] .* diff(knots))];
+
+% Front points at or below py are the last nBelow ones (y descending)
+nBelow = discretize(py, [-Inf; flip(P(:,2)); Inf]) - 1;
+xRight = knots(n - nBelow + 2);
+xRight = max(xRight, px); % Zero width if the point is dominated
+
+gain = interp1(knots, G, xRight) - interp1(knots, G, px) - py.*(xRight - px);
+gain = max(gain, 0);
+
+end
@@ -7,7 +7,7 @@ end
 
 if isa(model, 'struct')
 	[y, ~] = predictor(X, model);
-elseif isa(model, 'RegressionGP')
+elseif isa(model, 'RegressionGP') || isa(model, 'GPsurrogate')
 	[y, ~] = predict(model, X);
 else
 	error('Model type not recognized.');
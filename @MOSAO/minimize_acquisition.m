@@ -0,0 +1,53 @@
+function [x, fval, exitflag, output, solutions] = minimize_acquisition(obj, objective, seedX)
+%MINIMIZE_ACQUISITION Finds local minima of an acquisition function
+%	OBJECTIVE	Function handle to minimize
+%	SEEDX		Start points (row-wise), e.g. the best or pareto points.
+%				MultiStart starts from up to half of these, the pool
+%				optimizer adds them to its pool.
+%
+%	Uses opt.BayesAcqOptimizer, outputs are those of MultiStart's run.
+%
+%	Part of the MOSAO class. Private method.
+
+switch obj.opt.BayesAcqOptimizer
+	case 'multistart'
+		% Create start points (half random, half from seedX)
+		tempN = size(seedX, 1);
+		tempNset = min(tempN, max(1, floor(obj.opt.BayesNstarts/2)));
+		tempNrand = max(1, obj.opt.BayesNstarts - tempNset);
+		tempStartPoints = {RandomStartPointSet('NumStartPoints', tempNrand)};
+		if tempNset > 0
+			tempStartPoints = [ ...
+				{CustomStartPointSet(seedX(randsample(tempN, tempNset),:))}, ...
+				tempStartPoints ];
+		end
+		
+		% Run multistart fmincon to find local minima
+		tempProblem = createOptimProblem( ...
+			'fmincon',...
+			'objective', objective, ...
+			'x0', obj.db.x(1,:), ...
+			'lb', obj.db.LB, ...
+			'ub', obj.db.UB, ...
+			'options', obj.fminconOptions );
+		[x, fval, exitflag, output, solutions] = run( ...
+			obj.MultiStartOptions, ...
+			tempProblem, ...
+			tempStartPoints );
+	case 'pool'
+		% Score a quasi-random pool and the seeds at once, polish the
+		% best points (up to half from the seeds)
+		[x, fval, exitflag, output, solutions] = MOSAO.optimize_acquisition( ...
+			objective, ...
+			obj.db.LB, ...
+			obj.db.UB, ...
+			obj.opt.BayesNpool, ...
+			obj.opt.BayesNpolish, ...
+			seedX, ...
+			obj.fminconOptions, ...
+			obj.opt.BayesParallelMS );
+	otherwise
+		error('MOSAO:UnrecognizedAcqOptimizer', 'Unrecognized MOSAO.opt.BayesAcqOptimizer');
+end
+
+end
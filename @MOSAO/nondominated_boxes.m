@@ -0,0 +1,97 @@
+function [lowerB, upperB] = nondominated_boxes(P, Yref)
+%NONDOMINATED_BOXES Splits the region not dominated by P into boxes.
+%	P		The pareto set (dominated points are allowed).
+%	Yref	The reference point for the upper bounds of the hypervolume.
+%
+%	Returns the lower and upper corners (one box per row) of disjoint boxes
+%	that cover the part of the Yref box not dominated by P. Lower corners
+%	can be -Inf. The hypervolume improvement of a point y is the sum over
+%	the boxes of prod(max(upperB - max(y, lowerB), 0), 2), which
+%	exact_ehvi integrates in closed form.
+%
+%	For 2 objectives the boxes are the strips between the front points.
+%	For 3 objectives a sweep along objective 3 keeps the strips of the 2D
+%	front of the points swept so far, and closes a box whenever a strip
+%	is changed, so there are at most 2n+1 boxes for n front points. Only 2
+%	and 3 objectives are supported.
+%
+%	Part of the MOSAO class.
+
+nObjectives = size(Yref, 2);
+if nObjectives < 2 || nObjectives > 3
+	error('MOSAO:UnsupportedObjectives', 'Box decomposition needs 2 or 3 objectives.');
+end
+
+% Keep the non-dominated points inside the reference box
+P = P(all(P < Yref, 2), :);
+if ~isempty(P)
+	P = MOSAO.pareto_front(P);
+end
+n = size(P, 1);
+
+if nObjectives == 2
+	P = sortrows(P, 1);
+	lowerB = [[-Inf; P(:,1)], -Inf(n+1, 1)];
+	upperB = [[P(:,1); Yref(1)], [Yref(2); P(:,2)]];
+	return
+end
+
+% Strips of the 2D front below the sweep: x from xL to xU, y below yU,
+% z from z0 (x ascending, yU descending)
+P = sortrows(P, 3);
+xL = -Inf;
+xU = Yref(1);
+yU = Yref(2);
+z0 = -Inf;
+lowerB = zeros(2*n+1, 3);
+upperB = zeros(2*n+1, 3);
+nBoxes = 0;
+
+for i = 1:n
+	px = P(i,1);
+	py = P(i,2);
+	pz = P(i,3);
+	
+	% Strip containing px, the point is dominated if that strip is lower
+	s = find(xL <= px, 1, 'last');
+	if yU(s) <= py
+		continue
+	end
+	
+	% Strips s:e are changed (e: last strip of a point it dominates)
+	e = find(yU >= py, 1, 'last');
+	
+	% Close them
+	closed = s:e;
+	closed = closed(z0(closed) < pz);
+	nClosed = length(closed);
+	lowerB(nBoxes+1:nBoxes+nClosed,:) = [xL(closed)', -Inf(nClosed, 1), z0(closed)'];
+	upperB(nBoxes+1:nBoxes+nClosed,:) = [xU(closed)', yU(closed)', pz*ones(nClosed, 1)];
+	nBoxes = nBoxes + nClosed;
+	
+	% Replace them with the part left of the point, and the point's strip
+	if xL(s) < px
+		newXL = [xL(s), px];
+		newXU = [px, xU(e)];
+		newYU = [yU(s), py];
+	else
+		newXL = px;
+		newXU = xU(e);
+		newYU = py;
+	end
+	xL = [xL(1:s-1), newXL, xL(e+1:end)];
+	xU = [xU(1:s-1), newXU, xU(e+1:end)];
+	yU = [yU(1:s-1), newYU, yU(e+1:end)];
+	z0 = [z0(1:s-1), pz*ones(size(newXL)), z0(e+1:end)];
+end
+
+% Close the remaining strips at the reference point
+nLeft = length(xL);
+lowerB(nBoxes+1:nBoxes+nLeft,:) = [xL', -Inf(nLeft, 1), z0'];
+upperB(nBoxes+1:nBoxes+nLeft,:) = [xU', yU', Yref(3)*ones(nLeft, 1)];
+nBoxes = nBoxes + nLeft;
+
+lowerB = lowerB(1:nBoxes,:);
+upperB = upperB(1:nBoxes,:);
+
+end
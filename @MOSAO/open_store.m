@@ -0,0 +1,28 @@
+function [obj] = open_store(obj, folderPath)
+%OPEN_STORE Records the run in a new run store
+%	FOLDERPATH	Folder of the store. It is created with the Database's
+%				sizes and bounds and obj.opt, and the calls and completed
+%				iterations so far are written to it. Each later call and
+%				completed iteration is appended as it happens.
+%
+%	To pick up a run from an existing store use MOSAO.from_store.
+%
+%	Part of the MOSAO class.
+
+store = RunStore(folderPath);
+if store.exists()
+	error('MOSAO:StoreExists', ...
+		'A run store already exists in:\n\t%s\nUse MOSAO.from_store to continue it.', folderPath);
+end
+
+obj.opt.storePath = folderPath;
+store.create(obj.db.lenX, obj.db.lenY, obj.db.LB, obj.db.UB, obj.opt);
+obj.db.set_store(store);
+
+for j = 1:length(obj.iter)
+	if isfield(obj.iter, 'completeBool') && isequal(obj.iter(j).completeBool, true)
+		store.append_iteration(j, obj.iter(j));
+	end
+end
+
+end
@@ -0,0 +1,84 @@
+function [x, fval, exitflag, output, solutions] = optimize_acquisition(objective, LB, UB, nPool, nPolish, seedX, fminconOptions, useParallel)
+%OPTIMIZE_ACQUISITION Minimizes an acquisition function from a scored pool
+%	OBJECTIVE		Function handle to minimize, must take many points
+%					(row-wise) in one call and return a column
+%	LB, UB			Bounds
+%	NPOOL			Number of quasi-random (scrambled Sobol) pool points
+%	NPOLISH			Number of points polished with fmincon
+%	SEEDX			(optional) Points to add to the pool, e.g. the pareto
+%					set. Up to half of the polished points are the best
+%					of these.
+%	FMINCONOPTIONS	Options for fmincon
+%	USEPARALLEL		(optional) Polish on the parallel pool, default false
+%
+%	The whole pool is scored in one call of OBJECTIVE, so the surrogate
+%	predicts all of it at once, instead of the one point per call of a
+%	MultiStart run. The best points are then polished by fmincon.
+%
+%	Outputs are those of MultiStart's run: the best point, its value,
+%	exit flag and output, and SOLUTIONS, a struct array (fields X, Fval,
+%	Exitflag, Output, X0) of the distinct local minima sorted by Fval.
+%
+%	Part of the MOSAO class.
+
+if nargin < 8
+	useParallel = false;
+	if nargin < 6
+		seedX = [];
+	end
+end
+nX = length(LB);
+seedX = reshape(seedX, [], nX);
+
+% Score the seeds and a scrambled Sobol pool in one call
+pool = net(scramble(sobolset(nX), 'MatousekAffineOwen'), nPool);
+pool = LB + (UB - LB).*pool;
+scores = objective([seedX; pool]);
+seedScores = scores(1:size(seedX, 1));
+poolScores = scores(size(seedX, 1)+1:end);
+
+% Keep the best seeds (up to half) and fill up with the best pool points
+[~, seedOrder] = sort(seedScores, 'ascend');
+nSeeds = min(length(seedOrder), floor(nPolish/2));
+[~, poolOrder] = sort(poolScores, 'ascend');
+nFromPool = min(nPool, nPolish - nSeeds);
+startX = [seedX(seedOrder(1:nSeeds),:); pool(poolOrder(1:nFromPool),:)];
+
+% Polish each start point
+nStarts = size(startX, 1);
+tempX = zeros(nStarts, nX);
+tempF = zeros(nStarts, 1);
+tempFlag = zeros(nStarts, 1);
+tempOutput = cell(nStarts, 1);
+nWorkers = 0;
+if useParallel
+	nWorkers = Inf;
+end
+parfor (k = 1:nStarts, nWorkers)
+	[tempX(k,:), tempF(k), tempFlag(k), tempOutput{k}] = fmincon( ...
+		objective, startX(k,:), [], [], [], [], LB, UB, [], fminconOptions );
+end
+
+% Keep converged results (all if none converged), best first, distinct
+keep = tempFlag > 0;
+if ~any(keep)
+	keep = true(nStarts, 1);
+end
+iKeep = find(keep);
+[~, order] = sort(tempF(iKeep), 'ascend');
+iKeep = iKeep(order);
+iKeep = iKeep(MOSAO.filter_unique(tempX(iKeep,:), 1e-6, UB - LB));
+
+solutions = struct( ...
+	'X', num2cell(tempX(iKeep,:), 2), ...
+	'Fval', num2cell(tempF(iKeep)), ...
+	'Exitflag', num2cell(tempFlag(iKeep)), ...
+	'Output', tempOutput(iKeep), ...
+	'X0', num2cell(startX(iKeep,:), 2) );
+
+x = tempX(iKeep(1),:);
+fval = tempF(iKeep(1));
+exitflag = tempFlag(iKeep(1));
+output = tempOutput{iKeep(1)};
+
+end
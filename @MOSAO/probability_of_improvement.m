@@ -9,7 +9,7 @@ end
 if isa(model, 'struct')
 	[y, ssq] = predictor(X, model);
 	s = sqrt(ssq);
-elseif isa(model, 'RegressionGP')
+elseif isa(model, 'RegressionGP') || isa(model, 'GPsurrogate')
 	[y, s] = predict(model, X);
 else
 	error('Model type not recognized.');
@@ -0,0 +1,217 @@
+function [X, solutions] = propose_batch(obj, nBatch, acqMargin, classifier, seedX)
+%PROPOSE_BATCH Proposes a batch of candidates, conditioned on pending calls
+%	Chooses NBATCH candidates one at a time, each by minimizing the
+%	acquisition function conditioned on the calls still running
+%	(obj.db.pendingX) and on the candidates chosen before it, using
+%	opt.BayesBatchMethod:
+%		'believer'	Kriging believer: the models are given their mean
+%					prediction as the result at the conditioned points
+%		'liar'		Constant liar: the models are given their lowest
+%					training response as the result at those points
+%		'penalize'	Local penalization (Gonzalez et al., 2016): the
+%					acquisition function is multiplied by the probability
+%					that x is outside each point's Lipschitz ball (for
+%					more objectives, the largest over the objectives)
+%		'qEHVI'		Sequential greedy q-EHVI (Daulton et al., 2020): the
+%					EHVI averaged over opt.BayesNfantasies fantasy sets,
+%					each given sampled results at the conditioned points
+%	Fantasized results are added to copies of the models as GPsurrogate
+%	rank-k updates, keeping the hyperparameters. If the models can not
+%	be made GPsurrogates, 'penalize' is used.
+%
+%	ACQMARGIN	Function handle (x, models, acqFunc) used by the run
+%	CLASSIFIER	Function handle for the probability of x being valid
+%	SEEDX		Start points for the acquisition optimizer
+%
+%	Returns the candidates X (row-wise) and the local minima SOLUTIONS
+%	found for the first one.
+%
+%	Part of the MOSAO class. Private method.
+
+method = obj.opt.BayesBatchMethod;
+nY = obj.db.lenY;
+models = obj.model;
+if ~iscell(models)
+	models = {models};
+end
+nRows = size(models, 1);
+
+if strcmp(method, 'qEHVI') && nY < 2
+	error('MOSAO:UnrecognizedBatchMethod', 'qEHVI batches need more than one objective.');
+end
+
+% Copies of the models to add fantasized results to (one set of models,
+% or for qEHVI one set per fantasy, cycling through the model rows)
+if any(strcmp(method, {'believer', 'liar', 'qEHVI'}))
+	tempModels = MOSAO.to_gp_surrogates(models);
+	if all(cellfun(@(m) isa(m, 'GPsurrogate'), tempModels(:)))
+		if strcmp(method, 'qEHVI')
+			nSets = obj.opt.BayesNfantasies;
+			fantasyModels = cell(nSets, 1);
+			for s = 1:nSets
+				fantasyModels{s} = cellfun(@copy, tempModels(mod(s-1, nRows)+1,:), 'UniformOutput', false);
+			end
+		else
+			nSets = 1;
+			fantasyModels = {cellfun(@copy, tempModels, 'UniformOutput', false)};
+		end
+		fantasyY = repmat({zeros(0, nY)}, nSets, 1);
+	else
+		warning('MOSAO:BatchMethodFallback', ...
+			'Models can not be given fantasized results, using ''penalize'' for the batch.');
+		method = 'penalize';
+	end
+end
+
+% Lipschitz constant of each objective's mean prediction, the largest
+% gradient norm (central differences) at random points
+if strcmp(method, 'penalize')
+	nL = 500;
+	tempXL = obj.db.LB + (obj.db.UB - obj.db.LB).*rand(nL, obj.db.lenX);
+	tempH = 1e-4*max(obj.db.UB - obj.db.LB, eps);
+	L = zeros(1, nY);
+	M = zeros(1, nY);
+	for i = 1:nY
+		tempGrad = zeros(nL, obj.db.lenX);
+		for d = 1:obj.db.lenX
+			tempStep = zeros(1, obj.db.lenX);
+			tempStep(d) = tempH(d);
+			tempGrad(:,d) = (predict(models{1,i}, tempXL + tempStep) - predict(models{1,i}, tempXL - tempStep))/(2*tempH(d));
+		end
+		L(i) = max(max(sqrt(sum(tempGrad.^2, 2))), 1e-7);
+		M(i) = min(models{1,i}.Y);
+	end
+	centers = zeros(0, obj.db.lenX);
+	centerMu = zeros(0, nY);
+	centerSd = zeros(0, nY);
+	baseAcquisition = obj.build_acquisition(obj.model, acqMargin);
+end
+
+X = zeros(0, obj.db.lenX);
+Xcond = obj.db.pendingX;
+solutions = [];
+for k = 1:nBatch
+	% Condition on the pending calls, then on each chosen candidate
+	if ~isempty(Xcond)
+		switch method
+			case {'believer', 'liar', 'qEHVI'}
+				for s = 1:nSets
+					fantasyY{s} = [fantasyY{s}; add_fantasies(fantasyModels{s}, Xcond, method)];
+				end
+			case 'penalize'
+				tempMu = zeros(size(Xcond, 1), nY);
+				tempSd = zeros(size(Xcond, 1), nY);
+				for i = 1:nY
+					[tempMu(:,i), tempSd(:,i)] = predict(models{1,i}, Xcond);
+				end
+				centers = [centers; Xcond];
+				centerMu = [centerMu; tempMu];
+				centerSd = [centerSd; max(tempSd, eps)];
+		end
+	end
+
+	% Acquisition function of the conditioned models
+	switch method
+		case {'believer', 'liar'}
+			acquisitionFunction = obj.build_acquisition(fantasyModels{1}, acqMargin, fantasyY{1});
+		case 'qEHVI'
+			tempAcq = cell(nSets, 1);
+			for s = 1:nSets
+				tempAcq{s} = obj.build_acquisition(fantasyModels{s}, @(x, mod, acqFunc) acqFunc(x, mod), fantasyY{s}, 'EHVI');
+			end
+			acquisitionFunction = @(kX) mean_acquisition(kX, tempAcq);
+		case 'penalize'
+			% Softplus keeps the acquisition (negated) positive for the
+			% multiplicative penalty
+			tempCenters = centers;
+			tempCenterMu = centerMu;
+			tempCenterSd = centerSd;
+			acquisitionFunction = @(kX) -1*softplus(-1*baseAcquisition(kX)) ...
+				.*local_penalty(kX, tempCenters, tempCenterMu, tempCenterSd, L, M);
+		otherwise
+			error('MOSAO:UnrecognizedBatchMethod', 'Unrecognized MOSAO.opt.BayesBatchMethod');
+	end
+
+	% Find local minima
+	[~, ~, ~, ~, tempSolutions] = obj.minimize_acquisition( ...
+		@(kX) classifier(kX).*acquisitionFunction(kX), ...
+		seedX );
+	if k == 1
+		solutions = tempSolutions;
+	end
+
+	% Take the best new point, or a random point if there is none
+	tempX = cell2mat({tempSolutions.X}');
+	tempNew = ~obj.db.check_existence(tempX) & ~is_near(tempX, [obj.db.pendingX; X]);
+	if any(tempNew)
+		Xcond = tempX(find(tempNew, 1, 'first'),:);
+	else
+		Xcond = obj.db.LB + (obj.db.UB - obj.db.LB).*rand(1, obj.db.lenX);
+	end
+	X = [X; Xcond];
+end
+
+end
+
+function [Ynew] = add_fantasies(models, Xnew, method)
+%ADD_FANTASIES Adds fantasized results at XNEW to the models (in place)
+%	Returns the results averaged over the rows of MODELS. Sampled results
+%	(qEHVI) are added one point at a time, so that each sample is
+%	conditioned on the ones before it.
+nRows = size(models, 1);
+nNew = size(Xnew, 1);
+Ynew = zeros(nNew, size(models, 2));
+for i = 1:size(models, 2)
+	for r = 1:nRows
+		switch method
+			case 'believer'
+				y = predict(models{r,i}, Xnew);
+				models{r,i}.update([models{r,i}.X; Xnew], [models{r,i}.Y; y]);
+			case 'liar'
+				y = min(models{r,i}.Y)*ones(nNew, 1);
+				models{r,i}.update([models{r,i}.X; Xnew], [models{r,i}.Y; y]);
+			case 'qEHVI'
+				y = zeros(nNew, 1);
+				for n = 1:nNew
+					[tempY, tempSd] = predict(models{r,i}, Xnew(n,:));
+					y(n) = tempY + tempSd*randn();
+					models{r,i}.update([models{r,i}.X; Xnew(n,:)], [models{r,i}.Y; y(n)]);
+				end
+		end
+		Ynew(:,i) = Ynew(:,i) + y/nRows;
+	end
+end
+end
+
+function [value] = mean_acquisition(kX, acquisitionFunctions)
+%MEAN_ACQUISITION Averages several acquisition functions at kX
+value = 0;
+for s = 1:numel(acquisitionFunctions)
+	value = value + acquisitionFunctions{s}(kX);
+end
+value = value/numel(acquisitionFunctions);
+end
+
+function [phi] = local_penalty(kX, centers, centerMu, centerSd, L, M)
+%LOCAL_PENALTY Probability that kX is outside the Lipschitz balls of the
+%	centers, for several objectives the largest over the objectives
+phi = ones(size(kX, 1), 1);
+for c = 1:size(centers, 1)
+	r = sqrt(sum((kX - centers(c,:)).^2, 2));
+	phi = phi.*max(normcdf((L.*r - M + centerMu(c,:))./centerSd(c,:)), [], 2);
+end
+end
+
+function [y] = softplus(x)
+%SOFTPLUS log(1 + exp(x)) without overflow
+y = max(x, 0) + log1p(exp(-abs(x)));
+end
+
+function [isNear] = is_near(X, Xother)
+%IS_NEAR Rows of X within the tolerance of Database.check_existence of
+%	any row of XOTHER
+isNear = false(size(X, 1), 1);
+for k = 1:size(Xother, 1)
+	isNear = isNear | (sum((X - Xother(k,:)).^2, 2) < 1e-10);
+end
+end
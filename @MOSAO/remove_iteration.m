@@ -10,5 +10,8 @@ end
 
 obj.iter(iteration) = [];
 obj.temp(iteration) = [];
+if ~isempty(obj.db.store)
+	obj.db.store.append_iteration_removal(iteration);
+end
 
 end
@@ -25,6 +25,11 @@ if nargin < 2
 	initialX = [];
 end
 
+% Record the run in opt.storePath
+if ~isempty(obj.opt.storePath) && isempty(obj.db.store)
+	obj = obj.open_store(obj.opt.storePath);
+end
+
 % Show messages
 if obj.opt.showMessages
 	if obj.db.lenY > 1
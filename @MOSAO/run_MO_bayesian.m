@@ -13,8 +13,15 @@ if isempty(obj.iter)
 	continueBool = false;
 end
 
-% Set up parallel pool if needed
-if obj.opt.BayesParallelMS
+% Asynchronous calls run on copies of the function, so refuse ones that
+% are not safe to copy before any time is spent (a WBpackage needs its
+% sets run on project copies, see Database.set_async_calls)
+if obj.opt.BayesAsync
+	obj.db.check_async();
+end
+
+% Set up parallel pool if needed (also runs the asynchronous calls)
+if obj.opt.BayesParallelMS || obj.opt.BayesAsync
 	poolObj = parpool('local', 'IdleTimeout', Inf);
 	%pctrunonall(warning('OFF', 'MATLAB:nearlySingularMatrix')); % turns off singularity warnings
 	finishUp = onCleanup(@() delete(poolObj)); % Ensure shutdown on cleanup
@@ -115,26 +122,33 @@ for i = 1:obj.db.lenY
 		case 'none'
 			obj.model(:,i) = obj.initModel(i);
 		case 'sliceSample'
-			obj.model(:,i) = MOSAO.slice_sample_models(obj.initModel{i}, obj.opt.AcqSamples, obj.opt.AcqNBurnin, obj.opt.AcqNThin);
+			obj.model(:,i) = MOSAO.slice_sample_models(obj.initModel{i}, obj.opt.AcqSamples, obj.opt.AcqNBurnin, obj.opt.AcqNThin, obj.opt.BayesParallelMS);
 		otherwise
 			error('MOSAO:UnrecognizedAcqusitionSamplingType', 'Unrecognized MOSAO.opt.AcqMarginalization');
 	end
+	if obj.opt.GSrefitInterval > 1
+		obj.model(:,i) = MOSAO.to_gp_surrogates(obj.model(:,i));
+	end
 end
 
+% Pareto front of the database, kept up to date as calls are added
+obj.db.archive.set_reference(obj.opt.hypervolumeRef);
+
 % Show messages
 if obj.opt.showMessages
-	[printP,~,printVol] = MOSAO.pareto_front_hypervolume(obj.db.y(obj.db.valid,:), obj.opt.hypervolumeRef);
+	[printP,~,printVol] = obj.db.archive.front_hypervolume();
 	fprintf('%5d %13d %#15.3e %8d\n', j-1, obj.db.callAmount, printVol, size(printP, 1));
 end
 
 lastCallAmount = 0;
+nModelUpdates = 0;
 timeGenList = [];
 runningCallAmountList = [];
 nParetoList = [];
 HVList = [];
 
 % Main loop
-while obj.db.callAmount < obj.opt.maxCalls
+while obj.db.callAmount + size(obj.db.pendingX, 1) < obj.opt.maxCalls
 	timeGenTic = tic;
 	obj.iter(j).completeBool = false;
 	obj.iter(j).prevCallAmount = obj.db.callAmount;
@@ -146,67 +160,55 @@ while obj.db.callAmount < obj.opt.maxCalls
 		tempClassifier = @(kX) 1;
 	end
 	
-	% Define GA criteria based on options
-	[tempP, tempYref, tempHV, tempPind] = MOSAO.pareto_front_hypervolume(obj.db.y(obj.db.valid,:), obj.opt.hypervolumeRef);
-	switch obj.opt.BayesMOAcqFunc
-		case 'HVIncreaseMean'
-			%acquisitionFunction = @(kX) -1*MOSAO.change_of_hypervolume(tempP, tempYref, tempHV, obj.model, kX, 'meanValue');
-			acquisitionFunction = @(kX) -1*tempAcqMargin(kX, obj.model, @(x, mod) MOSAO.change_of_hypervolume(tempP, tempYref, tempHV, mod, x, 'meanValue'));
-		case 'HVIncreaseLCB'
-			%acquisitionFunction = @(kX) -1*MOSAO.change_of_hypervolume(tempP, tempYref, tempHV, obj.model, kX, 'LCB');
-			acquisitionFunction = @(kX) -1*tempAcqMargin(kX, obj.model, @(x, mod) MOSAO.change_of_hypervolume(tempP, tempYref, tempHV, mod, x, 'LCB'));
-		case 'PoPI'
-			%acquisitionFunction = @(kX) -1*MOSAO.probability_of_pareto_improvement(tempP, obj.model, kX);
-			acquisitionFunction = @(kX) -1*tempAcqMargin(kX, obj.model, @(x, mod) MOSAO.probability_of_pareto_improvement(tempP, mod, x));
-		case 'EHVI'
-			%acquisitionFunction = @(kX) -1*MOSAO.expected_hypervolume_improvement(tempP, tempYref, tempHV, obj.model, kX);
-			acquisitionFunction = @(kX) -1*tempAcqMargin(kX, obj.model, @(x, mod) MOSAO.expected_hypervolume_improvement(tempP, tempYref, tempHV, mod, x));
-		otherwise
-			error('MOSAO:UnrecognizedGAcriteria', 'Unrecognized obj.opt.GAcriteria');
-	end
-	
-	% Create start points (half random, half from pareto front)
-	tempN = length(tempPind);
-	tempNset = min(tempN, max(1, floor(obj.opt.BayesNstarts/2)));
-	tempNrand = max(1, obj.opt.BayesNstarts - tempNset);
-	tempStartPoints = {...
-		CustomStartPointSet(obj.db.x(tempPind(randsample(tempN, tempNset)),:)), ...
-		RandomStartPointSet('NumStartPoints', tempNrand) };
-	
-	% Run multistart fmincon to find local minima
-	tempProblem = createOptimProblem( ...
-		'fmincon',...
-		'objective', @(kX) tempClassifier(kX).*acquisitionFunction(kX), ...
-		'x0', obj.db.x(1,:), ...
-		'lb', obj.db.LB, ...
-		'ub', obj.db.UB, ...
-		'options', obj.fminconOptions );
-	[obj.temp(j).x, obj.temp(j).fval, obj.temp(j).exitflag, ...
-	 obj.temp(j).output, obj.temp(j).solutions] = run( ...
-		obj.MultiStartOptions, ...
-		tempProblem, ...
-		tempStartPoints );
+	% Find candidate(s) for this iteration (tempPind are database indices)
+	[~, ~, ~, tempPind] = obj.db.archive.front_hypervolume();
+	if strcmp(obj.opt.BayesBatchMethod, 'none')
+		% Define GA criteria based on options
+		acquisitionFunction = obj.build_acquisition(obj.model, tempAcqMargin);
+		
+		% Run multistart fmincon to find local minima (starting from the
+		% pareto front and random points)
+		[obj.temp(j).x, obj.temp(j).fval, obj.temp(j).exitflag, ...
+		 obj.temp(j).output, obj.temp(j).solutions] = obj.minimize_acquisition( ...
+			@(kX) tempClassifier(kX).*acquisitionFunction(kX), ...
+			obj.db.x(tempPind,:) );
 
-	% Check for duplicates
-	obj.iter(j).foundMinX = cell2mat({obj.temp(j).solutions.X}');
-	obj.iter(j).untestedI = find(~obj.db.check_existence(obj.iter(j).foundMinX));
-	
-	% If not enough (non-duplicate) candidate points are found, use random points
-	nUntested = length(obj.iter(j).untestedI);
-	if nUntested < obj.opt.BayesNcandidates
-		obj.iter(j).toUseX = [ ...
-			obj.iter(j).foundMinX(obj.iter(j).untestedI(1:nUntested),:); ...
-			obj.db.LB + (obj.db.UB - obj.db.LB).*rand(obj.opt.BayesNcandidates - nUntested, obj.db.lenX) ];
+		% Check for duplicates
+		obj.iter(j).foundMinX = cell2mat({obj.temp(j).solutions.X}');
+		obj.iter(j).untestedI = find(~obj.db.check_existence(obj.iter(j).foundMinX));
+		
+		% If not enough (non-duplicate) candidate points are found, use random points
+		nUntested = length(obj.iter(j).untestedI);
+		if nUntested < obj.opt.BayesNcandidates
+			obj.iter(j).toUseX = [ ...
+				obj.iter(j).foundMinX(obj.iter(j).untestedI(1:nUntested),:); ...
+				obj.db.LB + (obj.db.UB - obj.db.LB).*rand(obj.opt.BayesNcandidates - nUntested, obj.db.lenX) ];
+		else
+			obj.iter(j).toUseX = obj.iter(j).foundMinX(obj.iter(j).untestedI(1:obj.opt.BayesNcandidates),:);
+		end
+		%obj.iter(j).toUseI = obj.iter(j).untestedI(1:obj.opt.BayesNcandidates);
 	else
-		obj.iter(j).toUseX = obj.iter(j).foundMinX(obj.iter(j).untestedI(1:obj.opt.BayesNcandidates),:);
+		% Choose the batch one candidate at a time, each conditioned on
+		% the pending calls and the candidates before it
+		[obj.iter(j).toUseX, obj.temp(j).solutions] = obj.propose_batch( ...
+			obj.opt.BayesNcandidates, ...
+			tempAcqMargin, ...
+			tempClassifier, ...
+			obj.db.x(tempPind,:) );
 	end
-	%obj.iter(j).toUseI = obj.iter(j).untestedI(1:obj.opt.BayesNcandidates);
 	
 	% Evaluate candidates
 	switch obj.opt.type
 		case 'b'
-			% Evaluate candidate(s) directly
-			obj.db = obj.db.call_function(obj.iter(j).toUseX);
+			if obj.opt.BayesAsync
+				% Start the candidate(s), only waiting for results when
+				% BayesNpending call sets are running
+				obj.db = obj.db.submit_call(obj.iter(j).toUseX);
+				obj.db = obj.db.collect_calls(obj.db.nPendingSets >= obj.opt.BayesNpending);
+			else
+				% Evaluate candidate(s) directly
+				obj.db = obj.db.call_function(obj.iter(j).toUseX);
+			end
 		otherwise
 			error('MOSAO:UnrecognizedType', 'Unrecognized obj.opt.type for MO optimization.');
 	end
@@ -224,9 +226,50 @@ while obj.db.callAmount < obj.opt.maxCalls
 				'ClassNames', [false, true] ));
 		end
 		
+		% Refit the hyperparameters every GSrefitInterval updates, in
+		% between add the new calls to the factorized models
+		nModelUpdates = nModelUpdates + 1;
 		for i = 1:obj.db.lenY
-			if obj.opt.reuseKernel
-				try
+			tempRefit = true;
+			if mod(nModelUpdates, obj.opt.GSrefitInterval) ~= 0
+				tempRefit = ~MOSAO.update_gp_surrogates(obj.model(:,i), obj.db.x, tempYTransform(obj.db.y(:,i), obj.db.valid));
+			end
+			
+			if tempRefit
+				if obj.opt.reuseKernel
+					try
+						obj.initModel{i} = fitrgp( ...
+							obj.db.x, ...
+							tempYTransform(obj.db.y(:,i), obj.db.valid), ...
+							'Standardize', true, ...
+							'FitMethod', 'exact', ...
+							'PredictMethod', 'exact', ...
+							'BasisFunction', obj.opt.GSbasis, ...
+							'KernelFunction', obj.opt.GSkernel, ...
+							'Sigma', tempNoiseSigma, ...
+							'ConstantSigma', obj.opt.constantNoiseSigma, ... 
+							'KernelParameters', obj.initModel{i}.KernelInformation.KernelParameters );
+					catch tempME
+						switch tempME.identifier
+							% If unable to find theta, try again with no theta0 set
+							case 'stats:classreg:learning:impl:GPImpl:GPImpl:UnableToComputeLFactorExact'
+								warning('MOSAO:DefaultingTheta0', ...
+									'Unable to compute theta (kernel) given specified theta0 at j=%d.\nDefaulting to unspecified theta0.', j);
+								obj.initModel{i} = fitrgp( ...
+									obj.db.x, ...
+									tempYTransform(obj.db.y(:,i), obj.db.valid), ...
+									'Standardize', true, ...
+									'FitMethod', 'exact', ...
+									'PredictMethod', 'exact', ...
+									'BasisFunction', obj.opt.GSbasis, ...
+									'KernelFunction', obj.opt.GSkernel, ...
+									'Sigma', tempNoiseSigma, ...
+									'ConstantSigma', obj.opt.constantNoiseSigma );
+							otherwise
+								rethrow(tempME);
+						end
+					end
+				else
 					obj.initModel{i} = fitrgp( ...
 						obj.db.x, ...
 						tempYTransform(obj.db.y(:,i), obj.db.valid), ...
@@ -236,55 +279,27 @@ while obj.db.callAmount < obj.opt.maxCalls
 						'BasisFunction', obj.opt.GSbasis, ...
 						'KernelFunction', obj.opt.GSkernel, ...
 						'Sigma', tempNoiseSigma, ...
-						'ConstantSigma', obj.opt.constantNoiseSigma, ... 
-						'KernelParameters', obj.initModel{i}.KernelInformation.KernelParameters );
-				catch tempME
-					switch tempME.identifier
-						% If unable to find theta, try again with no theta0 set
-						case 'stats:classreg:learning:impl:GPImpl:GPImpl:UnableToComputeLFactorExact'
-							warning('MOSAO:DefaultingTheta0', ...
-								'Unable to compute theta (kernel) given specified theta0 at j=%d.\nDefaulting to unspecified theta0.', j);
-							obj.initModel{i} = fitrgp( ...
-								obj.db.x, ...
-								tempYTransform(obj.db.y(:,i), obj.db.valid), ...
-								'Standardize', true, ...
-								'FitMethod', 'exact', ...
-								'PredictMethod', 'exact', ...
-								'BasisFunction', obj.opt.GSbasis, ...
-								'KernelFunction', obj.opt.GSkernel, ...
-								'Sigma', tempNoiseSigma, ...
-								'ConstantSigma', obj.opt.constantNoiseSigma );
-						otherwise
-							rethrow(tempME);
-					end
+						'ConstantSigma', obj.opt.constantNoiseSigma );
 				end
-			else
-				obj.initModel{i} = fitrgp( ...
-					obj.db.x, ...
-					tempYTransform(obj.db.y(:,i), obj.db.valid), ...
-					'Standardize', true, ...
-					'FitMethod', 'exact', ...
-					'PredictMethod', 'exact', ...
-					'BasisFunction', obj.opt.GSbasis, ...
-					'KernelFunction', obj.opt.GSkernel, ...
-					'Sigma', tempNoiseSigma, ...
-					'ConstantSigma', obj.opt.constantNoiseSigma );
-			end
 			
-			% Update model(s) for acquisition functions
-			switch obj.opt.AcqMarginalization
-				case 'none'
-					obj.model(:,i) = obj.initModel(i);
-				case 'sliceSample'
-					obj.model(:,i) = MOSAO.slice_sample_models(obj.initModel{i}, obj.opt.AcqSamples, obj.opt.AcqNBurnin, obj.opt.AcqNThin);
-				otherwise
-					error('MOSAO:UnrecognizedAcqusitionSamplingType', 'Unrecognized MOSAO.opt.AcqMarginalization');
+				% Update model(s) for acquisition functions
+				switch obj.opt.AcqMarginalization
+					case 'none'
+						obj.model(:,i) = obj.initModel(i);
+					case 'sliceSample'
+						obj.model(:,i) = MOSAO.slice_sample_models(obj.initModel{i}, obj.opt.AcqSamples, obj.opt.AcqNBurnin, obj.opt.AcqNThin, obj.opt.BayesParallelMS);
+					otherwise
+						error('MOSAO:UnrecognizedAcqusitionSamplingType', 'Unrecognized MOSAO.opt.AcqMarginalization');
+				end
+				if obj.opt.GSrefitInterval > 1
+					obj.model(:,i) = MOSAO.to_gp_surrogates(obj.model(:,i));
+				end
 			end
 		end
 	end
 	
 	% Get iteration's pareto state
-	[tempP, ~, tempHV] = MOSAO.pareto_front_hypervolume(obj.db.y(obj.db.valid,:), obj.opt.hypervolumeRef);
+	[tempP, ~, tempHV] = obj.db.archive.front_hypervolume();
 	
 	% Show messages
 	if obj.opt.showMessages
@@ -297,9 +312,17 @@ while obj.db.callAmount < obj.opt.maxCalls
 	nParetoList = [nParetoList; size(tempP, 1)];
 	HVList = [HVList; tempHV];
 	obj.iter(j).completeBool = true;
+	if ~isempty(obj.db.store)
+		obj.db.store.append_iteration(j, obj.iter(j));
+	end
 	j = j+1;
 end
 
+% Collect the calls still running
+while obj.db.nPendingSets > 0
+	obj.db = obj.db.collect_calls(true);
+end
+
 % Organize output values, appending values if they already exist
 obj = obj.organize_run_outputs(runningCallAmountList, timeGenList, nParetoList, HVList);
 
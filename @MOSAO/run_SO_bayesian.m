@@ -13,8 +13,15 @@ if isempty(obj.iter)
 	continueBool = false;
 end
 
-% Set up parallel pool if needed
-if obj.opt.BayesParallelMS
+% Asynchronous calls run on copies of the function, so refuse ones that
+% are not safe to copy before any time is spent (a WBpackage needs its
+% sets run on project copies, see Database.set_async_calls)
+if obj.opt.BayesAsync
+	obj.db.check_async();
+end
+
+% Set up parallel pool if needed (also runs the asynchronous calls)
+if obj.opt.BayesParallelMS || obj.opt.BayesAsync
 	poolObj = parpool('local', 'IdleTimeout', Inf);
 	finishUp = onCleanup(@() delete(poolObj)); % Ensure shutdown on cleanup
 end
@@ -111,10 +118,13 @@ switch obj.opt.AcqMarginalization
 	case 'none'
 		obj.model = obj.initModel;
 	case 'sliceSample'
-		obj.model = MOSAO.slice_sample_models(obj.initModel, obj.opt.AcqSamples, obj.opt.AcqNBurnin, obj.opt.AcqNThin);
+		obj.model = MOSAO.slice_sample_models(obj.initModel, obj.opt.AcqSamples, obj.opt.AcqNBurnin, obj.opt.AcqNThin, obj.opt.BayesParallelMS);
 	otherwise
 		error('MOSAO:UnrecognizedAcqusitionSamplingType', 'Unrecognized MOSAO.opt.AcqMarginalization');
 end
+if obj.opt.GSrefitInterval > 1
+	obj.model = MOSAO.to_gp_surrogates(obj.model);
+end
 		
 % Show messages
 if obj.opt.showMessages
@@ -122,11 +132,12 @@ if obj.opt.showMessages
 end
 
 lastCallAmount = 0;
+nModelUpdates = 0;
 timeGenList = [];
 runningCallAmountList = [];
 
 % Main loop
-while obj.db.callAmount < obj.opt.maxCalls
+while obj.db.callAmount + size(obj.db.pendingX, 1) < obj.opt.maxCalls
 	timeGenTic = tic;
 	obj.iter(j).completeBool = false;
 	obj.iter(j).prevCallAmount = obj.db.callAmount;
@@ -138,51 +149,41 @@ while obj.db.callAmount < obj.opt.maxCalls
 		tempClassifier = @(kX) 1;
 	end
 	
-	% Define GA criteria based on options
-	switch obj.opt.BayesAcqFunc
-		case 'fitness'
-			%acquisitionFunction = @(kX) MOSAO.mean_prediction(kX, obj.model);
-			acquisitionFunction = @(kX) tempAcqMargin(kX, obj.model, @MOSAO.mean_prediction);
-		case 'PoI'
-			%acquisitionFunction = @(kX) -1*MOSAO.probability_of_improvement(kX, obj.model, min(obj.db.y(obj.db.valid)));
-			acquisitionFunction = @(kX) -1*tempAcqMargin(kX, obj.model, @(x, mod) MOSAO.probability_of_improvement(x, mod, min(obj.db.y(obj.db.valid))));
-		case 'EI'
-			%acquisitionFunction = @(kX) -1*MOSAO.expected_improvement(kX, obj.model, min(obj.db.y(obj.db.valid)));
-			acquisitionFunction = @(kX) -1*tempAcqMargin(kX, obj.model, @(x, mod) MOSAO.expected_improvement(x, mod, min(obj.db.y(obj.db.valid))));
-		otherwise
-			error('MOSAO:UnrecognizedGAcriteria', 'Unrecognized MOSAO.opt.GAcriteria');
-	end
-	
-	% Run multistart fmincon to find local minima
+	% Find candidate(s) for this iteration
 	[~, tempMinInd] = min(obj.db.y(obj.db.valid));
-	tempProblem = createOptimProblem( ...
-		'fmincon',...
-		'objective', @(kX) tempClassifier(kX).*acquisitionFunction(kX), ...
-		'x0', obj.db.x(tempMinInd,:), ...
-		'lb', obj.db.LB, ...
-		'ub', obj.db.UB, ...
-		'options', obj.fminconOptions );
-
-	[obj.temp(j).x, obj.temp(j).fval, obj.temp(j).exitflag, ...
-	 obj.temp(j).output, tempSolutions] = run( ...
-		obj.MultiStartOptions, ...
-		tempProblem, ...
-		obj.opt.BayesNstarts );
-	
-	% Check for duplicates
-	obj.iter(j).foundMinX = cell2mat({tempSolutions.X}');
-	obj.iter(j).untestedI = find(~obj.db.check_existence(obj.iter(j).foundMinX));
-	
-	% If not enough (non-duplicate) candidate points are found, use random points
-	nUntested = length(obj.iter(j).untestedI);
-	if nUntested < obj.opt.BayesNcandidates
-		obj.iter(j).toUseX = [ ...
-			obj.iter(j).foundMinX(obj.iter(j).untestedI(1:nUntested),:); ...
-			obj.db.LB + (obj.db.UB - obj.db.LB).*rand(obj.opt.BayesNcandidates - nUntested, obj.db.lenX) ];
+	if strcmp(obj.opt.BayesBatchMethod, 'none')
+		% Define GA criteria based on options
+		acquisitionFunction = obj.build_acquisition(obj.model, tempAcqMargin);
+		
+		% Run multistart fmincon to find local minima
+		[obj.temp(j).x, obj.temp(j).fval, obj.temp(j).exitflag, ...
+		 obj.temp(j).output, tempSolutions] = obj.minimize_acquisition( ...
+			@(kX) tempClassifier(kX).*acquisitionFunction(kX), ...
+			obj.db.x(tempMinInd,:) );
+		
+		% Check for duplicates
+		obj.iter(j).foundMinX = cell2mat({tempSolutions.X}');
+		obj.iter(j).untestedI = find(~obj.db.check_existence(obj.iter(j).foundMinX));
+		
+		% If not enough (non-duplicate) candidate points are found, use random points
+		nUntested = length(obj.iter(j).untestedI);
+		if nUntested < obj.opt.BayesNcandidates
+			obj.iter(j).toUseX = [ ...
+				obj.iter(j).foundMinX(obj.iter(j).untestedI(1:nUntested),:); ...
+				obj.db.LB + (obj.db.UB - obj.db.LB).*rand(obj.opt.BayesNcandidates - nUntested, obj.db.lenX) ];
+		else
+			obj.iter(j).toUseX = obj.iter(j).foundMinX(obj.iter(j).untestedI(1:obj.opt.BayesNcandidates),:);
+		end
+		%obj.iter(j).toUseI = obj.iter(j).untestedI(1:obj.opt.BayesNcandidates);
 	else
-		obj.iter(j).toUseX = obj.iter(j).foundMinX(obj.iter(j).untestedI(1:obj.opt.BayesNcandidates),:);
+		% Choose the batch one candidate at a time, each conditioned on
+		% the pending calls and the candidates before it
+		[obj.iter(j).toUseX, tempSolutions] = obj.propose_batch( ...
+			obj.opt.BayesNcandidates, ...
+			tempAcqMargin, ...
+			tempClassifier, ...
+			obj.db.x(tempMinInd,:) );
 	end
-	%obj.iter(j).toUseI = obj.iter(j).untestedI(1:obj.opt.BayesNcandidates);
 			
 	% Evaluate candidates
 	switch obj.opt.type
@@ -192,8 +193,15 @@ while obj.db.callAmount < obj.opt.maxCalls
 				[obj,~,~] = obj.local_search(obj.iter(j).toUseX(k,:));
 			end
 		case 'b'
-			% Evaluate candidate(s) directly
-			obj.db = obj.db.call_function(obj.iter(j).toUseX);
+			if obj.opt.BayesAsync
+				% Start the candidate(s), only waiting for results when
+				% BayesNpending call sets are running
+				obj.db = obj.db.submit_call(obj.iter(j).toUseX);
+				obj.db = obj.db.collect_calls(obj.db.nPendingSets >= obj.opt.BayesNpending);
+			else
+				% Evaluate candidate(s) directly
+				obj.db = obj.db.call_function(obj.iter(j).toUseX);
+			end
 		otherwise
 			error('MOSAO:UnrecognizedType', 'Unrecognized MOSAO.opt.type');
 	end
@@ -211,8 +219,49 @@ while obj.db.callAmount < obj.opt.maxCalls
 				'ClassNames', [false, true] ));
 		end
 		
-		if obj.opt.reuseKernel
-			try
+		% Refit the hyperparameters every GSrefitInterval updates, in
+		% between add the new calls to the factorized models
+		nModelUpdates = nModelUpdates + 1;
+		tempRefit = true;
+		if mod(nModelUpdates, obj.opt.GSrefitInterval) ~= 0
+			tempRefit = ~MOSAO.update_gp_surrogates(obj.model, obj.db.x, tempYTransform(obj.db.y, obj.db.valid));
+		end
+		
+		if tempRefit
+			if obj.opt.reuseKernel
+				try
+					obj.initModel = fitrgp( ...
+						obj.db.x, ...
+						tempYTransform(obj.db.y, obj.db.valid), ...
+						'Standardize', true, ...
+						'FitMethod', 'exact', ...
+						'PredictMethod', 'exact', ...
+						'BasisFunction', obj.opt.GSbasis, ...
+						'KernelFunction', obj.opt.GSkernel, ...
+						'Sigma', tempNoiseSigma, ...
+						'ConstantSigma', obj.opt.constantNoiseSigma, ... 
+						'KernelParameters', obj.initModel.KernelInformation.KernelParameters );
+				catch tempME
+					switch tempME.identifier
+						% If unable to find theta, try again with no theta0 set
+						case 'stats:classreg:learning:impl:GPImpl:GPImpl:UnableToComputeLFactorExact'
+							warning('MOSAO:DefaultingTheta0', ...
+								'Unable to compute theta (kernel) given specified theta0 at j=%d.\nDefaulting to unspecified theta0.', j);
+							obj.initModel = fitrgp( ...
+								obj.db.x, ...
+								tempYTransform(obj.db.y, obj.db.valid), ...
+								'Standardize', true, ...
+								'FitMethod', 'exact', ...
+								'PredictMethod', 'exact', ...
+								'BasisFunction', obj.opt.GSbasis, ...
+								'KernelFunction', obj.opt.GSkernel, ...
+								'Sigma', tempNoiseSigma, ...
+								'ConstantSigma', obj.opt.constantNoiseSigma );
+						otherwise
+							rethrow(tempME);
+					end
+				end
+			else
 				obj.initModel = fitrgp( ...
 					obj.db.x, ...
 					tempYTransform(obj.db.y, obj.db.valid), ...
@@ -222,49 +271,21 @@ while obj.db.callAmount < obj.opt.maxCalls
 					'BasisFunction', obj.opt.GSbasis, ...
 					'KernelFunction', obj.opt.GSkernel, ...
 					'Sigma', tempNoiseSigma, ...
-					'ConstantSigma', obj.opt.constantNoiseSigma, ... 
-					'KernelParameters', obj.initModel.KernelInformation.KernelParameters );
-			catch tempME
-				switch tempME.identifier
-					% If unable to find theta, try again with no theta0 set
-					case 'stats:classreg:learning:impl:GPImpl:GPImpl:UnableToComputeLFactorExact'
-						warning('MOSAO:DefaultingTheta0', ...
-							'Unable to compute theta (kernel) given specified theta0 at j=%d.\nDefaulting to unspecified theta0.', j);
-						obj.initModel = fitrgp( ...
-							obj.db.x, ...
-							tempYTransform(obj.db.y, obj.db.valid), ...
-							'Standardize', true, ...
-							'FitMethod', 'exact', ...
-							'PredictMethod', 'exact', ...
-							'BasisFunction', obj.opt.GSbasis, ...
-							'KernelFunction', obj.opt.GSkernel, ...
-							'Sigma', tempNoiseSigma, ...
-							'ConstantSigma', obj.opt.constantNoiseSigma );
-					otherwise
-						rethrow(tempME);
-				end
+					'ConstantSigma', obj.opt.constantNoiseSigma );
 			end
-		else
-			obj.initModel = fitrgp( ...
-				obj.db.x, ...
-				tempYTransform(obj.db.y, obj.db.valid), ...
-				'Standardize', true, ...
-				'FitMethod', 'exact', ...
-				'PredictMethod', 'exact', ...
-				'BasisFunction', obj.opt.GSbasis, ...
-				'KernelFunction', obj.opt.GSkernel, ...
-				'Sigma', tempNoiseSigma, ...
-				'ConstantSigma', obj.opt.constantNoiseSigma );
-		end
 		
-		% Update model(s) for acquisition functions
-		switch obj.opt.AcqMarginalization
-			case 'none'
-				obj.model = obj.initModel;
-			case 'sliceSample'
-				obj.model = MOSAO.slice_sample_models(obj.initModel, obj.opt.AcqSamples, obj.opt.AcqNBurnin, obj.opt.AcqNThin);
-			otherwise
-				error('MOSAO:UnrecognizedAcqusitionSamplingType', 'Unrecognized MOSAO.opt.AcqMarginalization');
+			% Update model(s) for acquisition functions
+			switch obj.opt.AcqMarginalization
+				case 'none'
+					obj.model = obj.initModel;
+				case 'sliceSample'
+					obj.model = MOSAO.slice_sample_models(obj.initModel, obj.opt.AcqSamples, obj.opt.AcqNBurnin, obj.opt.AcqNThin, obj.opt.BayesParallelMS);
+				otherwise
+					error('MOSAO:UnrecognizedAcqusitionSamplingType', 'Unrecognized MOSAO.opt.AcqMarginalization');
+			end
+			if obj.opt.GSrefitInterval > 1
+				obj.model = MOSAO.to_gp_surrogates(obj.model);
+			end
 		end
 	end
 	
@@ -277,9 +298,17 @@ while obj.db.callAmount < obj.opt.maxCalls
 	runningCallAmountList = [runningCallAmountList; obj.db.callAmount];
 	timeGenList = [timeGenList; toc(timeGenTic)];
 	obj.iter(j).completeBool = true;
+	if ~isempty(obj.db.store)
+		obj.db.store.append_iteration(j, obj.iter(j));
+	end
 	j = j+1;
 end
 
+% Collect the calls still running
+while obj.db.nPendingSets > 0
+	obj.db = obj.db.collect_calls(true);
+end
+
 % Organize output values, appending values if they already exist
 obj = obj.organize_run_outputs(runningCallAmountList, timeGenList);
 
@@ -90,6 +90,9 @@ else % Single-objective
 end
 
 obj.iter(j).completeBool = true;
+if ~isempty(obj.db.store)
+	obj.db.store.append_iteration(j, obj.iter(j));
+end
 
 % Organize output values, appending values if they already exist
 obj = obj.organize_run_outputs(obj.db.callAmount, toc(timeGenTic));
@@ -96,6 +96,9 @@ obj.model = fitrgp( ...
 	'KernelFunction', obj.opt.GSkernel, ...
 	'Sigma', tempNoiseSigma, ...
 	'ConstantSigma', obj.opt.constantNoiseSigma	);
+if obj.opt.GSrefitInterval > 1
+	obj.model = MOSAO.to_gp_surrogates(obj.model);
+end
 
 % Show messages
 if obj.opt.showMessages
@@ -103,6 +106,7 @@ if obj.opt.showMessages
 end
 
 lastCallAmount = 0;
+nModelUpdates = 0;
 timeGenList = [];
 runningCallAmountList = [];
 
@@ -213,8 +217,49 @@ while obj.db.callAmount < obj.opt.maxCalls
 				'ClassNames', [false, true] ));
 		end
 		
-		if obj.opt.reuseKernel
-			try
+		% Refit the hyperparameters every GSrefitInterval updates, in
+		% between add the new calls to the factorized model
+		nModelUpdates = nModelUpdates + 1;
+		tempRefit = true;
+		if mod(nModelUpdates, obj.opt.GSrefitInterval) ~= 0
+			tempRefit = ~MOSAO.update_gp_surrogates(obj.model, obj.db.x, tempYTransform(obj.db.y, obj.db.valid));
+		end
+		
+		if tempRefit
+			if obj.opt.reuseKernel
+				try
+					obj.model = fitrgp( ...
+						obj.db.x, ...
+						tempYTransform(obj.db.y, obj.db.valid), ...
+						'Standardize', true, ...
+						'FitMethod', 'exact', ...
+						'PredictMethod', 'exact', ...
+						'BasisFunction', obj.opt.GSbasis, ...
+						'KernelFunction', obj.opt.GSkernel, ...
+						'Sigma', tempNoiseSigma, ...
+						'ConstantSigma', obj.opt.constantNoiseSigma, ... 
+						'KernelParameters', obj.model.KernelInformation.KernelParameters );
+				catch tempME
+					switch tempME.identifier
+						% If unable to find theta, try again with no theta0 set
+						case 'stats:classreg:learning:impl:GPImpl:GPImpl:UnableToComputeLFactorExact'
+							warning('MOSAO:DefaultingTheta0', ...
+								'Unable to compute theta (kernel) given specified theta0 at j=%d.\nDefaulting to unspecified theta0.', j);
+							obj.model = fitrgp( ...
+								obj.db.x, ...
+								tempYTransform(obj.db.y, obj.db.valid), ...
+								'Standardize', true, ...
+								'FitMethod', 'exact', ...
+								'PredictMethod', 'exact', ...
+								'BasisFunction', obj.opt.GSbasis, ...
+								'KernelFunction', obj.opt.GSkernel, ...
+								'Sigma', tempNoiseSigma, ...
+								'ConstantSigma', obj.opt.constantNoiseSigma );
+						otherwise
+							rethrow(tempME);
+					end
+				end
+			else
 				obj.model = fitrgp( ...
 					obj.db.x, ...
 					tempYTransform(obj.db.y, obj.db.valid), ...
@@ -224,39 +269,11 @@ while obj.db.callAmount < obj.opt.maxCalls
 					'BasisFunction', obj.opt.GSbasis, ...
 					'KernelFunction', obj.opt.GSkernel, ...
 					'Sigma', tempNoiseSigma, ...
-					'ConstantSigma', obj.opt.constantNoiseSigma, ... 
-					'KernelParameters', obj.model.KernelInformation.KernelParameters );
-			catch tempME
-				switch tempME.identifier
-					% If unable to find theta, try again with no theta0 set
-					case 'stats:classreg:learning:impl:GPImpl:GPImpl:UnableToComputeLFactorExact'
-						warning('MOSAO:DefaultingTheta0', ...
-							'Unable to compute theta (kernel) given specified theta0 at j=%d.\nDefaulting to unspecified theta0.', j);
-						obj.model = fitrgp( ...
-							obj.db.x, ...
-							tempYTransform(obj.db.y, obj.db.valid), ...
-							'Standardize', true, ...
-							'FitMethod', 'exact', ...
-							'PredictMethod', 'exact', ...
-							'BasisFunction', obj.opt.GSbasis, ...
-							'KernelFunction', obj.opt.GSkernel, ...
-							'Sigma', tempNoiseSigma, ...
-							'ConstantSigma', obj.opt.constantNoiseSigma );
-					otherwise
-						rethrow(tempME);
-				end
+					'ConstantSigma', obj.opt.constantNoiseSigma );
+			end
+			if obj.opt.GSrefitInterval > 1
+				obj.model = MOSAO.to_gp_surrogates(obj.model);
 			end
-		else
-			obj.model = fitrgp( ...
-				obj.db.x, ...
-				tempYTransform(obj.db.y, obj.db.valid), ...
-				'Standardize', true, ...
-				'FitMethod', 'exact', ...
-				'PredictMethod', 'exact', ...
-				'BasisFunction', obj.opt.GSbasis, ...
-				'KernelFunction', obj.opt.GSkernel, ...
-				'Sigma', tempNoiseSigma, ...
-				'ConstantSigma', obj.opt.constantNoiseSigma );
 		end
 	end
 	
@@ -272,6 +289,9 @@ while obj.db.callAmount < obj.opt.maxCalls
 	runningCallAmountList = [runningCallAmountList; obj.db.callAmount];
 	timeGenList = [timeGenList; toc(timeGenTic)];
 	obj.iter(j).completeBool = true;
+	if ~isempty(obj.db.store)
+		obj.db.store.append_iteration(j, obj.iter(j));
+	end
 	j = j+1;
 end
 
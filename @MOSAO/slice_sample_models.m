@@ -1,5 +1,28 @@
-function [modelArray] = slice_sample_models(initModel, nSamples, nBurnin, nThin)
-%SLICE_SAMPLE_MODELS
+function [modelArray] = slice_sample_models(initModel, nSamples, nBurnin, nThin, useParallel, nChains)
+%SLICE_SAMPLE_MODELS Samples GP models by slice sampling their hyperparameters
+%	INITMODEL	RegressionGP with the training data and the starting
+%				hyperparameters
+%	NSAMPLES	Number of models to sample
+%	NBURNIN		Number of samples discarded at the start of each chain
+%	NTHIN		Keep every NTHIN-th sample after the burn-in
+%	USEPARALLEL	(optional) Factorize the chains' kernel matrices on the
+%				parallel pool, default false
+%	NCHAINS		(optional) Number of chains, default min(NSAMPLES, 4)
+%
+%	If GPsurrogate supports the kernel and basis, the likelihood comes
+%	straight from a distance tensor of the training inputs computed once,
+%	for all chains in one call per step, and the models are GPsurrogate
+%	objects sharing one copy of the training data. Otherwise a single
+%	chain is run with slicesample, fitting a RegressionGP at each step.
+%
+%	Part of the MOSAO class.
+
+if nargin < 6
+	nChains = min(nSamples, 4);
+	if nargin < 5
+		useParallel = false;
+	end
+end
 
 % Initialize based on initial model
 theta0 = [ ...
@@ -16,6 +39,39 @@ iKernel = lenBeta + 1 + (1:lenKernel);
 xS = initModel.X;
 yS = initModel.Y;
 
+if GPsurrogate.is_supported(initModel.KernelFunction, initModel.BasisFunction)
+	% Training data and standardization used by fitrgp
+	used = ~isnan(yS);
+	xS = xS(used,:);
+	yS = yS(used);
+	tempMu = mean(xS, 1);
+	tempScale = std(xS, 0, 1);
+	tempScale(tempScale == 0) = 1;
+	D2 = GPsurrogate.distance_tensor(xS, xS, tempMu, tempScale);
+	
+	nWorkers = 0;
+	if useParallel
+		nWorkers = Inf;
+	end
+	
+	thetaList = slice_sample_chains( ...
+		@(t) gplogPDFbatch(t, D2, yS, iBeta, iSigma, iKernel, initModel.BasisFunction, initModel.KernelFunction, nWorkers), ...
+		theta0, nSamples, nBurnin, nThin, nChains );
+	
+	modelArray = cell(nSamples, 1);
+	for i = 1:nSamples
+		modelArray{i} = GPsurrogate( ...
+			xS, ...
+			yS, ...
+			initModel.KernelFunction, ...
+			thetaList(i, iKernel), ...
+			initModel.BasisFunction, ...
+			thetaList(i, iBeta), ...
+			thetaList(i, iSigma) );
+	end
+	return
+end
+
 % Do slice sampling to obtain hyperparameter samples
 thetaList = slicesample( ...
 	theta0, ...
@@ -80,3 +136,75 @@ end
 logpdf = logpdfPRIOR + logpdfMODEL;
 
 end
+
+function [thetaList] = slice_sample_chains(logpdfBatch, theta0, nSamples, nBurnin, nThin, nChains)
+% Hyperrectangle slice sampling (Neal, 2003) of several chains in
+% lockstep. All chains start at THETA0, the log densities of the chains'
+% proposals are found in one call of LOGPDFBATCH (one row per chain).
+% Uses the slicesample default width of 10 for every parameter.
+
+width = 10;
+maxShrink = 200;
+nTheta = numel(theta0);
+
+X = repmat(theta0, nChains, 1);
+logP = logpdfBatch(X);
+nPerChain = ceil(nSamples/nChains);
+thetaList = zeros(nPerChain*nChains, nTheta);
+
+for step = 1:(nBurnin + nPerChain*nThin)
+	% Slice height and hyperrectangle placed randomly around each point
+	logY = logP + log(rand(nChains, 1));
+	lowerX = X - width*rand(nChains, nTheta);
+	upperX = lowerX + width;
+	
+	% Sample uniformly within the hyperrectangles, shrinking them towards
+	% the current points until every chain has a point above its slice
+	active = true(nChains, 1);
+	for iShrink = 1:maxShrink
+		ia = find(active);
+		Xp = lowerX(ia,:) + rand(length(ia), nTheta).*(upperX(ia,:) - lowerX(ia,:));
+		logPp = logpdfBatch(Xp);
+		
+		accept = logPp > logY(ia);
+		X(ia(accept),:) = Xp(accept,:);
+		logP(ia(accept)) = logPp(accept);
+		active(ia(accept)) = false;
+		if ~any(active)
+			break
+		end
+		
+		ir = ia(~accept);
+		Xr = Xp(~accept,:);
+		below = Xr < X(ir,:);
+		tempLower = lowerX(ir,:);
+		tempLower(below) = Xr(below);
+		lowerX(ir,:) = tempLower;
+		tempUpper = upperX(ir,:);
+		tempUpper(~below) = Xr(~below);
+		upperX(ir,:) = tempUpper;
+	end
+	
+	% Keep every nThin-th state after the burn-in
+	if step > nBurnin && mod(step - nBurnin, nThin) == 0
+		row = (step - nBurnin)/nThin;
+		thetaList((row - 1)*nChains + (1:nChains),:) = X;
+	end
+end
+
+thetaList = thetaList(1:nSamples,:);
+
+end
+
+function [logpdf] = gplogPDFbatch(theta, D2, y, indBeta, indSigma, indKernel, basisFunc, kernelFunc, nWorkers)
+% GPLOGPDFBATCH Log density of each row of theta, with the priors of
+% gplogPDF and the likelihood from GPsurrogate.log_likelihood
+
+logpdf = -Inf(size(theta, 1), 1);
+priorBool = all(theta(:,indSigma) > 0.001, 2) & all(theta(:,indKernel) > 0, 2);
+if any(priorBool)
+	logpdf(priorBool) = GPsurrogate.log_likelihood(D2, y, kernelFunc, basisFunc, ...
+		theta(priorBool,indKernel), theta(priorBool,indBeta), theta(priorBool,indSigma), nWorkers);
+end
+
+end
@@ -0,0 +1,19 @@
+function [models] = to_gp_surrogates(models)
+%TO_GP_SURROGATES Replaces RegressionGP model(s) with GPsurrogate copies
+%	MODELS	A RegressionGP or a cell array of them. Models with a kernel or
+%			basis that GPsurrogate does not support are left as they are.
+%
+%	The copies keep the hyperparameters of the fit, and can have calls
+%	added with update_gp_surrogates instead of being refit.
+%
+%	Part of the MOSAO class.
+
+if iscell(models)
+	for k = 1:numel(models)
+		models{k} = MOSAO.to_gp_surrogates(models{k});
+	end
+elseif isa(models, 'RegressionGP') && GPsurrogate.is_supported(models.KernelFunction, models.BasisFunction)
+	models = GPsurrogate.from_fitrgp(models);
+end
+
+end
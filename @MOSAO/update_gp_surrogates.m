@@ -0,0 +1,23 @@
+function [updatedBool] = update_gp_surrogates(models, X, Y)
+%UPDATE_GP_SURROGATES Sets the training data of GPsurrogate model(s)
+%	MODELS	A GPsurrogate or a cell array of them (updated in place)
+%	X, Y	All training data. Rows appended since the last update are
+%			added to each model's Cholesky factor.
+%
+%	Returns false, changing nothing, if any model is not a GPsurrogate
+%	(it must be refit instead).
+%
+%	Part of the MOSAO class.
+
+if ~iscell(models)
+	models = {models};
+end
+
+updatedBool = all(cellfun(@(m) isa(m, 'GPsurrogate'), models(:)));
+if updatedBool
+	for k = 1:numel(models)
+		models{k}.update(X, Y);
+	end
+end
+
+end
@@ -46,14 +46,23 @@ defaultOptions.LSrbf =				'linear';
 defaultOptions.LSbasis =			'constant';
 defaultOptions.LSuseValidOnly =		false;
 defaultOptions.reuseKernel =		true;
+defaultOptions.GSrefitInterval =	1;
 defaultOptions.GSinvalidTransform =	'none';
 defaultOptions.GSuseClassifier =	false;
 defaultOptions.showMessages =		false;
+defaultOptions.storePath =			'';
 
 defaultOptions.BayesAcqFunc =		'PoI';
 defaultOptions.BayesNstarts =		100;
 defaultOptions.BayesNcandidates =	1;
 defaultOptions.BayesParallelMS =	false;
+defaultOptions.BayesAcqOptimizer =	'multistart';
+defaultOptions.BayesNpool =			10000;
+defaultOptions.BayesNpolish =		10;
+defaultOptions.BayesBatchMethod =	'none';
+defaultOptions.BayesNfantasies =	16;
+defaultOptions.BayesAsync =			false;
+defaultOptions.BayesNpending =		2;
 
 defaultOptions.BayesMOAcqFunc =		'PoPI';
 defaultOptions.hypervolumeRef =		[];
@@ -134,18 +143,63 @@ if ~ischar(options.LSbasis) || ~any(strcmp(options.LSbasis, {'none', 'constant',
 	options.LSbasis = defaultOptions.LSbasis;
 	validBool = false;
 end
+if ~isnumeric(options.GSrefitInterval) || ~isscalar(options.GSrefitInterval) || ...
+		options.GSrefitInterval < 1 || mod(options.GSrefitInterval, 1) ~= 0
+	warning('MOSAO:MiscOptionsInvalid', 'GSrefitInterval not a positive integer: set to default');
+	options.GSrefitInterval = defaultOptions.GSrefitInterval;
+	validBool = false;
+end
 if ~ischar(options.GSinvalidTransform) || ~any(strcmp(options.GSinvalidTransform, {'none', 'mean', 'worst', 'remove'}))
 	warning('MOSAO:MiscOptionsInvalid', 'GSinvalidTransform not valid: set to default');
 	options.GSinvalidTransform = defaultOptions.GSinvalidTransform;
 	validBool = false;
 end
 
+if ~ischar(options.storePath)
+	warning('MOSAO:MiscOptionsInvalid', 'storePath must be a folder path: set to default');
+	options.storePath = defaultOptions.storePath;
+	validBool = false;
+end
+
 if ~ischar(options.BayesAcqFunc) || ~any(strcmp(options.BayesAcqFunc, {'fitness', 'PoI', 'EI'}))
 	warning('MOSAO:MiscOptionsInvalid', 'BayesAcqFunc not valid: set to default');
 	options.BayesAcqFunc = defaultOptions.BayesAcqFunc;
 	validBool = false;
 end
 
+if ~ischar(options.BayesAcqOptimizer) || ~any(strcmp(options.BayesAcqOptimizer, {'multistart', 'pool'}))
+	warning('MOSAO:MiscOptionsInvalid', 'BayesAcqOptimizer not valid: set to default');
+	options.BayesAcqOptimizer = defaultOptions.BayesAcqOptimizer;
+	validBool = false;
+end
+if options.BayesNpool < 1 || options.BayesNpolish < 1
+	warning('MOSAO:MiscOptionsInvalid', 'BayesNpool and BayesNpolish must be at least 1: set to default');
+	options.BayesNpool = defaultOptions.BayesNpool;
+	options.BayesNpolish = defaultOptions.BayesNpolish;
+	validBool = false;
+end
+
+if ~ischar(options.BayesBatchMethod) || ~any(strcmp(options.BayesBatchMethod, {'none', 'believer', 'liar', 'penalize', 'qEHVI'}))
+	warning('MOSAO:MiscOptionsInvalid', 'BayesBatchMethod not valid: set to default');
+	options.BayesBatchMethod = defaultOptions.BayesBatchMethod;
+	validBool = false;
+end
+if options.BayesNfantasies < 1
+	warning('MOSAO:MiscOptionsInvalid', 'BayesNfantasies must be at least 1: set to default');
+	options.BayesNfantasies = defaultOptions.BayesNfantasies;
+	validBool = false;
+end
+if options.BayesAsync && strcmp(options.BayesBatchMethod, 'none')
+	warning('MOSAO:MiscOptionsInvalid', 'BayesAsync needs a BayesBatchMethod to condition on pending calls: set to ''believer''');
+	options.BayesBatchMethod = 'believer';
+	validBool = false;
+end
+if options.BayesNpending < 1
+	warning('MOSAO:MiscOptionsInvalid', 'BayesNpending must be at least 1: set to default');
+	options.BayesNpending = defaultOptions.BayesNpending;
+	validBool = false;
+end
+
 if ~ischar(options.BayesMOAcqFunc) || ~any(strcmp(options.BayesMOAcqFunc, {'HVIncreaseMean', 'HVIncreaseLCB', 'PoPI', 'EHVI'}))
 	warning('MOSAO:MiscOptionsInvalid', 'BayesMOAcqFunc not valid: set to default');
 	options.BayesMOAcqFunc = defaultOptions.BayesMOAcqFunc;
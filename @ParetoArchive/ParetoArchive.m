@@ -0,0 +1,79 @@
+classdef ParetoArchive < handle
+	%PARETOARCHIVE Incrementally updated set of non-dominated points
+	%   Keeps the pareto front of the points inserted so far, and its
+	%	hypervolume, without rescanning earlier points. For 2 objectives
+	%	the front is kept sorted by the first objective. For any other
+	%	number of objectives it is kept in an ND-tree (Jaszkiewicz & Lust,
+	%	2018): each node bounds its points by an ideal and nadir point, so
+	%	that whole subtrees can be skipped, rejected or removed, and the
+	%	hypervolume is recomputed when next needed after the front changed.
+	%
+	%	Points are minimized. A point that is weakly dominated by the
+	%	front (including a copy of a front point) does not enter it, as in
+	%	MOSAO.pareto_front.
+
+	properties (SetAccess = private, GetAccess = public)
+		nObjectives	% Number of objectives
+		Yref		% Reference point of the hypervolume
+		count		% Number of points on the front
+	end
+	properties (SetAccess = private, GetAccess = private)
+		fixedRef	% If false, Yref is the worst extent of the points
+		worstY		% Worst (highest) extent of all inserted points
+		volume		% Cached hypervolume of the front
+		volumeStale	% Indicates volume must be recomputed
+		lastId		% Highest id inserted
+
+		P			% Front points (2 objectives: sorted by objective 1)
+		Pids		% Ids of the front points
+		frontStale	% Indicates P and Pids must be gathered from the tree
+
+		maxLeafSize	% Points in a leaf of the ND-tree before it is split
+		nodeIdeal	% Lower bound of the points in each node (row-wise)
+		nodeNadir	% Upper bound of the points in each node (row-wise)
+		nodeChildren % Child nodes of each node, empty for leaves
+		nodeY		% Points in each leaf
+		nodeIds		% Ids of the points in each leaf
+		nodeFree	% Indicates unused node slots
+	end
+	methods
+		function obj = ParetoArchive(nObjectives, Yref, maxLeafSize)
+		%PARETOARCHIVE Class constructor for ParetoArchive
+		%	NOBJECTIVES	Number of objectives
+		%	YREF		(optional) Reference point for the hypervolume. If
+		%				empty or not given the worst (highest) extent of
+		%				the inserted points is used.
+		%	MAXLEAFSIZE	(optional) Leaf size of the ND-tree, default 20
+
+			if nargin < 3
+				maxLeafSize = 20;
+				if nargin < 2
+					Yref = [];
+				end
+			end
+
+			obj.nObjectives = nObjectives;
+			obj.maxLeafSize = maxLeafSize;
+			obj.lastId = 0;
+			obj.reset_front();
+			obj.set_reference(Yref);
+		end
+
+		% Public methods
+		[entered, displaced] = insert(obj, y, ids);
+		[P, ids] = get_front(obj);
+		[P, Yref, volume, Pind] = front_hypervolume(obj);
+		[] = set_reference(obj, Yref);
+		[] = rebuild(obj, Y, ids);
+		[rebuildBool] = remove(obj, ids, Yremoved);
+	end
+	methods (Access = private)
+		[] = reset_front(obj);
+		[enteredBool, displacedIds] = insert_sorted(obj, y, id);
+		[dominatedBool, removedIds] = nd_update(obj, node, y);
+		[] = nd_add(obj, y, id);
+		[] = nd_split(obj, node);
+		[node] = nd_new_node(obj);
+		[ids] = nd_free(obj, node);
+	end
+end
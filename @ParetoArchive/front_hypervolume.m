@@ -0,0 +1,18 @@
+function [P, Yref, volume, Pind] = front_hypervolume(obj)
+%FRONT_HYPERVOLUME Returns the front with its reference point and hypervolume
+%	Same outputs as MOSAO.pareto_front_hypervolume of the inserted points,
+%	with PIND the ids of the front points. The hypervolume is only
+%	recomputed if the reference point changed since it was last found.
+%
+%	Part of the ParetoArchive class.
+
+[P, Pind] = obj.get_front();
+Yref = obj.Yref;
+
+if obj.volumeStale
+	obj.volume = MOSAO.get_hypervolume(P, Yref);
+	obj.volumeStale = false;
+end
+volume = obj.volume;
+
+end
@@ -0,0 +1,18 @@
+function [P, ids] = get_front(obj)
+%GET_FRONT Returns the front points (row-wise) and their ids
+%	For 2 objectives the points are sorted by objective 1.
+%
+%	Part of the ParetoArchive class.
+
+if obj.frontStale
+	% Gather the points in the leaves of the ND-tree
+	leaves = find(~obj.nodeFree & cellfun(@isempty, obj.nodeChildren));
+	obj.P = vertcat(zeros(0, obj.nObjectives), obj.nodeY{leaves});
+	obj.Pids = vertcat(zeros(0, 1), obj.nodeIds{leaves});
+	obj.frontStale = false;
+end
+
+P = obj.P;
+ids = obj.Pids;
+
+end
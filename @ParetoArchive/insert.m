@@ -0,0 +1,71 @@
+function [entered, displaced] = insert(obj, y, ids)
+%INSERT Adds point(s) to the archive, keeping the front non-dominated
+%	Y	Point(s), row-wise, inserted in order.
+%	IDS	(optional) Id of each point, returned with the front (e.g. its
+%		index in a Database). Defaults to counting up from the highest id
+%		inserted so far.
+%
+%	ENTERED		Indicates each point that was not weakly dominated by
+%				the front when it was inserted
+%	DISPLACED	Ids of the front points removed because a new point
+%				dominated them (can include points of this same call)
+%
+%	For 2 objectives the cached hypervolume is updated with the gain of
+%	each point, using only the front points next to it. For any other
+%	number of objectives the gain would need the whole front, so the
+%	hypervolume is only marked stale and recomputed once, when next
+%	needed (front_hypervolume).
+%
+%	Part of the ParetoArchive class.
+
+nY = size(y, 1);
+if nargin < 3
+	ids = obj.lastId + (1:nY)';
+end
+
+% Check inputs for size
+if (size(y, 2) ~= obj.nObjectives) && (nY > 0)
+	error('ParetoArchive:InvalidInputs', 'y must have nObjectives (%d) columns', obj.nObjectives);
+end
+if numel(ids) ~= nY
+	error('ParetoArchive:InvalidInputs', 'ids must have one value for each row of y');
+end
+
+entered = false(nY, 1);
+displaced = zeros(0, 1);
+for k = 1:nY
+	ky = y(k,:);
+
+	% Track the worst extent, the reference point if none was given
+	obj.worstY = max(obj.worstY, ky);
+	if ~obj.fixedRef && any(ky > obj.Yref)
+		obj.Yref = obj.worstY;
+		obj.volumeStale = true;
+	end
+
+	if obj.nObjectives == 2
+		[entered(k), kDisplaced] = obj.insert_sorted(ky, ids(k));
+	else
+		if obj.count > 0
+			[isDominated, kDisplaced] = obj.nd_update(1, ky);
+		else
+			isDominated = false;
+			kDisplaced = zeros(0, 1);
+		end
+		entered(k) = ~isDominated;
+		if entered(k)
+			obj.nd_add(ky, ids(k));
+		end
+		obj.frontStale = obj.frontStale || entered(k);
+		obj.volumeStale = obj.volumeStale || entered(k);
+	end
+
+	obj.count = obj.count + entered(k) - length(kDisplaced);
+	displaced = [displaced; kDisplaced(:)];
+end
+
+if nY > 0
+	obj.lastId = max(obj.lastId, max(ids));
+end
+
+end
@@ -0,0 +1,68 @@
+function [enteredBool, displacedIds] = insert_sorted(obj, y, id)
+%INSERT_SORTED Inserts a point into the sorted 2 objective front
+%	The front is sorted by objective 1, so objective 2 decreases along it.
+%	Binary searches find where y goes and the run of points it dominates.
+%
+%	Part of the ParetoArchive class. Private method.
+
+displacedIds = zeros(0, 1);
+n = size(obj.P, 1);
+
+% Last point at or left of y, it weakly dominates y if not above it
+nLeft = count_ascending(obj.P(:,1), y(1));
+if (nLeft > 0) && (obj.P(nLeft,2) <= y(2))
+	enteredBool = false;
+	return
+end
+enteredBool = true;
+
+% Points first:last are not left of y and not below it: y dominates them
+first = nLeft + 1;
+if (nLeft > 0) && (obj.P(nLeft,1) == y(1))
+	first = nLeft;
+end
+last = count_descending(obj.P(:,2), y(2));
+
+% Hypervolume gain, only the neighbours of y (and the points it
+% dominates) limit the region y adds
+if ~obj.volumeStale
+	local = obj.P(max(first-1, 1):min(last+1, n),:);
+	obj.volume = obj.volume + ...
+		MOSAO.get_hypervolume([local; y], obj.Yref) - MOSAO.get_hypervolume(local, obj.Yref);
+end
+
+displacedIds = obj.Pids(first:last);
+obj.P = [obj.P(1:first-1,:); y; obj.P(last+1:n,:)];
+obj.Pids = [obj.Pids(1:first-1); id; obj.Pids(last+1:n)];
+
+end
+
+function [k] = count_ascending(v, value)
+% Number of entries of ascending v that are <= value
+lo = 0;
+hi = length(v);
+while lo < hi
+	mid = ceil((lo + hi)/2);
+	if v(mid) <= value
+		lo = mid;
+	else
+		hi = mid - 1;
+	end
+end
+k = lo;
+end
+
+function [k] = count_descending(v, value)
+% Number of entries of descending v that are >= value
+lo = 0;
+hi = length(v);
+while lo < hi
+	mid = ceil((lo + hi)/2);
+	if v(mid) >= value
+		lo = mid;
+	else
+		hi = mid - 1;
+	end
+end
+k = lo;
+end
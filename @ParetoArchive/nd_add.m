@@ -0,0 +1,29 @@
+function [] = nd_add(obj, y, id)
+%ND_ADD Adds a non-dominated point to the ND-tree
+%	Descends from the root to the child with the closest midpoint
+%	(between its ideal and nadir points), widening the bounds on the way.
+%	The leaf is split once it has more than maxLeafSize points.
+%
+%	Part of the ParetoArchive class. Private method.
+
+node = 1;
+while true
+	obj.nodeIdeal(node,:) = min(obj.nodeIdeal(node,:), y);
+	obj.nodeNadir(node,:) = max(obj.nodeNadir(node,:), y);
+
+	children = obj.nodeChildren{node};
+	if isempty(children)
+		break
+	end
+	tempMid = (obj.nodeIdeal(children,:) + obj.nodeNadir(children,:))/2;
+	[~, iClosest] = min(sum((tempMid - y).^2, 2));
+	node = children(iClosest);
+end
+
+obj.nodeY{node} = [obj.nodeY{node}; y];
+obj.nodeIds{node} = [obj.nodeIds{node}; id];
+if size(obj.nodeY{node}, 1) > obj.maxLeafSize
+	obj.nd_split(node);
+end
+
+end
@@ -0,0 +1,25 @@
+function [ids] = nd_free(obj, node)
+%ND_FREE Empties node(s) of the ND-tree, returning the ids they held
+%	The nodes below are freed. The emptied node itself stays in use as an
+%	empty leaf, its parent frees it (the root stays).
+%
+%	Part of the ParetoArchive class. Private method.
+
+ids = zeros(0, 1);
+d = obj.nObjectives;
+for n = node(:)'
+	for c = obj.nodeChildren{n}
+		ids = [ids; obj.nd_free(c)];
+		obj.nodeFree(c) = true;
+	end
+	ids = [ids; obj.nodeIds{n}];
+
+	% Leave n as an empty leaf
+	obj.nodeIdeal(n,:) = Inf(1, d);
+	obj.nodeNadir(n,:) = -Inf(1, d);
+	obj.nodeChildren{n} = zeros(1, 0);
+	obj.nodeY{n} = zeros(0, d);
+	obj.nodeIds{n} = zeros(0, 1);
+end
+
+end
@@ -0,0 +1,19 @@
+function [node] = nd_new_node(obj)
+%ND_NEW_NODE Returns an empty leaf, reusing a freed node if there is one
+%
+%	Part of the ParetoArchive class. Private method.
+
+node = find(obj.nodeFree, 1);
+if isempty(node)
+	node = length(obj.nodeFree) + 1;
+end
+
+d = obj.nObjectives;
+obj.nodeIdeal(node,:) = Inf(1, d);
+obj.nodeNadir(node,:) = -Inf(1, d);
+obj.nodeChildren{node,1} = zeros(1, 0);
+obj.nodeY{node,1} = zeros(0, d);
+obj.nodeIds{node,1} = zeros(0, 1);
+obj.nodeFree(node,1) = false;
+
+end
@@ -0,0 +1,51 @@
+function [] = nd_split(obj, node)
+%ND_SPLIT Splits a full leaf of the ND-tree into nObjectives+1 children
+%	The first seed is the point with the highest mean distance to the
+%	others, each next seed the one with the highest mean distance to the
+%	seeds so far. The other points go to the child with the closest
+%	midpoint.
+%
+%	Part of the ParetoArchive class. Private method.
+
+tempY = obj.nodeY{node};
+tempIds = obj.nodeIds{node};
+n = size(tempY, 1);
+nChildren = min(obj.nObjectives + 1, n);
+
+% Squared distances between the points
+tempD = sum((permute(tempY, [1 3 2]) - permute(tempY, [3 1 2])).^2, 3);
+
+seeds = zeros(1, nChildren);
+[~, seeds(1)] = max(mean(tempD, 2));
+for k = 2:nChildren
+	tempMeanD = mean(tempD(:,seeds(1:k-1)), 2);
+	tempMeanD(seeds(1:k-1)) = -Inf;
+	[~, seeds(k)] = max(tempMeanD);
+end
+
+children = zeros(1, nChildren);
+for k = 1:nChildren
+	children(k) = obj.nd_new_node();
+	obj.nodeIdeal(children(k),:) = tempY(seeds(k),:);
+	obj.nodeNadir(children(k),:) = tempY(seeds(k),:);
+	obj.nodeY{children(k)} = tempY(seeds(k),:);
+	obj.nodeIds{children(k)} = tempIds(seeds(k));
+end
+
+tempRest = true(n, 1);
+tempRest(seeds) = false;
+for i = find(tempRest)'
+	tempMid = (obj.nodeIdeal(children,:) + obj.nodeNadir(children,:))/2;
+	[~, iClosest] = min(sum((tempMid - tempY(i,:)).^2, 2));
+	c = children(iClosest);
+	obj.nodeIdeal(c,:) = min(obj.nodeIdeal(c,:), tempY(i,:));
+	obj.nodeNadir(c,:) = max(obj.nodeNadir(c,:), tempY(i,:));
+	obj.nodeY{c} = [obj.nodeY{c}; tempY(i,:)];
+	obj.nodeIds{c} = [obj.nodeIds{c}; tempIds(i)];
+end
+
+obj.nodeChildren{node} = children;
+obj.nodeY{node} = zeros(0, obj.nObjectives);
+obj.nodeIds{node} = zeros(0, 1);
+
+end
@@ -0,0 +1,64 @@
+function [dominatedBool, removedIds] = nd_update(obj, node, y)
+%ND_UPDATE Checks y against the points in a node of the ND-tree
+%	Returns true if a point in the node weakly dominates y. Otherwise
+%	removes the points y dominates and returns their ids. Children left
+%	empty are freed. The node bounds are only tightened in leaves, looser
+%	bounds are still valid (every point stays between them).
+%
+%	Part of the ParetoArchive class. Private method.
+
+dominatedBool = false;
+removedIds = zeros(0, 1);
+ideal = obj.nodeIdeal(node,:);
+nadir = obj.nodeNadir(node,:);
+
+if all(nadir <= y)
+	% Every point in the node weakly dominates y
+	dominatedBool = true;
+
+elseif all(y <= ideal) && any(y < ideal)
+	% y dominates every point in the node
+	removedIds = obj.nd_free(node);
+
+elseif all(ideal <= y) || all(y <= nadir)
+	% Some points may dominate y or be dominated by it
+	children = obj.nodeChildren{node};
+	if isempty(children)
+		tempY = obj.nodeY{node};
+		if any(all(tempY <= y, 2))
+			dominatedBool = true;
+			return
+		end
+		tempRemove = all(y <= tempY, 2);
+		if any(tempRemove)
+			removedIds = obj.nodeIds{node}(tempRemove);
+			obj.nodeY{node}(tempRemove,:) = [];
+			obj.nodeIds{node}(tempRemove) = [];
+			if ~isempty(obj.nodeY{node})
+				obj.nodeIdeal(node,:) = min(obj.nodeY{node}, [], 1);
+				obj.nodeNadir(node,:) = max(obj.nodeY{node}, [], 1);
+			end
+		end
+	else
+		for c = children
+			[dominatedBool, cRemoved] = obj.nd_update(c, y);
+			removedIds = [removedIds; cRemoved];
+			if dominatedBool
+				break
+			end
+		end
+
+		% Free children left empty
+		tempEmpty = false(size(children));
+		for k = 1:length(children)
+			c = children(k);
+			tempEmpty(k) = isempty(obj.nodeChildren{c}) && isempty(obj.nodeIds{c});
+		end
+		if any(tempEmpty)
+			obj.nodeFree(children(tempEmpty)) = true;
+			obj.nodeChildren{node} = children(~tempEmpty);
+		end
+	end
+end
+
+end
@@ -0,0 +1,27 @@
+function [] = rebuild(obj, Y, ids)
+%REBUILD Replaces the archive contents with the front of Y
+%	Y	Points, row-wise
+%	IDS	(optional) Id of each point, default 1:size(Y, 1)
+%
+%	Points are inserted in order of their sum of objectives (stable, so
+%	of copies the first is kept), which keeps few of them from being
+%	displaced again. The hypervolume is found once, when next needed.
+%
+%	Part of the ParetoArchive class.
+
+if nargin < 3
+	ids = (1:size(Y, 1))';
+end
+
+obj.reset_front();
+obj.lastId = 0;
+if ~obj.fixedRef
+	obj.Yref = obj.worstY;
+end
+obj.volumeStale = true;
+
+[~, order] = sort(sum(Y, 2));
+obj.insert(Y(order,:), ids(order));
+obj.lastId = max([0; ids(:)]);
+
+end
@@ -0,0 +1,37 @@
+function [rebuildBool] = remove(obj, ids, Yremoved)
+%REMOVE Removes ids from the archive, renumbering the ones after them
+%	IDS			Ids to remove. Higher ids are shifted down, as the rows
+%				after rows deleted from a matrix (e.g. Database.remove_call).
+%	YREMOVED	(optional) Points of the removed ids, to check if they set
+%				the reference point (only used if none was given)
+%
+%	Returns true if the archive must be rebuilt from the remaining points:
+%	a removed front point may have been the only one dominating others,
+%	which the archive does not keep, or the worst extent may have shrunk.
+%
+%	Part of the ParetoArchive class.
+
+if nargin < 3
+	Yremoved = [];
+end
+ids = unique(ids(:));
+
+[~, frontIds] = obj.get_front();
+rebuildBool = any(ismember(frontIds, ids));
+if ~obj.fixedRef && ~isempty(Yremoved)
+	rebuildBool = rebuildBool || any(any(Yremoved >= obj.worstY));
+end
+
+% Shift ids down by the number of removed ids below them
+shift = @(kIds) kIds - sum(kIds(:) > ids', 2);
+if obj.nObjectives == 2
+	obj.Pids = shift(obj.Pids);
+else
+	for node = find(~obj.nodeFree & cellfun(@isempty, obj.nodeChildren))'
+		obj.nodeIds{node} = shift(obj.nodeIds{node});
+	end
+	obj.frontStale = true;
+end
+obj.lastId = obj.lastId - sum(ids <= obj.lastId);
+
+end
@@ -0,0 +1,25 @@
+function [] = reset_front(obj)
+%RESET_FRONT Empties the front, keeping the reference point setting
+%
+%	Part of the ParetoArchive class. Private method.
+
+d = obj.nObjectives;
+
+obj.count = 0;
+obj.worstY = -Inf(1, d);
+obj.volume = 0;
+obj.volumeStale = false;
+
+obj.P = zeros(0, d);
+obj.Pids = zeros(0, 1);
+obj.frontStale = false;
+
+% ND-tree with an empty root leaf (node 1)
+obj.nodeIdeal = Inf(1, d);
+obj.nodeNadir = -Inf(1, d);
+obj.nodeChildren = {zeros(1, 0)};
+obj.nodeY = {zeros(0, d)};
+obj.nodeIds = {zeros(0, 1)};
+obj.nodeFree = false;
+
+end
@@ -0,0 +1,18 @@
+function [] = set_reference(obj, Yref)
+%SET_REFERENCE Sets the reference point of the hypervolume
+%	YREF	Reference point. If empty or not of length nObjectives, the
+%			worst (highest) extent of the inserted points is used, as in
+%			MOSAO.pareto_front_hypervolume.
+%
+%	Part of the ParetoArchive class.
+
+if isempty(Yref) || (length(Yref) ~= obj.nObjectives)
+	obj.fixedRef = false;
+	obj.Yref = obj.worstY;
+else
+	obj.fixedRef = true;
+	obj.Yref = reshape(Yref, 1, []);
+end
+obj.volumeStale = true;
+
+end
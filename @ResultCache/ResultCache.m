@@ -0,0 +1,89 @@
+classdef ResultCache < handle
+	%RESULTCACHE Persistent, size-bounded cache of design point results
+	%   Maps a content key (e.g. from WBinstance.result_cache_keys: the
+	%	quantized mutable parameter values of a design point, with the
+	%	parameter names and run type) to the design point's exported data
+	%	row, so that a geometry and operating point simulated in an earlier
+	%	run, or in another copy of the project, is not simulated again.
+	%
+	%	The cache is kept in a MAT file that several runs or projects can
+	%	share: save_cache() merges in the entries other processes saved
+	%	since it was last read. When there are more than maxEntries
+	%	entries, the least recently used ones are evicted. Hits and misses
+	%	of lookup() are counted for get_stats().
+
+	properties (SetAccess = private, GetAccess = public)
+		filePath	% MAT file of the cache (empty for a cache in memory)
+		maxEntries	% Entries kept before evicting the least recently used
+		decimals	% Decimal places parameter values are quantized to
+		count		% Number of entries
+		hits		% Keys found by lookup()
+		misses		% Keys not found by lookup()
+		evictions	% Entries evicted
+	end
+	properties (SetAccess = private, GetAccess = private)
+		keys		% Key of each entry (cell column)
+		rows		% Data row of each entry (cell column)
+		lastUsed	% Use counter value at each entry's last insert or hit
+		useCounter	% Incremented for each insert or lookup
+		keyMap		% Entry index of each key (containers.Map)
+		fileStamp	% [datenum, bytes] of the file when last read or written
+	end
+	methods
+		function obj = ResultCache(filePath, maxEntries, decimals)
+		%RESULTCACHE Class constructor for ResultCache
+		%	FILEPATH	(optional) MAT file of the cache, read if it exists
+		%	MAXENTRIES	(optional) Size bound, default 10000 entries
+		%	DECIMALS	(optional) Decimal places of the keys, default 6 (as
+		%				the '%f' values run_set sends to Workbench)
+
+			if nargin < 3
+				decimals = 6;
+				if nargin < 2
+					maxEntries = 10000;
+					if nargin < 1
+						filePath = '';
+					end
+				end
+			end
+
+			if ~isscalar(maxEntries) || maxEntries < 1
+				error('ResultCache:BadInputs', 'maxEntries must be a positive scalar.');
+			end
+			if ~isscalar(decimals) || decimals < 0 || decimals > 15
+				error('ResultCache:BadInputs', 'decimals must be a scalar from 0 to 15.');
+			end
+
+			obj.filePath = filePath;
+			obj.maxEntries = maxEntries;
+			obj.decimals = round(decimals);
+			obj.hits = 0;
+			obj.misses = 0;
+			obj.evictions = 0;
+			obj.keys = cell(0, 1);
+			obj.rows = cell(0, 1);
+			obj.lastUsed = zeros(0, 1);
+			obj.useCounter = 0;
+			obj.keyMap = containers.Map('KeyType', 'char', 'ValueType', 'double');
+			obj.count = 0;
+			obj.fileStamp = [];
+
+			if ~isempty(obj.filePath) && exist(obj.filePath, 'file') == 2
+				obj.merge_file();
+			end
+		end
+
+		% Public methods
+		[key] = make_key(obj, values, prefix);
+		[rows, hitBool] = lookup(obj, keys);
+		[] = insert(obj, keys, rows);
+		[] = save_cache(obj);
+		[stats] = get_stats(obj);
+		[] = reset_stats(obj);
+	end
+	methods (Access = private)
+		[] = merge_file(obj);
+		[] = evict(obj);
+		[] = rebuild_map(obj);
+	end
+end
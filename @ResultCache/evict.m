@@ -0,0 +1,16 @@
+function [] = evict(obj)
+%EVICT Removes the least recently used entries beyond obj.maxEntries
+%
+%	Part of the ResultCache class. Private method.
+
+[~, order] = sort(obj.lastUsed, 'descend');
+tempKeep = sort(order(1:min(obj.count, obj.maxEntries)));
+
+obj.evictions = obj.evictions + obj.count - length(tempKeep);
+obj.keys = obj.keys(tempKeep);
+obj.rows = obj.rows(tempKeep);
+obj.lastUsed = obj.lastUsed(tempKeep);
+obj.count = length(tempKeep);
+obj.rebuild_map();
+
+end
@@ -0,0 +1,17 @@
+function [stats] = get_stats(obj)
+%GET_STATS Returns the cache statistics
+%	STATS has fields count, maxEntries, hits, misses, hitRate (hits over
+%	lookups, NaN before any lookup) and evictions, counted since the
+%	cache was created or reset_stats was called.
+%
+%	Part of the ResultCache class.
+
+stats = struct( ...
+	'count', obj.count, ...
+	'maxEntries', obj.maxEntries, ...
+	'hits', obj.hits, ...
+	'misses', obj.misses, ...
+	'hitRate', obj.hits/(obj.hits + obj.misses), ...
+	'evictions', obj.evictions );
+
+end
@@ -0,0 +1,36 @@
+function [] = insert(obj, keys, rows)
+%INSERT Adds entries, or replaces the rows of existing keys
+%	KEYS	Cell array of keys (from make_key)
+%	ROWS	Cell array of the data row of each key
+%
+%	The entries become the most recently used. Least recently used
+%	entries are evicted if there are more than obj.maxEntries.
+%
+%	Part of the ResultCache class.
+
+keys = reshape(keys, [], 1);
+rows = reshape(rows, [], 1);
+if length(keys) ~= length(rows)
+	error('ResultCache:BadInputs', 'There must be a data row for each key.');
+end
+
+for k = 1:length(keys)
+	obj.useCounter = obj.useCounter + 1;
+	if isKey(obj.keyMap, keys{k})
+		i = obj.keyMap(keys{k});
+		obj.rows{i} = rows{k};
+	else
+		obj.count = obj.count + 1;
+		i = obj.count;
+		obj.keys{i,1} = keys{k};
+		obj.rows{i,1} = rows{k};
+		obj.keyMap(keys{k}) = i;
+	end
+	obj.lastUsed(i,1) = obj.useCounter;
+end
+
+if obj.count > obj.maxEntries
+	obj.evict();
+end
+
+end
@@ -0,0 +1,31 @@
+function [rows, hitBool] = lookup(obj, keys)
+%LOOKUP Finds the data rows of keys
+%	KEYS	Cell array of keys (from make_key)
+%
+%	Returns a cell array ROWS with the data row of each key found, empty
+%	for the others, and HITBOOL marking the keys found. Found entries
+%	become the most recently used.
+%
+%	Part of the ResultCache class.
+
+keys = reshape(keys, [], 1);
+rows = cell(size(keys));
+hitBool = false(size(keys));
+if isempty(keys)
+	return
+end
+
+if obj.count > 0
+	hitBool = isKey(obj.keyMap, keys);
+end
+if any(hitBool)
+	iEntry = cell2mat(values(obj.keyMap, keys(hitBool)));
+	rows(hitBool) = obj.rows(iEntry);
+	obj.lastUsed(iEntry) = obj.useCounter + (1:length(iEntry))';
+	obj.useCounter = obj.useCounter + length(iEntry);
+end
+
+obj.hits = obj.hits + sum(hitBool);
+obj.misses = obj.misses + sum(~hitBool);
+
+end
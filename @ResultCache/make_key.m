@@ -0,0 +1,17 @@
+function [key] = make_key(obj, values, prefix)
+%MAKE_KEY Content key of a vector of parameter values
+%	VALUES	Parameter values, rounded to obj.decimals decimal places
+%	PREFIX	(optional) Text identifying what the values mean (parameter
+%			names, run type), keys only match with the same prefix
+%
+%	Part of the ResultCache class.
+
+if nargin < 3
+	prefix = '';
+end
+
+values = round(reshape(double(values), 1, []), obj.decimals);
+values(values == 0) = 0; % Same key for -0 and 0
+key = [prefix '|' sprintf('%.*f,', obj.decimals, values)];
+
+end
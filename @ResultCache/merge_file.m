@@ -0,0 +1,45 @@
+function [] = merge_file(obj)
+%MERGE_FILE Adds the entries of obj.filePath that are not in the cache
+%	Entries in both keep the cache's row and the later use. The counts
+%	of hits and misses are not changed.
+%
+%	Part of the ResultCache class. Private method.
+
+tempFile = dir(obj.filePath);
+try
+	tempData = load(obj.filePath, '-mat');
+catch tempError
+	warning('ResultCache:CannotRead', 'Result cache could not be read, it is left unchanged:\n\t%s\n%s', ...
+		obj.filePath, tempError.message);
+	return
+end
+if ~all(isfield(tempData, {'keys', 'rows', 'lastUsed', 'useCounter'}))
+	warning('ResultCache:CannotRead', 'Not a result cache file, it is left unchanged:\n\t%s', obj.filePath);
+	return
+end
+
+tempKeys = reshape(tempData.keys, [], 1);
+tempLastUsed = reshape(tempData.lastUsed, [], 1);
+tempFound = false(size(tempKeys));
+if obj.count > 0 && ~isempty(tempKeys)
+	tempFound = isKey(obj.keyMap, tempKeys);
+end
+if any(tempFound)
+	iEntry = cell2mat(values(obj.keyMap, tempKeys(tempFound)));
+	obj.lastUsed(iEntry) = max(obj.lastUsed(iEntry), tempLastUsed(tempFound));
+end
+
+tempNew = find(~tempFound);
+obj.keys = [obj.keys; tempKeys(tempNew)];
+obj.rows = [obj.rows; reshape(tempData.rows(tempNew), [], 1)];
+obj.lastUsed = [obj.lastUsed; tempLastUsed(tempNew)];
+obj.count = length(obj.keys);
+obj.useCounter = max(obj.useCounter, tempData.useCounter);
+obj.rebuild_map();
+obj.fileStamp = [tempFile.datenum, tempFile.bytes];
+
+if obj.count > obj.maxEntries
+	obj.evict();
+end
+
+end
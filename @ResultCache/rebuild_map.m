@@ -0,0 +1,12 @@
+function [] = rebuild_map(obj)
+%REBUILD_MAP Recreates the key to entry index map
+%
+%	Part of the ResultCache class. Private method.
+
+if obj.count > 0
+	obj.keyMap = containers.Map(obj.keys, num2cell(1:obj.count));
+else
+	obj.keyMap = containers.Map('KeyType', 'char', 'ValueType', 'double');
+end
+
+end
@@ -0,0 +1,10 @@
+function [] = reset_stats(obj)
+%RESET_STATS Sets the hit, miss and eviction counts to zero
+%
+%	Part of the ResultCache class.
+
+obj.hits = 0;
+obj.misses = 0;
+obj.evictions = 0;
+
+end
@@ -0,0 +1,35 @@
+function [] = save_cache(obj)
+%SAVE_CACHE Writes the cache to obj.filePath
+%	If the file was written by another process since this cache last
+%	read or wrote it, its entries are merged in first. The file is
+%	written under a temporary name (unique, as processes sharing the
+%	file can save at the same time) and then renamed, so that readers
+%	never see a partial file.
+%
+%	Part of the ResultCache class.
+
+if isempty(obj.filePath)
+	error('ResultCache:NoFile', 'The cache has no file to save to.');
+end
+
+% Merge entries saved by other runs or projects
+tempFile = dir(obj.filePath);
+if ~isempty(tempFile) && ~isequal(obj.fileStamp, [tempFile.datenum, tempFile.bytes])
+	obj.merge_file();
+end
+
+tempData = struct( ...
+	'version', 1, ...
+	'keys', {obj.keys}, ...
+	'rows', {obj.rows}, ...
+	'lastUsed', obj.lastUsed, ...
+	'useCounter', obj.useCounter ); %#ok<NASGU>
+[~, tempName] = fileparts(tempname);
+tempPath = [obj.filePath '.' tempName '.tmp'];
+save(tempPath, '-struct', 'tempData', '-mat');
+movefile(tempPath, obj.filePath, 'f');
+
+tempFile = dir(obj.filePath);
+obj.fileStamp = [tempFile.datenum, tempFile.bytes];
+
+end
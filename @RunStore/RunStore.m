@@ -0,0 +1,86 @@
+classdef RunStore < handle
+	%RUNSTORE Append-only on-disk record of an optimization run
+	%   Keeps every function call and completed iteration of a run in a
+	%	folder, so that a run can be continued (MOSAO.from_store) or
+	%	monitored (resources/run_store.py) without saving the MOSAO object.
+	%	Records are only ever appended, each append opens, writes and
+	%	closes its file, so a crash loses at most the record being written
+	%	(readers ignore an incomplete last record, and repair() drops it
+	%	before a continued run appends again).
+	%
+	%	Files in the folder:
+	%		store.json			Header: sizes, bounds and options of the run
+	%		calls.f64			Little-endian float64 records, one row of
+	%							recordLength = 3 + lenX + lenY values each:
+	%							[1, call set, valid, x, y] for a call, or
+	%							[2, removal number, removed index, NaN...]
+	%							for a call removed from the Database (the
+	%							records of one removal share its number)
+	%		iterations.jsonl	One JSON line per completed iteration, with
+	%							the iteration number and its obj.iter record,
+	%							or with the iterations removed
+
+	properties (SetAccess = private, GetAccess = public)
+		folderPath		% Folder of the store
+		lenX			% Number of inputs
+		lenY			% Number of outputs
+		recordLength	% Values per record of calls.f64
+		nRecords		% Number of complete records in calls.f64
+		nRemovals		% Number of removals recorded
+	end
+	properties (Constant = true)
+		headerFile = 'store.json'
+		callsFile = 'calls.f64'
+		iterationsFile = 'iterations.jsonl'
+	end
+	methods
+		function obj = RunStore(folderPath)
+		%RUNSTORE Class constructor for RunStore
+		%	FOLDERPATH	Folder of the store, an existing store is opened
+		%				and a new one is written by create()
+
+			obj.folderPath = folderPath;
+			obj.lenX = [];
+			obj.lenY = [];
+			obj.recordLength = [];
+			obj.nRecords = 0;
+			obj.nRemovals = 0;
+
+			if obj.exists()
+				header = obj.read_header();
+				obj.lenX = header.lenX;
+				obj.lenY = header.lenY;
+				obj.recordLength = header.recordLength;
+
+				% Count complete records, and the removals among them
+				tempFile = dir(fullfile(obj.folderPath, RunStore.callsFile));
+				if ~isempty(tempFile)
+					obj.nRecords = floor(tempFile.bytes/(8*obj.recordLength));
+					[tempKind, tempSet] = obj.read_records();
+					obj.nRemovals = max([0; tempSet(tempKind == 2)]);
+				end
+			end
+		end
+
+		% Public methods
+		[existsBool] = exists(obj);
+		[] = create(obj, lenX, lenY, LB, UB, opt);
+		[] = append_calls(obj, x, y, valid, call);
+		[] = append_removal(obj, indices);
+		[] = append_iteration(obj, j, iterRecord);
+		[] = append_iteration_removal(obj, iterations);
+		[] = repair(obj);
+		[header] = read_header(obj);
+		[x, y, valid, call] = read_calls(obj);
+		[iter] = read_iterations(obj);
+	end
+	methods (Access = private)
+		[kind, set, value, x, y] = read_records(obj);
+		[] = append_records(obj, records);
+		[] = append_line(obj, fileName, text);
+	end
+	methods (Static = true, Access = private)
+		[encoded] = encode_value(value);
+		[value] = decode_value(encoded);
+	end
+end
@@ -0,0 +1,15 @@
+function [] = append_calls(obj, x, y, valid, call)
+%APPEND_CALLS Records function calls, in the order they were added
+%	X, Y, VALID	Inputs, outputs and validity of the calls (row-wise)
+%	CALL		Call set of each call
+%
+%	Part of the RunStore class.
+
+obj.append_records([ ...
+	ones(size(x, 1), 1), ...
+	call(:), ...
+	double(valid(:)), ...
+	x, ...
+	y ]);
+
+end
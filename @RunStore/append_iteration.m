@@ -0,0 +1,12 @@
+function [] = append_iteration(obj, j, iterRecord)
+%APPEND_ITERATION Records a completed iteration
+%	J			Iteration number
+%	ITERRECORD	The iteration's obj.iter(j) struct
+%
+%	Part of the RunStore class.
+
+obj.append_line(RunStore.iterationsFile, jsonencode(struct( ...
+	'iteration', j, ...
+	'record', RunStore.encode_value(iterRecord) )));
+
+end
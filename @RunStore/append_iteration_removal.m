@@ -0,0 +1,11 @@
+function [] = append_iteration_removal(obj, iterations)
+%APPEND_ITERATION_REMOVAL Records the removal of iterations
+%	ITERATIONS	Iteration numbers removed together (the ones after them
+%				shift down, as in MOSAO.remove_iteration)
+%
+%	Part of the RunStore class.
+
+obj.append_line(RunStore.iterationsFile, jsonencode(struct( ...
+	'removed', {reshape(unique(iterations), 1, [])} )));
+
+end
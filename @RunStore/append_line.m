@@ -0,0 +1,14 @@
+function [] = append_line(obj, fileName, text)
+%APPEND_LINE Appends a line of text to a file of the store
+%
+%	Part of the RunStore class. Private method.
+
+tempPath = fullfile(obj.folderPath, fileName);
+fileID = fopen(tempPath, 'a', 'n', 'UTF-8');
+if fileID == -1
+	error('RunStore:CannotWrite', 'Run store file could not be written:\n\t%s', tempPath);
+end
+fprintf(fileID, '%s\n', text);
+fclose(fileID);
+
+end
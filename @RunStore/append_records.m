@@ -0,0 +1,25 @@
+function [] = append_records(obj, records)
+%APPEND_RECORDS Appends records (rows of recordLength values) to calls.f64
+%	One write of all the records, then the file is closed so that they
+%	are handed to the file system before returning.
+%
+%	Part of the RunStore class. Private method.
+
+if isempty(records)
+	return
+end
+
+tempPath = fullfile(obj.folderPath, RunStore.callsFile);
+fileID = fopen(tempPath, 'a', 'ieee-le');
+if fileID == -1
+	error('RunStore:CannotWrite', 'Run store calls could not be written:\n\t%s', tempPath);
+end
+tempCount = fwrite(fileID, records', 'double');
+fclose(fileID);
+
+if tempCount ~= numel(records)
+	error('RunStore:CannotWrite', 'Only %d of %d values were written to:\n\t%s', tempCount, numel(records), tempPath);
+end
+obj.nRecords = obj.nRecords + size(records, 1);
+
+end
@@ -0,0 +1,16 @@
+function [] = append_removal(obj, indices)
+%APPEND_REMOVAL Records the removal of calls from the Database
+%	INDICES	Database indices removed together (the ones after them shift
+%			down, as in Database.remove_call)
+%
+%	Part of the RunStore class.
+
+indices = unique(indices(:));
+obj.append_records([ ...
+	2*ones(length(indices), 1), ...
+	(obj.nRemovals + 1)*ones(length(indices), 1), ...
+	indices, ...
+	NaN(length(indices), obj.lenX + obj.lenY) ]);
+obj.nRemovals = obj.nRemovals + 1;
+
+end
@@ -0,0 +1,46 @@
+function [] = create(obj, lenX, lenY, LB, UB, opt)
+%CREATE Writes the header of a new store
+%	LENX, LENY	Number of inputs and outputs
+%	LB, UB		Bounds of the inputs
+%	OPT			Options struct of the run
+%
+%	Part of the RunStore class.
+
+if obj.exists()
+	error('RunStore:AlreadyExists', 'A run store already exists in:\n\t%s', obj.folderPath);
+end
+if exist(obj.folderPath, 'dir') ~= 7
+	mkdir(obj.folderPath);
+end
+
+obj.lenX = lenX;
+obj.lenY = lenY;
+obj.recordLength = 3 + lenX + lenY;
+obj.nRecords = 0;
+obj.nRemovals = 0;
+
+header = struct( ...
+	'format', 'MOSAOrunStore', ...
+	'version', 1, ...
+	'dtype', '<f8', ...
+	'lenX', lenX, ...
+	'lenY', lenY, ...
+	'recordLength', obj.recordLength, ...
+	'callsFile', RunStore.callsFile, ...
+	'iterationsFile', RunStore.iterationsFile, ...
+	'LB', {reshape(LB, 1, [])}, ...
+	'UB', {reshape(UB, 1, [])}, ...
+	'opt', RunStore.encode_value(opt) );
+
+% Write the header last (as a temporary file renamed once complete), the
+% store exists once it is there
+tempPath = fullfile(obj.folderPath, [RunStore.headerFile '.tmp']);
+fileID = fopen(tempPath, 'w');
+if fileID == -1
+	error('RunStore:CannotWrite', 'Run store header could not be written:\n\t%s', tempPath);
+end
+fprintf(fileID, '%s', jsonencode(header));
+fclose(fileID);
+movefile(tempPath, fullfile(obj.folderPath, RunStore.headerFile));
+
+end
@@ -0,0 +1,41 @@
+function [value] = decode_value(encoded)
+%DECODE_VALUE Reverses encode_value on a jsondecode result
+%	NaN and Inf are written as null by jsonencode, both come back as NaN.
+%
+%	Part of the RunStore class. Static method.
+
+if isstruct(encoded) && isscalar(encoded) ...
+		&& isequal(sort(fieldnames(encoded)), {'class'; 'data'; 'size'})
+	tempData = encoded.data;
+	if iscell(tempData)
+		% Arrays with nulls in them
+		tempData = cellfun(@(v) nan_if_empty(v), tempData);
+	end
+	if strcmp(encoded.class, 'logical')
+		tempData = logical(tempData);
+	else
+		tempData = cast(tempData, encoded.class);
+	end
+	value = reshape(tempData, reshape(encoded.size, 1, []));
+elseif isstruct(encoded) && isscalar(encoded)
+	value = struct();
+	tempNames = fieldnames(encoded);
+	for f = 1:length(tempNames)
+		value.(tempNames{f}) = RunStore.decode_value(encoded.(tempNames{f}));
+	end
+elseif isstruct(encoded)
+	% Encoded values with the same fields are decoded as a struct array
+	value = arrayfun(@RunStore.decode_value, encoded, 'UniformOutput', false);
+elseif iscell(encoded)
+	value = cellfun(@RunStore.decode_value, encoded, 'UniformOutput', false);
+else
+	value = encoded;
+end
+
+end
+
+function [v] = nan_if_empty(v)
+if isempty(v)
+	v = NaN;
+end
+end
@@ -0,0 +1,29 @@
+function [encoded] = encode_value(value)
+%ENCODE_VALUE Prepares a value for jsonencode, keeping its shape and class
+%	Numeric and logical arrays become structs with class, size and data
+%	(column-major) fields, which jsonencode alone would flatten (a row
+%	vector comes back as a column). Structs and cells are encoded
+%	element-wise, other values are left as they are.
+%
+%	Part of the RunStore class. Static method.
+
+if isnumeric(value) || islogical(value)
+	encoded = struct( ...
+		'class', class(value), ...
+		'size', size(value), ...
+		'data', {reshape(value, 1, [])} );
+elseif isstruct(value) && isscalar(value)
+	encoded = struct();
+	tempNames = fieldnames(value);
+	for f = 1:length(tempNames)
+		encoded.(tempNames{f}) = RunStore.encode_value(value.(tempNames{f}));
+	end
+elseif isstruct(value)
+	encoded = arrayfun(@RunStore.encode_value, value, 'UniformOutput', false);
+elseif iscell(value)
+	encoded = cellfun(@RunStore.encode_value, value, 'UniformOutput', false);
+else
+	encoded = value;
+end
+
+end
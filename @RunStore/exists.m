@@ -0,0 +1,8 @@
+function [existsBool] = exists(obj)
+%EXISTS Indicates if the store has been created (its header exists)
+%
+%	Part of the RunStore class.
+
+existsBool = exist(fullfile(obj.folderPath, RunStore.headerFile), 'file') == 2;
+
+end
@@ -0,0 +1,33 @@
+function [x, y, valid, call] = read_calls(obj)
+%READ_CALLS Replays the records into the calls left in the Database
+%	Returns the inputs, outputs, validity and call set of the calls, in
+%	Database order, with the recorded removals applied.
+%
+%	Part of the RunStore class.
+
+[kind, set, value, recX, recY] = obj.read_records();
+
+% Replay blocks of calls and removals in order, keeping the records of
+% the calls still in the Database
+alive = zeros(0, 1);
+blockStart = [1; find(diff(kind) ~= 0 | diff(set) ~= 0 & kind(2:end) == 2) + 1];
+blockEnd = [blockStart(2:end) - 1; length(kind)];
+for b = 1:length(blockStart)
+	tempRecords = (blockStart(b):blockEnd(b))';
+	if isempty(tempRecords)
+		continue
+	end
+	if kind(blockStart(b)) == 1
+		alive = [alive; tempRecords];
+	else
+		tempRemoved = value(tempRecords);
+		alive(tempRemoved(tempRemoved <= length(alive))) = [];
+	end
+end
+
+x = recX(alive,:);
+y = recY(alive,:);
+valid = logical(value(alive));
+call = set(alive);
+
+end
@@ -0,0 +1,16 @@
+function [header] = read_header(obj)
+%READ_HEADER Reads the header of the store
+%	The options are decoded and the bounds are row vectors.
+%
+%	Part of the RunStore class.
+
+header = jsondecode(fileread(fullfile(obj.folderPath, RunStore.headerFile)));
+if ~isfield(header, 'format') || ~strcmp(header.format, 'MOSAOrunStore')
+	error('RunStore:BadHeader', 'Not a run store header:\n\t%s', fullfile(obj.folderPath, RunStore.headerFile));
+end
+
+header.LB = reshape(header.LB, 1, []);
+header.UB = reshape(header.UB, 1, []);
+header.opt = RunStore.decode_value(header.opt);
+
+end
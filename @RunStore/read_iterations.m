@@ -0,0 +1,46 @@
+function [iter] = read_iterations(obj)
+%READ_ITERATIONS Reads the completed iterations as an obj.iter struct array
+%	Iterations recorded more than once (redone by a continued run) keep
+%	their last record, and recorded removals are applied in order.
+%	Fields missing from some records are left empty.
+%
+%	Part of the RunStore class.
+
+iter = [];
+tempPath = fullfile(obj.folderPath, RunStore.iterationsFile);
+if exist(tempPath, 'file') ~= 2
+	return
+end
+
+% Complete lines only (the last may still be being written)
+tempText = fileread(tempPath);
+tempLines = strsplit(tempText(1:find(tempText == newline, 1, 'last')), newline);
+tempLines = tempLines(~cellfun(@isempty, tempLines));
+
+records = cell(0, 1);
+for k = 1:length(tempLines)
+	tempLine = jsondecode(tempLines{k});
+	if isfield(tempLine, 'removed')
+		tempRemoved = tempLine.removed(tempLine.removed <= length(records));
+		records(tempRemoved) = [];
+	else
+		records{tempLine.iteration, 1} = RunStore.decode_value(tempLine.record);
+	end
+end
+
+% Merge into one struct array
+if isempty(records)
+	return
+end
+iter = struct();
+for j = 1:length(records)
+	if isempty(records{j})
+		continue
+	end
+	tempNames = fieldnames(records{j});
+	for f = 1:length(tempNames)
+		iter(j).(tempNames{f}) = records{j}.(tempNames{f});
+	end
+end
+
+end
@@ -0,0 +1,29 @@
+function [kind, set, value, x, y] = read_records(obj)
+%READ_RECORDS Reads the complete records of calls.f64, as columns
+%
+%	Part of the RunStore class. Private method.
+
+tempPath = fullfile(obj.folderPath, RunStore.callsFile);
+tempFile = dir(tempPath);
+nComplete = 0;
+if ~isempty(tempFile)
+	nComplete = floor(tempFile.bytes/(8*obj.recordLength));
+end
+
+records = zeros(0, obj.recordLength);
+if nComplete > 0
+	fileID = fopen(tempPath, 'r', 'ieee-le');
+	if fileID == -1
+		error('RunStore:CannotRead', 'Run store calls could not be read:\n\t%s', tempPath);
+	end
+	records = fread(fileID, [obj.recordLength, nComplete], 'double=>double')';
+	fclose(fileID);
+end
+
+kind = records(:,1);
+set = records(:,2);
+value = records(:,3);
+x = records(:,3 + (1:obj.lenX));
+y = records(:,3 + obj.lenX + (1:obj.lenY));
+
+end
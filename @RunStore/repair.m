@@ -0,0 +1,44 @@
+function [] = repair(obj)
+%REPAIR Drops a record or line left incomplete by an interrupted append
+%	Appends after it would otherwise be misaligned (calls.f64) or joined
+%	to it (iterations.jsonl). A file is only rewritten if it ends in an
+%	incomplete record or line. Only for the process that records the run,
+%	a monitor would cut the record another process is writing.
+%
+%	Part of the RunStore class.
+
+% calls.f64: keep the complete records
+tempPath = fullfile(obj.folderPath, RunStore.callsFile);
+tempFile = dir(tempPath);
+if ~isempty(tempFile) && mod(tempFile.bytes, 8*obj.recordLength) ~= 0
+	fileID = fopen(tempPath, 'r');
+	tempBytes = fread(fileID, [1, 8*obj.recordLength*floor(tempFile.bytes/(8*obj.recordLength))], 'uint8=>uint8');
+	fclose(fileID);
+	rewrite_file(tempPath, tempBytes);
+end
+
+% iterations.jsonl: keep the complete lines
+tempPath = fullfile(obj.folderPath, RunStore.iterationsFile);
+if exist(tempPath, 'file') == 2
+	fileID = fopen(tempPath, 'r');
+	tempBytes = fread(fileID, [1, Inf], 'uint8=>uint8');
+	fclose(fileID);
+	if ~isempty(tempBytes) && tempBytes(end) ~= uint8(newline)
+		rewrite_file(tempPath, tempBytes(1:find(tempBytes == uint8(newline), 1, 'last')));
+	end
+end
+
+end
+
+function [] = rewrite_file(filePath, bytes)
+%REWRITE_FILE Replaces a file's contents (written to a temporary file
+%	renamed once complete)
+tempPath = [filePath '.tmp'];
+fileID = fopen(tempPath, 'w');
+if fileID == -1
+	error('RunStore:CannotWrite', 'Run store file could not be repaired:\n\t%s', filePath);
+end
+fwrite(fileID, bytes, 'uint8');
+fclose(fileID);
+movefile(tempPath, filePath, 'f');
+end
@@ -0,0 +1,64 @@
+classdef SpatialIndex < handle
+	%SPATIALINDEX Incrementally updated KD-tree of points in a box
+	%   Indexes points (e.g. the X values of a Database) normalized by the
+	%	box [LB, UB], so that existence and nearest neighbor queries visit
+	%	O(log n) nodes instead of comparing with every point. Each node
+	%	keeps the bounding box of its points, so whole subtrees are
+	%	skipped. Leaves are split at the median of their widest dimension
+	%	once they have more than maxLeafSize points, and the tree is
+	%	rebuilt balanced if inserts make it too deep.
+	%
+	%	Points have ids (e.g. Database indices). Removing ids shifts the
+	%	higher ones down, as for rows deleted from a matrix.
+
+	properties (SetAccess = private, GetAccess = public)
+		nDims		% Number of dimensions
+		count		% Number of points
+	end
+	properties (SetAccess = private, GetAccess = private)
+		LB			% Lower bounds of the box
+		scale		% UB - LB (1 where they are equal)
+		idLeaf		% Leaf of each id
+
+		maxLeafSize	% Points in a leaf before it is split
+		nodeLower	% Lower bound of the points in each node (row-wise)
+		nodeUpper	% Upper bound of the points in each node (row-wise)
+		nodeChildren % Child nodes [left, right] of each node, 0 for leaves
+		nodeSplitDim % Dimension each node is split on
+		nodeSplitValue % Value each node is split at (left if <=)
+		nodeDepth	% Depth of each node (root is 0)
+		nodeZ		% Normalized points in each leaf
+		nodeIds		% Ids of the points in each leaf
+	end
+	methods
+		function obj = SpatialIndex(LB, UB, maxLeafSize)
+		%SPATIALINDEX Class constructor for SpatialIndex
+		%	LB, UB		Bounds of the box the points are normalized by
+		%	MAXLEAFSIZE	(optional) Leaf size of the KD-tree, default 16
+
+			if nargin < 3
+				maxLeafSize = 16;
+			end
+
+			obj.nDims = length(LB);
+			obj.LB = reshape(LB, 1, []);
+			obj.scale = reshape(UB, 1, []) - obj.LB;
+			obj.scale(obj.scale == 0) = 1;
+			obj.maxLeafSize = maxLeafSize;
+			obj.reset_index();
+		end
+
+		% Public methods
+		[] = insert(obj, X, ids);
+		[] = remove(obj, ids);
+		[] = rebuild(obj, X, ids);
+		[iFirst] = find_existing(obj, X, minDistance);
+		[ids, distances] = nearest(obj, x, n, mask);
+	end
+	methods (Access = private)
+		[] = reset_index(obj);
+		[] = kd_build(obj, Z, ids);
+		[children] = kd_split(obj, node);
+		[node] = kd_new_node(obj, depth);
+	end
+end
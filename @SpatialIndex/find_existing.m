@@ -0,0 +1,47 @@
+function [iFirst] = find_existing(obj, X, minDistance)
+%FIND_EXISTING Finds the first point close to each X
+%	X			Points to look for, row-wise
+%	MINDISTANCE	Squared (unnormalized) distance below which points match
+%
+%	Returns, for each row of X, the lowest id of the matching points, or
+%	0 if there is none. All rows descend the tree together: at each node
+%	the rows whose search box does not overlap the node's bounds are
+%	dropped, and at each leaf the remaining rows are compared with its
+%	points at once.
+%
+%	Part of the SpatialIndex class.
+
+nX = size(X, 1);
+iFirst = Inf(nX, 1);
+Z = (X - obj.LB)./obj.scale;
+w = sqrt(minDistance)./obj.scale;
+tempScale = permute(obj.scale, [1 3 2]);
+
+stackNodes = 1;
+stackRows = {(1:nX)'};
+while ~isempty(stackNodes)
+	node = stackNodes(end);
+	rows = stackRows{end};
+	stackNodes(end) = [];
+	stackRows(end) = [];
+	
+	rows = rows(all( ...
+		(Z(rows,:) + w >= obj.nodeLower(node,:)) & ...
+		(Z(rows,:) - w <= obj.nodeUpper(node,:)), 2));
+	if isempty(rows)
+		continue
+	end
+	
+	if obj.nodeChildren(node,1) > 0
+		stackNodes = [stackNodes, obj.nodeChildren(node,:)];
+		stackRows = [stackRows, {rows, rows}];
+	elseif ~isempty(obj.nodeIds{node})
+		tempD = sum(((permute(Z(rows,:), [1 3 2]) - permute(obj.nodeZ{node}, [3 1 2])).*tempScale).^2, 3);
+		tempIds = repmat(obj.nodeIds{node}', length(rows), 1);
+		tempIds(tempD >= minDistance) = Inf;
+		iFirst(rows) = min(iFirst(rows), min(tempIds, [], 2));
+	end
+end
+iFirst(isinf(iFirst)) = 0;
+
+end
@@ -0,0 +1,47 @@
+function [] = insert(obj, X, ids)
+%INSERT Adds points to the index
+%	X	Points, row-wise
+%	IDS	(optional) Id of each point, default count+1, count+2, ...
+%
+%	Each point descends to its leaf, widening the bounds on the way. The
+%	leaf is split once it has more than maxLeafSize points. If a split
+%	makes the tree much deeper than a balanced one, it is rebuilt.
+%
+%	Part of the SpatialIndex class.
+
+nNew = size(X, 1);
+if nargin < 3
+	ids = obj.count + (1:nNew)';
+end
+Z = (X - obj.LB)./obj.scale;
+
+maxDepth = 0;
+for i = 1:nNew
+	z = Z(i,:);
+	node = 1;
+	while true
+		obj.nodeLower(node,:) = min(obj.nodeLower(node,:), z);
+		obj.nodeUpper(node,:) = max(obj.nodeUpper(node,:), z);
+		if obj.nodeChildren(node,1) == 0
+			break
+		end
+		node = obj.nodeChildren(node, 1 + (z(obj.nodeSplitDim(node)) > obj.nodeSplitValue(node)));
+	end
+	
+	obj.nodeZ{node} = [obj.nodeZ{node}; z];
+	obj.nodeIds{node} = [obj.nodeIds{node}; ids(i)];
+	obj.idLeaf(ids(i),1) = node;
+	if size(obj.nodeZ{node}, 1) > obj.maxLeafSize
+		obj.kd_split(node);
+		maxDepth = max(maxDepth, obj.nodeDepth(node) + 1);
+	end
+end
+obj.count = obj.count + nNew;
+
+% Rebuild if the tree got too deep
+if maxDepth > 2*ceil(log2(obj.count/obj.maxLeafSize + 1)) + 4
+	leaves = find(obj.nodeChildren(:,1) == 0);
+	obj.kd_build(vertcat(obj.nodeZ{leaves}), vertcat(obj.nodeIds{leaves}));
+end
+
+end
@@ -0,0 +1,29 @@
+function [] = kd_build(obj, Z, ids)
+%KD_BUILD Replaces the tree with a balanced one of the normalized points Z
+%	All points start in the root leaf, leaves with more than maxLeafSize
+%	points are split until none are left.
+%
+%	Part of the SpatialIndex class. Private method.
+
+obj.reset_index();
+obj.count = size(Z, 1);
+if obj.count == 0
+	return
+end
+
+obj.nodeZ{1} = Z;
+obj.nodeIds{1} = ids(:);
+obj.nodeLower(1,:) = min(Z, [], 1);
+obj.nodeUpper(1,:) = max(Z, [], 1);
+obj.idLeaf(ids) = 1;
+
+stack = 1;
+while ~isempty(stack)
+	node = stack(end);
+	stack(end) = [];
+	if size(obj.nodeZ{node}, 1) > obj.maxLeafSize
+		stack = [stack, obj.kd_split(node)];
+	end
+end
+
+end
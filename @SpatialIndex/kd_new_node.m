@@ -0,0 +1,18 @@
+function [node] = kd_new_node(obj, depth)
+%KD_NEW_NODE Returns a new empty leaf at DEPTH
+%
+%	Part of the SpatialIndex class. Private method.
+
+node = size(obj.nodeChildren, 1) + 1;
+
+d = obj.nDims;
+obj.nodeLower(node,:) = Inf(1, d);
+obj.nodeUpper(node,:) = -Inf(1, d);
+obj.nodeChildren(node,:) = [0, 0];
+obj.nodeSplitDim(node,1) = 0;
+obj.nodeSplitValue(node,1) = 0;
+obj.nodeDepth(node,1) = depth;
+obj.nodeZ{node,1} = zeros(0, d);
+obj.nodeIds{node,1} = zeros(0, 1);
+
+end
@@ -0,0 +1,44 @@
+function [children] = kd_split(obj, node)
+%KD_SPLIT Splits a leaf of the KD-tree in two
+%	Splits along the dimension the leaf's points spread most in, at the
+%	gap between distinct values that is closest to the median. Returns
+%	the two new leaves, or an empty array if all of the points are equal
+%	(the leaf is then kept as it is).
+%
+%	Part of the SpatialIndex class. Private method.
+
+tempZ = obj.nodeZ{node};
+tempIds = obj.nodeIds{node};
+n = size(tempZ, 1);
+
+[spread, dim] = max(max(tempZ, [], 1) - min(tempZ, [], 1));
+if n < 2 || spread <= 0
+	children = zeros(1, 0);
+	return
+end
+
+% Split value between distinct values, as near to the median as possible
+v = sort(tempZ(:,dim));
+gaps = find(diff(v) > 0);
+[~, iGap] = min(abs(gaps - n/2));
+splitValue = (v(gaps(iGap)) + v(gaps(iGap) + 1))/2;
+isLeft = tempZ(:,dim) <= splitValue;
+
+children = [obj.kd_new_node(obj.nodeDepth(node) + 1), obj.kd_new_node(obj.nodeDepth(node) + 1)];
+sides = {isLeft, ~isLeft};
+for k = 1:2
+	c = children(k);
+	obj.nodeZ{c} = tempZ(sides{k},:);
+	obj.nodeIds{c} = tempIds(sides{k});
+	obj.nodeLower(c,:) = min(obj.nodeZ{c}, [], 1);
+	obj.nodeUpper(c,:) = max(obj.nodeZ{c}, [], 1);
+	obj.idLeaf(obj.nodeIds{c}) = c;
+end
+
+obj.nodeChildren(node,:) = children;
+obj.nodeSplitDim(node) = dim;
+obj.nodeSplitValue(node) = splitValue;
+obj.nodeZ{node} = zeros(0, obj.nDims);
+obj.nodeIds{node} = zeros(0, 1);
+
+end
@@ -0,0 +1,59 @@
+function [ids, distances] = nearest(obj, x, n, mask)
+%NEAREST Finds the N nearest points to x
+%	X		Point (one row)
+%	N		Number of points to find
+%	MASK	(optional) Logical vector over the ids, only points whose id
+%			is true in it are found
+%
+%	Returns the ids and squared normalized distances, nearest first (of
+%	equal distances, lowest id first). Nodes are visited depth first,
+%	nearer child first, and skipped once their bounds are farther than
+%	the N-th nearest point found so far.
+%
+%	Part of the SpatialIndex class.
+
+if nargin < 4
+	mask = [];
+end
+
+z = (x - obj.LB)./obj.scale;
+boxDistance = @(nodes) sum(max(max(obj.nodeLower(nodes,:) - z, z - obj.nodeUpper(nodes,:)), 0).^2, 2);
+
+ids = zeros(0, 1);
+distances = zeros(0, 1);
+if n < 1
+	return
+end
+
+stack = 1;
+while ~isempty(stack)
+	node = stack(end);
+	stack(end) = [];
+	if length(ids) >= n && boxDistance(node) > distances(end)
+		continue
+	end
+	
+	if obj.nodeChildren(node,1) > 0
+		% Nearer child goes last on the stack, so it is visited first
+		children = obj.nodeChildren(node,:);
+		if diff(boxDistance(children)) < 0
+			stack = [stack, children];
+		else
+			stack = [stack, fliplr(children)];
+		end
+	else
+		tempIds = obj.nodeIds{node};
+		tempD = sum((obj.nodeZ{node} - z).^2, 2);
+		if ~isempty(mask)
+			keep = reshape(mask(tempIds), [], 1);
+			tempIds = tempIds(keep);
+			tempD = tempD(keep);
+		end
+		tempBest = sortrows([distances, ids; tempD, tempIds]);
+		tempBest = tempBest(1:min(n, end),:);
+		distances = tempBest(:,1);
+		ids = tempBest(:,2);
+	end
+end
+
+end
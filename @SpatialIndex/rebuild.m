@@ -0,0 +1,14 @@
+function [] = rebuild(obj, X, ids)
+%REBUILD Replaces the index contents with a balanced tree of X
+%	X	Points, row-wise
+%	IDS	(optional) Id of each point, default 1:size(X, 1)
+%
+%	Part of the SpatialIndex class.
+
+if nargin < 3
+	ids = (1:size(X, 1))';
+end
+
+obj.kd_build((X - obj.LB)./obj.scale, ids);
+
+end
@@ -0,0 +1,28 @@
+function [] = remove(obj, ids)
+%REMOVE Removes ids from the index, renumbering the ones after them
+%	IDS	Ids to remove. Higher ids are shifted down, as the rows after
+%		rows deleted from a matrix (e.g. Database.remove_call).
+%
+%	The bounds of the nodes are not narrowed, they still hold the points
+%	that are left.
+%
+%	Part of the SpatialIndex class.
+
+ids = unique(ids(:));
+ids = ids(ids >= 1 & ids <= length(obj.idLeaf));
+
+leaves = unique(obj.idLeaf(ids));
+for leaf = leaves(leaves > 0)'
+	keep = ~ismember(obj.nodeIds{leaf}, ids);
+	obj.nodeZ{leaf} = obj.nodeZ{leaf}(keep,:);
+	obj.nodeIds{leaf} = obj.nodeIds{leaf}(keep);
+end
+obj.count = obj.count - sum(obj.idLeaf(ids) > 0);
+obj.idLeaf(ids) = [];
+
+% Shift ids down by the number of removed ids below them
+for leaf = find(obj.nodeChildren(:,1) == 0)'
+	obj.nodeIds{leaf} = obj.nodeIds{leaf} - sum(obj.nodeIds{leaf} > ids', 2);
+end
+
+end
@@ -0,0 +1,21 @@
+function [] = reset_index(obj)
+%RESET_INDEX Empties the index
+%
+%	Part of the SpatialIndex class. Private method.
+
+d = obj.nDims;
+
+obj.count = 0;
+obj.idLeaf = zeros(0, 1);
+
+% KD-tree with an empty root leaf (node 1)
+obj.nodeLower = Inf(1, d);
+obj.nodeUpper = -Inf(1, d);
+obj.nodeChildren = [0, 0];
+obj.nodeSplitDim = 0;
+obj.nodeSplitValue = 0;
+obj.nodeDepth = 0;
+obj.nodeZ = {zeros(0, d)};
+obj.nodeIds = {zeros(0, 1)};
+
+end
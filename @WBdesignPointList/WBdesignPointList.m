@@ -42,6 +42,13 @@ classdef WBdesignPointList
 				
 				return;
 			end
+			
+			% Read the binary export format from its JSON header
+			[~, ~, tempExtension] = fileparts(projectDataPath);
+			if strcmpi(tempExtension, '.json')
+				obj = obj.read_binary_export(projectDataPath);
+				return;
+			end
 				
 			% Open the project data file
 			fileID = fopen(projectDataPath, 'r');
@@ -118,6 +125,11 @@ classdef WBdesignPointList
 		[obj, newDesignPointIndex] = add_copy(obj, copyDesignPointIndex)
 		[obj] = change_value(obj, designPointIndex, paramIndex, value, retainValidity)
 		[obj] = change_initialize(obj, initializeDesignPointIndex)
+		[obj, endOffset, lastSequence, successBool] = merge_delta(obj, deltaDataPath, startOffset, expectedSequence)
+	end
+	
+	methods(Access = private) % Private methods
+		[obj] = read_binary_export(obj, headerPath)
 	end
 end
 
@@ -0,0 +1,106 @@
+function [obj, endOffset, lastSequence, successBool] = merge_delta(obj, deltaDataPath, startOffset, expectedSequence)
+%merge_delta Merges delta export blocks into the design point list
+%	[obj, OFFSET, SEQ, SUCCESS] = merge_delta(obj, PATH, START, EXPECTED)
+%	reads the delta export blocks written by delta_export_script.py to
+%	PATH, from byte offset START, and merges their design points into the
+%	list. Blocks must carry consecutive sequence numbers starting at
+%	EXPECTED. OFFSET is the byte offset after the last merged block and SEQ
+%	its sequence number.
+%
+%	SUCCESS is false if the deltas cannot be merged (missing or
+%	out-of-order blocks, changed parameters, or design points that do not
+%	match the list); the list should then be re-read from a full export.
+%
+%	Part of the WBdesignPointList class
+
+endOffset = startOffset;
+lastSequence = expectedSequence - 1;
+successBool = false;
+
+fileID = fopen(deltaDataPath, 'r');
+if fileID == -1
+	return
+end
+fseek(fileID, startOffset, 'bof');
+
+merged = obj;
+blockOpen = false;
+tempLine = read_line(fileID);
+while ischar(tempLine)
+	tempFields = strsplit(tempLine, ',', 'CollapseDelimiters', false);
+	if isempty(tempLine)
+		tempLine = read_line(fileID);
+		continue
+	end
+
+	switch tempFields{1}
+		case 'Delta'
+			% Check sequence number and design point amount
+			if blockOpen || str2double(tempFields{2}) ~= lastSequence + 1 ...
+					|| str2double(tempFields{3}) ~= merged.amount
+				fclose(fileID);
+				return
+			end
+			blockOpen = true;
+			blockObj = merged;
+		case 'ParamName'
+			% Check parameters are unchanged
+			if ~blockOpen || ~isequal(tempFields(2:end)', merged.paramNames)
+				fclose(fileID);
+				return
+			end
+		case 'DP'
+			if ~blockOpen
+				fclose(fileID);
+				return
+			end
+			i = str2double(tempFields{2}) + 1;
+			if i > blockObj.amount || ...
+					(~blockObj.new(i) && ~strcmp(blockObj.names{i}, tempFields{3}))
+				fclose(fileID);
+				return
+			end
+
+			% Pad empty trailing values
+			tempValues = str2double(tempFields(6:end));
+			tempValues(end+1:blockObj.paramAmount) = NaN;
+
+			blockObj.names{i} = tempFields{3};
+			blockObj.data(i,:) = tempValues(1:blockObj.paramAmount);
+			blockObj.new(i) = false;
+			blockObj.valid(i) = strcmp(tempFields{5}, '1');
+			blockObj.needsUpdate(i,:) = ~strcmp(tempFields{4}, '1') && blockObj.valid(i);
+		case 'End'
+			% Block is complete, keep its changes
+			if ~blockOpen || str2double(tempFields{2}) ~= lastSequence + 1
+				fclose(fileID);
+				return
+			end
+			blockOpen = false;
+			merged = blockObj;
+			lastSequence = lastSequence + 1;
+			endOffset = ftell(fileID);
+	end
+
+	tempLine = read_line(fileID);
+end
+fclose(fileID);
+
+% Every new design point must have been created in Workbench
+if any(merged.new)
+	return
+end
+
+obj = merged;
+successBool = true;
+
+end
+
+function [tempLine] = read_line(fileID)
+%READ_LINE fgetl without the '\r' of CRLF line endings (the Workbench
+%	scripts write text files with Windows line endings)
+tempLine = fgetl(fileID);
+if ischar(tempLine) && ~isempty(tempLine) && tempLine(end) == sprintf('\r')
+	tempLine = tempLine(1:end-1);
+end
+end
@@ -0,0 +1,51 @@
+function [obj] = read_binary_export(obj, headerPath)
+%read_binary_export Fills the design point list from a binary data export
+%	Reads the JSON header (dataExport.json) and the little-endian float64
+%	matrix sidecar written by binary_export_script.py.
+%	Part of the WBdesignPointList class
+
+% Read and decode the header
+header = jsondecode(fileread(headerPath));
+if ~isfield(header, 'format') || ~strcmp(header.format, 'WBdataExport')
+	error('Not a binary data export header:\n\t%s', headerPath);
+end
+
+% Import the parameter attributes
+obj.paramNames = cellstr(header.paramNames);
+obj.paramDescriptions = cellstr(header.paramDescriptions);
+obj.paramUnits = cellstr(header.paramUnits);
+obj.paramMutable = and(strcmp(cellstr(header.paramUsage), 'Input'), ...
+	~strcmp(cellstr(header.paramExpressionType), 'Derived'));
+obj.paramAmount = size(obj.paramNames, 1);
+
+% Import the designPoint attributes
+obj.names = cellstr(header.dpNames);
+obj.amount = header.rows;
+obj.valid = logical(header.valid(:));
+tempDesignPointsNeedingUpdate = ~logical(header.upToDate(:));
+if obj.amount == 0
+	obj.names = {};
+	obj.valid = [];
+	tempDesignPointsNeedingUpdate = [];
+end
+
+% Read the data matrix in one call
+fileID = fopen(fullfile(fileparts(headerPath), header.dataFile), 'r', 'ieee-le');
+if fileID == -1
+	error('Binary data export file could not be opened:\n\t%s', header.dataFile);
+end
+obj.data = fread(fileID, [header.cols, header.rows], 'double=>double')';
+fclose(fileID);
+
+if ~isequal(size(obj.data), [header.rows, header.cols])
+	error('Binary data export does not match its header dimensions.');
+end
+
+% Set update flags
+obj.new = false(size(obj.names));
+obj.needsUpdate = repmat(and(tempDesignPointsNeedingUpdate, obj.valid), 1, obj.paramAmount);
+
+% Set initialize to default (1)
+obj.initializeFrom = 1;
+
+end
@@ -15,6 +15,21 @@ classdef WBinstance < handle
 		seekInputParamInd
 		seekOutputParamInd
 		iterationsParamInd
+		seekLockstep
+		seekWarmStartNeighbors
+		seekIterationLadder
+		seekNetTolerance
+		seekStepTolerance
+		seekMaxTrials
+		
+		dataExportMode
+		dataExportFormat
+		exportCompactEvery
+		
+		useScriptServer
+		scriptServerTimeoutSec
+		
+		resultCache
 	end
 	
 	properties (Access = protected)
@@ -22,11 +37,17 @@ classdef WBinstance < handle
 		workbenchVersion = '17.1';
 		workbenchPlatform = 'Win64';
 		workbenchExecPath;
+		exportSequence = 0;
+		exportDeltaOffset = -1; % Negative until the first full export
+		scriptServerSequence = 0;
+		scriptServerHeartbeatSec = 60; % Server is stopped if silent longer
 	end
 	
 	methods
 		% Constructor method
-		function obj = WBinstance(projectFilePath)
+		function obj = WBinstance(projectFilePath, settingsSource)
+			% (optional) settingsSource: WBinstance whose settings are
+			% copied, e.g. the instance of the project this is a copy of
 			if nargin < 1
 				error('Too few arguements passed.');
 			else
@@ -38,6 +59,16 @@ classdef WBinstance < handle
 				% Set up project path
 				obj.projectPath = projectFilePath;
 			end
+			if nargin < 2
+				settingsSource = [];
+			end
+			
+			% Export the past project data with the source's installation
+			if ~isempty(settingsSource)
+				obj.workbenchInstallFolder = settingsSource.workbenchInstallFolder;
+				obj.workbenchVersion = settingsSource.workbenchVersion;
+				obj.workbenchPlatform = settingsSource.workbenchPlatform;
+			end
 			
 			% Create default WB-opening command path
 			obj.workbenchExecPath = [ ...
@@ -60,6 +91,29 @@ classdef WBinstance < handle
 			obj.seekInputParamInd = 0;
 			obj.seekOutputParamInd = 0;
 			obj.iterationsParamInd = 0;
+			obj.seekLockstep = false;
+			obj.seekWarmStartNeighbors = 0;
+			obj.seekIterationLadder = [75 150];
+			obj.seekNetTolerance = 0;
+			obj.seekStepTolerance = 0;
+			obj.seekMaxTrials = 5;
+			
+			% Set default (full) data export
+			obj.dataExportMode = 'full';
+			obj.dataExportFormat = 'csv';
+			obj.exportCompactEvery = 50;
+			
+			% Set default (one Workbench session per script) script runs
+			obj.useScriptServer = false;
+			obj.scriptServerTimeoutSec = Inf;
+			
+			% Set default (no) result cache
+			obj.resultCache = [];
+			
+			% Take the settings of the source instance
+			if ~isempty(settingsSource)
+				obj = obj.copy_settings(settingsSource);
+			end
 		end
 
 		[obj] = set_WB_installation(obj, installationFolder, installationVersion, platform)
@@ -67,6 +121,19 @@ classdef WBinstance < handle
 		[obj] = set_seek_input_parameter(obj, paramIndex)
 		[obj] = set_seek_output_parameter(obj, paramIndex)
 		[obj] = set_iterations_parameter(obj, paramIndex)
+		[obj] = set_seek_lockstep(obj, lockstepBool)
+		[obj] = set_seek_warm_start(obj, nNeighbors)
+		[obj] = set_seek_fidelity(obj, iterationLadder, netTolerance, stepTolerance, maxTrials)
+		[obj] = set_data_export(obj, exportMode, compactEvery)
+		[obj] = set_data_export_format(obj, exportFormat)
+		[obj] = set_script_server(obj, useBool, batchTimeoutSec)
+		[obj] = start_script_server(obj, startupTimeoutSec)
+		[obj] = stop_script_server(obj)
+		[obj] = set_result_cache(obj, cache)
+		[obj] = copy_settings(obj, source)
+		[obj] = cache_results(obj, designPointIndices, simType)
+		[keys] = result_cache_keys(obj, paramData, simType)
+		[inputValues, slopes] = predict_seek_start(obj, designPointIndices)
 		[obj, workbenchRunTimeSec, successBool] = run_set(obj, designPointIndices, simType, debugModeBool)
 		[index] = check_param_index(obj, identifier)
 	end
@@ -74,6 +141,9 @@ classdef WBinstance < handle
 	methods(Access = private) % Private methods
 		[obj, pastDataExportPath] = export_past_project_data(obj)
 		[obj, runTimeSec] = run_workbench_script(obj, echoBool)
+		[obj, runTimeSec] = run_server_batch(obj)
+		[ageSec] = script_server_age(obj)
+		[spoolPath] = script_server_spool_path(obj)
 		[obj] = clear_workbench_script(obj, saveScriptBool)
 		[obj, messageInfo, message] = import_messages(obj)
 	end
@@ -0,0 +1,30 @@
+function [obj] = cache_results(obj, designPointIndices, simType)
+%CACHE_RESULTS Adds design point results to the result cache
+%	Adds the exported data of the valid design points in
+%	'designPointIndices', as results of a run_set of 'simType' ('simple'
+%	or 'seek'), then saves the cache if it has a file. Called by run_set
+%	after each export; can also be used to add the design points of a
+%	project's past data.
+%	Method for WBinstance class
+
+if isempty(obj.resultCache)
+	warning('No result cache is set, results were not cached.');
+	return
+end
+
+% Only valid results are cached (failures may be transient)
+DPind = reshape(designPointIndices, [], 1);
+DPind = DPind(obj.designPoints.valid(DPind));
+if isempty(DPind)
+	return
+end
+
+obj.resultCache.insert( ...
+	obj.result_cache_keys(obj.designPoints.data(DPind,:), simType), ...
+	num2cell(obj.designPoints.data(DPind,:), 2) );
+
+if ~isempty(obj.resultCache.filePath)
+	obj.resultCache.save_cache();
+end
+
+end
@@ -0,0 +1,34 @@
+function [obj] = copy_settings(obj, source)
+%COPY_SETTINGS Copies the settings of another WBinstance
+%	Copies the Workbench installation and the seek, data export, script
+%	server and result cache settings of 'source' (the result cache is
+%	shared, not copied), e.g. to run a copy of source's project the same
+%	way. The project, its design point list and the export and script
+%	server state are left as they are.
+%	Method for WBinstance class
+
+% Check input
+if ~isa(source, 'WBinstance')
+	error('Settings to copy should be from a WBinstance object.');
+end
+
+% Workbench installation
+obj.workbenchInstallFolder = source.workbenchInstallFolder;
+obj.workbenchVersion = source.workbenchVersion;
+obj.workbenchPlatform = source.workbenchPlatform;
+obj.workbenchExecPath = source.workbenchExecPath;
+
+% Public settings
+tempNames = { ...
+	'seekPolynomial', 'seekInputParamInd', 'seekOutputParamInd', 'iterationsParamInd', ...
+	'seekLockstep', 'seekWarmStartNeighbors', 'seekIterationLadder', 'seekNetTolerance', ...
+	'seekStepTolerance', 'seekMaxTrials', ...
+	'dataExportMode', 'dataExportFormat', 'exportCompactEvery', ...
+	'useScriptServer', 'scriptServerTimeoutSec', ...
+	'resultCache' };
+for i = 1:length(tempNames)
+	obj.(tempNames{i}) = source.(tempNames{i});
+end
+obj.scriptServerHeartbeatSec = source.scriptServerHeartbeatSec;
+
+end
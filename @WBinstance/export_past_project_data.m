@@ -13,7 +13,10 @@ fprintf(fileID, 'SetScriptVersion(Version="17.1.127")\n');
 fprintf(fileID, '\n');
 
 % Write command to script to open relevant project file
-fprintf(fileID, 'Open(FilePath="%s")\n', strrep(obj.projectPath, '\', '/'));
+% (already open on the script server)
+if ~obj.useScriptServer
+	fprintf(fileID, 'Open(FilePath="%s")\n', strrep(obj.projectPath, '\', '/'));
+end
 
 % Copy the data export commands into script
 localPath = fileparts(mfilename('fullpath'));
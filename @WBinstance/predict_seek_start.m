@@ -0,0 +1,85 @@
+function [inputValues, slopes] = predict_seek_start(obj, designPointIndices)
+%PREDICT_SEEK_START Predicts warm-start seek inputs and slopes from history
+%	[X, SLOPE] = PREDICT_SEEK_START(obj,IND) predicts the seek input value
+%	X and output slope SLOPE (dy/dx) to start the seeks of the design
+%	points in IND. Predictions are inverse-distance weighted means over the
+%	obj.seekWarmStartNeighbors nearest converged seeks in the seek history
+%	(seekHistory.csv in the project folder), measured in the geometry
+%	parameters and scaled by each parameter's range in the history.
+%	Entries are NaN where no prediction can be made.
+%
+%	Part of the WBinstance class
+
+inputValues = NaN(size(designPointIndices));
+slopes = NaN(size(designPointIndices));
+nNeighbors = obj.seekWarmStartNeighbors;
+if nNeighbors < 1
+	return
+end
+
+% Open the seek history file
+historyPath = [fileparts(obj.projectPath) '\seekHistory.csv'];
+fileID = fopen(historyPath, 'r');
+if fileID == -1
+	return
+end
+
+% Read the header and the history records
+historyNames = {};
+historyData = zeros(0, 0);
+tempLine = fgetl(fileID);
+while ischar(tempLine)
+	if strncmp(tempLine, 'DP Name,', 8)
+		tempLineData = textscan(tempLine, '%s', 'Delimiter', ',');
+		historyNames = tempLineData{1}(2:end-2);
+		historyData = zeros(0, length(historyNames) + 2);
+	elseif ~isempty(tempLine) && tempLine(1) ~= '#' && ~isempty(historyNames)
+		tempLineData = textscan(tempLine, '%s', 'Delimiter', ',');
+		tempValues = str2double(tempLineData{1}(2:end))';
+		if length(tempValues) == size(historyData, 2) && all(isfinite(tempValues))
+			historyData(end+1, :) = tempValues; %#ok<AGROW>
+		end
+	end
+	tempLine = fgetl(fileID);
+end
+fclose(fileID);
+
+if isempty(historyData)
+	return
+end
+
+% Match the history's geometry parameters to the design point parameters
+[found, paramInd] = ismember(historyNames, obj.designPoints.paramNames);
+if ~all(found)
+	warning('Seek history geometry parameters do not match the project, no warm start used.');
+	return
+end
+historyX = historyData(:, 1:end-2);
+historyInput = historyData(:, end-1);
+historySlope = historyData(:, end);
+
+% Scale distances by the range of each geometry parameter in the history
+rangeX = max(historyX, [], 1) - min(historyX, [], 1);
+rangeX(rangeX == 0) = 1;
+
+for j = 1:numel(designPointIndices)
+	kx = obj.designPoints.data(designPointIndices(j), paramInd');
+	if any(~isfinite(kx))
+		continue
+	end
+	tempDistances = sqrt(sum(((historyX - kx)./rangeX).^2, 2));
+	[tempDistances, iTemp] = sort(tempDistances, 'ascend');
+	iNeighbors = iTemp(1:min(nNeighbors, end));
+	tempDistances = tempDistances(1:length(iNeighbors));
+
+	if tempDistances(1) == 0 % Same geometry seeked before
+		weights = double(tempDistances == 0);
+	else
+		weights = 1./tempDistances;
+	end
+	weights = weights/sum(weights);
+	inputValues(j) = sum(weights.*historyInput(iNeighbors));
+	slopes(j) = sum(weights.*historySlope(iNeighbors));
+end
+
+end
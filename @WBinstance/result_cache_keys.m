@@ -0,0 +1,31 @@
+function [keys] = result_cache_keys(obj, paramData, simType)
+%RESULT_CACHE_KEYS Result cache keys of design points
+%	'paramData' has a row of values of all the parameters (as in
+%	designPoints.data) for each design point, and 'simType' is the
+%	run_set type ('simple' or 'seek') of the results. A key is made of
+%	the values of the mutable parameters (which include the operating
+%	point), rounded by the cache as they are when sent to Workbench, with
+%	the names of all the parameters and simType. For 'seek' results the
+%	seek input and iterations parameters are set by the seeking, so they
+%	are left out and the seek output parameter and polynomial are used
+%	instead.
+%	Method for WBinstance class
+
+keyInd = find(obj.designPoints.paramMutable)';
+if strcmp(simType, 'seek')
+	keyInd = keyInd(keyInd ~= obj.seekInputParamInd & keyInd ~= obj.iterationsParamInd);
+	prefix = sprintf('seek:%s:%s:', obj.designPoints.paramNames{obj.seekOutputParamInd}, ...
+		sprintf('%.8f,', obj.seekPolynomial));
+else
+	prefix = sprintf('%s:', simType);
+end
+% All parameter names, so that data rows are only shared between projects
+% with the same parameters
+prefix = [prefix sprintf('%s,', obj.designPoints.paramNames{:})];
+
+keys = cell(size(paramData, 1), 1);
+for i = 1:size(paramData, 1)
+	keys{i} = obj.resultCache.make_key(paramData(i,keyInd), prefix);
+end
+
+end
@@ -0,0 +1,48 @@
+function [obj, runTimeSec] = run_server_batch(obj)
+%run_server_batch Runs the current Workbench script on the script server
+%	Queues the script in the server's spool directory with a new request
+%	ID and waits for its result. Errors if the script failed, the server
+%	stops or the timeout passes.
+%	Part of the WBinstance class
+
+% Start the server if it is not running
+if obj.script_server_age() >= obj.scriptServerHeartbeatSec
+	obj.start_script_server();
+end
+spoolPath = obj.script_server_spool_path();
+
+% Queue the script (renamed once written, so it is never read partially)
+obj.scriptServerSequence = obj.scriptServerSequence + 1;
+requestId = sprintf('%s-%06d', datestr(now, 'yyyymmddTHHMMSSFFF'), obj.scriptServerSequence);
+copyfile(obj.scriptFilePath, fullfile(spoolPath, [requestId '.tmp']));
+movefile(fullfile(spoolPath, [requestId '.tmp']), fullfile(spoolPath, [requestId '.wbjn']));
+
+% Wait for the result
+resultPath = fullfile(spoolPath, [requestId '.result']);
+runningPath = fullfile(spoolPath, [requestId '.running']);
+tic;
+while exist(resultPath, 'file') ~= 2
+	if toc > obj.scriptServerTimeoutSec
+		obj = obj.clear_workbench_script(true);
+		error('Timed out waiting for script server request %s.', requestId);
+	end
+	if exist(runningPath, 'file') ~= 2 && toc > obj.scriptServerHeartbeatSec ...
+			&& obj.script_server_age() > obj.scriptServerHeartbeatSec
+		obj = obj.clear_workbench_script(true);
+		error('Script server stopped before running request %s.', requestId);
+	end
+	pause(0.2);
+end
+runTimeSec = toc;
+result = jsondecode(fileread(resultPath));
+delete(resultPath);
+
+% Archive the (now-used) script file
+obj = obj.clear_workbench_script(true);
+
+% Show error message if the script failed
+if ~strcmp(result.status, 'ok')
+	error('Script server request %s failed:\n\t"%s"', requestId, result.error)
+end
+
+end
@@ -68,8 +68,10 @@ fprintf(fileID, '\n');
 messagePreCommands = fileread(fullfile(localPath, '..', 'resources', 'messages_export_pre_script.py'));
 fprintf(fileID, '%s', messagePreCommands);
 
-% Write command to open relevant file
-fprintf(fileID, 'Open(FilePath="%s")\n', strrep(obj.projectPath, '\', '/'));
+% Write command to open relevant file (already open on the script server)
+if ~obj.useScriptServer
+	fprintf(fileID, 'Open(FilePath="%s")\n', strrep(obj.projectPath, '\', '/'));
+end
 
 % Change method depending on simType
 if strcmp(simType, 'geometry') % --- GEOMETRY MODE ------------------------
@@ -213,7 +215,8 @@ elseif strcmp(simType, 'seek') % --- SEEK MODE ----------------------------
 	
 	% Write commands to import necessary linear algebra functions
 	fprintf(fileID, 'import sys, os\n');
-	fprintf(fileID, 'sys.path.append(os.path.abspath(''%s''))\n', strrep(fullfile(localPath, '..', 'resources'), filesep, '/'));
+	fprintf(fileID, 'if os.path.abspath(resourcesPath) not in sys.path:\n'); % The script server keeps sys.path between sets
+	fprintf(fileID, '\tsys.path.append(os.path.abspath(resourcesPath))\n');
 	fprintf(fileID, 'import LinAlg as la\n');
 	
 	% Define a list of design points for the seeking
@@ -241,6 +244,41 @@ elseif strcmp(simType, 'seek') % --- SEEK MODE ----------------------------
 	fprintf(fileID, 'inputParameter = Parameters.GetParameter(Name="%s")\n', obj.designPoints.paramNames{obj.seekInputParamInd});
 	fprintf(fileID, 'outputParameter = Parameters.GetParameter(Name="%s")\n', obj.designPoints.paramNames{obj.seekOutputParamInd});
 	fprintf(fileID, 'iterationsParameter = Parameters.GetParameter(Name="%s")\n', obj.designPoints.paramNames{obj.iterationsParamInd});
+	if obj.seekLockstep
+		fprintf(fileID, 'seekLockstep = True\n');
+	else
+		fprintf(fileID, 'seekLockstep = False\n');
+	end
+	
+	% Define the fidelity controller settings for seeking
+	fprintf(fileID, 'seekIterationLadder = [');
+	for i = 1:length(obj.seekIterationLadder)
+		fprintf(fileID, '%d,', obj.seekIterationLadder(i));
+	end
+	fprintf(fileID, ']\n');
+	fprintf(fileID, 'seekNetTolerance = %.8g\n', obj.seekNetTolerance);
+	fprintf(fileID, 'seekStepTolerance = %.8g\n', obj.seekStepTolerance);
+	fprintf(fileID, 'seekMaxTrials = %d\n', obj.seekMaxTrials);
+	
+	% Define the geometry parameters recorded in the seek history
+	fprintf(fileID, 'geometryParameters = [');
+	for i = find(obj.designPoints.paramMutable)'
+		if i ~= obj.seekInputParamInd && i ~= obj.iterationsParamInd
+			fprintf(fileID, 'Parameters.GetParameter(Name="%s"),', obj.designPoints.paramNames{i});
+		end
+	end
+	fprintf(fileID, ']\n');
+	
+	% Define the warm-start predictions from the seek history
+	[tempInputs, tempSlopes] = obj.predict_seek_start(DPind);
+	fprintf(fileID, 'seekStart = {');
+	for j = 1:length(DPind)
+		i = DPind(j);
+		if obj.designPoints.valid(i) && isfinite(tempInputs(j)) && isfinite(tempSlopes(j)) && tempSlopes(j) ~= 0
+			fprintf(fileID, '"%s": (%.10g, %.10g),', obj.designPoints.names{i}, tempInputs(j), tempSlopes(j));
+		end
+	end
+	fprintf(fileID, '}\n');
 	
 	% Copy in the seeking script
 	seekingUpdateCommands = fileread(fullfile(localPath, '..', 'resources', 'seeking_update_script.py'));
@@ -253,14 +291,45 @@ else % Invalid simType
 	return
 end
 
+% Copy in the message pre-pass shared by the post-scripts
+% (fetches and filters the run's messages once)
+messageCacheCommands = fileread(fullfile(localPath, '..', 'resources', 'message_cache_script.py'));
+fprintf(fileID, '%s', messageCacheCommands);
+
 % Copy in the script for validity parsing
 % (sets invalid/failed simulation DP's to retained=false)
 validityParsingCommands = fileread(fullfile(localPath, '..', 'resources', 'validity_parsing_script.py'));
 fprintf(fileID, '%s', validityParsingCommands);
 
-% Copy the data export commands into script
-dataExportCommands = fileread(fullfile(localPath, '..', 'resources', 'data_export_script.py'));
-fprintf(fileID, '%s', dataExportCommands);
+% Copy the data export commands into script, as a delta of the touched
+% design points or (periodically, or in 'full' mode) as a full snapshot
+exportSequence = obj.exportSequence + 1;
+deltaExportBool = strcmp(obj.dataExportMode, 'delta') && obj.exportDeltaOffset >= 0 ...
+	&& mod(exportSequence, obj.exportCompactEvery) ~= 0;
+if deltaExportBool
+	fprintf(fileID, 'exportSequence = %d\n', exportSequence);
+	knownDesignPointCount = find([obj.designPoints.new; true], 1) - 1;
+	fprintf(fileID, 'knownDesignPointCount = %d\n', knownDesignPointCount);
+	fprintf(fileID, 'touchedDesignPointNames = [');
+	for i = DPind
+		if i <= knownDesignPointCount
+			fprintf(fileID, '"%s",', obj.designPoints.names{i});
+		end
+	end
+	fprintf(fileID, ']\n');
+	dataExportCommands = fileread(fullfile(localPath, '..', 'resources', 'delta_export_script.py'));
+	fprintf(fileID, '%s', dataExportCommands);
+elseif strcmp(obj.dataExportFormat, 'binary')
+	dataExportCommands = fileread(fullfile(localPath, '..', 'resources', 'binary_export_script.py'));
+	fprintf(fileID, '%s', dataExportCommands);
+else
+	dataExportCommands = fileread(fullfile(localPath, '..', 'resources', 'data_export_script.py'));
+	fprintf(fileID, '%s', dataExportCommands);
+end
+if ~deltaExportBool && strcmp(obj.dataExportMode, 'delta')
+	% Compaction, start a new delta file after the snapshot
+	fprintf(fileID, 'open(GetProjectDirectory() + ''\\\\deltaDataExport.csv'', ''w'').close()\n');
+end
 
 % Copy in the post-script for message export
 messagePostCommands = fileread(fullfile(localPath, '..', 'resources', 'messages_export_post_script.py'));
@@ -275,8 +344,36 @@ fclose(fileID);
 [obj, workbenchRunTimeSec] = obj.run_workbench_script(debugModeBool);
 
 % Import results from exported file
-dataExportPath = [fileparts(obj.projectPath) '\fullDataExport.csv'];
-obj.designPoints = WBdesignPointList(dataExportPath);
+if strcmp(obj.dataExportFormat, 'binary')
+	dataExportPath = [fileparts(obj.projectPath) '\dataExport.json'];
+else
+	dataExportPath = [fileparts(obj.projectPath) '\fullDataExport.csv'];
+end
+if deltaExportBool
+	deltaDataPath = [fileparts(obj.projectPath) '\deltaDataExport.csv'];
+	[obj.designPoints, obj.exportDeltaOffset, obj.exportSequence, mergedBool] = ...
+		obj.designPoints.merge_delta(deltaDataPath, obj.exportDeltaOffset, exportSequence);
+	if ~mergedBool
+		% Re-read the whole project, the next run starts a new delta file
+		warning('Delta data export could not be merged, exporting full project data.');
+		[obj, pastDataExportPath] = obj.export_past_project_data();
+		obj.designPoints = WBdesignPointList(pastDataExportPath);
+		obj.exportDeltaOffset = -1;
+	end
+else
+	obj.designPoints = WBdesignPointList(dataExportPath);
+	obj.exportSequence = exportSequence;
+	if strcmp(obj.dataExportMode, 'delta')
+		obj.exportDeltaOffset = 0; % Delta file was restarted
+	else
+		obj.exportDeltaOffset = -1;
+	end
+end
+
+% Add the results to the result cache
+if ~isempty(obj.resultCache) && any(strcmp(simType, {'simple', 'seek'}))
+	obj = obj.cache_results(DPind, simType);
+end
 
 % Set successBool output
 successBool = obj.designPoints.valid(DPind');
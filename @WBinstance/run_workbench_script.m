@@ -2,6 +2,12 @@ function [obj, runTimeSec] = run_workbench_script(obj, echoBool)
 %run_workbench_script Runs the current Workbench script, returns run time
 %	Part of the WBinstance class
 
+% Pass the script to the persistent Workbench session, if used
+if obj.useScriptServer
+	[obj, runTimeSec] = obj.run_server_batch();
+	return
+end
+
 command = ['"' obj.workbenchExecPath '"'];
 arguments = [' -B -R "' obj.scriptFilePath '"'];
 
@@ -0,0 +1,15 @@
+function [ageSec] = script_server_age(obj)
+%script_server_age Seconds since the script server's last heartbeat
+%	Returns Inf if there is no server heartbeat.
+%	Part of the WBinstance class
+
+ageSec = Inf;
+heartbeatPath = fullfile(obj.script_server_spool_path(), 'heartbeat');
+if exist(heartbeatPath, 'file') == 2
+	beatTime = str2double(fileread(heartbeatPath));
+	if isfinite(beatTime)
+		ageSec = posixtime(datetime('now', 'TimeZone', 'UTC')) - beatTime;
+	end
+end
+
+end
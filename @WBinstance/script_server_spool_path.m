@@ -0,0 +1,7 @@
+function [spoolPath] = script_server_spool_path(obj)
+%script_server_spool_path Path of the script server's spool directory
+%	Part of the WBinstance class
+
+spoolPath = [fileparts(obj.projectPath) '\scriptServer'];
+
+end
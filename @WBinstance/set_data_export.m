@@ -0,0 +1,31 @@
+function [obj] = set_data_export(obj, exportMode, compactEvery)
+%SET_DATA_EXPORT Sets how run_set exports project data from Workbench
+%	'exportMode' is one of:
+%		'full'	- Rewrites fullDataExport.csv with every design point
+%				after each run (default)
+%		'delta'	- Appends only the design points touched by each run to
+%				deltaDataExport.csv, merged into the design point list
+%	In 'delta' mode a full snapshot is exported (and the delta file
+%	restarted) every 'compactEvery' runs, and whenever the deltas cannot
+%	be merged.
+%	Method for WBinstance class
+
+if nargin < 3
+	compactEvery = obj.exportCompactEvery;
+end
+
+% Check inputs
+if ~any(strcmp(exportMode, {'full', 'delta'}))
+	warning('Data export mode to set should be ''full'' or ''delta''.\nPrevious value left unchanged.');
+	return
+end
+if ~isscalar(compactEvery) || compactEvery < 1 || mod(compactEvery, 1) ~= 0
+	warning('Compaction interval to set should be a positive integer.\nPrevious value left unchanged.');
+	return
+end
+
+% Set WBinstance properties
+obj.dataExportMode = exportMode;
+obj.exportCompactEvery = compactEvery;
+
+end
@@ -0,0 +1,18 @@
+function [obj] = set_data_export_format(obj, exportFormat)
+%SET_DATA_EXPORT_FORMAT Sets the file format of full project data exports
+%	'exportFormat' is one of:
+%		'csv'		- fullDataExport.csv text table (default)
+%		'binary'	- dataExport.json header with a little-endian float64
+%					matrix in dataExport.f64, read without text parsing
+%	Method for WBinstance class
+
+% Check input
+if ~any(strcmp(exportFormat, {'csv', 'binary'}))
+	warning('Data export format to set should be ''csv'' or ''binary''.\nPrevious value left unchanged.');
+	return
+end
+
+% Set WBinstance property
+obj.dataExportFormat = exportFormat;
+
+end
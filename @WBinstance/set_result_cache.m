@@ -0,0 +1,19 @@
+function [obj] = set_result_cache(obj, cache)
+%SET_RESULT_CACHE Sets the cache of simulation results
+%	'cache' is a ResultCache (e.g. ResultCache('C:\cfd\results.mat'),
+%	which can be shared by several projects), or empty for none. Each
+%	'simple' or 'seek' run_set adds its valid results to the cache, and
+%	WBpackage.simulate takes the design points it finds there from it
+%	instead of simulating them.
+%	Method for WBinstance class
+
+% Check input
+if ~isempty(cache) && ~isa(cache, 'ResultCache')
+	warning('Result cache to set should be a ResultCache object.\nPrevious value left unchanged.');
+	return
+end
+
+% Set WBinstance property
+obj.resultCache = cache;
+
+end
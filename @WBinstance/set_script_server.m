@@ -0,0 +1,33 @@
+function [obj] = set_script_server(obj, useBool, batchTimeoutSec)
+%SET_SCRIPT_SERVER Sets whether scripts run in a persistent Workbench session
+%	If 'useBool' is true, run_set passes its scripts to a long-lived
+%	Workbench session (started on first use, see start_script_server)
+%	that keeps the project open, instead of starting Workbench and
+%	reopening the project for each script. 'batchTimeoutSec' (default
+%	Inf) limits the wait for each script's result.
+%	Method for WBinstance class
+
+if nargin < 3
+	batchTimeoutSec = Inf;
+end
+
+% Check inputs
+if ~isscalar(useBool) || ~(islogical(useBool) || isnumeric(useBool))
+	warning('Script server value to set should be a logical scalar.\nPrevious value left unchanged.');
+	return
+end
+if ~isscalar(batchTimeoutSec) || ~isnumeric(batchTimeoutSec) || batchTimeoutSec <= 0
+	warning('Script server timeout to set should be a positive scalar.\nPrevious value left unchanged.');
+	return
+end
+
+% Stop a running server when switching back
+if obj.useScriptServer && ~useBool
+	obj.stop_script_server();
+end
+
+% Set WBinstance properties
+obj.useScriptServer = logical(useBool);
+obj.scriptServerTimeoutSec = batchTimeoutSec;
+
+end
@@ -0,0 +1,49 @@
+function [obj] = set_seek_fidelity(obj, iterationLadder, netTolerance, stepTolerance, maxTrials)
+%SET_SEEK_FIDELITY Sets the fidelity controller for the seek run-type
+%	'iterationLadder' is a vector of increasing solver iterations amounts,
+%	from the first trial's to the final (high-resolution) trial's:
+%		low-res 75, high-res 150  -->  iterationLadder = [75 150]
+%	A trial is converged when |net| <= 'netTolerance' and the change in
+%	the seek input from the previous trial is <= 'stepTolerance'
+%	(tolerances <= 0 are not checked). A converged trial promotes the next
+%	trial one step up the ladder, and a converged trial at the top of the
+%	ladder ends the seek. At most 'maxTrials' trials are run, the last of
+%	them always at the top of the ladder. With no tolerances set, every
+%	trial is run as before.
+%	Method for WBinstance class
+
+if nargin < 5
+	maxTrials = obj.seekMaxTrials;
+	if nargin < 4
+		stepTolerance = 0;
+		if nargin < 3
+			netTolerance = 0;
+		end
+	end
+end
+
+% Check the ladder is an increasing vector of positive integers
+if isempty(iterationLadder) || ~isnumeric(iterationLadder) || ~isvector(iterationLadder) ...
+		|| any(iterationLadder <= 0) || any(mod(iterationLadder, 1) ~= 0) ...
+		|| any(diff(iterationLadder) <= 0)
+	warning('Iteration ladder to set should be an increasing vector of positive integers.\nPrevious value left unchanged.');
+	return
+end
+
+% Check the tolerances and trials amount
+if ~isscalar(netTolerance) || ~isscalar(stepTolerance) || ~isreal(netTolerance) || ~isreal(stepTolerance)
+	warning('Seek tolerances to set should be real scalars.\nPrevious value left unchanged.');
+	return
+end
+if ~isscalar(maxTrials) || maxTrials < length(iterationLadder) || mod(maxTrials, 1) ~= 0
+	warning('Seek maxTrials to set should be an integer no less than the ladder length.\nPrevious value left unchanged.');
+	return
+end
+
+% Set WBinstance properties
+obj.seekIterationLadder = reshape(iterationLadder, 1, []);
+obj.seekNetTolerance = netTolerance;
+obj.seekStepTolerance = stepTolerance;
+obj.seekMaxTrials = maxTrials;
+
+end
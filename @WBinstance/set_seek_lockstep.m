@@ -0,0 +1,17 @@
+function [obj] = set_seek_lockstep(obj, lockstepBool)
+%SET_SEEK_LOCKSTEP Sets whether seeks run in lockstep for WBinstance class
+%	If 'lockstepBool' is true, trial i of every still-active design point
+%	in a seek set is submitted in a single UpdateAllDesignPoints call,
+%	instead of seeking one design point at a time.
+%	Static method for WBinstance class
+
+% Check input is a logical scalar
+if ~isscalar(lockstepBool) || ~(islogical(lockstepBool) || isnumeric(lockstepBool))
+	warning('Seek lockstep value to set should be a logical scalar.\nPrevious value left unchanged.');
+	return
+end
+
+% Set WBinstance property
+obj.seekLockstep = logical(lockstepBool);
+
+end
@@ -0,0 +1,18 @@
+function [obj] = set_seek_warm_start(obj, nNeighbors)
+%SET_SEEK_WARM_START Sets the neighbors used for warm-start seek predictions
+%	'nNeighbors' is the number of nearest converged seeks in the seek
+%	history used to predict each new seek's starting input and slope (see
+%	predict_seek_start). Set to 0 to start seeks from the design point's
+%	current input value and the default guessed slope.
+%	Method for WBinstance class
+
+% Check input is a non-negative integer scalar
+if ~isscalar(nNeighbors) || ~isnumeric(nNeighbors) || nNeighbors < 0 || mod(nNeighbors, 1) ~= 0
+	warning('Warm-start neighbors to set should be a non-negative integer.\nPrevious value left unchanged.');
+	return
+end
+
+% Set WBinstance property
+obj.seekWarmStartNeighbors = nNeighbors;
+
+end
@@ -0,0 +1,62 @@
+function [obj] = start_script_server(obj, startupTimeoutSec)
+%START_SCRIPT_SERVER Starts a persistent Workbench session for run_set
+%	Launches Workbench once in batch mode with the project open, running
+%	the command loop in resources/ScriptServer.py. Scripts are then
+%	passed to it through a spool directory next to the project, instead
+%	of starting Workbench and reopening the project for every script.
+%	Waits up to STARTUPTIMEOUTSEC (default 600) for the server to start.
+%
+%	Part of the WBinstance class
+
+if nargin < 2
+	startupTimeoutSec = 600;
+end
+
+% Nothing to do if a server is already running
+if obj.script_server_age() < obj.scriptServerHeartbeatSec
+	return
+end
+
+localPath = fileparts(mfilename('fullpath'));
+resourcesPath = strrep(fullfile(localPath, '..', 'resources'), filesep, '/');
+spoolPath = obj.script_server_spool_path();
+if exist(spoolPath, 'dir') ~= 7
+	mkdir(spoolPath);
+end
+
+% Write the server bootstrap script
+bootstrapPath = [fileparts(obj.projectPath) '\scriptServer.wbjn'];
+fileID = fopen(bootstrapPath, 'w');
+fprintf(fileID, '# encoding: utf-8\n');
+fprintf(fileID, '# Release %s\n', obj.workbenchVersion);
+fprintf(fileID, '# SCRIPT SERVER - script autogenerated in Matlab.\n');
+fprintf(fileID, 'SetScriptVersion(Version="17.1.127")\n');
+fprintf(fileID, '\n');
+fprintf(fileID, 'projectFilePath = "%s"\n', strrep(obj.projectPath, '\', '/'));
+fprintf(fileID, 'Open(FilePath=projectFilePath)\n');
+fprintf(fileID, 'import sys, os\n');
+fprintf(fileID, 'sys.path.append(os.path.abspath(''%s''))\n', resourcesPath);
+fprintf(fileID, 'import ScriptServer\n');
+fprintf(fileID, 'def reopenProject():\n');
+fprintf(fileID, '\tOpen(FilePath=projectFilePath)\n');
+fprintf(fileID, 'ScriptServer.serveForever(''%s'', globals(), onError=reopenProject)\n', strrep(spoolPath, '\', '/'));
+fclose(fileID);
+
+% Launch Workbench without waiting for it
+command = ['start "WBscriptServer" /B "' obj.workbenchExecPath '"'];
+arguments = [' -B -R "' bootstrapPath '"'];
+[status, message] = system([command arguments]);
+if status ~= 0
+	error('Script server could not be started: %d\n\t"%s"', status, message)
+end
+
+% Wait for the first heartbeat
+tic;
+while obj.script_server_age() >= obj.scriptServerHeartbeatSec
+	if toc > startupTimeoutSec
+		error('Script server did not start within %d seconds.', startupTimeoutSec);
+	end
+	pause(1);
+end
+
+end
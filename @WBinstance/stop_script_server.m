@@ -0,0 +1,15 @@
+function [obj] = stop_script_server(obj)
+%STOP_SCRIPT_SERVER Asks the persistent Workbench session to exit
+%	The server finishes its current script first. run_set goes back to
+%	starting Workbench for every script unless useScriptServer is set,
+%	in which case a new server is started for the next script.
+%
+%	Part of the WBinstance class
+
+spoolPath = obj.script_server_spool_path();
+if exist(spoolPath, 'dir') == 7
+	fileID = fopen(fullfile(spoolPath, 'shutdown'), 'w');
+	fclose(fileID);
+end
+
+end
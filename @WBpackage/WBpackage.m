@@ -6,6 +6,13 @@ classdef WBpackage < handle
 	%	Use the following syntax for calling WBpackage.simulate() as an 
 	%	anonymous function:
 	%		@(x) WBpack.simulate(x, 'seek')
+	%
+	%	For MOSAO's asynchronous mode (opt.BayesAsync), give the package
+	%	copies of the project to run the pending sets on, and pass its
+	%	handles to the Database:
+	%		WBpack = WBpack.set_async_projects({copy1Path, copy2Path});
+	%		[tempSubmit, tempCollect] = WBpack.async_handles('seek');
+	%		optimizer.db.set_async_calls(tempSubmit, tempCollect);
 	
 	properties (SetAccess = public, GetAccess = public) % Public read/write properties
 		WBi					% WBinstance object
@@ -32,6 +39,13 @@ classdef WBpackage < handle
 		operatingPointInd		% Indices of operating point variables
 		operatingPointValues	% Values used for operating point(s)
 		nOperatingPoints		% Amount of operating points
+		
+		asyncWBi				% WBinstance of each project copy for asynchronous sets
+		asyncBusy				% Indicates the project copies running a set
+	end
+	
+	properties (SetAccess = private, GetAccess = private) % Private properties
+		asyncFutureIDs			% ID of the future running on each project copy
 	end
 	
 	methods
@@ -94,6 +108,11 @@ classdef WBpackage < handle
 			obj.operatingPointInd = [];
 			obj.operatingPointValues = [];
 			obj.nOperatingPoints = 1;
+			
+			% Set no (default) project copies for asynchronous sets
+			obj.asyncWBi = cell(1, 0);
+			obj.asyncBusy = false(1, 0);
+			obj.asyncFutureIDs = zeros(1, 0);
 		end
 		
 		% Public methods
@@ -104,5 +123,15 @@ classdef WBpackage < handle
 		[y, valid] = simulate(obj, x, runType);
 		%y = read(obj, readInd);
 		lenY = get_y_length(obj);
+		nDP = get_set_size(obj);
+		obj = set_async_projects(obj, projectFilePaths);
+		[submitHandle, collectHandle] = async_handles(obj, runType);
+		future = submit_async(obj, x, runType);
+		[y, valid] = collect_async(obj, future, runType);
+		[y, valid, WBi] = simulate_project(obj, k, x, runType);
+	end
+	
+	methods (Access = private) % Private methods
+		WBi = open_async_project(obj, projectFilePath);
 	end
 end
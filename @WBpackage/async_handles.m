@@ -0,0 +1,25 @@
+function [submitHandle, collectHandle] = async_handles(obj, runType)
+%ASYNC_HANDLES Returns the handles for Database.set_async_calls
+%
+%	RUNTYPE		(optional) As for simulate(), default 'plain'. Use the
+%				same one as the function handle the Database calls.
+%
+%	The Database then starts each call set on a free project copy
+%	(submit_async) and adds its results with collect_async, e.g.
+%		[tempSubmit, tempCollect] = WBpack.async_handles('seek');
+%		optimizer.db.set_async_calls(tempSubmit, tempCollect);
+%
+%	Part of the WBpackage class.
+
+if nargin < 2
+	runType = 'plain';
+end
+
+if isempty(obj.asyncWBi)
+	error('WBpackage:NoAsyncProjects', 'No project copies are set for asynchronous sets (set_async_projects).');
+end
+
+submitHandle = @(x) obj.submit_async(x, runType);
+collectHandle = @(future) obj.collect_async(future, runType);
+
+end
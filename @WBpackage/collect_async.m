@@ -0,0 +1,52 @@
+function [y, valid] = collect_async(obj, future, runType)
+%COLLECT_ASYNC Returns the results of a set started by submit_async
+%	Keeps the WBinstance the worker returned as the project copy's (its
+%	design point list now has the set's design points), adds the set's
+%	results to the result cache of obj.WBi, if any, and frees the copy
+%	for the next set. If the set failed, the copy's design point list is
+%	read from its project again and the set's error is rethrown.
+%
+%	Part of the WBpackage class.
+
+if nargin < 3
+	runType = 'plain';
+end
+
+k = find(obj.asyncFutureIDs == future.ID, 1);
+if isempty(k)
+	error('WBpackage:UnknownFuture', 'The set was not started by submit_async of this package.');
+end
+obj.asyncBusy(k) = false;
+obj.asyncFutureIDs(k) = 0;
+
+try
+	[y, valid, tempWBi] = fetchOutputs(future);
+catch tempME
+	% The design points the set added are only known to the project now
+	try
+		obj.asyncWBi{k} = obj.open_async_project(obj.asyncWBi{k}.projectPath);
+	catch
+		obj.asyncBusy(k) = true; % Not used again
+		warning('WBpackage:AsyncProjectLost', 'Project copy %d could not be read again and is left unused:\n\t%s', ...
+			k, obj.asyncWBi{k}.projectPath);
+	end
+	rethrow(tempME);
+end
+
+% Keep the copy's design point list, sharing the client's result cache
+tempAmount = obj.asyncWBi{k}.designPoints.amount;
+tempWBi.resultCache = obj.WBi.resultCache;
+obj.asyncWBi{k} = tempWBi;
+
+% The worker cached the results in its copy of the cache (and its file)
+if ~isempty(tempWBi.resultCache) && tempWBi.designPoints.amount > tempAmount
+	switch runType
+		case 'plain'
+			simType = 'simple';
+		case 'seek'
+			simType = 'seek';
+	end
+	obj.asyncWBi{k} = tempWBi.cache_results((tempAmount + 1):tempWBi.designPoints.amount, simType);
+end
+
+end
@@ -0,0 +1,13 @@
+function [nDP] = get_set_size(obj)
+%GET_SET_SIZE Returns the number of x vectors simulated per Workbench set
+%	Each x vector is run at every operating point, so a set holds
+%	maxCallsPerSet/nOperatingPoints of them. Use as MOSAO's
+%	opt.BayesNcandidates so that each batch of candidates fills one set.
+%
+%	Part of the WBpackage class.
+
+nDP = max( ...
+	floor(obj.maxCallsPerSet/obj.nOperatingPoints), ...
+	obj.nOperatingPoints );
+
+end
@@ -0,0 +1,22 @@
+function WBi = open_async_project(obj, projectFilePath)
+%OPEN_ASYNC_PROJECT Creates the WBinstance of a copy of the project
+%	The copy takes the settings of obj.WBi, must have its parameters, and
+%	initializes new design points from the design point of the same name
+%	as obj.WBi does.
+%
+%	Part of the WBpackage class. Private method.
+
+WBi = WBinstance(projectFilePath, obj.WBi);
+
+if ~isequal(WBi.designPoints.paramNames, obj.WBi.designPoints.paramNames)
+	error('WBpackage:ProjectMismatch', ...
+		'Project copy does not have the parameters of the main project:\n\t%s', projectFilePath);
+end
+
+tempInd = find(strcmp(WBi.designPoints.names, ...
+	obj.WBi.designPoints.names{obj.WBi.designPoints.initializeFrom}), 1);
+if ~isempty(tempInd)
+	WBi.designPoints = WBi.designPoints.change_initialize(tempInd);
+end
+
+end
@@ -0,0 +1,48 @@
+function obj = set_async_projects(obj, projectFilePaths)
+%SET_ASYNC_PROJECTS Sets the project copies asynchronous sets run on
+%
+%	PROJECTFILEPATHS	Cell array of project files, each a copy of the
+%						project of obj.WBi (with the same parameters) in
+%						a folder of its own, or empty for none.
+%
+%	A Workbench project cannot run two sets at once, and a set adds
+%	design points numbered after the ones in the project's design point
+%	list. So each set started by submit_async runs on a copy that is not
+%	running another set, and the design point list of each copy is kept
+%	here, on the client, and updated with the set's results by
+%	collect_async. Use at least as many copies as sets can be pending
+%	(MOSAO's opt.BayesNpending).
+%
+%	A WBinstance is created for each copy (exporting its past project
+%	data, one Workbench run each), with the settings of obj.WBi.
+%
+%	Part of the WBpackage class.
+
+if isempty(projectFilePaths)
+	projectFilePaths = cell(1, 0);
+elseif ischar(projectFilePaths)
+	projectFilePaths = {projectFilePaths};
+end
+
+if any(obj.asyncBusy)
+	error('WBpackage:AsyncBusy', 'Project copies cannot be changed while sets are running on them.');
+end
+
+% Scripts and exports are written next to each project file
+tempFolders = cellfun(@fileparts, [{obj.WBi.projectPath}, reshape(projectFilePaths, 1, [])], ...
+	'UniformOutput', false);
+if length(unique(lower(tempFolders))) < length(tempFolders)
+	error('WBpackage:SharedProjectFolder', ...
+		'Each project copy must be in a folder of its own, apart from the main project.');
+end
+
+tempWBi = cell(1, length(projectFilePaths));
+for k = 1:length(projectFilePaths)
+	tempWBi{k} = obj.open_async_project(projectFilePaths{k});
+end
+
+obj.asyncWBi = tempWBi;
+obj.asyncBusy = false(1, length(tempWBi));
+obj.asyncFutureIDs = zeros(1, length(tempWBi));
+
+end
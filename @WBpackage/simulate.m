@@ -1,5 +1,9 @@
 function [y, valid] = simulate(obj, x, runType)
 %SIMULATE Sets up and runs simulations in ANSYS Workbench
+%	If the WBinstance has a result cache (WBinstance.set_result_cache),
+%	the x values whose design points (one for each operating point) are
+%	all in it take their results from the cache, and only the others are
+%	simulated.
 %
 %	Part of the WBpackage class.
 
@@ -26,10 +30,8 @@ end
 nDP = size(x, 1);
 
 % Create empty output arrays
-results = [];
-simValid = [];
-y = [];
-valid = [];
+yCell = cell(nDP, 1);
+validCell = cell(nDP, 1);
 
 % Use inputFunc if applicable
 paramValues = zeros(nDP, length(obj.inputInd));
@@ -41,12 +43,43 @@ else
 	paramValues = x;
 end
 
+% Take the x values with all their operating points cached from the
+% result cache
+iSimulate = (1:nDP)';
+if ~isempty(obj.WBi.resultCache)
+	switch runType
+		case 'plain'
+			simType = 'simple';
+		case 'seek'
+			simType = 'seek';
+	end
+
+	% Parameter values the design points would be created with
+	tempData = repmat(obj.WBi.designPoints.data(obj.WBi.designPoints.initializeFrom,:), ...
+		nDP*obj.nOperatingPoints, 1);
+	for j = 1:obj.nOperatingPoints
+		tempRows = (1:nDP)' + (j - 1)*nDP;
+		if ~isempty(obj.operatingPointInd)
+			tempData(tempRows, obj.operatingPointInd) = repmat(obj.operatingPointValues(j,:), nDP, 1);
+		end
+		tempData(tempRows, obj.inputInd) = paramValues;
+	end
+
+	[tempCached, tempHit] = obj.WBi.resultCache.lookup(obj.WBi.result_cache_keys(tempData, simType));
+	tempCached = reshape(tempCached, nDP, obj.nOperatingPoints);
+	tempHit = all(reshape(tempHit, nDP, obj.nOperatingPoints), 2);
+	for i = find(tempHit)'
+		[yCell{i}, validCell{i}] = collect_results(obj, x, ...
+			cell2mat(tempCached(i,:)'), true(obj.nOperatingPoints, 1));
+	end
+	iSimulate = find(~tempHit);
+end
+nSimulate = length(iSimulate);
+
 % Create ranges for sets of runs
-maxDPsPerSet = max( ...
-	floor(obj.maxCallsPerSet/obj.nOperatingPoints), ...
-	obj.nOperatingPoints );
-setStart = 1:maxDPsPerSet:nDP;
-setEnd = min(nDP, setStart + maxDPsPerSet - 1);
+maxDPsPerSet = obj.get_set_size();
+setStart = 1:maxDPsPerSet:nSimulate;
+setEnd = min(nSimulate, setStart + maxDPsPerSet - 1);
 
 % For each set of runs
 for r = 1:length(setStart)
@@ -73,7 +106,7 @@ for r = 1:length(setStart)
 			% Change input values
 			for k = 1:size(paramValues, 2)
 				obj.WBi.designPoints = obj.WBi.designPoints.change_value( ...
-					iDP(i,j), obj.inputInd(k), paramValues(setStart(r) + i - 1, k));
+					iDP(i,j), obj.inputInd(k), paramValues(iSimulate(setStart(r) + i - 1), k));
 			end
 		end
 	end
@@ -94,24 +127,12 @@ for r = 1:length(setStart)
 
 	% Collect results
 	for i = 1:(setEnd(r) - setStart(r) + 1)
-		tempResults = obj.WBi.designPoints.data(iDP(i,:), obj.outputInd);
-		tempValid = obj.WBi.designPoints.valid(iDP(i,:));
-		
-		% Use outputFunc if applicable
-		if obj.outputFuncSetBool
-			y = [y; obj.outputFunc(tempResults, tempValid)];
-		else
-			y = [y; tempResults];
-		end
-		
-		% Use validFunc if applicable
-		if ~isempty(obj.validFunc)
-			valid = [valid; obj.validFunc(x, tempResults, tempValid)];
-		else
-			valid = [valid; all(tempValid)];
-		end
+		[yCell{iSimulate(setStart(r) + i - 1)}, validCell{iSimulate(setStart(r) + i - 1)}] = ...
+			collect_results(obj, x, obj.WBi.designPoints.data(iDP(i,:),:), obj.WBi.designPoints.valid(iDP(i,:)));
 	end
 end
+y = cell2mat(yCell);
+valid = cell2mat(validCell);
 
 % Check size of y
 if size(y, 2) ~= obj.lenOutput
@@ -122,3 +143,24 @@ if size(y, 1) ~= nDP
 end
 
 end
+
+function [y, valid] = collect_results(obj, x, data, validDP)
+%COLLECT_RESULTS Output and validity of one x value from the data rows of
+%	its design points (one for each operating point)
+tempResults = data(:, obj.outputInd);
+tempValid = validDP;
+
+% Use outputFunc if applicable
+if obj.outputFuncSetBool
+	y = obj.outputFunc(tempResults, tempValid);
+else
+	y = tempResults;
+end
+
+% Use validFunc if applicable
+if ~isempty(obj.validFunc)
+	valid = obj.validFunc(x, tempResults, tempValid);
+else
+	valid = all(tempValid);
+end
+end
@@ -0,0 +1,14 @@
+function [y, valid, WBi] = simulate_project(obj, k, x, runType)
+%SIMULATE_PROJECT Simulates x on project copy k
+%	Run on a parallel pool worker by submit_async: OBJ is the worker's
+%	copy of the package, which simulates with project copy K's
+%	WBinstance and returns it (WBI), with the design points the set
+%	added, for collect_async to keep.
+%
+%	Part of the WBpackage class.
+
+obj.WBi = obj.asyncWBi{k};
+[y, valid] = obj.simulate(x, runType);
+WBi = obj.WBi;
+
+end
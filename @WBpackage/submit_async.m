@@ -0,0 +1,30 @@
+function future = submit_async(obj, x, runType)
+%SUBMIT_ASYNC Starts simulating x on a free project copy
+%	Runs simulate(x, runType) on a parallel pool worker (parfeval), with
+%	the WBinstance of the first project copy (set_async_projects) not
+%	running a set, which is marked busy until collect_async. Returns the
+%	future of the set.
+%
+%	Part of the WBpackage class.
+
+if nargin < 3
+	runType = 'plain';
+end
+
+if isempty(obj.asyncWBi)
+	error('WBpackage:NoAsyncProjects', 'No project copies are set for asynchronous sets (set_async_projects).');
+end
+k = find(~obj.asyncBusy, 1);
+if isempty(k)
+	error('WBpackage:NoFreeProject', ['All %d project copies are running a set: add copies ' ...
+		'(set_async_projects) or keep fewer sets pending (MOSAO opt.BayesNpending).'], length(obj.asyncWBi));
+end
+
+% Run the copy with the current settings of the main project
+obj.asyncWBi{k} = obj.asyncWBi{k}.copy_settings(obj.WBi);
+
+future = parfeval(@simulate_project, 3, obj, k, x, runType);
+obj.asyncBusy(k) = true;
+obj.asyncFutureIDs(k) = future.ID;
+
+end
@@ -30,54 +30,147 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
-class vector(tuple):
+from array import array
+from operator import mul
+
+try:  # Optional, CPython only (see setBackend)
+    import numpy as _np
+except ImportError:
+    _np = None
+
+_eps = 2.220446049250313e-16  # Machine epsilon of a double
+
+
+class vector(object):
     '''vector(iterable) -> new vector initialized from iterable's items
 
     A vector here is represented by its components in Cartesian 
-    coordinates.  A vector can be in any number of dimensions.'''
+    coordinates.  A vector can be in any number of dimensions.  The
+    components are stored in a flat array of doubles.'''
+    __slots__ = ('_data',)
+
+    def __init__(self, iterable=()):
+        if isinstance(iterable, vector):
+            self._data = array('d', iterable._data)
+        else:
+            self._data = array('d', iterable)
+
+    @classmethod
+    def _fromArray(cls, data):
+        '''Wraps the array('d') data without copying it.'''
+        v = object.__new__(cls)
+        v._data = data
+        return v
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return vector._fromArray(self._data[i])
+        return self._data[i]
+
+    def __setitem__(self, i, value):
+        self._data[i] = value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and tuple(self._data) == tuple(other)
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(tuple(self._data))
+
+    def __repr__(self):
+        return repr(tuple(self._data))
+
     def __add__(self,other):
         '''x.__add__(y) <==> x+y vector addition'''
-        if len(self) == len(other):
-            v=[]
-            for i in range(len(self)):
-                v.append(self[i]+other[i])
-            return vector(v)
-        else:
-            raise ValueError("Cannot add vectors of different size")
+        return self.copy().iadd(other)
+
+    def __radd__(self,other):
+        '''x.__radd__(y) <==> y+x'''
+        return self+other
+
+    def __iadd__(self,other):
+        '''x.__iadd__(y) <==> x+=y, in place'''
+        return self.iadd(other)
 
     def __mul__(self,num):
         '''x.__mul__(c) <==> x*c scalar multiplication of vector.
         c is expected to be a scalar, e.g. int or float'''
-        v=[]
-        for i in range(len(self)):
-            v.append(self[i]*num)
-        return vector(v)
+        return self.copy().scale_(num)
 
     def __rmul__(self,num):
         '''x.__rmul__(c) <==> c*x'''
         return self*num
 
+    def __neg__(self):
+        '''x.__neg__() <==> -x'''
+        return self*-1
+
     def __sub__(self,other):
         '''x.__sub__(y) <==> x-y vector subtraction.'''
-        return self+(other*-1)
+        return self.copy().axpy_(-1.0,other)
+
+    def __isub__(self,other):
+        '''x.__isub__(y) <==> x-=y, in place'''
+        return self.axpy_(-1.0,other)
 
     def __div__(self,num):
         '''x.__div__(c) <==> (1.0/c)*x'''
         return (1.0/num)*self
 
+    __truediv__ = __div__
+
     def __floordiv__(self,num):
         '''x.__floordiv__(c) <==> x//c'''
-        l1=[]
-        for e in self:
-            l1.append(e//num)
-        return vector(l1)
+        return vector._fromArray(array('d', [e//num for e in self._data]))
 
     def __pow__(self,p):
         '''x.__pow__(c) <==> x.^c'''
-        l1=[]
-        for e in self:
-            l1.append(e**p)
-        return vector(l1)
+        return vector._fromArray(array('d', [e**p for e in self._data]))
+
+    def copy(self):
+        '''Returns a copy of the vector.'''
+        return vector._fromArray(array('d', self._data))
+
+    def iadd(self,other):
+        '''Adds the vector other to this vector in place, returns self.'''
+        d=self._data
+        if len(d) != len(other):
+            raise ValueError("Cannot add vectors of different size")
+        if isinstance(other, vector):
+            other=other._data
+        for i in range(len(d)):
+            d[i]+=other[i]
+        return self
+
+    def scale_(self,c):
+        '''Multiplies this vector by the scalar c in place, returns self.'''
+        d=self._data
+        for i in range(len(d)):
+            d[i]*=c
+        return self
+
+    def axpy_(self,a,x):
+        '''Adds a*x to this vector in place (self <- a*x + self), returns
+        self.'''
+        d=self._data
+        if len(d) != len(x):
+            raise ValueError("Cannot add vectors of different size")
+        if isinstance(x, vector):
+            x=x._data
+        for i in range(len(d)):
+            d[i]+=a*x[i]
+        return self
 
     def getLength(self):
         '''Returns the Euclidian norm of the vector (Pythagorean formula)'''
@@ -88,13 +181,15 @@ class vector(tuple):
         return len(self)
 
 
-class matrix(tuple):
+class matrix(object):
     '''matrix(iterable) -> initializes a matrix based on the given iterable,
     which is expected to contain iterables.
     A matrix is a two dimensional collection.  It is indexed by:
-    x[row][column]'''
+    x[row][column] or x[row,column]
+    The elements are stored row-major in one flat array of doubles.'''
+    __slots__ = ('_data', '_rows', '_cols')
 
-    def __new__(cls, t):
+    def __init__(self, t):
         '''It is easy to enter a new matrix in the following format:
         >>>x=matrix((
         (r0c0, r0c1, r0c2),
@@ -102,13 +197,92 @@ class matrix(tuple):
         (r2c0, r2c1, r2c2)
         ))
         (the matrix can have any number of rows and columns)'''
-        temp=[]
+        if isinstance(t, matrix):
+            self._data = array('d', t._data)
+            self._rows, self._cols = t._rows, t._cols
+            return
+        data=array('d')
+        rows=0
+        cols=None
         for row in t:
-            if len(row)==len(t[0]):
-                temp.append(tuple(row))
-            else:
+            if cols is None:
+                cols=len(row)
+            elif len(row) != cols:
                 raise ValueError("Rows are of different lengths.")
-        return tuple.__new__(cls, tuple(temp))
+            if isinstance(row, vector):
+                data.extend(row._data)
+            else:
+                data.extend(row)
+            rows+=1
+        self._data = data
+        self._rows = rows
+        self._cols = cols or 0
+
+    @classmethod
+    def _fromArray(cls, data, rows, cols):
+        '''Wraps the row-major array('d') data without copying it.'''
+        m = object.__new__(cls)
+        m._data = data
+        m._rows = rows
+        m._cols = cols
+        return m
+
+    def getShape(self):
+        '''Returns the (rows, columns) of the matrix.'''
+        return (self._rows, self._cols)
+
+    def __len__(self):
+        return self._rows
+
+    def __getitem__(self, i):
+        c=self._cols
+        if isinstance(i, tuple):
+            r, j = i
+            if r < 0:
+                r+=self._rows
+            if j < 0:
+                j+=c
+            if not (0 <= r < self._rows and 0 <= j < c):
+                raise IndexError("matrix index out of range")
+            return self._data[r*c + j]
+        if isinstance(i, slice):
+            rows=range(self._rows)[i]
+            data=array('d')
+            for r in rows:
+                data.extend(self._data[r*c:(r+1)*c])
+            return matrix._fromArray(data, len(rows), c)
+        if i < 0:
+            i+=self._rows
+        if not 0 <= i < self._rows:
+            raise IndexError("matrix index out of range")
+        return vector._fromArray(self._data[i*c:(i+1)*c])
+
+    def __setitem__(self, i, value):
+        r, j = i
+        self._data[r*self._cols + j] = value
+
+    def __iter__(self):
+        return self.generateRows()
+
+    def __eq__(self, other):
+        try:
+            if len(self) != len(other):
+                return False
+            for i in range(self._rows):
+                if self[i] != other[i]:
+                    return False
+            return True
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self._rows, self._cols, tuple(self._data)))
+
+    def __repr__(self):
+        return repr(tuple(tuple(row) for row in self))
 
     def __str__(self):
         '''Prints the matrix in an easy to read format.
@@ -124,106 +298,125 @@ class matrix(tuple):
 
     def __add__(self, other):
         '''x.__add__(y) <==> x+y  is not concatenation.'''
-        l1=[]
-        for i in range(len(self)):
-            ltemp=[]
-            for j in range(len(self[0])):
-                ltemp.append(self[i][j]+other[i][j])
-            l1.append(tuple(ltemp))
-        return matrix(tuple(l1))
+        return self.copy().iadd(other)
+
+    def __iadd__(self, other):
+        '''x.__iadd__(y) <==> x+=y, in place'''
+        return self.iadd(other)
 
     def __mul__(self, scal):
         '''x.__mul__(y) <==> x*y '''
-        l1=[]
-        for i in range(len(self)):
-            ltemp=[]
-            for j in range(len(self[0])):
-                ltemp.append(scal*self[i][j])
-            l1.append(tuple(ltemp))
-        return matrix(tuple(l1))
+        return self.copy().scale_(scal)
 
     def __rmul__(self, scal):
         '''x.__rmul__(y) <==> y*x '''
         return self*scal
 
+    def __neg__(self):
+        '''x.__neg__() <==> -x'''
+        return self*-1
+
     def __sub__(self, other):
         '''x.__sub__(y) <==> x-y '''
-        return self + (-1*other)
+        return self.copy().axpy_(-1.0, other)
+
+    def __isub__(self, other):
+        '''x.__isub__(y) <==> x-=y, in place'''
+        return self.axpy_(-1.0, other)
 
     def __div__(self,c):
         '''x.__div__(c) <==> (1.0/c)*x'''
         return (1.0/c)*self
 
+    __truediv__ = __div__
+
     def __floordiv__(self,c):
         '''x.__floordiv__(c) <==> x//c'''
-        outer=[]
-        for i in self:
-            inner=[]
-            for j in i:
-                inner.append(j//c)
-            outer.append(inner)
-        return matrix(outer)
+        return matrix._fromArray(array('d', [e//c for e in self._data]),
+                                 self._rows, self._cols)
 
     def __pow__(self,p):
         '''x.__pow__(p) <==> x.^p'''
-        outer=[]
-        for i in self:
-            inner=[]
-            for j in i:
-                inner.append(j**p)
-            outer.append(inner)
-        return matrix(outer)
+        return matrix._fromArray(array('d', [e**p for e in self._data]),
+                                 self._rows, self._cols)
+
+    def copy(self):
+        '''Returns a copy of the matrix.'''
+        return matrix._fromArray(array('d', self._data), self._rows, self._cols)
+
+    def _otherData(self, other):
+        '''Returns the flat row-major data of other, checking its shape.'''
+        if not isinstance(other, matrix):
+            other=matrix(other)
+        if other.getShape() != self.getShape():
+            raise ValueError("Cannot add matrices of different shapes")
+        return other._data
+
+    def iadd(self, other):
+        '''Adds the matrix other to this matrix in place, returns self.'''
+        d=self._data
+        o=self._otherData(other)
+        for i in range(len(d)):
+            d[i]+=o[i]
+        return self
+
+    def scale_(self, c):
+        '''Multiplies this matrix by the scalar c in place, returns self.'''
+        d=self._data
+        for i in range(len(d)):
+            d[i]*=c
+        return self
+
+    def axpy_(self, a, x):
+        '''Adds a*x to this matrix in place (self <- a*x + self), returns
+        self.'''
+        d=self._data
+        o=self._otherData(x)
+        for i in range(len(d)):
+            d[i]+=a*o[i]
+        return self
 
     def generateRows(self):
         '''A generator which yields the rows of the matrix as vectors.'''
-        for row in self:
-            yield vector(row)
+        c=self._cols
+        for i in range(self._rows):
+            yield vector._fromArray(self._data[i*c:(i+1)*c])
 
     def generateCols(self):
         '''A generator which yields the columns of the matrix as vectors'''
-        for i in range(len(self[0])):
-            l1=[]
-            for row in self:
-                l1.append(row[i])
-            yield(vector(l1))
+        for i in range(self._cols):
+            yield vector._fromArray(self._data[i::self._cols])
 
     def rcGenerator(self):
         '''A generator which yields all of the elements of the matrix 
         going across each row first.  It is a breadth first generator.'''
-        for row in self:
-            for e in row:
-                yield(e)
+        for e in self._data:
+            yield(e)
 
     def crGenerator(self):
         '''A generator which yields all of the elements of the matrix
         going down each column first.  It is a depth first generator.'''
-        for i in range(len(self[0])):
-            for row in self:
-                yield(row[i])
+        for i in range(self._cols):
+            for e in self._data[i::self._cols]:
+                yield(e)
 
 
 # Functions
 
 def zeroVector(l):
     '''Makes a zero vector of size l.'''
-    res=[]
-    for i in range(l):
-        res.append(0)
-    return vector(res)
+    return vector._fromArray(array('d', [0.0])*l)
 
 
 def onesVector(l):
     '''Makes a ones vector of size l.'''
-    res=[]
-    for i in range(l):
-        res.append(1)
-    return vector(res)
+    return vector._fromArray(array('d', [1.0])*l)
 
 
 def zeroMatrix(m,n):
     '''Constructs a matrix with m rows and n columns which contains
     zeroes.'''
-    return matrix([zeroVector(n) for i in range(m)])
+    return matrix._fromArray(array('d', [0.0])*(m*n), m, n)
 
 
 def identityMatrix(n):
@@ -257,6 +450,15 @@ def v(*args):
 def transpose(m1):
     '''Returns a matrix which is the transpose of the given two dimensional
     collection.'''
+    if isinstance(m1, matrix):
+        if _backend == 'numpy':
+            return _fromNumpy(_toNumpy(m1).T)
+        r, c = m1.getShape()
+        d=m1._data
+        data=array('d')
+        for j in range(c):
+            data.extend(d[j::c])
+        return matrix._fromArray(data, c, r)
     temp=[]
     for i in range(len(m1[0])):
         temp.append([])           #makes a template for the new matrix
@@ -277,11 +479,12 @@ def axpy(a,x,y):
 
 def dot(x,y):
     '''returns the dot product of vector x and vector y.'''
+    if isinstance(x, vector):
+        x=x._data
+    if isinstance(y, vector):
+        y=y._data
     if len(x)==len(y):
-        v=0.0
-        for i in range(len(x)):
-            v+=x[i]*y[i]
-        return v
+        return 0.0+sum(map(mul, x, y))
     else:
         raise ValueError("The given vectors are of different sizes.")
 
@@ -294,17 +497,24 @@ def det(m):
     if(len(m)==2):
         return(m[0][0]*m[1][1] - m[0][1]*m[1][0])
     elif(len(m)>2):
-        ans=m[0][0]-m[0][0]  #helps if the top row is vectors for a cross product
-        for i in range(len(m[0])):
-            l1=[]
-            for j in range(1,len(m)):
-                l2=[]
-                for k in range(len(m[0])):
-                    if(k!=i):
-                        l2.append(m[j][k])
-                l1.append(l2)
-            submat=matrix(l1)
-            ans+=((-1)**i)*m[0][i]*det(submat)
+        if not _isScalar(m[0][0]):
+            #top row is vectors for a cross product, expand along it and
+            #take the (scalar) minors with the LU decomposition
+            ans=m[0][0]-m[0][0]
+            for i in range(len(m[0])):
+                submat=[[m[j][k] for k in range(len(m[0])) if k!=i]
+                        for j in range(1,len(m))]
+                ans+=((-1)**i)*m[0][i]*det(submat)
+            return ans
+        if _backend == 'numpy':
+            return float(_np.linalg.det(_toNumpy(m)))
+        try:
+            lu, perm, sign = _luDecompose(m)
+        except ZeroDivisionError:
+            return 0.0
+        ans=float(sign)
+        for i in range(len(lu)):
+            ans*=lu[i][i]
         return ans
     else:
         raise ValueError("Invalid Matrix")
@@ -359,29 +569,53 @@ def linearCombination(l1,l2):
     are of the same size.'''
     ans=zeroVector(len(l2[0]))
     for i in range(len(l1)):
-        ans+=l1[i]*l2[i]
+        ans.axpy_(l1[i],l2[i])
     return ans
 
 
 def mvMult(m,v):
     '''Matrix-vector multiplication.  This multiplies the matrix m by the
     vector v.'''
-    if len(v)!=len(m[0]):
+    m=_asMatrix(m)
+    r, c = m.getShape()
+    if len(v)!=c:
         raise ValueError("Incompatible matrix vector multiplication. "
         "The matrix has the wrong number of columns.")
-    l1=[]
-    for row in m:
-        l1.append(dot(vector(row),v))
-    return vector(l1)
+    if _backend == 'numpy':
+        return _fromNumpy(_toNumpy(m).dot(_toNumpy(v)))
+    if isinstance(v, vector):
+        v=v._data
+    d=m._data
+    return vector._fromArray(array('d',
+        [sum(map(mul, d[i*c:(i+1)*c], v)) for i in range(r)]))
 
 
 def mmMult(m1,m2):
     '''Matrix-matrix multiplication.  This multiplies the matrix m1 by
     the matrix m2.'''
-    l1=[]
-    for col in m2.generateCols():
-        l1.append(mvMult(m1,col))
-    return transpose(matrix(l1))   #l1 contains the columns, whereas these matrices are row-major
+    m1, m2 = _asMatrix(m1), _asMatrix(m2)
+    r, n = m1.getShape()
+    if n != len(m2):
+        raise ValueError("Incompatible matrix matrix multiplication. "
+        "The first matrix has the wrong number of columns.")
+    if _backend == 'numpy':
+        return _fromNumpy(_toNumpy(m1).dot(_toNumpy(m2)))
+    c=m2.getShape()[1]
+    a, b = m1._data, m2._data
+    cols=[b[j::c] for j in range(c)]
+    res=array('d')
+    for i in range(r):
+        row=a[i*n:(i+1)*n]
+        res.extend([sum(map(mul, row, col)) for col in cols])
+    return matrix._fromArray(res, r, c)
+
+
+def _asMatrix(m):
+    '''Helper for the multiplications.  Returns m if it is a matrix,
+    otherwise converts it.'''
+    if isinstance(m, matrix):
+        return m
+    return matrix(m)
 
 
 def permutationMatrix(vec):
@@ -402,21 +636,126 @@ def GaussJordan(a, b):
     '''Solves a system of linear equations based on the given matrix.
     Solves for X in the problem AX=B with matrices A and B given.  a and
     b should be matrices.  To make b a column vector use colVec, which
-    makes a matrix with one column.'''
-    for i in range(len(a)):
-        permVec = []
-        if(a[i][i] == 0):
-            try:
-                permVec = permute(i, i, a)
-            except IndexError:
-                print("No Solution")
+    makes a matrix with one column.  Uses luFactor and luSolve, the
+    name is kept for compatibility.'''
+    lu=luFactor(a)
+    return luSolve(lu,b)
+
+
+def luFactor(a):
+    '''LU decomposition of the square matrix a with partial pivoting.
+    Returns a factorization that can be passed to luSolve, so that one
+    decomposition can be used for many right-hand sides.  Raises a
+    ValueError if a is singular.'''
+    if len(a) != len(a[0]):
+        raise ValueError("Not a square matrix.")
+    try:
+        if _backend == 'numpy':
+            lu, perm, sign = _npLuDecompose(a)
         else:
-            permVec = vector([j for j in range(len(a))])
-        a, b = mmMult(permutationMatrix(permVec), a), mmMult(permutationMatrix(permVec), b)
-        transform = eliminate(i, a)
-        a, b = mmMult(transform, a), mmMult(transform, b)
-    # After that Gauss-Jordan elimination a is the identity matrix, so x=b.
-    return b
+            lu, perm, sign = _luDecompose(a)
+    except ZeroDivisionError:
+        raise ValueError("Singular matrix, no solution.")
+    return (lu, perm)
+
+
+def luSolve(lu, b):
+    '''Solves AX=B for X, given lu=luFactor(A).  b can be a matrix (one
+    column per right-hand side) or a vector, the result is of the same
+    kind.'''
+    rows, perm = lu
+    n=len(rows)
+    if len(b) != n:
+        raise ValueError("Right-hand side has the wrong number of rows.")
+    if _np is not None and isinstance(rows, _np.ndarray):
+        return _fromNumpy(_npLuSubstitute(rows, perm, _toNumpy(b)))
+    if _isScalar(b[0]):
+        return vector(_luSubstitute(rows, perm, b))
+    b=_asMatrix(b)
+    c=b.getShape()[1]
+    data=array('d', [0.0])*(n*c)
+    for j in range(c):
+        data[j::c]=array('d', _luSubstitute(rows, perm, b._data[j::c]))
+    return matrix._fromArray(data, n, c)
+
+
+def _isScalar(e):
+    '''Helper for det and luSolve.'''
+    try:
+        len(e)
+    except TypeError:
+        return True
+    return False
+
+
+def _luDecompose(a):
+    '''Helper for luFactor and det.  Decomposes a copy of a in place, so
+    that the strictly lower part holds L (unit diagonal) and the upper part
+    holds U.  Returns (lu, perm, sign) where perm[i] is the original row in
+    row i and sign is the permutation parity.  Raises ZeroDivisionError if
+    a is singular to working precision.'''
+    n=len(a)
+    if isinstance(a, matrix):
+        lu=[a._data[i*n:(i+1)*n].tolist() for i in range(n)]
+    else:
+        lu=[[float(e) for e in row] for row in a]
+    perm=list(range(n))
+    sign=1
+    tol=_pivotTolerances(n, [max([abs(row[k]) for row in lu]) for k in range(n)])
+    for k in range(n):
+        #partial pivoting: largest magnitude in column k at or below row k
+        p=k
+        big=abs(lu[k][k])
+        for i in range(k+1,n):
+            if abs(lu[i][k]) > big:
+                p=i
+                big=abs(lu[i][k])
+        if big <= tol[k]:
+            raise ZeroDivisionError("Singular matrix.")
+        if p != k:
+            lu[k], lu[p] = lu[p], lu[k]
+            perm[k], perm[p] = perm[p], perm[k]
+            sign=-sign
+        rowk=lu[k]
+        pivot=rowk[k]
+        for i in range(k+1,n):
+            rowi=lu[i]
+            f=rowi[k]/pivot
+            if f != 0.0:
+                rowi[k]=f
+                for j in range(k+1,n):
+                    rowi[j]-=f*rowk[j]
+            else:
+                rowi[k]=0.0
+    return lu, perm, sign
+
+
+def _pivotTolerances(n, columnMax):
+    '''Helper for the LU decompositions.  A pivot in column k at or below
+    tol[k] is treated as zero (round-off in a singular matrix).  Relative
+    to each column's largest magnitude, so that the rank decision does not
+    depend on how the columns are scaled.'''
+    return [n*_eps*c for c in columnMax]
+
+
+def _luSubstitute(lu, perm, b):
+    '''Helper for luSolve.  Forward and back substitution for a single
+    right-hand side b, returns the solution as a list.'''
+    n=len(lu)
+    y=[float(b[perm[i]]) for i in range(n)]
+    for i in range(n):
+        row=lu[i]
+        s=y[i]
+        for j in range(i):
+            s-=row[j]*y[j]
+        y[i]=s
+    for i in range(n-1,-1,-1):
+        row=lu[i]
+        s=y[i]
+        for j in range(i+1,n):
+            s-=row[j]*y[j]
+        y[i]=s/row[i]
+    return y
 
 
 def bestFit(m):
@@ -425,7 +764,7 @@ def bestFit(m):
     of m and b in the slope intercept form y=mx+b to define the line of
     best fit.  m and b are returned in the form of a vector in this way:
     (b,m).'''
-    cols=[l for l in m.generateCols()]
+    cols=[l for l in _asMatrix(m).generateCols()]
     colb=[1 for n in range(len(m))]
     colm=cols[0]
     A=transpose(matrix((colb,colm)))
@@ -438,14 +777,69 @@ def AxApproxB(A,b):
     the best value of x which will approximately solve Ax=b.  Input A and
     b should be matrices.  To make b a column vector, use colVec, which
     makes a matrix with one column.'''
-    return GaussJordan(mmMult(transpose(A),A),mmMult(transpose(A),b))
+    if _backend == 'numpy':
+        return _fromNumpy(_npLeastSquares(_toNumpy(A), _toNumpy(b)))
+    return _qrLeastSquares(_asMatrix(A), _asMatrix(b))
+
+
+def _qrLeastSquares(A, b):
+    '''Helper for AxApproxB.  Least-squares solution of Ax=b by Householder
+    QR of A, without forming the normal equations (which square the
+    condition number: a polynomial fit at x near 1000 is singular to
+    working precision in A'A).  Raises a ValueError if a diagonal element
+    of R is at or below _rankTolerance of its column.'''
+    m, n = A.getShape()
+    c = b.getShape()[1]
+    if b.getShape()[0] != m:
+        raise ValueError("Right-hand side has the wrong number of rows.")
+    if m < n:
+        raise ValueError("Singular matrix, no solution.")
+    cols = [A._data[j::n].tolist() for j in range(n)]
+    rhs = [b._data[j::c].tolist() for j in range(c)]
+    tol = _rankTolerances(m, n, [sum([e*e for e in col])**0.5 for col in cols])
+    for k in range(n):
+        colk = cols[k]
+        alpha = sum([e*e for e in colk[k:]])**0.5
+        if alpha <= tol[k]:
+            raise ValueError("Singular matrix, no solution.")
+        if colk[k] > 0:
+            alpha = -alpha
+        # Reflect the remaining columns by I - 2vv'/v'v, v = x - alpha*e1
+        v = colk[k:]
+        v[0] -= alpha
+        vv = sum([e*e for e in v])
+        colk[k] = alpha
+        for col in cols[k+1:] + rhs:
+            f = 2.0*sum([v[i]*col[k+i] for i in range(m-k)])/vv
+            if f != 0.0:
+                for i in range(m-k):
+                    col[k+i] -= f*v[i]
+    # Back substitution with R, for each right-hand side
+    data = array('d', [0.0])*(n*c)
+    for j in range(c):
+        y = rhs[j]
+        x = [0.0]*n
+        for i in range(n-1, -1, -1):
+            s = y[i]
+            for l in range(i+1, n):
+                s -= cols[l][i]*x[l]
+            x[i] = s/cols[i][i]
+        data[j::c] = array('d', x)
+    return matrix._fromArray(data, n, c)
+
+
+def _rankTolerances(m, n, columnNorms):
+    '''Helper for the least-squares solvers.  A diagonal element of R at or
+    below tol[k] marks column k as dependent on the ones before it, relative
+    to the column's norm (the same decision for both backends).'''
+    return [max(m, n)*_eps*c for c in columnNorms]
 
 
 def permute(row,col,mat):
-    '''Helper for GaussJordan.  Looks for a vector with a non-zero value
-    in the given column after the given row, and constructs a permutation
-    vector to switch the given row with the row it found.  Raises an 
-    IndexError if no row is found.'''
+    '''Formerly a helper for GaussJordan, kept for compatibility.  Looks
+    for a vector with a non-zero value in the given column after the given
+    row, and constructs a permutation vector to switch the given row with
+    the row it found.  Raises an IndexError if no row is found.'''
     c=row
     permuteVec=[]
     while(True):
@@ -464,7 +858,8 @@ def permute(row,col,mat):
 
 
 def eliminate(row,mat):
-    '''Helper for GaussJordan.'''
+    '''Formerly a helper for GaussJordan, kept for compatibility.  Returns
+    the elimination matrix that clears the given column of mat.'''
     res=[]
     for i in range(len(mat)):
         l1=[]
@@ -493,6 +888,8 @@ def linSpace(lb, ub, n=500):
 
 def polyVal(p, x):
     '''Evaluates the polynomial given by the coefficients in p at x'''
+    if _backend == 'numpy':
+        return float(_np.polynomial.polynomial.polyval(x, _np.asarray(p, dtype=float)))
     ans = 0.
     for i in range(len(p)):
         ans += p[i]*(x**i)
@@ -551,7 +948,264 @@ def polyFit(x, y, n=2):
     '''Fits a n-th order polynomial to the data y at x.'''
     if len(x) != len(y):
         raise ValueError('data x and y should be the same length')
-    X = transpose(matrix([vector(x)**i for i in range(n+1)]))
-    Y = transpose(matrix([y]))
+    if _backend == 'numpy':
+        V = _np.vander(_np.asarray(x, dtype=float), n+1, increasing=True)
+        fitV = _npLeastSquares(V, _np.asarray(y, dtype=float))
+        return [float(s) for s in fitV]
+    data = array('d')
+    for xi in x:
+        p = 1.0
+        for i in range(n+1):
+            data.append(p)
+            p *= xi
+    X = matrix._fromArray(data, len(x), n+1)
+    Y = matrix._fromArray(array('d', y), len(y), 1)
     fitV = AxApproxB(X, Y)
     return [s for s in fitV.rcGenerator()]
+
+
+class PolyFitAccumulator(object):
+    '''PolyFitAccumulator(maxDegree) -> running least-squares polynomial fit
+
+    Keeps the running (weighted) power sums of the points added to it, so
+    that adding a point costs O(maxDegree) and a polyFit of any degree up
+    to maxDegree can be found without going back over the points.  The x
+    values are shifted by the first point added and scaled by the distance
+    to the first different x, so that the normal equations stay well
+    conditioned however far the points are from 0.'''
+    __slots__ = ('maxDegree', 'count', '_sx', '_sxy', '_origin', '_scale')
+
+    def __init__(self, maxDegree=2):
+        if maxDegree < 0:
+            raise ValueError('maxDegree cannot be less than zero')
+        self.maxDegree = maxDegree
+        self.count = 0
+        self._sx = array('d', [0.0])*(2*maxDegree+1)     # sum(w*t^k)
+        self._sxy = array('d', [0.0])*(maxDegree+1)      # sum(w*t^k*y)
+        self._origin = None
+        self._scale = None
+
+    def add(self, x, y, w=1.0):
+        '''Adds the point (x, y) to the fit, with the weight w.'''
+        if self._origin is None:
+            self._origin = float(x)
+        if self._scale is None:
+            # The points so far are all at t = 0, so their sums do not
+            # change with the scale
+            if x == self._origin:
+                t = 0.0
+            else:
+                self._scale = abs(float(x) - self._origin)
+                t = (x - self._origin)/self._scale
+        else:
+            t = (x - self._origin)/self._scale
+        sx, sxy = self._sx, self._sxy
+        nxy = len(sxy)
+        p = float(w)
+        for k in range(len(sx)):
+            sx[k] += p
+            if k < nxy:
+                sxy[k] += p*y
+            p *= t
+        self.count += 1
+
+    def extend(self, x, y, w=None):
+        '''Adds the points in x and y, with the optional weights w.'''
+        if len(x) != len(y):
+            raise ValueError('data x and y should be the same length')
+        for i in range(len(x)):
+            if w is None:
+                self.add(x[i], y[i])
+            else:
+                self.add(x[i], y[i], w[i])
+
+    def fit(self, n=None):
+        '''Returns the coefficients of the n-th order least-squares fit to
+        the points added so far, from 0-th to n-th power like polyFit.  n
+        defaults to maxDegree.'''
+        if n is None:
+            n = self.maxDegree
+        if n < 0 or n > self.maxDegree:
+            raise ValueError('n must be between 0 and maxDegree')
+        if self.count == 0:
+            raise ValueError('no points have been added')
+        sx = self._sx
+        A = matrix._fromArray(
+            array('d', [sx[i+j] for i in range(n+1) for j in range(n+1)]),
+            n+1, n+1)
+        c = luSolve(luFactor(A), vector._fromArray(self._sxy[:n+1]))
+        return _polyUnshift(list(c), self._origin, self._scale or 1.0)
+
+
+def _polyUnshift(c, a, s):
+    '''Helper for PolyFitAccumulator.  Returns the coefficients of
+    p(x) = sum(c[k]*((x - a)/s)**k) as a polynomial in x.'''
+    ans = [c[-1]]
+    for k in range(len(c)-2, -1, -1):
+        # ans <- ans*(x - a)/s + c[k]
+        shifted = [0.0]*(len(ans)+1)
+        for i in range(len(ans)):
+            shifted[i+1] += ans[i]/s
+            shifted[i] -= a*ans[i]/s
+        shifted[0] += c[k]
+        ans = shifted
+    return ans
+
+
+# Batched functions
+
+def polyValMany(ps, xs):
+    '''Evaluates each polynomial ps[i] at the point xs[i], returns a list.
+    The polynomials can be of different orders.'''
+    if len(ps) != len(xs):
+        raise ValueError('ps and xs should be the same length')
+    if _backend == 'numpy' and len(ps) > 0:
+        width = max(len(p) for p in ps)
+        P = _np.zeros((len(ps), width))
+        for i in range(len(ps)):
+            P[i, :len(ps[i])] = ps[i]
+        X = _np.asarray(xs, dtype=float)
+        ans = _np.zeros(len(ps))
+        for k in range(width-1, -1, -1):  # Horner, all polynomials at once
+            ans = ans*X + P[:, k]
+        return ans.tolist()
+    return [polyVal(ps[i], xs[i]) for i in range(len(ps))]
+
+
+def polyFitMany(xs, ys, n=2):
+    '''Fits a n-th order polynomial to each data set (xs[i], ys[i]), for
+    example many seek trial histories.  Returns a list of coefficient lists
+    (as polyFit), with None where a data set cannot be fit.'''
+    if len(xs) != len(ys):
+        raise ValueError('xs and ys should be the same length')
+    for i in range(len(xs)):
+        if len(xs[i]) != len(ys[i]):
+            raise ValueError('data x and y should be the same length')
+    if _backend != 'numpy':
+        fits = []
+        for i in range(len(xs)):
+            try:
+                fits.append(polyFit(xs[i], ys[i], n))
+            except ValueError:
+                fits.append(None)
+        return fits
+
+    # Solve the data sets of each length together
+    fits = [None]*len(xs)
+    groups = {}
+    for i in range(len(xs)):
+        groups.setdefault(len(xs[i]), []).append(i)
+    for m, indices in groups.items():
+        if m == 0:
+            continue
+        X = _np.array([xs[i] for i in indices], dtype=float)
+        Y = _np.array([ys[i] for i in indices], dtype=float)
+        if m < n+1:
+            continue
+        V = X[:, :, None]**_np.arange(n+1)
+        # Batched QR, with the rank decision of _npLeastSquares
+        Q, R = _np.linalg.qr(V)
+        tol = max(m, n+1)*_eps*_np.sqrt((V*V).sum(axis=1))
+        full = ~(_np.abs(_np.diagonal(R, axis1=1, axis2=2)) <= tol).any(axis=1)
+        if not full.any():
+            continue
+        r = _np.einsum('kmi,km->ki', Q[full], Y[full])
+        solution = _np.linalg.solve(R[full], r[:, :, None])[:, :, 0]
+        for j, i in enumerate(_np.asarray(indices)[full]):
+            fits[i] = solution[j].tolist()
+    return fits
+
+
+# Backends
+
+_backend = 'python' if _np is None else 'numpy'
+
+
+def getBackend():
+    '''Returns the name of the backend in use, 'python' or 'numpy'.'''
+    return _backend
+
+
+def setBackend(name):
+    '''Selects the backend used by mmMult, mvMult, transpose, det, the
+    solvers, polyVal, polyFit and the batched functions.  'numpy' is the
+    default when NumPy can be imported (CPython), 'python' otherwise (e.g.
+    IronPython in Workbench).  Both give the same results within rounding.'''
+    global _backend
+    if name == 'numpy' and _np is None:
+        raise ValueError('NumPy is not available')
+    if name not in ('python', 'numpy'):
+        raise ValueError("backend must be 'python' or 'numpy'")
+    _backend = name
+
+
+def _toNumpy(m):
+    '''Helper for the NumPy backend.  Views a matrix or vector (without
+    copying) or converts other sequences to a float array.'''
+    if isinstance(m, matrix):
+        r, c = m.getShape()
+        return _np.frombuffer(m._data, dtype=_np.float64, count=r*c).reshape(r, c)
+    if isinstance(m, vector):
+        return _np.frombuffer(m._data, dtype=_np.float64, count=len(m))
+    return _np.asarray(m, dtype=float)
+
+
+def _fromNumpy(a):
+    '''Helper for the NumPy backend.  Copies a 1-D array to a vector or a
+    2-D array to a matrix.'''
+    a = _np.ascontiguousarray(a, dtype=_np.float64)
+    data = array('d')
+    if hasattr(data, 'frombytes'):
+        data.frombytes(a.tobytes())
+    else:
+        data.fromstring(a.tobytes())
+    if a.ndim == 1:
+        return vector._fromArray(data)
+    return matrix._fromArray(data, a.shape[0], a.shape[1])
+
+
+def _npLeastSquares(A, b):
+    '''Helper for the NumPy backend.  Least-squares solution of Ax=b by QR,
+    raising a ValueError where _qrLeastSquares would (same rank
+    decision).'''
+    m, n = A.shape
+    if m < n:
+        raise ValueError("Singular matrix, no solution.")
+    Q, R = _np.linalg.qr(A)
+    tol = _rankTolerances(m, n, _np.sqrt((A*A).sum(axis=0)).tolist())
+    if (_np.abs(_np.diag(R)) <= tol).any():
+        raise ValueError("Singular matrix, no solution.")
+    return _np.linalg.solve(R, Q.T.dot(b))
+
+
+def _npLuDecompose(a):
+    '''Helper for the NumPy backend, as _luDecompose with vectorized row
+    operations.'''
+    lu = _np.array(_toNumpy(a), dtype=_np.float64)
+    n = lu.shape[0]
+    perm = list(range(n))
+    sign = 1
+    tol = _pivotTolerances(n, _np.abs(lu).max(axis=0).tolist() if n else [])
+    for k in range(n):
+        p = k + int(_np.argmax(_np.abs(lu[k:, k])))
+        if abs(lu[p, k]) <= tol[k]:
+            raise ZeroDivisionError("Singular matrix.")
+        if p != k:
+            lu[[k, p]] = lu[[p, k]]
+            perm[k], perm[p] = perm[p], perm[k]
+            sign = -sign
+        lu[k+1:, k] /= lu[k, k]
+        lu[k+1:, k+1:] -= _np.outer(lu[k+1:, k], lu[k, k+1:])
+    return lu, perm, sign
+
+
+def _npLuSubstitute(lu, perm, b):
+    '''Helper for the NumPy backend.  Forward and back substitution for
+    the right-hand side(s) b.'''
+    y = _np.array(b[perm], dtype=_np.float64)
+    n = lu.shape[0]
+    for i in range(n):
+        y[i] -= lu[i, :i].dot(y[:i])
+    for i in range(n-1, -1, -1):
+        y[i] = (y[i] - lu[i, i+1:].dot(y[i+1:]))/lu[i, i]
+    return y
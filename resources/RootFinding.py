@@ -0,0 +1,209 @@
+#
+# Root finding for the operating point seek.
+#
+# Pure Python so that it can be imported by the Workbench (IronPython)
+# seeking script alongside LinAlg.  Polynomials use the LinAlg convention:
+# coefficients from the 0-th to the n-th power.
+#
+
+import math
+
+import LinAlg as la
+
+
+def polyRoots(p):
+    '''Returns the real roots of the polynomial p (degree 3 or less) in
+    closed form, sorted in ascending order.  Raises a ValueError for higher
+    degrees.'''
+    p = _trim(p)
+    n = len(p) - 1
+    if n > 3:
+        raise ValueError('closed-form roots only available up to degree 3')
+    if n < 1:
+        return []
+    if n == 1:
+        return [-float(p[0])/p[1]]
+    if n == 2:
+        roots = _quadraticRoots(p[2], p[1], p[0])
+    else:
+        roots = _cubicRoots(p[3], p[2], p[1], p[0])
+    return sorted(_polish(p, r) for r in roots)
+
+
+def safeNewton(p, a, b, tol=1e-12, maxIter=100):
+    '''Finds a zero of the polynomial p within the bracket [a, b], where
+    p(a) and p(b) must have opposite signs.  Newton steps are taken while
+    they stay inside the (shrinking) bracket and reduce it quickly enough,
+    otherwise bisection is used, so convergence is guaranteed.'''
+    pDeriv = la.polyDeriv(p)
+    fa, fb = la.polyVal(p, a), la.polyVal(p, b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if (fa > 0) == (fb > 0):
+        raise ValueError('p(a) and p(b) must have opposite signs')
+    # Orient so that p(lo) < 0 < p(hi)
+    if fa < 0:
+        lo, hi = float(a), float(b)
+    else:
+        lo, hi = float(b), float(a)
+    x = 0.5*(lo + hi)
+    dxOld = abs(hi - lo)
+    dx = dxOld
+    f, df = la.polyVal(p, x), la.polyVal(pDeriv, x)
+    xTol = tol*max(1.0, abs(a), abs(b))
+    for i in range(maxIter):
+        outside = ((x - hi)*df - f)*((x - lo)*df - f) > 0
+        if outside or abs(2.0*f) > abs(dxOld*df):
+            # Bisect
+            dxOld = dx
+            dx = 0.5*(hi - lo)
+            x = lo + dx
+        else:
+            # Newton
+            dxOld = dx
+            dx = f/df
+            x -= dx
+        if abs(dx) < xTol:
+            return x
+        f, df = la.polyVal(p, x), la.polyVal(pDeriv, x)
+        if f == 0:
+            return x
+        if f < 0:
+            lo = x
+        else:
+            hi = x
+    raise ValueError('no zero found')
+
+
+def findBracket(x, y, x0=None):
+    '''Finds a sign-change bracket among the observed points (x[i], y[i]).
+    Neighbouring points (sorted by x) whose y values have opposite signs
+    form a bracket; the one nearest x0 (defaults to the last point) is
+    returned as (a, b), or None if there is no sign change.'''
+    if len(x) != len(y):
+        raise ValueError('data x and y should be the same length')
+    if len(x) < 2:
+        return None
+    if x0 is None:
+        x0 = x[-1]
+    points = sorted(zip(x, y))
+    best = None
+    bestDistance = None
+    for i in range(len(points) - 1):
+        (xa, ya), (xb, yb) = points[i], points[i+1]
+        if ya == 0 or yb == 0 or (ya > 0) != (yb > 0):
+            if xa <= x0 <= xb:
+                distance = 0.0
+            else:
+                distance = min(abs(xa - x0), abs(xb - x0))
+            if best is None or distance < bestDistance:
+                best = (xa, xb)
+                bestDistance = distance
+    return best
+
+
+def nearestRoot(roots, x0):
+    '''Returns the root nearest x0, or None if there are no roots.'''
+    best = None
+    for r in roots:
+        if best is None or abs(r - x0) < abs(best - x0):
+            best = r
+    return best
+
+
+def seekZero(p, x0, x=None, y=None):
+    '''Finds the zero of the fitted polynomial p to use as the next seek
+    trial, near the current trial x0.  If the observed trials (x, y) bracket
+    a sign change, roots inside that bracket are preferred.  Closed-form
+    roots are used up to degree 3; otherwise a safeguarded Newton iteration
+    is run on the bracket, falling back to LinAlg.newtonsMethod from x0.
+    Raises a ValueError if no zero is found.'''
+    bracket = None
+    if x is not None and y is not None:
+        bracket = findBracket(x, y, x0)
+
+    if len(_trim(p)) <= 4:
+        roots = polyRoots(p)
+        if bracket is not None:
+            inside = [r for r in roots if bracket[0] <= r <= bracket[1]]
+            if inside:
+                return nearestRoot(inside, x0)
+        if roots:
+            return nearestRoot(roots, x0)
+        raise ValueError('no zero found')
+
+    if bracket is not None:
+        try:
+            return safeNewton(p, bracket[0], bracket[1])
+        except ValueError:
+            pass  # The fit does not change sign over the observed bracket
+    return la.newtonsMethod(p, x0)
+
+
+def _trim(p):
+    '''Helper, removes zero high-order coefficients.'''
+    p = [float(c) for c in p]
+    while p and p[-1] == 0:
+        p.pop()
+    return p
+
+
+def _quadraticRoots(a, b, c):
+    '''Helper, real roots of a*x^2 + b*x + c (a != 0).'''
+    disc = b*b - 4.0*a*c
+    if disc < 0:
+        return []
+    if b >= 0:
+        q = -0.5*(b + math.sqrt(disc))
+    else:
+        q = -0.5*(b - math.sqrt(disc))
+    if q == 0:  # b == 0 and c == 0
+        return [0.0]
+    return [q/a, c/q]
+
+
+def _cubicRoots(a, b, c, d):
+    '''Helper, real roots of a*x^3 + b*x^2 + c*x + d (a != 0).'''
+    b, c, d = b/a, c/a, d/a
+    # Depressed cubic t^3 + P*t + Q = 0, with x = t - b/3
+    shift = b/3.0
+    P = c - b*b/3.0
+    Q = 2.0*b*b*b/27.0 - b*c/3.0 + d
+    disc = (Q/2.0)**2 + (P/3.0)**3
+    if disc > 0:
+        # One real root (Cardano)
+        s = math.sqrt(disc)
+        u = _cbrt(-Q/2.0 + s)
+        v = _cbrt(-Q/2.0 - s)
+        return [u + v - shift]
+    if P == 0:
+        return [-shift]
+    # Three real roots (trigonometric)
+    r = 2.0*math.sqrt(-P/3.0)
+    arg = 3.0*Q/(P*r)
+    arg = max(-1.0, min(1.0, arg))
+    phi = math.acos(arg)/3.0
+    return [r*math.cos(phi - 2.0*math.pi*k/3.0) - shift for k in range(3)]
+
+
+def _cbrt(v):
+    '''Helper, real cube root.'''
+    if v < 0:
+        return -((-v)**(1.0/3.0))
+    return v**(1.0/3.0)
+
+
+def _polish(p, r, steps=2):
+    '''Helper, refines the closed-form root r of p with Newton steps.'''
+    pDeriv = la.polyDeriv(p)
+    for i in range(steps):
+        df = la.polyVal(pDeriv, r)
+        if df == 0:
+            break
+        step = la.polyVal(p, r)/df
+        if abs(step) > 1e-6*max(1.0, abs(r)):
+            break  # Not a refinement, keep the closed-form value
+        r -= step
+    return r
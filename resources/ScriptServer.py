@@ -0,0 +1,238 @@
+#
+# Persistent Workbench script server.
+#
+# Runs a command loop inside one Workbench session so that the project is
+# opened once, instead of starting RunWB2 and reopening the project for
+# every run set.  Pure Python so that it can run in the Workbench
+# (IronPython) bootstrap script written by WBinstance.start_script_server,
+# and under CPython as a local stand-in for testing the protocol.
+#
+# Protocol, through a spool directory:
+#   <id>.wbjn      batch script, written by the client (as <id>.tmp, then
+#                  renamed so the server never sees a partial script)
+#   <id>.running   the batch while the server runs it
+#   <id>.result    JSON result: id, status ('ok' or 'error'), error text,
+#                  runTimeSec, queuedSec; written as <id>.rtmp then renamed
+#   heartbeat      time of the server's last poll, rewritten every few
+#                  seconds while it is idle
+#   shutdown       written by the client to stop the server
+# Batches are run in order of their ids, each in a fresh copy of the
+# server's namespace.  A batch that raises is reported in its result and
+# the server keeps running (calling onError first, e.g. to reopen the
+# project).
+#
+# Stand-in usage (CPython, from the resources folder):
+#   python ScriptServer.py serve path/to/spool
+#   python ScriptServer.py submit path/to/spool batch.py [requestId]
+#   python ScriptServer.py stop path/to/spool
+#
+
+import json
+import os
+import sys
+import time
+import traceback
+
+requestSuffix = '.wbjn'
+runningSuffix = '.running'
+resultSuffix = '.result'
+heartbeatName = 'heartbeat'
+shutdownName = 'shutdown'
+
+
+def serveForever(spoolPath, namespace, pollInterval=0.2, heartbeatInterval=2.0, onError=None):
+    '''Runs batches from spoolPath until a shutdown file appears.  Each
+    batch is executed in a copy of namespace.  Returns the number of
+    batches run.'''
+    if not os.path.isdir(spoolPath):
+        os.makedirs(spoolPath)
+    _recoverRunning(spoolPath)
+    nBatches = 0
+    lastBeat = 0.0
+    while True:
+        now = time.time()
+        if now - lastBeat >= heartbeatInterval:
+            _writeText(os.path.join(spoolPath, heartbeatName), repr(now))
+            lastBeat = now
+
+        shutdownPath = os.path.join(spoolPath, shutdownName)
+        if os.path.exists(shutdownPath):
+            os.remove(shutdownPath)
+            _removeFile(os.path.join(spoolPath, heartbeatName))
+            return nBatches
+
+        requestIds = pendingRequests(spoolPath)
+        if not requestIds:
+            time.sleep(pollInterval)
+            continue
+        for requestId in requestIds:
+            runBatch(spoolPath, requestId, namespace, onError)
+            nBatches += 1
+            _writeText(os.path.join(spoolPath, heartbeatName), repr(time.time()))
+            lastBeat = time.time()
+
+
+def pendingRequests(spoolPath):
+    '''Returns the ids of the batches waiting in spoolPath, in order.'''
+    return sorted(name[:-len(requestSuffix)] for name in os.listdir(spoolPath)
+                  if name.endswith(requestSuffix))
+
+
+def runBatch(spoolPath, requestId, namespace, onError=None):
+    '''Runs one batch and writes its result, returns the result dict.'''
+    requestPath = os.path.join(spoolPath, requestId + requestSuffix)
+    runningPath = os.path.join(spoolPath, requestId + runningSuffix)
+    result = {'id': requestId, 'status': 'ok', 'error': '', 'runTimeSec': 0.0, 'queuedSec': 0.0}
+    try:
+        result['queuedSec'] = max(0.0, time.time() - os.path.getmtime(requestPath))
+        _replaceFile(requestPath, runningPath)
+        f = open(runningPath, 'r')
+        try:
+            scriptText = f.read()
+        finally:
+            f.close()
+    except Exception:
+        result['status'] = 'error'
+        result['error'] = 'batch could not be read:\n' + traceback.format_exc()
+        _writeResult(spoolPath, result)
+        return result
+
+    batchNamespace = dict(namespace)
+    batchNamespace['batchRequestId'] = requestId
+    startTime = time.time()
+    try:
+        code = compile(scriptText, requestId + requestSuffix, 'exec')
+        exec(code, batchNamespace)
+    except KeyboardInterrupt:
+        raise
+    except BaseException:  # Includes SystemExit, a batch must not stop the server
+        result['status'] = 'error'
+        result['error'] = traceback.format_exc()
+        if onError is not None:
+            try:
+                onError()
+            except Exception:
+                result['error'] += '\nonError failed:\n' + traceback.format_exc()
+    result['runTimeSec'] = time.time() - startTime
+    _removeFile(runningPath)
+    _writeResult(spoolPath, result)
+    return result
+
+
+def submitBatch(spoolPath, requestId, scriptText):
+    '''Client side: queues a batch script with the given id.'''
+    tmpPath = os.path.join(spoolPath, requestId + '.tmp')
+    _writeText(tmpPath, scriptText)
+    _replaceFile(tmpPath, os.path.join(spoolPath, requestId + requestSuffix))
+
+
+def waitForResult(spoolPath, requestId, timeout=None, pollInterval=0.1, heartbeatTimeout=30.0):
+    '''Client side: waits for the result of a batch and returns it as a
+    dict (the result file is removed).  Raises a RuntimeError if the server
+    stops beating or the timeout (seconds) passes.'''
+    resultPath = os.path.join(spoolPath, requestId + resultSuffix)
+    heartbeatPath = os.path.join(spoolPath, heartbeatName)
+    start = time.time()
+    while not os.path.exists(resultPath):
+        now = time.time()
+        if timeout is not None and now - start > timeout:
+            raise RuntimeError('timed out waiting for batch ' + requestId)
+        running = os.path.exists(os.path.join(spoolPath, requestId + runningSuffix))
+        if not running and now - start > heartbeatTimeout and serverAge(spoolPath) > heartbeatTimeout:
+            raise RuntimeError('script server is not running (no heartbeat in ' + heartbeatPath + ')')
+        time.sleep(pollInterval)
+    f = open(resultPath, 'r')
+    try:
+        result = json.loads(f.read())
+    finally:
+        f.close()
+    _removeFile(resultPath)
+    return result
+
+
+def serverAge(spoolPath):
+    '''Returns the seconds since the server's last heartbeat, or infinity
+    if there is none.'''
+    try:
+        f = open(os.path.join(spoolPath, heartbeatName), 'r')
+        try:
+            return time.time() - float(f.read())
+        finally:
+            f.close()
+    except (IOError, OSError, ValueError):
+        return float('inf')
+
+
+def requestShutdown(spoolPath):
+    '''Client side: asks the server to stop after its current batch.'''
+    _writeText(os.path.join(spoolPath, shutdownName), '')
+
+
+def _recoverRunning(spoolPath):
+    '''Helper, reports batches left running by a server that died.'''
+    for name in os.listdir(spoolPath):
+        if name.endswith(runningSuffix):
+            requestId = name[:-len(runningSuffix)]
+            _removeFile(os.path.join(spoolPath, name))
+            _writeResult(spoolPath, {'id': requestId, 'status': 'error',
+                                     'error': 'server stopped while running this batch',
+                                     'runTimeSec': 0.0, 'queuedSec': 0.0})
+
+
+def _writeResult(spoolPath, result):
+    '''Helper, writes a result file so that it appears complete.'''
+    tmpPath = os.path.join(spoolPath, result['id'] + '.rtmp')
+    _writeText(tmpPath, json.dumps(result))
+    _replaceFile(tmpPath, os.path.join(spoolPath, result['id'] + resultSuffix))
+
+
+def _writeText(path, text):
+    f = open(path, 'w')
+    try:
+        f.write(text)
+    finally:
+        f.close()
+
+
+def _replaceFile(src, dst):
+    '''Helper, renames src to dst (replacing dst; os.replace is not
+    available in IronPython 2.7).'''
+    if os.path.exists(dst):
+        os.remove(dst)
+    os.rename(src, dst)
+
+
+def _removeFile(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) >= 2 and argv[0] == 'serve':
+        # Stand-in server: batches run as plain Python
+        nBatches = serveForever(argv[1], {'__name__': '__batch__'})
+        print('%d batches run' % nBatches)
+        return 0
+    if len(argv) >= 3 and argv[0] == 'submit':
+        f = open(argv[2], 'r')
+        try:
+            scriptText = f.read()
+        finally:
+            f.close()
+        requestId = argv[3] if len(argv) > 3 else '%.6f' % time.time()
+        submitBatch(argv[1], requestId, scriptText)
+        print(json.dumps(waitForResult(argv[1], requestId)))
+        return 0
+    if len(argv) >= 2 and argv[0] == 'stop':
+        requestShutdown(argv[1])
+        return 0
+    print('usage: python ScriptServer.py serve|submit|stop spoolPath [batch.py [requestId]]')
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
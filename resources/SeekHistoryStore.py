@@ -0,0 +1,111 @@
+#
+# Seek history store for the operating point seek.
+#
+# Keeps one record per converged seek in seekHistory.csv (in the project
+# directory): the geometry parameter values of the design point, the
+# converged seek input and the output slope dy/dx there.  MATLAB reads the
+# store to predict warm-start inputs and slopes for new seeks (see
+# WBinstance.predict_seek_start).  Pure Python so that it can be imported by
+# the Workbench (IronPython) seeking script alongside LinAlg.
+#
+# File layout:
+#   # Seek history written by seeking_update_script.py
+#   DP Name,<geometry parameter names...>,input,slope
+#   DP 3,<geometry parameter values...>,<input>,<slope>
+#
+
+import os
+
+import LinAlg as la
+
+historyFileName = 'seekHistory.csv'
+historyComment = '# Seek history written by seeking_update_script.py\n'
+
+
+def finalSlope(x, y):
+    '''Returns the slope dy/dx at the last trial x[-1], from a polynomial
+    fit (quadratic if possible) of all trials, or the secant of the last two
+    trials if the fit fails.  Returns None if neither can be computed.'''
+    if len(x) != len(y):
+        raise ValueError('data x and y should be the same length')
+    if len(x) < 2:
+        return None
+    fit = la.PolyFitAccumulator(2)
+    fit.extend(x, y)
+    for n in (min(2, len(x) - 1), 1):
+        try:
+            return la.polyVal(la.polyDeriv(fit.fit(n)), x[-1])
+        except Exception:
+            pass
+    if x[-1] == x[-2]:
+        return None
+    return (y[-1] - y[-2])/(x[-1] - x[-2])
+
+
+def readHistory(path):
+    '''Reads a seek history file, returns (names, records) where names are
+    the geometry parameter names and each record is a tuple
+    (dpName, geometryValues, input, slope).  Returns ([], []) if the file
+    does not exist.'''
+    names = []
+    records = []
+    if not os.path.exists(path):
+        return names, records
+    f = open(path, 'r')
+    try:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            values = line.split(',')
+            if values[0] == 'DP Name':
+                names = values[1:-2]
+                continue
+            try:
+                numbers = [float(v) for v in values[1:]]
+            except ValueError:
+                continue
+            if len(numbers) != len(names) + 2:
+                continue
+            records.append((values[0], numbers[:-2], numbers[-2], numbers[-1]))
+    finally:
+        f.close()
+    return names, records
+
+
+def appendRecord(path, names, dpName, geometry, x, slope):
+    '''Appends one converged seek to the history file at path, writing the
+    header first if the file is new.  Raises a ValueError if the file
+    already has a header for different geometry parameters.'''
+    if len(names) != len(geometry):
+        raise ValueError('geometry names and values should be the same length')
+    header = 'DP Name,' + ','.join(names) + ',input,slope\n'
+    existing = _readNames(path)
+    if existing is None:
+        text = historyComment + header
+    elif existing != list(names):
+        raise ValueError('seek history geometry parameters do not match')
+    else:
+        text = ''
+    text += str(dpName) + ',' + ','.join([repr(float(v)) for v in geometry])
+    text += ',' + repr(float(x)) + ',' + repr(float(slope)) + '\n'
+    f = open(path, 'a')
+    try:
+        f.write(text)
+    finally:
+        f.close()
+
+
+def _readNames(path):
+    '''Helper, returns the geometry parameter names in the header of the
+    history file at path, or None if there is no file or header.'''
+    if not os.path.exists(path):
+        return None
+    f = open(path, 'r')
+    try:
+        for line in f:
+            if line.startswith('DP Name,'):
+                return line.strip().split(',')[1:-2]
+    finally:
+        f.close()
+    return None
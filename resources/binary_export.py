@@ -0,0 +1,148 @@
+#
+# Reader for the binary columnar project data export.
+#
+# binary_export_script.py writes the Workbench design point table as a
+# JSON header (dataExport.json: parameter and design point attributes) and
+# a raw little-endian float64 matrix (dataExport.f64: one row per design
+# point, one column per parameter, NaN for missing values).  This module
+# memory-maps the matrix so columns can be sliced without parsing text or
+# copying the data: as a numpy.memmap if NumPy is available, otherwise as a
+# memoryview over an mmap.
+#
+# Usage (from the resources folder):
+#   python binary_export.py path/to/dataExport.json [param name ...]
+#
+
+import json
+import mmap
+import os
+import struct
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BinaryExport(object):
+    '''A memory-mapped binary project data export.
+
+    header is the decoded JSON header, data the (rows x cols) matrix: a
+    read-only numpy.memmap, or a flat memoryview of doubles (row-major) if
+    NumPy is not available or use_numpy is False.'''
+
+    def __init__(self, header_path, use_numpy=True):
+        with open(header_path, 'r') as f:
+            self.header = json.load(f)
+        if self.header.get('format') != 'WBdataExport':
+            raise ValueError('not a binary data export header: %s' % header_path)
+        if self.header.get('dtype') != '<f8' or self.header.get('order') != 'C':
+            raise ValueError('unsupported data layout in %s' % header_path)
+        self.rows = int(self.header['rows'])
+        self.cols = int(self.header['cols'])
+        self.data_path = os.path.join(os.path.dirname(os.path.abspath(header_path)),
+                                      self.header['dataFile'])
+        size = os.path.getsize(self.data_path)
+        if size != 8*self.rows*self.cols:
+            raise ValueError('data file size %d does not match a %dx%d matrix'
+                             % (size, self.rows, self.cols))
+        self._file = None
+        self._mmap = None
+        if self.rows*self.cols == 0:
+            self.data = np.zeros((self.rows, self.cols)) if (np and use_numpy) else memoryview(b'').cast('d')
+        elif np is not None and use_numpy:
+            self.data = np.memmap(self.data_path, dtype='<f8', mode='r',
+                                  shape=(self.rows, self.cols), order='C')
+        else:
+            self._file = open(self.data_path, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if sys.byteorder == 'little':
+                self.data = memoryview(self._mmap).cast('d')
+            else:
+                # Byte-swapped copy, a native view is not possible
+                self.data = memoryview(bytearray(struct.pack(
+                    '=%dd' % (self.rows*self.cols),
+                    *struct.unpack('<%dd' % (self.rows*self.cols), self._mmap)))).cast('d')
+
+    @property
+    def param_names(self):
+        return self.header['paramNames']
+
+    @property
+    def dp_names(self):
+        return self.header['dpNames']
+
+    def param_index(self, name):
+        '''Returns the column index of the parameter name (or description).'''
+        if name in self.header['paramNames']:
+            return self.header['paramNames'].index(name)
+        if name in self.header['paramDescriptions']:
+            return self.header['paramDescriptions'].index(name)
+        raise KeyError(name)
+
+    def column(self, name):
+        '''Returns the column for parameter name, without copying.'''
+        j = self.param_index(name)
+        if np is not None and not isinstance(self.data, memoryview):
+            return self.data[:, j]
+        return self.data[j::self.cols]
+
+    def row(self, dp_name):
+        '''Returns the row for design point dp_name, without copying.'''
+        i = self.header['dpNames'].index(dp_name)
+        if np is not None and not isinstance(self.data, memoryview):
+            return self.data[i]
+        return self.data[i*self.cols:(i + 1)*self.cols]
+
+    def mutable(self):
+        '''Returns a list of bools, True for the mutable input parameters
+        (as WBdesignPointList.paramMutable).'''
+        return [u == 'Input' and e != 'Derived' for u, e in
+                zip(self.header['paramUsage'], self.header['paramExpressionType'])]
+
+    def close(self):
+        if isinstance(self.data, memoryview):
+            self.data.release()
+        self.data = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # Column or row views are still in use, closed when freed
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def read_binary_export(header_path, use_numpy=True):
+    '''Opens the binary export described by header_path (dataExport.json).'''
+    return BinaryExport(header_path, use_numpy)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) < 1:
+        print('usage: python binary_export.py dataExport.json [param name ...]')
+        return 1
+    with read_binary_export(argv[0]) as export:
+        print('%d design points, %d parameters' % (export.rows, export.cols))
+        for name in argv[1:]:
+            values = [v for v in export.column(name) if v == v]
+            if values:
+                print('%s: %d values, min %g, max %g' % (name, len(values), min(values), max(values)))
+            else:
+                print('%s: no values' % name)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
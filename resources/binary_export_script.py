@@ -0,0 +1,61 @@
+import json
+import struct
+
+designPointList = Parameters.GetAllDesignPoints()
+parameterList = Parameters.GetAllParameters()
+
+header = {
+    'format': 'WBdataExport',
+    'version': 1,
+    'project': str(Project.GetProjectFile()),
+    'dataFile': 'dataExport.f64',
+    'dtype': '<f8',
+    'order': 'C',
+    'rows': len(designPointList),
+    'cols': len(parameterList),
+    'dpNames': [],
+    'upToDate': [],
+    'valid': [],
+    'paramNames': [],
+    'paramDescriptions': [],
+    'paramUnits': [],
+    'paramUsage': [],
+    'paramExpressionType': [],
+}
+
+for para in parameterList:
+    header['paramNames'].append(str(para.Name))
+    header['paramDescriptions'].append(str(para.DisplayText))
+    try:
+        header['paramUnits'].append(str(para.Value.Unit))
+    except:
+        header['paramUnits'].append('None')
+    header['paramUsage'].append(str(para.Usage))
+    header['paramExpressionType'].append(str(para.ExpressionType))
+
+values = []
+nan = float('nan')
+for desi in designPointList:
+    header['dpNames'].append(str(desi.Name))
+    header['upToDate'].append(desi.StateOfParameters == 'UpToDate')
+    header['valid'].append(bool(desi.Retained))
+    for para in parameterList:
+        value = nan
+        if desi.Retained and Parameters.IsParameterInDesignPointUpToDate(DesignPoint=desi, Parameter=para):
+            try:
+                value = float(desi.GetParameterValue(para).Value)
+            except:
+                try:
+                    value = float(desi.GetParameterValue(para))
+                except:
+                    pass
+        values.append(value)
+
+# Matrix first, the header is written last so it only describes complete data
+f = open(GetProjectDirectory() + '\\dataExport.f64', 'wb')
+f.write(struct.pack('<%dd' % len(values), *values))
+f.close()
+
+f = open(GetProjectDirectory() + '\\dataExport.json', 'w')
+f.write(json.dumps(header))
+f.close()
@@ -0,0 +1,38 @@
+touchedNames = set(touchedDesignPointNames)
+touchedNames.update(runMessagesByDesignPoint.keys())
+
+designPointList = Parameters.GetAllDesignPoints()
+parameterList = Parameters.GetAllParameters()
+
+lines = ['Delta,' + str(exportSequence) + ',' + str(len(designPointList)) + '\n']
+lines.append('ParamName,' + ','.join([str(para.Name) for para in parameterList]) + '\n')
+for position in range(len(designPointList)):
+    desi = designPointList[position]
+    if position < knownDesignPointCount and str(desi.Name) not in touchedNames:
+        continue
+    line = ['DP', str(position), str(desi.Name)]
+    if desi.StateOfParameters == 'UpToDate':
+        line.append('1')
+    else:
+        line.append('0')
+    if desi.Retained:
+        line.append('1')
+    else:
+        line.append('0')
+    for para in parameterList:
+        if desi.Retained and Parameters.IsParameterInDesignPointUpToDate(DesignPoint=desi, Parameter=para):
+            try:
+                line.append(str(desi.GetParameterValue(para).Value))
+            except:
+                try:
+                    line.append(str(desi.GetParameterValue(para)))
+                except:
+                    line.append('')
+        else:
+            line.append('')
+    lines.append(','.join(line) + '\n')
+lines.append('End,' + str(exportSequence) + '\n')
+
+f = open(GetProjectDirectory() + '\\deltaDataExport.csv', 'a')
+f.write(''.join(lines))
+f.close()
@@ -0,0 +1,255 @@
+#
+# Microbenchmark for the LinAlg polyFit/AxApproxB path, and scaling
+# benchmark for the main LinAlg operations.
+#
+# Run with CPython 3 from the resources folder:
+#   python linalg_benchmark.py
+#   python linalg_benchmark.py --compare path/to/other/LinAlg.py
+#   python linalg_benchmark.py --scaling --output scaling.json
+#   python linalg_benchmark.py --scaling --baseline scaling.json
+#
+# For each case the best wall time over several repeats is reported, along
+# with the peak traced memory and the net memory blocks allocated for one
+# call (tracemalloc).  Passing --compare loads a second copy of LinAlg (for
+# example an older version exported with git show) and prints both.
+#
+# --scaling times mmMult, transpose, GaussJordan, AxApproxB, det, polyFit
+# and newtonsMethod over sizes from seek fits (3) up to 200, and fits the
+# empirical exponent of time against size over the larger sizes.  It exits
+# with status 1 if an exponent is above the operation's expected
+# complexity, or above the exponent in the --baseline results, by more
+# than the tolerance, and likewise for the exponent of the peak memory.
+# The python backend is benchmarked unless --backend says otherwise.
+# --output writes the results as JSON; with --compare the other LinAlg is
+# benchmarked instead (e.g. to write a baseline).
+#
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_linalg(path=None):
+    '''Imports LinAlg, or the LinAlg module found at path.'''
+    if path is None:
+        import LinAlg
+        return LinAlg
+    spec = importlib.util.spec_from_file_location('LinAlg_compare', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_cases(la, seed=0):
+    '''Returns a list of (name, callable) benchmark cases for module la.'''
+    rng = random.Random(seed)
+    cases = []
+
+    # Seek-sized fits: 3-5 trials, quadratic
+    for nPoints in (3, 5):
+        x = [rng.uniform(0.5, 1.5) for i in range(nPoints)]
+        y = [rng.uniform(-1, 1) for i in range(nPoints)]
+        cases.append(('polyFit n=%d deg=2' % nPoints,
+                      lambda x=x, y=y: la.polyFit(x, y, 2)))
+
+    # Larger least-squares problems
+    for nRows, nCols in ((50, 3), (200, 10)):
+        A = la.matrix([[rng.uniform(-1, 1) for j in range(nCols)] for i in range(nRows)])
+        b = la.matrix([[rng.uniform(-1, 1)] for i in range(nRows)])
+        cases.append(('AxApproxB %dx%d' % (nRows, nCols),
+                      lambda A=A, b=b: la.AxApproxB(A, b)))
+    return cases
+
+
+# Scaling operations: name: (expected exponent, expected peak memory
+# exponent, size meaning)
+SCALING_OPERATIONS = {
+    'mmMult': (3.0, 2.0, 'n for n x n times n x n'),
+    'transpose': (2.0, 2.0, 'n for n x n'),
+    'GaussJordan': (3.0, 2.0, 'n for n x n, one right-hand side'),
+    'AxApproxB': (3.0, 2.0, 'n for 2n x n, one right-hand side'),
+    'det': (3.0, 2.0, 'n for n x n'),
+    'polyFit': (1.0, 1.0, 'number of points, degree 2'),
+    'newtonsMethod': (1.0, 1.0, 'polynomial degree'),
+}
+SCALING_SIZES = (3, 5, 10, 25, 50, 100, 200)
+
+
+def make_scaling_case(la, name, n, rng):
+    '''Returns a callable running operation name at size n.'''
+    def randomMatrix(rows, cols):
+        return la.matrix([[rng.uniform(-1, 1) for j in range(cols)] for i in range(rows)])
+
+    if name == 'mmMult':
+        A, B = randomMatrix(n, n), randomMatrix(n, n)
+        return lambda: la.mmMult(A, B)
+    if name == 'transpose':
+        A = randomMatrix(n, n)
+        return lambda: la.transpose(A)
+    if name == 'GaussJordan':
+        A, b = randomMatrix(n, n) + la.identityMatrix(n)*n, randomMatrix(n, 1)
+        return lambda: la.GaussJordan(A, b)
+    if name == 'AxApproxB':
+        A, b = randomMatrix(2*n, n), randomMatrix(2*n, 1)
+        return lambda: la.AxApproxB(A, b)
+    if name == 'det':
+        A = randomMatrix(n, n) + la.identityMatrix(n)*n
+        return lambda: la.det(A)
+    if name == 'polyFit':
+        x = [rng.uniform(0.5, 1.5) for i in range(n)]
+        y = [rng.uniform(-1, 1) for i in range(n)]
+        return lambda: la.polyFit(x, y, 2)
+    if name == 'newtonsMethod':
+        # Nearly linear near its zero (about 1), so the iterations amount
+        # does not depend on the degree
+        p = [-1.0, 1.0] + [1e-3/n]*(n - 1)
+        return lambda: la.newtonsMethod(p, 0.5)
+    raise ValueError('unknown operation: %s' % name)
+
+
+def fit_exponent(sizes, seconds, min_size=25):
+    '''Least-squares slope of log(seconds) against log(size), over the
+    sizes of at least min_size (where per-call overhead no longer
+    dominates).  Returns None if fewer than two sizes are left.'''
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, seconds) if n >= min_size and t > 0]
+    if len(points) < 2:
+        return None
+    mx = sum(p[0] for p in points)/len(points)
+    my = sum(p[1] for p in points)/len(points)
+    sxx = sum((p[0] - mx)**2 for p in points)
+    sxy = sum((p[0] - mx)*(p[1] - my) for p in points)
+    return sxy/sxx
+
+
+def run_scaling(la, operations=None, sizes=SCALING_SIZES, repeat=3, min_size=25, seed=0, verbose=True):
+    '''Benchmarks the operations over the sizes, returns the results dict.'''
+    results = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'backend': getattr(la, 'getBackend', lambda: 'python')(),
+        'min_fit_size': min_size,
+        'operations': {},
+    }
+    for name in operations or sorted(SCALING_OPERATIONS):
+        expected, expected_peak, meaning = SCALING_OPERATIONS[name]
+        rng = random.Random(seed)
+        record = {'expected': expected, 'expected_peak': expected_peak, 'size': meaning,
+                  'sizes': [], 'seconds': [], 'peak_bytes': []}
+        for n in sizes:
+            best, peak, blocks = measure(make_scaling_case(la, name, n, rng), repeat)
+            record['sizes'].append(n)
+            record['seconds'].append(best)
+            record['peak_bytes'].append(peak)
+            if verbose:
+                print('%-14s %5d %14.1f %12.1f' % (name, n, best*1e6, peak/1024.0))
+        record['exponent'] = fit_exponent(record['sizes'], record['seconds'], min_size)
+        record['peak_exponent'] = fit_exponent(record['sizes'], record['peak_bytes'], min_size)
+        results['operations'][name] = record
+    return results
+
+
+def check_scaling(results, baseline=None, tolerance=0.5):
+    '''Returns a list of messages, one per operation and exponent (time or
+    peak memory) above its expected one, or the baseline's, by more than
+    tolerance.'''
+    problems = []
+    for name, record in sorted(results['operations'].items()):
+        before = None
+        if baseline is not None:
+            before = baseline['operations'].get(name)
+        for key, expected_key, label in (('exponent', 'expected', 'exponent'),
+                                         ('peak_exponent', 'expected_peak', 'peak exponent')):
+            exponent = record.get(key)
+            if exponent is None:
+                continue
+            expected = record.get(expected_key)
+            if expected is not None and exponent > expected + tolerance:
+                problems.append('%s: %s %.2f, expected %.1f' % (name, label, exponent, expected))
+            if before is not None and before.get(key) is not None and exponent > before[key] + tolerance:
+                problems.append('%s: %s %.2f, baseline %.2f' % (name, label, exponent, before[key]))
+    return problems
+
+
+def measure(func, repeat=5):
+    '''Returns (best seconds per call, peak bytes, net blocks) for func.'''
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return best, peak, blocks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='LinAlg polyFit/AxApproxB microbenchmark')
+    parser.add_argument('--compare', help='path to another LinAlg.py to benchmark against')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--scaling', action='store_true', help='run the scaling benchmark')
+    parser.add_argument('--operations', nargs='+', choices=sorted(SCALING_OPERATIONS))
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SCALING_SIZES))
+    parser.add_argument('--min-fit-size', type=int, default=25)
+    parser.add_argument('--backend', choices=('python', 'numpy'), default='python',
+                        help='LinAlg backend to benchmark (default python)')
+    parser.add_argument('--output', help='write the scaling results to this JSON file')
+    parser.add_argument('--baseline', help='scaling results JSON to check the exponents against')
+    parser.add_argument('--tolerance', type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    if args.scaling:
+        la = load_linalg(args.compare)
+        if hasattr(la, 'setBackend'):
+            la.setBackend(args.backend)
+        elif args.backend != 'python':
+            parser.error('this LinAlg has no %s backend' % args.backend)
+        print('%-14s %5s %14s %12s' % ('operation', 'size', 'time [us]', 'peak [KiB]'))
+        results = run_scaling(la, args.operations, args.sizes, min(args.repeat, 3), args.min_fit_size)
+        print()
+        print('%-14s %9s %9s %13s' % ('operation', 'exponent', 'expected', 'peak exponent'))
+        for name, record in sorted(results['operations'].items()):
+            print('%-14s %9s %9.1f %13s' % (
+                name, '-' if record['exponent'] is None else '%.2f' % record['exponent'], record['expected'],
+                '-' if record['peak_exponent'] is None else '%.2f' % record['peak_exponent']))
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=1, sort_keys=True)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)
+        problems = check_scaling(results, baseline, args.tolerance)
+        for problem in problems:
+            print('SCALING REGRESSION ' + problem)
+        return 1 if problems else 0
+
+    modules = [('current', load_linalg())]
+    if args.compare:
+        modules.insert(0, ('compare', load_linalg(args.compare)))
+
+    print('%-22s %-8s %12s %10s %8s' % ('case', 'module', 'time [us]', 'peak [KiB]', 'blocks'))
+    for label, la in modules:
+        for name, func in make_cases(la):
+            best, peak, blocks = measure(func, args.repeat)
+            print('%-22s %-8s %12.1f %10.1f %8d' % (name, label, best*1e6, peak/1024.0, blocks))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
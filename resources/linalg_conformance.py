@@ -0,0 +1,145 @@
+#
+# Conformance check for the LinAlg backends.
+#
+# Runs the same randomized cases through the pure-Python and the NumPy
+# backends of LinAlg and checks the results agree within a tolerance.
+# Needs NumPy, run with CPython from the resources folder:
+#   python linalg_conformance.py
+#
+# Exits with a non-zero status if any case disagrees.
+#
+
+import random
+import sys
+
+import LinAlg as la
+
+
+def _flatten(value):
+    '''Returns the values in a (nested) result as a flat list of floats,
+    None stays None.'''
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return [float(value)]
+    flat = []
+    for e in value:
+        sub = _flatten(e)
+        flat.extend([None] if sub is None else sub)
+    return flat
+
+
+def _close(a, b, rtol, atol):
+    a, b = _flatten(a), _flatten(b)
+    if a is None or b is None:
+        return a is None and b is None
+    if len(a) != len(b):
+        return False
+    for x, y in zip(a, b):
+        if (x is None) != (y is None):
+            return False
+        if x is not None and abs(x - y) > atol + rtol*max(abs(x), abs(y)):
+            return False
+    return True
+
+
+def _call(func):
+    '''Returns func(), or the exception type if it raised a ValueError.'''
+    try:
+        return func()
+    except ValueError:
+        return ValueError
+
+
+def _accumulated(x, y):
+    acc = la.PolyFitAccumulator(2)
+    acc.extend(x, y)
+    return acc
+
+
+def make_cases(seed=0):
+    '''Returns a list of (name, callable) cases, each run under both
+    backends.'''
+    rng = random.Random(seed)
+
+    def rand(r, c):
+        return la.matrix([[rng.uniform(-1, 1) for j in range(c)] for i in range(r)])
+
+    cases = []
+    for n in (1, 3, 8, 40):
+        A, B, C = rand(n, n), rand(n, 2), rand(2, n)
+        v = la.vector([rng.uniform(-1, 1) for i in range(n)])
+        cases.append(('mmMult %d' % n, lambda A=A, B=B: la.mmMult(A, B)))
+        cases.append(('mmMult wide %d' % n, lambda B=B, C=C: la.mmMult(B, C)))
+        cases.append(('mvMult %d' % n, lambda A=A, v=v: la.mvMult(A, v)))
+        cases.append(('transpose %d' % n, lambda B=B: la.transpose(B)))
+        cases.append(('GaussJordan %d' % n, lambda A=A, B=B: la.GaussJordan(A, B)))
+        cases.append(('luSolve %d' % n, lambda A=A, v=v: la.luSolve(la.luFactor(A), v)))
+        cases.append(('det %d' % n, lambda A=A: la.det(A) if n > 1 else A[0][0]))
+    cases.append(('AxApproxB 30x4', lambda A=rand(30, 4), b=rand(30, 1): la.AxApproxB(A, b)))
+    cases.append(('singular', lambda: la.GaussJordan(la.matrix(((1, 2), (2, 4))), la.colVec(1, 2))))
+    # Columns of very different scales, well-posed
+    cases.append(('luSolve scaled columns', lambda: la.luSolve(
+        la.luFactor(la.matrix(((1e-9, 2e6), (3e-9, -1e6)))), la.vector((1.0, 2.0)))))
+
+    histories = []
+    for i in range(50):
+        m = rng.randint(1, 6)
+        x = [rng.uniform(0.5, 1.5) for j in range(m)]
+        histories.append((x, [rng.uniform(-1, 1) for j in range(m)]))
+    histories.append(([1.0, 1.0, 1.0], [0.0, 1.0, 2.0]))  # Rank deficient
+    # Well-posed fit far from the origin, singular in unscaled normal
+    # equations (seek trials at operating points near 1000)
+    histories.append(([1000.0, 1010.0, 1005.0, 1004.0], [1.0, 2.0, 0.5, 3.0]))
+    for deg in (1, 2):
+        for k, (x, y) in enumerate(histories[:10]):
+            cases.append(('polyFit %d deg=%d' % (k, deg),
+                          lambda x=x, y=y, deg=deg: la.polyFit(x, y, deg)))
+        for k, (x, y) in enumerate(histories[-2:]):
+            cases.append(('polyFit special %d deg=%d' % (k, deg),
+                          lambda x=x, y=y, deg=deg: la.polyFit(x, y, deg)))
+        # Trials 0.5 apart near 1500: the coefficients are ill-conditioned
+        # there, compare the fitted values
+        x, y = [1500.0, 1500.5, 1501.0, 1499.5], [0.3, -0.1, -0.7, 0.8]
+        cases.append(('polyFit values near 1500 deg=%d' % deg,
+                      lambda x=x, y=y, deg=deg: [la.polyVal(la.polyFit(x, y, deg), xi) for xi in x]))
+        cases.append(('PolyFitAccumulator values near 1500 deg=%d' % deg,
+                      lambda x=x, y=y, deg=deg: [la.polyVal(_accumulated(x, y).fit(deg), xi) for xi in x]))
+        cases.append(('polyFitMany deg=%d' % deg,
+                      lambda deg=deg: la.polyFitMany([h[0] for h in histories], [h[1] for h in histories], deg)))
+    ps = [[rng.uniform(-1, 1) for j in range(rng.randint(1, 4))] for i in range(20)]
+    xs = [rng.uniform(-2, 2) for i in range(20)]
+    cases.append(('polyVal', lambda: [la.polyVal(p, x) for p, x in zip(ps, xs)]))
+    cases.append(('polyValMany', lambda: la.polyValMany(ps, xs)))
+    return cases
+
+
+def main():
+    if la._np is None:
+        print('NumPy is not available, nothing to compare.')
+        return 1
+    rtol, atol = 1e-8, 1e-10
+    failures = 0
+    cases = make_cases()
+    original = la.getBackend()
+    try:
+        for name, func in cases:
+            la.setBackend('python')
+            expected = _call(func)
+            la.setBackend('numpy')
+            actual = _call(func)
+            if expected is ValueError or actual is ValueError:
+                ok = expected is actual
+            else:
+                ok = _close(expected, actual, rtol, atol)
+            if not ok:
+                failures += 1
+                print('MISMATCH %s:\n  python: %r\n  numpy:  %r' % (name, expected, actual))
+    finally:
+        la.setBackend(original)
+    print('%d cases, %d mismatches' % (len(cases), failures))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,325 @@
+#
+# Indexed, tail-following reader for the append-only Workbench logs.
+#
+# messages_export_post_script.py appends to messageArchive.txt and
+# seeking_update_script.py appends to operatingPointDebug.txt, forever.
+# LogIndex keeps a sidecar index (<log>.idx) with the byte offset, time
+# stamp and design point name of every record, so that:
+#   - updating the index reads only the part of the log appended since the
+#     last update (the log is never rescanned),
+#   - queries (records of one design point, records after a time) read the
+#     index and then seek straight to the matching records.
+#
+# Index file lines (tab separated, append-only):
+#   R <offset> <epoch seconds or empty> <time text> <design point>
+#   E <offset>     the log is indexed up to this offset
+# R lines after the last E line are from an interrupted update and are
+# ignored.  If the log is shorter than the indexed offset (replaced or
+# truncated) the index is rebuilt.
+#
+# Usage (from the resources folder):
+#   python log_index.py path/to/messageArchive.txt [--dp NAME] [--after TIME]
+#   python log_index.py path/to/operatingPointDebug.txt --follow
+#
+
+import argparse
+import bisect
+import calendar
+import os
+import sys
+import time
+from datetime import datetime
+
+from seek_replay import parse_seek_histories
+
+MESSAGES = 'messages'
+SEEKS = 'seeks'
+
+# .NET DateTime.ToString() formats seen in the logs (culture dependent)
+_TIME_FORMATS = (
+    '%m/%d/%Y %I:%M:%S %p',
+    '%d/%m/%Y %I:%M:%S %p',
+    '%m/%d/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M:%S',
+    '%Y-%m-%d %I:%M:%S %p',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%d.%m.%Y %H:%M:%S',
+)
+
+
+def parse_time(text):
+    '''Returns the epoch seconds (as UTC) of a log time stamp, or None if
+    the text is not in a known format.'''
+    text = text.strip()
+    for fmt in _TIME_FORMATS:
+        try:
+            return calendar.timegm(datetime.strptime(text, fmt).timetuple())
+        except ValueError:
+            pass
+    return None
+
+
+def _as_epoch(value):
+    '''Helper, converts a datetime, time text or number to epoch seconds.'''
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, datetime):
+        return calendar.timegm(value.timetuple())
+    epoch = parse_time(value)
+    if epoch is None:
+        raise ValueError('unrecognized time: %r' % value)
+    return epoch
+
+
+class Record(object):
+    '''One indexed log record.'''
+    __slots__ = ('offset', 'time', 'time_text', 'dp')
+
+    def __init__(self, offset, time, time_text, dp):
+        self.offset = offset
+        self.time = time
+        self.time_text = time_text
+        self.dp = dp
+
+    def __repr__(self):
+        return 'Record(%d, %r, %r)' % (self.offset, self.time_text, self.dp)
+
+
+class LogIndex(object):
+    '''Byte-offset index of an append-only messageArchive.txt or
+    operatingPointDebug.txt log.  kind is MESSAGES or SEEKS, guessed from
+    the file name if not given.'''
+
+    def __init__(self, log_path, kind=None, index_path=None):
+        self.log_path = log_path
+        self.index_path = index_path or log_path + '.idx'
+        if kind is None:
+            kind = SEEKS if 'operatingpoint' in os.path.basename(log_path).lower() else MESSAGES
+        if kind not in (MESSAGES, SEEKS):
+            raise ValueError('unknown log kind: %r' % kind)
+        self.kind = kind
+        self.records = []
+        self.end = 0
+        self._by_dp = {}
+        self._timed = []  # Records with a parsed time stamp, and their times
+        self._times = []
+        self._monotonic = True  # Whether _times is nondecreasing
+        self._load()
+
+    # --- Index maintenance ---------------------------------------------
+
+    def _load(self):
+        '''Reads the sidecar index, keeping records up to the last E line.'''
+        self.records = []
+        self.end = 0
+        pending = []
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r') as f:
+                for line in f:
+                    fields = line.rstrip('\n').split('\t')
+                    if fields[0] == 'R' and len(fields) == 5:
+                        epoch = float(fields[2]) if fields[2] else None
+                        pending.append(Record(int(fields[1]), epoch, fields[3], fields[4]))
+                    elif fields[0] == 'E' and len(fields) == 2:
+                        self.records.extend(pending)
+                        pending = []
+                        self.end = int(fields[1])
+        self._rebuild_lookup()
+
+    def _rebuild_lookup(self):
+        self._by_dp = {}
+        self._timed = []
+        self._times = []
+        self._monotonic = True
+        self._extend_lookup(0)
+
+    def _extend_lookup(self, first):
+        '''Helper, adds self.records[first:] to the lookups by design point
+        and by time.'''
+        for k in range(first, len(self.records)):
+            r = self.records[k]
+            self._by_dp.setdefault(r.dp, []).append(k)
+            if r.time is not None:
+                if self._times and r.time < self._times[-1]:
+                    self._monotonic = False
+                self._timed.append(r)
+                self._times.append(r.time)
+
+    def reset(self):
+        '''Discards the index, the next update indexes the whole log.'''
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+        self.records = []
+        self.end = 0
+        self._rebuild_lookup()
+
+    def update(self):
+        '''Indexes the records appended to the log since the last update,
+        returns the list of new records.'''
+        if not os.path.exists(self.log_path):
+            return []
+        size = os.path.getsize(self.log_path)
+        if size < self.end:
+            self.reset()  # Log was replaced or truncated
+        if size == self.end:
+            return []
+
+        new = []
+        end = self.end
+        with open(self.log_path, 'rb') as f:
+            f.seek(self.end)
+            offset = self.end
+            pending = None  # Seek record start waiting for its time line
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # Incomplete line still being written
+                line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+                record = None
+                if self.kind == MESSAGES:
+                    record = self._message_record(offset, line)
+                elif line.startswith('# DP'):
+                    pending = Record(offset, None, '', line[4:])
+                elif pending is not None and line.startswith('# ') and not line.startswith('# n,'):
+                    pending.time_text = line[2:]
+                    pending.time = parse_time(pending.time_text)
+                    record = pending
+                    pending = None
+                if record is not None:
+                    new.append(record)
+                offset += len(raw)
+                if pending is None:
+                    end = offset
+            # A seek record with no time line yet is indexed on a later update
+        if not new and end == self.end:
+            return new  # Only a partial line or record, nothing to index
+
+        with open(self.index_path, 'a') as f:
+            lines = []
+            for r in new:
+                lines.append('R\t%d\t%s\t%s\t%s\n' % (
+                    r.offset, '' if r.time is None else repr(float(r.time)),
+                    r.time_text.replace('\t', ' '), r.dp.replace('\t', ' ')))
+            lines.append('E\t%d\n' % end)
+            f.write(''.join(lines))
+
+        first = len(self.records)
+        self.records.extend(new)
+        self._extend_lookup(first)
+        self.end = end
+        return new
+
+    @staticmethod
+    def _message_record(offset, line):
+        '''Helper, parses a '----- time, type (DP name)' message header.'''
+        if not line.startswith('----- '):
+            return None
+        body = line[6:]
+        dp = ''
+        if body.endswith(')') and ' (DP ' in body:
+            body, dp = body[:-1].rsplit(' (DP ', 1)
+        time_text = body.rsplit(', ', 1)[0] if ', ' in body else body
+        return Record(offset, parse_time(time_text), time_text, dp)
+
+    # --- Queries -------------------------------------------------------
+
+    def read(self, record):
+        '''Returns the text of an indexed record, reading only its bytes.'''
+        k = self._position(record)
+        if k + 1 < len(self.records):
+            stop = self.records[k + 1].offset
+        else:
+            stop = self.end
+        with open(self.log_path, 'rb') as f:
+            f.seek(record.offset)
+            data = f.read(max(0, stop - record.offset))
+        if k + 1 == len(self.records) and stop == self.end:
+            # Last record, include any complete lines appended since
+            with open(self.log_path, 'rb') as f:
+                f.seek(stop)
+                tail = f.read()
+            data += tail[:tail.rfind(b'\n') + 1]
+        return data.decode('utf-8', 'replace').replace('\r\n', '\n')
+
+    def _position(self, record):
+        '''Helper, index of record in self.records (by offset).'''
+        lo, hi = 0, len(self.records)
+        while lo < hi:
+            mid = (lo + hi)//2
+            if self.records[mid].offset < record.offset:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(self.records) or self.records[lo].offset != record.offset:
+            raise ValueError('record is not in this index')
+        return lo
+
+    def for_dp(self, dp):
+        '''Returns the indexed records of design point dp, oldest first.'''
+        return [self.records[k] for k in self._by_dp.get(dp, [])]
+
+    def after(self, when):
+        '''Returns the records with a time stamp later than when (datetime,
+        time text or epoch seconds).  Time stamps in an append-only log are
+        nondecreasing, so the first match is found by bisection (checked as
+        records are indexed, otherwise all are scanned); records with
+        unparsed time stamps are skipped.'''
+        when = _as_epoch(when)
+        if self._monotonic:
+            return self._timed[bisect.bisect_right(self._times, when):]
+        return [r for r in self._timed if r.time > when]
+
+    def messages(self, dp=None, after=None):
+        '''Returns (record, text) pairs, optionally for one design point
+        and/or after a time.'''
+        records = self.records if dp is None else self.for_dp(dp)
+        if after is not None:
+            when = _as_epoch(after)
+            records = [r for r in records if r.time is not None and r.time > when]
+        return [(r, self.read(r)) for r in records]
+
+    def seek_histories(self, dp=None, after=None):
+        '''Returns the seek histories (as seek_replay.read_seek_histories)
+        of the selected records of an operatingPointDebug.txt log.'''
+        histories = []
+        for r, text in self.messages(dp, after):
+            histories.extend(parse_seek_histories(text.splitlines()))
+        return histories
+
+    def follow(self, interval=1.0, stop=None):
+        '''Yields new records as they are appended to the log, polling
+        every interval seconds, until stop() returns True.'''
+        while stop is None or not stop():
+            for r in self.update():
+                yield r
+            time.sleep(interval)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Indexed reader for Workbench logs')
+    parser.add_argument('log')
+    parser.add_argument('--kind', choices=(MESSAGES, SEEKS))
+    parser.add_argument('--dp', help='only records of this design point')
+    parser.add_argument('--after', help='only records after this time')
+    parser.add_argument('--follow', action='store_true', help='print new records as they are appended')
+    args = parser.parse_args(argv)
+
+    index = LogIndex(args.log, args.kind)
+    added = index.update()
+    if args.follow:
+        try:
+            for r in index.follow():
+                sys.stdout.write(index.read(r))
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            pass
+        return 0
+    print('%d records indexed (%d new)' % (len(index.records), len(added)))
+    if args.dp is not None or args.after is not None:
+        for r, text in index.messages(args.dp, args.after):
+            sys.stdout.write(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
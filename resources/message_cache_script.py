@@ -0,0 +1,10 @@
+# Messages since startTime, fetched and filtered once for the post-scripts
+runMessages = []
+runMessagesByDesignPoint = {}
+runMessagesBySummary = {}
+for message in GetMessages():
+	if DateTime.Compare(message.DateTimeStamp, startTime) == 1:
+		runMessages.append(message)
+		runMessagesByDesignPoint.setdefault(str(message.DesignPoint), []).append(message)
+		runMessagesBySummary.setdefault(str(message.Summary), []).append(message)
+
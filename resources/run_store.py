@@ -0,0 +1,200 @@
+#
+# Reader for a MOSAO run store.
+#
+# A run store (the @RunStore class, MOSAO option storePath) is a folder
+# with a JSON header (store.json), the function calls as little-endian
+# float64 records (calls.f64: [kind, set, value, x, y] rows, kind 1 for a
+# call and 2 for a removal) and one JSON line per completed iteration
+# (iterations.jsonl).  Files are only appended to, so a running
+# optimization can be followed from another process: only the records
+# added since the last read are read, and an incomplete last record or
+# line (still being written) is left for the next read.
+#
+# Usage (from the resources folder):
+#   python run_store.py path/to/store [--follow [interval]]
+#
+
+import json
+import math
+import os
+import struct
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class RunStoreReader(object):
+    '''Incremental reader of a run store folder.
+
+    After update(), x, y, valid and call hold the calls left in the
+    Database (removals applied, in Database order) as lists of rows, and
+    iterations the completed iterations (index j - 1 for iteration j, None
+    where there is no record).'''
+
+    def __init__(self, folder_path):
+        self.folder_path = folder_path
+        with open(os.path.join(folder_path, 'store.json'), 'r') as f:
+            self.header = json.load(f)
+        if self.header.get('format') != 'MOSAOrunStore':
+            raise ValueError('not a run store header in: %s' % folder_path)
+        if self.header.get('dtype') != '<f8':
+            raise ValueError('unsupported record layout in %s' % folder_path)
+        self.len_x = int(self.header['lenX'])
+        self.len_y = int(self.header['lenY'])
+        self.record_length = int(self.header['recordLength'])
+        self.calls_path = os.path.join(folder_path, self.header['callsFile'])
+        self.iterations_path = os.path.join(folder_path, self.header['iterationsFile'])
+        self.opt = decode_value(self.header['opt'])
+        self.x = []
+        self.y = []
+        self.valid = []
+        self.call = []
+        self.iterations = []
+        self._calls_offset = 0
+        self._iterations_offset = 0
+        self._removal = None  # [removal number, calls removed] of the last removal
+
+    def update(self):
+        '''Reads the records and lines appended since the last update.
+        Returns the numbers of new call records and iteration lines.'''
+        return self._update_calls(), self._update_iterations()
+
+    def _update_calls(self):
+        record_bytes = 8*self.record_length
+        records = _read_complete(self.calls_path, self._calls_offset, record_bytes)
+        self._calls_offset += len(records)
+        n = len(records)//record_bytes
+        values = struct.unpack('<%dd' % (n*self.record_length), records)
+        for k in range(n):
+            row = values[k*self.record_length:(k + 1)*self.record_length]
+            if row[0] == 2:
+                self._remove(int(row[1]), int(row[2]))
+                continue
+            self.call.append(int(row[1]))
+            self.valid.append(row[2] != 0)
+            self.x.append(list(row[3:3 + self.len_x]))
+            self.y.append(list(row[3 + self.len_x:]))
+        return n
+
+    def _remove(self, removal, index):
+        '''Helper, removes one call of a removal.  The indices of a removal
+        are 1-based, ascending, and refer to the Database before it, so each
+        is shifted down by the calls of the removal already removed (a
+        removal may be split across updates).'''
+        if self._removal is None or self._removal[0] != removal:
+            self._removal = [removal, 0]
+        position = index - self._removal[1]
+        if 1 <= position <= len(self.x):
+            for values in (self.x, self.y, self.valid, self.call):
+                del values[position - 1]
+            self._removal[1] += 1
+
+    def _update_iterations(self):
+        text = _read_complete(self.iterations_path, self._iterations_offset, None)
+        if not text:
+            return 0
+        self._iterations_offset += len(text)
+        lines = [line for line in text.decode('utf-8').split('\n') if line.strip()]
+        for line in lines:
+            entry = json.loads(line)
+            if 'removed' in entry:
+                removed = entry['removed']
+                if not isinstance(removed, list):
+                    removed = [removed]
+                for j in sorted(set(int(r) for r in removed), reverse=True):
+                    if 1 <= j <= len(self.iterations):
+                        del self.iterations[j - 1]
+                continue
+            j = int(entry['iteration'])
+            while len(self.iterations) < j:
+                self.iterations.append(None)
+            self.iterations[j - 1] = decode_value(entry['record'])
+        return len(lines)
+
+    def calls(self):
+        '''Returns (x, y, valid, call): NumPy arrays if NumPy is available,
+        otherwise the lists.'''
+        if np is None:
+            return self.x, self.y, self.valid, self.call
+        return (np.array(self.x, dtype=float).reshape(-1, self.len_x),
+                np.array(self.y, dtype=float).reshape(-1, self.len_y),
+                np.array(self.valid, dtype=bool),
+                np.array(self.call, dtype=int))
+
+
+def decode_value(encoded):
+    '''Reverses RunStore.encode_value: {class, size, data} dicts become
+    NumPy arrays of that shape (data is column-major), or if NumPy is not
+    available (size, data) with data a flat column-major list.  Nulls
+    (NaN or Inf in MATLAB) come back as NaN.'''
+    if isinstance(encoded, dict) and sorted(encoded.keys()) == ['class', 'data', 'size']:
+        data = encoded['data']
+        if not isinstance(data, list):
+            data = [data]
+        data = [float('nan') if v is None else v for v in data]
+        size = [int(s) for s in encoded['size']]
+        if np is None:
+            return tuple(size), data
+        dtype = bool if encoded['class'] == 'logical' else (
+            float if encoded['class'] in ('double', 'single') else np.dtype(encoded['class']))
+        return np.array(data, dtype=dtype).reshape(size, order='F')
+    if isinstance(encoded, dict):
+        return dict((name, decode_value(value)) for name, value in encoded.items())
+    if isinstance(encoded, list):
+        return [decode_value(value) for value in encoded]
+    return encoded
+
+
+def _read_complete(path, offset, unit):
+    '''Helper, reads the bytes of path after offset up to the last complete
+    record (unit bytes each) or, if unit is None, the last newline.'''
+    try:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+    except (IOError, OSError):
+        return b''
+    if unit is None:
+        return data[:data.rfind(b'\n') + 1]
+    return data[:len(data) - len(data) % unit]
+
+
+def _summary(reader):
+    x, y, valid, call = reader.calls()
+    n_valid = sum(1 for v in valid if v)
+    line = '%d calls (%d valid), %d iterations' % (len(call), n_valid, len(reader.iterations))
+    if n_valid and reader.len_y == 1:
+        best = min((row[0] for row, v in zip(reader.y, reader.valid) if v and not math.isnan(row[0])), default=float('nan'))
+        line += ', best f(x) %g' % best
+    return line
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) < 1:
+        print('usage: python run_store.py path/to/store [--follow [interval]]')
+        return 1
+    reader = RunStoreReader(argv[0])
+    reader.update()
+    print('%s: lenX %d, lenY %d, type %s' % (argv[0], reader.len_x, reader.len_y, reader.opt.get('type')))
+    print(_summary(reader))
+    if len(argv) > 1 and argv[1] == '--follow':
+        interval = float(argv[2]) if len(argv) > 2 else 5.0
+        try:
+            while True:
+                time.sleep(interval)
+                n_calls, n_lines = reader.update()
+                if n_calls or n_lines:
+                    print(_summary(reader))
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#
+# Builds and checks the seek history store (seekHistory.csv).
+#
+# New converged seeks are added to the store by seeking_update_script.py.
+# This script back-fills the store from the seeks already recorded in
+# operatingPointDebug.txt: the debug records only name the design point, so
+# their geometry is looked up by name in fullDataExport.csv.  The latest
+# successful seek of each design point is used, since the export holds the
+# design point's current geometry.  It can also report how well the
+# nearest-neighbour warm start (WBinstance.predict_seek_start) predicts the
+# converged input of each seek in the store, by leave-one-out.
+#
+# Usage (from the resources folder):
+#   python seek_history.py build operatingPointDebug.txt fullDataExport.csv
+#       seekHistory.csv --input P1 --iterations P2
+#   python seek_history.py check seekHistory.csv [--neighbors 3]
+#
+
+import argparse
+import math
+import os
+import sys
+
+import SeekHistoryStore as sh
+from seek_replay import read_seek_histories
+
+
+def read_data_export(path):
+    '''Parses a fullDataExport.csv file, returns (params, rows) where params
+    is a list of dicts with the keys name, unit, usage and expression, and
+    rows maps design point names to lists of values (None if empty).'''
+    with open(path, 'r') as f:
+        lines = [line.rstrip('\r\n') for line in f]
+    fields = {}
+    rows = {}
+    for line in lines:
+        if not line or line.startswith('#'):
+            continue
+        values = line.split(',')
+        if values and values[-1] == '':
+            values = values[:-1]
+        if values[0] in ('DP Name', 'UpToDate?', 'Valid?', 'ParamName', 'ParamDesc',
+                         'ParamUnit', 'ParamUsage', 'ParamExpressionType'):
+            fields[values[0]] = values[1:]
+            continue
+        data = []
+        for v in values[1:]:
+            try:
+                data.append(float(v))
+            except ValueError:
+                data.append(None)
+        rows[values[0]] = data
+    params = []
+    for i, name in enumerate(fields.get('ParamName', [])):
+        params.append({
+            'name': name,
+            'unit': fields['ParamUnit'][i],
+            'usage': fields['ParamUsage'][i],
+            'expression': fields['ParamExpressionType'][i],
+        })
+    return params, rows
+
+
+def geometry_indices(params, exclude):
+    '''Returns the indices of the mutable input parameters not in exclude,
+    matching WBinstance.run_set's geometryParameters.'''
+    return [i for i, p in enumerate(params)
+            if p['usage'] == 'Input' and p['expression'] != 'Derived'
+            and p['name'] not in exclude]
+
+
+def build(debugPath, exportPath, historyPath, exclude):
+    '''Appends the latest successful seek of each design point found in the
+    export to the history file, returns the number of records added.'''
+    params, rows = read_data_export(exportPath)
+    geometry = geometry_indices(params, exclude)
+    names = [params[i]['name'] for i in geometry]
+
+    latest = {}
+    for h in read_seek_histories(debugPath):
+        if h['succeeded'] and len(h['x']) >= 2:
+            latest[h['name']] = h
+
+    added = 0
+    for name in sorted(latest):
+        h = latest[name]
+        data = rows.get(name)
+        if data is None:
+            continue
+        values = [data[i] if i < len(data) else None for i in geometry]
+        if any(v is None for v in values):
+            continue
+        slope = sh.finalSlope(h['x'], h['y'])
+        if slope is None:
+            continue
+        sh.appendRecord(historyPath, names, name, values, h['x'][-1], slope)
+        added += 1
+    return added
+
+
+def predict(records, geometry, nNeighbors, skip=None):
+    '''Returns the (input, slope) warm-start prediction for geometry from
+    records, the same way as WBinstance.predict_seek_start, or None.'''
+    used = [r for k, r in enumerate(records) if k != skip]
+    if not used or nNeighbors < 1:
+        return None
+    nParams = len(geometry)
+    ranges = []
+    for j in range(nParams):
+        column = [r[1][j] for r in used]
+        ranges.append((max(column) - min(column)) or 1.0)
+    distances = []
+    for r in used:
+        d = math.sqrt(sum(((r[1][j] - geometry[j])/ranges[j])**2 for j in range(nParams)))
+        distances.append((d, r))
+    distances.sort(key=lambda item: item[0])
+    nearest = distances[:nNeighbors]
+    if nearest[0][0] == 0:
+        weights = [1.0 if d == 0 else 0.0 for d, r in nearest]
+    else:
+        weights = [1.0/d for d, r in nearest]
+    total = sum(weights)
+    x = sum(w*r[2] for w, (d, r) in zip(weights, nearest))/total
+    slope = sum(w*r[3] for w, (d, r) in zip(weights, nearest))/total
+    return x, slope
+
+
+def check(historyPath, nNeighbors):
+    '''Returns leave-one-out statistics of the warm-start predictions over
+    the records in the history file.'''
+    names, records = sh.readHistory(historyPath)
+    errors = []
+    slopeErrors = []
+    for k, r in enumerate(records):
+        prediction = predict(records, r[1], nNeighbors, skip=k)
+        if prediction is None:
+            continue
+        errors.append(abs(prediction[0] - r[2]))
+        if r[3] != 0:
+            slopeErrors.append(abs(prediction[1] - r[3])/abs(r[3]))
+    return {'records': len(records), 'predicted': len(errors),
+            'inputError': sum(errors)/len(errors) if errors else float('nan'),
+            'slopeError': sum(slopeErrors)/len(slopeErrors) if slopeErrors else float('nan')}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Seek history store tools')
+    sub = parser.add_subparsers(dest='command')
+    p = sub.add_parser('build', help='back-fill the store from operatingPointDebug.txt')
+    p.add_argument('debug')
+    p.add_argument('export')
+    p.add_argument('history')
+    p.add_argument('--input', required=True, help='name of the seek input parameter')
+    p.add_argument('--iterations', required=True, help='name of the iterations parameter')
+    p = sub.add_parser('check', help='leave-one-out check of the warm-start predictions')
+    p.add_argument('history')
+    p.add_argument('--neighbors', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        if not os.path.exists(args.debug) or not os.path.exists(args.export):
+            print('debug or export file not found')
+            return 1
+        added = build(args.debug, args.export, args.history, (args.input, args.iterations))
+        print('%d records added to %s' % (added, args.history))
+    elif args.command == 'check':
+        stats = check(args.history, args.neighbors)
+        print('records: %d (%d predicted)' % (stats['records'], stats['predicted']))
+        print('mean |input error|: %.6g' % stats['inputError'])
+        print('mean relative slope error: %.3g' % stats['slopeError'])
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#
+# Replays recorded operating point seeks against the seek root finders.
+#
+# Reads the operatingPointDebug.txt histories written by
+# seeking_update_script.py and, for every curve-fitted trial, repeats the
+# decision the seek made with the recorded (x, net) data: once with the
+# plain LinAlg.newtonsMethod (the previous behaviour) and once with
+# RootFinding.seekZero.  Reports how often each one fails, how often the
+# linear refit is needed, and how far each proposed x is from the last
+# recorded trial of a successful seek (a proxy for trials still needed).
+#
+# Usage (from the resources folder):
+#   python seek_replay.py path/to/operatingPointDebug.txt
+#
+
+import sys
+
+import LinAlg as la
+import RootFinding as rf
+
+
+def read_seek_histories(path):
+    '''Parses an operatingPointDebug.txt file, returns a list of dicts with
+    the keys name, time, n, x, y, net, succeeded and outcome.'''
+    with open(path, 'r') as f:
+        return parse_seek_histories(f)
+
+
+def parse_seek_histories(lines):
+    '''Parses operatingPointDebug.txt lines (any iterable of str), returns
+    a list of dicts as read_seek_histories.'''
+    histories = []
+    current = None
+    for line in lines:
+        line = line.strip()
+        if line.startswith('# DP'):
+            current = {'name': line[4:], 'time': None, 'n': [], 'x': [],
+                       'y': [], 'net': [], 'succeeded': False, 'outcome': ''}
+            histories.append(current)
+        elif current is None or not line:
+            continue
+        elif line.startswith('# Seek succeeded') or line.startswith('# Seek failed'):
+            current['outcome'] = line[2:]
+            current['succeeded'] = line.startswith('# Seek succeeded')
+        elif line.startswith('# n,'):
+            continue
+        elif line.startswith('#'):
+            # The time line follows '# DP', later notes are not times
+            if current['time'] is None:
+                current['time'] = line[2:]
+        else:
+            values = [v for v in line.split(',') if v != '']
+            if len(values) < 4:
+                continue  # Trial did not finish updating
+            try:
+                n, x, y, net = [float(v) for v in values[:4]]
+            except ValueError:
+                continue
+            current['n'].append(int(n))
+            current['x'].append(x)
+            current['y'].append(y)
+            current['net'].append(net)
+    return histories
+
+
+def _decide(fit2, fit1, x0, finder):
+    '''Returns (zero, linearUsed), or (None, None) if both fits fail.'''
+    for fit, linear in ((fit2, False), (fit1, True)):
+        if fit is None:
+            continue
+        try:
+            return finder(fit, linear), linear
+        except Exception:
+            pass
+    return None, None
+
+
+def replay(histories, unfitTrials=3):
+    '''Replays every fitted trial in histories, returns a dict of summary
+    statistics for the old (Newton) and new (seekZero) root finders.'''
+    stats = {'seeks': len(histories), 'trials': 0, 'iterations': 0, 'decisions': 0}
+    for key in ('old', 'new'):
+        stats[key] = {'failures': 0, 'linear': 0, 'distance': 0.0, 'compared': 0}
+
+    for h in histories:
+        x, net = h['x'], h['net']
+        stats['trials'] += len(x)
+        stats['iterations'] += sum(h['n'])
+        acc = la.PolyFitAccumulator(2)
+        for i in range(len(x)):
+            if i >= unfitTrials:
+                stats['decisions'] += 1
+                try:
+                    fit2 = acc.fit(2)
+                except ValueError:
+                    fit2 = None
+                try:
+                    fit1 = acc.fit(1)
+                except ValueError:
+                    fit1 = None
+                finders = {
+                    'old': lambda p, linear: la.newtonsMethod(p, x[i-1]),
+                    'new': lambda p, linear: rf.seekZero(p, x[i-1], x[:i], net[:i]),
+                }
+                for key, finder in finders.items():
+                    zero, linear = _decide(fit2, fit1, x[i-1], finder)
+                    if zero is None:
+                        stats[key]['failures'] += 1
+                        continue
+                    if linear:
+                        stats[key]['linear'] += 1
+                    if h['succeeded']:
+                        stats[key]['distance'] += abs(zero - x[-1])
+                        stats[key]['compared'] += 1
+            acc.add(x[i], net[i])
+    return stats
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) < 1:
+        print('usage: python seek_replay.py operatingPointDebug.txt [unfitTrials]')
+        return 1
+    unfitTrials = int(argv[1]) if len(argv) > 1 else 3
+    histories = read_seek_histories(argv[0])
+    stats = replay(histories, unfitTrials)
+
+    failed = sum(1 for h in histories if not h['succeeded'])
+    print('seeks: %d (%d recorded as failed)' % (stats['seeks'], failed))
+    print('trials per seek: %.2f' % (float(stats['trials'])/max(1, stats['seeks'])))
+    print('solver iterations per seek: %.1f' % (float(stats['iterations'])/max(1, stats['seeks'])))
+    print('fitted decisions replayed: %d' % stats['decisions'])
+    print('%-8s %10s %10s %22s' % ('finder', 'failures', 'linear', 'mean |x - x_final|'))
+    for key in ('old', 'new'):
+        s = stats[key]
+        meanDistance = s['distance']/s['compared'] if s['compared'] else float('nan')
+        print('%-8s %10d %10d %22.6g' % (key, s['failures'], s['linear'], meanDistance))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,123 +1,314 @@
 import sys
 import os
-sys.path.append(os.path.abspath(resourcesPath))
+if os.path.abspath(resourcesPath) not in sys.path:
+    sys.path.append(os.path.abspath(resourcesPath))
 import LinAlg as la
+import RootFinding as rf
+import SeekHistoryStore as sh
 
-maxTrials = 5
 unfitTrials = 3
 CFDnLowRes = 75
 CFDnHighRes = 150
 CFDguessedSlope = -0.0004
 unfitRelaxFactor = 0.5
 
+# Fidelity controller: trials climb the iterations ladder, a trial is
+# converged when |net| and the change in x are within their tolerances
+# (tolerances <= 0 are not checked, with none set every trial is run)
+try:
+    maxTrials = seekMaxTrials
+except NameError:
+    maxTrials = 5
+try:
+    seekIterationLadder
+except NameError:
+    seekIterationLadder = [CFDnLowRes, CFDnHighRes]
+try:
+    seekNetTolerance
+except NameError:
+    seekNetTolerance = 0.0
+try:
+    seekStepTolerance
+except NameError:
+    seekStepTolerance = 0.0
+topLevel = len(seekIterationLadder) - 1
+
+# Lockstep mode runs trial i of every active design point in one update
+try:
+    seekLockstep
+except NameError:
+    seekLockstep = False
+
+# Warm-start predictions from the seek history, {DP name: (input, slope)}
+try:
+    seekStart
+except NameError:
+    seekStart = {}
+
+# Geometry parameters recorded in the seek history for converged seeks
+try:
+    geometryParameters
+except NameError:
+    geometryParameters = []
+
 seekDerivPolynomial = la.polyDeriv(seekPolynomial)
 inputUnits = inputParameter.Value.Unit
 f = open(GetProjectDirectory() + '\\operatingPointDebug.txt', 'a')
 
-# For each design point in the list:
-for desi in designPoints:
-    # Write header for this design point to debug file
-    f.write('# DP' + desi.Name + '\n')
-    f.write('# ' + str(DateTime.Now) + '\n')
-    f.write('# n,x,y,net\n')
-
-    # Initialize
-    n = []
-    x = []
-    y = []
-    net = []
-    errorFlag = False
-    errorType = ''
-    linearFitUsed = []
-
-    # Set base design point to desi, unless it already is
-    if desi != Parameters.GetBaseDesignPoint():
-        Parameters.SetBaseDesignPoint(DesignPoint=desi)
-
-    # Run trials
-    for i in range(maxTrials):
-        # Decide new trial inputs and iterations amount
-        if i == 0:  # First trial
-            nNext = CFDnLowRes
+
+def startSeek(desi):
+    # Initialize the seek state for a design point, with its debug header
+    return {
+        'desi': desi,
+        'n': [],
+        'x': [],
+        'y': [],
+        'net': [],
+        'level': 0,
+        'convergedTrial': None,
+        'errorFlag': False,
+        'errorType': '',
+        'linearFitUsed': [],
+        'secantUsed': [],
+        'netFit': la.PolyFitAccumulator(2),
+        'debug': ['# DP' + desi.Name + '\n', '# ' + str(DateTime.Now) + '\n', '# n,x,y,net\n'],
+    }
+
+
+def planTrial(seek, i):
+    # Decide trial i's inputs and iterations amount and set them on the
+    # design point. Returns False if the seek failed instead.
+    desi = seek['desi']
+    n, x, y, net = seek['n'], seek['x'], seek['y'], seek['net']
+
+    nNext = trialIterations(seek, i)
+    if i == 0:  # First trial
+        if desi.Name in seekStart:  # Predicted from the seek history
+            xNext = seekStart[desi.Name][0]
+        else:
             xNext = desi.GetParameterValue(inputParameter).Value
-        elif i < unfitTrials:  # Trials before curve fitting
-            if i == 1:  # Second trial, guessed slope
-                slope = CFDguessedSlope - la.polyVal(seekDerivPolynomial, x[i-1])
-            else:
-                slope = (y[i-1] - y[i-2])/(x[i-1] - x[i-2]) - la.polyVal(seekDerivPolynomial, x[i-1])
+    elif i < unfitTrials:  # Trials before curve fitting
+        xNext = secantStep(seek, i)
+    else:  # Trials with curve fitting
+        try:
+            fit = seek['netFit'].fit(2)
+            zero = rf.seekZero(fit, x[i-1], x, net)
+        except Exception:  # Try a linear fit (also if trials are too close for a quadratic)
+            try:
+                fit = seek['netFit'].fit(1)
+            except Exception:  # Trials too close to fit, step as before fitting
+                fit = None
+                zero = secantStep(seek, i)
+                seek['secantUsed'].append(i)
+            if fit is not None:
+                try:
+                    zero = rf.seekZero(fit, x[i-1], x, net)
+                    seek['linearFitUsed'].append(i)
+                except Exception:
+                    seek['errorFlag'] = True
+                    seek['errorType'] = 'root finding failed in trial ' + str(i)
+                    return False
+        xNext = zero
+
+    # Save new trial inputs
+    n.append(nNext)
+    x.append(xNext)
+
+    # Save trial inputs to debug record
+    seek['debug'].append(str(n[i]) + ',' + str(x[i]) + ',')
+
+    # Update design point with input
+    desi.SetParameterExpression(
+        Parameter=iterationsParameter,
+        Expression=str(n[i]))
+    desi.SetParameterExpression(
+        Parameter=inputParameter,
+        Expression=(str(x[i]) + ' [' + inputUnits + ']'))
+    return True
+
+
+def secantStep(seek, i):
+    # Relaxed step for trial i from the slope of the last two trials, or
+    # the guessed (or predicted) slope if there is only one distinct trial
+    desi = seek['desi']
+    x, y, net = seek['x'], seek['y'], seek['net']
+    if i == 1 or x[i-1] == x[i-2]:
+        guessedSlope = CFDguessedSlope
+        if desi.Name in seekStart:
+            guessedSlope = seekStart[desi.Name][1]
+        slope = guessedSlope - la.polyVal(seekDerivPolynomial, x[i-1])
+    else:
+        slope = (y[i-1] - y[i-2])/(x[i-1] - x[i-2]) - la.polyVal(seekDerivPolynomial, x[i-1])
+    return x[i-1] - unfitRelaxFactor*(net[i-1]/slope)
+
+
+def trialIterations(seek, i):
+    # Iterations amount for trial i: the seek's ladder level, raised where
+    # needed so the last trial is always run at the top of the ladder
+    level = max(seek['level'], topLevel - (maxTrials-1 - i))
+    seek['level'] = min(level, topLevel)
+    return seekIterationLadder[seek['level']]
+
+
+def trialConverged(seek, i):
+    # Check trial i against the enabled tolerances
+    x, net = seek['x'], seek['net']
+    if seekNetTolerance <= 0 and seekStepTolerance <= 0:
+        return False
+    if seekNetTolerance > 0 and abs(net[i]) > seekNetTolerance:
+        return False
+    if seekStepTolerance > 0 and (i == 0 or abs(x[i] - x[i-1]) > seekStepTolerance):
+        return False
+    return True
+
+
+def recordTrial(seek, i):
+    # Get trial i's outputs, save to debug record. Returns True if the seek
+    # has converged at the top of the iterations ladder.
+    y, net = seek['y'], seek['net']
+    y.append(seek['desi'].GetParameterValue(outputParameter).Value)
+    net.append(y[i] - la.polyVal(seekPolynomial, seek['x'][i]))
+    seek['netFit'].add(seek['x'][i], net[i])
+    seek['debug'].append(str(y[i]) + ',' + str(net[i]) + ',\n')
+
+    if trialConverged(seek, i):
+        if seek['level'] == topLevel:
+            seek['convergedTrial'] = i
+            return True
+        seek['level'] += 1  # Promote the next trial to more iterations
+    return False
 
-            nNext = CFDnLowRes
-            xNext = x[i-1] - unfitRelaxFactor*(net[i-1]/slope)
-        else:  # Trials with curve fitting
+
+def failTrial(seek, i):
+    # Mark trial i's design point update as failed
+    seek['errorFlag'] = True
+    seek['errorType'] = 'design point update failed in trial ' + str(i)
+    seek['debug'].append('\n')
+
+
+def parameterNumber(desi, para):
+    # Value of para in desi as a number (unitless values have no .Value,
+    # as in data_export_script.py)
+    try:
+        return float(desi.GetParameterValue(para).Value)
+    except:
+        return float(desi.GetParameterValue(para))
+
+
+def recordHistory(seek):
+    # Add a converged seek to the seek history store
+    if len(geometryParameters) == 0:
+        return
+    desi = seek['desi']
+    slope = sh.finalSlope(seek['x'], seek['y'])
+    if slope is None:
+        return
+    geometry = [parameterNumber(desi, para) for para in geometryParameters]
+    try:
+        sh.appendRecord(
+            GetProjectDirectory() + '\\' + sh.historyFileName,
+            [para.Name for para in geometryParameters],
+            desi.Name,
+            geometry,
+            seek['x'][-1],
+            slope)
+    except Exception as e:
+        # The history is only used for warm starts, never fail a seek (the
+        # note must not start with '# Seek', which marks the outcome line)
+        seek['debug'].append('# History not written (' + str(e) + ')\n')
+
+
+def finishSeek(seek):
+    # Add line describing seek outcome, write the design point's record
+    debug = seek['debug']
+    if seek['errorFlag']:
+        debug.append('# Seek failed (' + seek['errorType'] + ')\n')
+        seek['desi'].Retained = False
+    else:
+        line = '# Seek succeeded'
+        if len(seek['linearFitUsed']) > 0:
+            line += ', linear fit used in trial(s) ' + str(seek['linearFitUsed'])
+        if len(seek['secantUsed']) > 0:
+            line += ', secant step used in trial(s) ' + str(seek['secantUsed'])
+        if seek['convergedTrial'] is not None:
+            line += ', converged in trial ' + str(seek['convergedTrial'])
+        debug.append(line + '\n')
+        recordHistory(seek)
+
+    # Add blank line to debug record
+    debug.append('\n')
+    f.write(''.join(debug))
+    f.flush()
+
+
+if not seekLockstep:
+    # For each design point in the list:
+    for desi in designPoints:
+        seek = startSeek(desi)
+
+        # Set base design point to desi, unless it already is
+        if desi != Parameters.GetBaseDesignPoint():
+            Parameters.SetBaseDesignPoint(DesignPoint=desi)
+
+        # Run trials
+        for i in range(maxTrials):
+            if not planTrial(seek, i):
+                break
+
+            # Simulate trial
             try:
-                fit = la.polyFit(x, net, 2)
+                backgroundSession1 = UpdateAllDesignPoints(DesignPoints=[desi])
             except Exception:
-                errorFlag = True
-                errorType = 'polyFit failed in trial ' + str(i)
+                failTrial(seek, i)
                 break
 
-            try:
-                zero = la.newtonsMethod(fit, x[i-1])
-            except Exception:  # Try a linear fit
-                try:
-                    fit = la.polyFit(x, net, 1)
-                    zero = la.newtonsMethod(fit, x[i-1])
-                    linearFitUsed.append(i)
-                except Exception:
-                    errorFlag = True
-                    errorType = 'newton\'s method failed in trial ' + str(i)
-                    break
+            if recordTrial(seek, i):
+                break
 
-            if i == maxTrials-1:
-                nNext = CFDnHighRes  # If last trial, set to highRes
+        finishSeek(seek)
+else:
+    # Run trial i for all still-active design points in a single update
+    active = [startSeek(desi) for desi in designPoints]
+    for i in range(maxTrials):
+        running = []
+        for seek in active:
+            if planTrial(seek, i):
+                running.append(seek)
             else:
-                nNext = CFDnLowRes
-            xNext = zero
-
-        # Save new trial inputs
-        n.append(nNext)
-        x.append(xNext)
-
-        # Save trial inputs to debug file
-        f.write(str(n[i]) + ',')
-        f.write(str(x[i]) + ',')
-
-        # Update design point with input
-        desi.SetParameterExpression(
-            Parameter=iterationsParameter,
-            Expression=str(n[i]))
-        desi.SetParameterExpression(
-            Parameter=inputParameter,
-            Expression=(str(x[i]) + ' [' + inputUnits + ']'))
-
-        # Simulate trial
+                finishSeek(seek)
+        active = []
+        if len(running) == 0:
+            break
+
+        # Only one design point can be the base. With several running the
+        # base is left as is: planTrial sets each trial's inputs on its own
+        # design point, so UpdateAllDesignPoints solves each of them
+        # whatever the base is, only not in place. A single running design
+        # point is made the base, as in the sequential loop.
+        if len(running) == 1 and running[0]['desi'] != Parameters.GetBaseDesignPoint():
+            Parameters.SetBaseDesignPoint(DesignPoint=running[0]['desi'])
+
+        # Simulate trials
+        failed = []
         try:
-            backgroundSession1 = UpdateAllDesignPoints(DesignPoints=[desi])
+            backgroundSession1 = UpdateAllDesignPoints(DesignPoints=[seek['desi'] for seek in running])
         except Exception:
-            errorFlag = True
-            errorType = 'design point update failed in trial ' + str(i)
-            f.write('\n')
-            break
+            # Only the design points left out-of-date have failed
+            failed = [seek for seek in running if seek['desi'].StateOfParameters != 'UpToDate']
+            if len(failed) == 0:
+                failed = running
 
-        # Get trial outputs, save to debug file
-        y.append(desi.GetParameterValue(outputParameter).Value)
-        net.append(y[i] - la.polyVal(seekPolynomial, x[i]))
-        f.write(str(y[i]) + ',')
-        f.write(str(net[i]) + ',')
-        f.write('\n')
-
-    # Add line to debug file describing seek outcome
-    if errorFlag:
-        f.write('# Seek failed (' + errorType + ')\n')
-        desi.Retained = False
-    else:
-        f.write('# Seek succeeded')
-        if len(linearFitUsed) > 0:
-            f.write(', linear fit used in trial(s) ' + str(linearFitUsed))
-        f.write('\n')
+        for seek in running:
+            if seek in failed:
+                failTrial(seek, i)
+                finishSeek(seek)
+            elif recordTrial(seek, i):
+                finishSeek(seek)
+            else:
+                active.append(seek)
 
-    # Add blank line to debug file
-    f.write('\n')
+    for seek in active:
+        finishSeek(seek)
 
 # Close the debug file
 f.close()
@@ -0,0 +1,661 @@
+#
+# Local stand-in for the Workbench scripting API.
+#
+# Runs the scripts that WBinstance.run_set generates (or the ones archived in
+# workbenchScriptArchive.wbjn) without ANSYS, so that changes to the
+# resources scripts can be checked and timed.  The mock implements the
+# objects those scripts use (Parameters, design points, parameter values
+# and expressions, UpdateAllDesignPoints, GetMessages, Save, Open,
+# System.DateTime, ...) on top of analytic response functions, and keeps a
+# simulated clock:
+#   - Open costs the startup time (Workbench start and project load),
+#   - a design point update costs the solve overhead plus a time per solver
+#     iteration, plus the geometry time if a geometry input changed,
+#   - updates of several design points run on a number of parallel slots,
+#   - a design point update fails with the given probability (or if the
+#     response is not finite), leaving it out-of-date with an error message.
+# The report gives the simulated Workbench time next to the real time
+# spent in the scripts.
+#
+# Usage (from the resources folder):
+#   python workbench_mock.py --mode seek --dps 20 --slots 4
+#   python workbench_mock.py --mode simple --project function --function ZDT1
+#   python workbench_mock.py --mode seek --dps 5 --history-fail
+#   python workbench_mock.py --script path/to/workbenchScriptArchive.wbjn
+#
+
+import argparse
+import datetime
+import heapq
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+import types
+
+RESOURCES_PATH = os.path.dirname(os.path.abspath(__file__))
+
+# Summary of the message Workbench shows for a failed design point update
+UPDATE_FAILED_SUMMARY = 'The design point failed to update.'
+
+
+# --- Analytic response functions (as FunctionSuite) ---------------------
+
+def sphere(x):
+    return [sum(v**2 for v in x)]
+
+
+def rosenbrock(x):
+    return [sum(100*(x[k + 1] - x[k]**2)**2 + (1 - x[k])**2 for k in range(len(x) - 1))]
+
+
+def _zdt(x, h):
+    f1 = x[0]
+    g = 1 + 9.0/(len(x) - 1)*sum(x[1:])
+    return [f1, g*h(f1, g)]
+
+
+def zdt1(x):
+    return _zdt(x, lambda f1, g: 1 - math.sqrt(f1/g))
+
+
+def zdt2(x):
+    return _zdt(x, lambda f1, g: 1 - (f1/g)**2)
+
+
+def zdt3(x):
+    return _zdt(x, lambda f1, g: 1 - math.sqrt(f1/g) - (f1/g)*math.sin(10*math.pi*f1))
+
+
+# name: (function, number of outputs, lower bound, upper bound)
+FUNCTIONS = {
+    'sphere': (sphere, 1, -5.12, 5.12),
+    'rosenbrock': (rosenbrock, 1, -2.048, 2.048),
+    'ZDT1': (zdt1, 2, 0.0, 1.0),
+    'ZDT2': (zdt2, 2, 0.0, 1.0),
+    'ZDT3': (zdt3, 2, 0.0, 1.0),
+}
+
+
+# --- Workbench objects --------------------------------------------------
+
+class NetDateTime(datetime.datetime):
+    '''A datetime that prints as .NET DateTime.ToString() does (en-US).'''
+
+    def __str__(self):
+        hour = self.hour % 12 or 12
+        return '%d/%d/%d %d:%02d:%02d %s' % (
+            self.month, self.day, self.year, hour, self.minute, self.second,
+            'AM' if self.hour < 12 else 'PM')
+
+
+class DateTimeClass(object):
+    '''System.DateTime, Now is the simulated time.'''
+
+    def __init__(self, workbench):
+        self._workbench = workbench
+
+    @property
+    def Now(self):
+        return self._workbench.now()
+
+    @staticmethod
+    def Compare(a, b):
+        return (a > b) - (a < b)
+
+
+class Quantity(object):
+    '''A parameter value with a unit.'''
+
+    def __init__(self, value, unit):
+        self.Value = value
+        self.Unit = unit
+
+    def __str__(self):
+        return '%s [%s]' % (self.Value, self.Unit)
+
+
+class Message(object):
+    def __init__(self, stamp, message_type, design_point, summary):
+        self.DateTimeStamp = stamp
+        self.MessageType = message_type
+        self.DesignPoint = design_point
+        self.Summary = summary
+
+
+class Parameter(object):
+    def __init__(self, workbench, name, display_text, usage, unit='', geometry=False):
+        self._workbench = workbench
+        self.Name = name
+        self.DisplayText = display_text
+        self.Usage = usage
+        self.ExpressionType = 'Constant' if usage == 'Input' else 'Derived'
+        self.unit = unit
+        self.geometry = geometry
+
+    @property
+    def Value(self):
+        desi = self._workbench.parameters.GetBaseDesignPoint()
+        if self.Usage == 'Input' or self.Name in desi.outputs:
+            return desi.GetParameterValue(self)
+        return self.quantity(0.0)
+
+    def quantity(self, value):
+        '''Helper, value as GetParameterValue returns it (unitless values
+        are plain numbers, as in Workbench).'''
+        if self.unit:
+            return Quantity(value, self.unit)
+        return value
+
+
+class DesignPoint(object):
+    def __init__(self, workbench, name, inputs):
+        self._workbench = workbench
+        self.Name = name
+        self.Retained = False
+        self.StateOfParameters = 'OutOfDate'
+        self.inputs = dict(inputs)
+        self.outputs = {}
+        self.solved_geometry = None  # Geometry inputs of the last update
+
+    def GetParameterValue(self, Parameter):
+        if Parameter.Usage == 'Input':
+            return Parameter.quantity(self.inputs[Parameter.Name])
+        if Parameter.Name not in self.outputs:
+            raise RuntimeError('parameter %s of design point %s has no value' % (Parameter.Name, self.Name))
+        return Parameter.quantity(self.outputs[Parameter.Name])
+
+    def SetParameterExpression(self, Parameter, Expression):
+        value = float(Expression.split('[')[0])
+        if Parameter.Usage != 'Input':
+            raise RuntimeError('parameter %s is not an input' % Parameter.Name)
+        self.inputs[Parameter.Name] = value
+        self.StateOfParameters = 'OutOfDate'
+
+    def geometry(self):
+        return tuple(self.inputs[p.Name] for p in self._workbench.parameter_list if p.geometry)
+
+
+class ParametersModule(object):
+    '''The Parameters scripting module.'''
+
+    def __init__(self, workbench):
+        self._workbench = workbench
+        self._base = None
+
+    def GetAllParameters(self):
+        return list(self._workbench.parameter_list)
+
+    def GetParameter(self, Name):
+        for para in self._workbench.parameter_list:
+            if para.Name == Name:
+                return para
+        raise KeyError('no parameter named ' + Name)
+
+    def GetAllDesignPoints(self):
+        return list(self._workbench.design_points)
+
+    def GetDesignPoint(self, Name):
+        for desi in self._workbench.design_points:
+            if desi.Name == Name:
+                return desi
+        raise KeyError('no design point named ' + Name)
+
+    def CreateDesignPoint(self):
+        workbench = self._workbench
+        desi = DesignPoint(workbench, str(workbench.next_design_point), self.GetBaseDesignPoint().inputs)
+        workbench.next_design_point += 1
+        workbench.design_points.append(desi)
+        return desi
+
+    def GetBaseDesignPoint(self):
+        return self._base
+
+    def SetBaseDesignPoint(self, DesignPoint):
+        self._base = DesignPoint
+
+    def IsParameterInDesignPointUpToDate(self, DesignPoint, Parameter):
+        if Parameter.Usage == 'Input':
+            return True
+        return DesignPoint.StateOfParameters == 'UpToDate' and Parameter.Name in DesignPoint.outputs
+
+
+class UpdateFailedError(Exception):
+    pass
+
+
+class _Settings(object):
+    '''Attribute bag for the settings objects scripts change.'''
+
+
+class _Component(object):
+    def __init__(self, workbench):
+        self._workbench = workbench
+
+    def UpdateUpstreamComponents(self):
+        desi = self._workbench.parameters.GetBaseDesignPoint()
+        self._workbench.advance(self._workbench.geometry_sec)
+        desi.solved_geometry = desi.geometry()
+
+
+class _System(object):
+    def __init__(self, workbench):
+        self._workbench = workbench
+
+    def GetComponent(self, Name):
+        return _Component(self._workbench)
+
+
+class _Project(object):
+    def __init__(self, workbench):
+        self._workbench = workbench
+
+    def GetProjectFile(self):
+        return os.path.join(self._workbench.directory, 'mockProject.wbpj')
+
+
+# --- Mock Workbench session ---------------------------------------------
+
+class MockWorkbench(object):
+    '''A simulated Workbench session with one project.
+
+    parameters is a list of (name, display text, usage, unit, geometry)
+    tuples, response a function from the dict of input values to the dict
+    of output values.  Times are in simulated seconds.  newline is the line
+    ending of the text files the scripts write ('\\r\\n' as on Windows,
+    default: the platform's).'''
+
+    def __init__(self, directory, parameters, response, design_points=(),
+                 iterations_parameter=None, startup_sec=60.0, solve_overhead_sec=20.0,
+                 per_iteration_sec=0.5, default_iterations=100, geometry_sec=30.0,
+                 save_sec=5.0, slots=1, failure_rate=0.0, seed=0,
+                 start=datetime.datetime(2026, 1, 1, 9, 0, 0), newline=None):
+        self.directory = directory
+        self.newline = newline
+        self.response = response
+        self.iterations_parameter = iterations_parameter
+        self.startup_sec = startup_sec
+        self.solve_overhead_sec = solve_overhead_sec
+        self.per_iteration_sec = per_iteration_sec
+        self.default_iterations = default_iterations
+        self.geometry_sec = geometry_sec
+        self.save_sec = save_sec
+        self.slots = max(1, int(slots))
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.start = start
+        self.clock = 0.0
+        self.messages = []
+        self.counts = {'updates': 0, 'solves': 0, 'failures': 0, 'saves': 0, 'opens': 0}
+
+        self.parameter_list = [Parameter(self, *p) for p in parameters]
+        self.parameters = ParametersModule(self)
+        self.design_points = []
+        self.next_design_point = 0
+        for inputs in design_points:
+            desi = DesignPoint(self, str(self.next_design_point), inputs)
+            desi.Retained = True
+            self.next_design_point += 1
+            self.design_points.append(desi)
+        self.parameters.SetBaseDesignPoint(self.design_points[0])
+
+    # --- Clock ---
+
+    def now(self, clock=None):
+        if clock is None:
+            clock = self.clock
+        t = self.start + datetime.timedelta(seconds=clock)
+        return NetDateTime(t.year, t.month, t.day, t.hour, t.minute, t.second, t.microsecond)
+
+    def advance(self, seconds):
+        # At least a millisecond, so that later messages are always after
+        # a DateTime.Now taken before them
+        self.clock += max(seconds, 0.001)
+
+    # --- Scripting API ---
+
+    def update_all(self, DesignPoints):
+        '''UpdateAllDesignPoints: solves the design points on the parallel
+        slots, raises UpdateFailedError if any of them failed.'''
+        self.counts['updates'] += 1
+        start = self.clock
+        slots = [start]*self.slots
+        failed = []
+        end = start
+        for desi in DesignPoints:
+            slotStart = heapq.heappop(slots)
+            seconds = self.solve_overhead_sec + self.per_iteration_sec*self.iterations(desi)
+            if desi.solved_geometry != desi.geometry():
+                seconds += self.geometry_sec
+            finish = slotStart + max(seconds, 0.001)
+            heapq.heappush(slots, finish)
+            end = max(end, finish)
+            self.counts['solves'] += 1
+
+            outputs = None
+            if self.rng.random() >= self.failure_rate:
+                try:
+                    outputs = self.response(dict(desi.inputs))
+                except (ArithmeticError, ValueError):
+                    outputs = None
+                if outputs is not None and not all(isinstance(v, float) and math.isfinite(v) for v in outputs.values()):
+                    outputs = None
+            if outputs is None:
+                failed.append(desi)
+                desi.StateOfParameters = 'OutOfDate'
+                self.messages.append(Message(self.now(finish), 'Error', desi.Name, UPDATE_FAILED_SUMMARY))
+            else:
+                desi.outputs = outputs
+                desi.solved_geometry = desi.geometry()
+                desi.StateOfParameters = 'UpToDate'
+        self.advance(end - start)
+        if failed:
+            self.counts['failures'] += len(failed)
+            raise UpdateFailedError('%d design point(s) failed to update' % len(failed))
+
+    def iterations(self, desi):
+        if self.iterations_parameter is None:
+            return self.default_iterations
+        return desi.inputs[self.iterations_parameter]
+
+    def open_project(self, FilePath=None):
+        self.counts['opens'] += 1
+        self.advance(self.startup_sec)
+
+    def save(self, Overwrite=False):
+        self.counts['saves'] += 1
+        self.advance(self.save_sec)
+
+    def namespace(self):
+        '''Returns the globals for running a Workbench script.'''
+        return {
+            '__name__': '__main__',
+            'Parameters': self.parameters,
+            'UpdateAllDesignPoints': self.update_all,
+            'GetMessages': lambda: list(self.messages),
+            'Save': self.save,
+            'Open': self.open_project,
+            'SetScriptVersion': lambda Version=None: None,
+            'GetProjectDirectory': lambda: self.directory,
+            'GetDesignPointUpdateSettings': _Settings,
+            'GetSystem': lambda Name=None: _System(self),
+            'Project': _Project(self),
+            'DateTime': DateTimeClass(self),
+            'open': self.open_text,
+        }
+
+    def open_text(self, path, mode='r', *args, **kwargs):
+        '''open() for the scripts, writing text with self.newline endings
+        (Workbench's IronPython writes CRLF text files).'''
+        if self.newline is not None and 'b' not in mode and mode[:1] in 'wa' and not args:
+            kwargs.setdefault('newline', self.newline)
+        return open(path, mode, *args, **kwargs)
+
+    def run_script(self, script_text):
+        '''Runs a Workbench script, returns a report dict with the simulated
+        and the real seconds, the counts of updates, solves, failures,
+        saves and opens, and the error (or None).'''
+        if os.sep != '\\':
+            # The scripts build Windows paths from GetProjectDirectory()
+            script_text = script_text.replace('\\\\', '/')
+        namespace = self.namespace()
+        system = types.ModuleType('System')
+        system.DateTime = namespace['DateTime']
+        saved_system = sys.modules.get('System')
+        sys.modules['System'] = system
+        sys.path.insert(0, RESOURCES_PATH)
+        counts = dict(self.counts)
+        clock = self.clock
+        error = None
+        start = time.time()
+        try:
+            exec(compile(script_text, 'workbench script', 'exec'), namespace)
+        except Exception as e:
+            error = '%s: %s' % (type(e).__name__, e)
+        finally:
+            real_sec = time.time() - start
+            sys.path.remove(RESOURCES_PATH)
+            if saved_system is None:
+                del sys.modules['System']
+            else:
+                sys.modules['System'] = saved_system
+        report = dict((k, self.counts[k] - counts[k]) for k in counts)
+        report['simulated_sec'] = self.clock - clock
+        report['real_sec'] = real_sec
+        report['error'] = error
+        return report
+
+
+# --- Projects -----------------------------------------------------------
+
+def function_project(directory, function='ZDT1', n_inputs=3, n_design_points=10, seed=0, **options):
+    '''A project whose outputs are a FunctionSuite-like function of its
+    inputs (all geometry inputs), with n_design_points random design points
+    besides the base one.'''
+    func, n_outputs, lower, upper = FUNCTIONS[function]
+    rng = random.Random(seed)
+    parameters = [('P%d' % (k + 1), 'x%d' % (k + 1), 'Input', '', True) for k in range(n_inputs)]
+    parameters += [('P%d' % (n_inputs + k + 1), 'f%d' % (k + 1), 'Output', '', False) for k in range(n_outputs)]
+    input_names = [p[0] for p in parameters[:n_inputs]]
+    output_names = [p[0] for p in parameters[n_inputs:]]
+
+    def response(inputs):
+        return dict(zip(output_names, [float(v) for v in func([inputs[n] for n in input_names])]))
+
+    design_points = [dict((n, rng.uniform(lower, upper)) for n in input_names)
+                     for k in range(n_design_points + 1)]
+    workbench = MockWorkbench(directory, parameters, response, design_points, seed=seed, **options)
+    workbench.bounds = (lower, upper)
+    return workbench
+
+
+def operating_point_project(directory, function='rosenbrock', n_geometry=2, n_design_points=10,
+                            seed=0, **options):
+    '''A project like the ones the seek mode is used on: geometry inputs,
+    an operating point input (P1, a flow rate in l/min, near 2000), the
+    solver iterations (P2) and an output (P3) that crosses zero at an
+    operating point set by a FunctionSuite-like function of the geometry,
+    with about the slope seeking_update_script.py guesses.  Results
+    converge with the iterations amount as CFD does.'''
+    func, n_outputs, lower, upper = FUNCTIONS[function]
+    rng = random.Random(seed)
+    geometry_names = ['P%d' % (k + 4) for k in range(n_geometry)]
+    parameters = [('P1', 'flow rate', 'Input', 'l min^-1', False),
+                  ('P2', 'iterations', 'Input', '', False),
+                  ('P3', 'net head', 'Output', 'm', False)]
+    parameters += [(name, 'g%d' % (k + 1), 'Input', 'm', True) for k, name in enumerate(geometry_names)]
+    scale = max(abs(v) for v in func([upper]*n_geometry)) or 1.0
+
+    def response(inputs):
+        geometry = [inputs[n] for n in geometry_names]
+        target = 2000*(1.0 + 0.3*math.tanh(func(geometry)[0]/scale))
+        x = inputs['P1']
+        error = 0.02*math.exp(-inputs['P2']/40.0)*math.sin(x/100)
+        return {'P3': float(-0.0004*(x - target) + 5e-8*(x - target)**2 + error)}
+
+    design_points = []
+    for k in range(n_design_points + 1):
+        inputs = dict((n, rng.uniform(lower, upper)) for n in geometry_names)
+        inputs['P1'] = 2000.0
+        inputs['P2'] = 75.0
+        design_points.append(inputs)
+    workbench = MockWorkbench(directory, parameters, response, design_points,
+                              iterations_parameter='P2', seed=seed, **options)
+    workbench.bounds = (lower, upper)
+    workbench.seek_parameters = ('P1', 'P3', 'P2')
+    return workbench
+
+
+# --- Scripts ------------------------------------------------------------
+
+def _resource(name):
+    with open(os.path.join(RESOURCES_PATH, name), 'r') as f:
+        return f.read()
+
+
+def run_set_script(workbench, design_point_names, sim_type='seek', data_export='csv',
+                   seek_polynomial=(0.0, 0.0, 0.0), seek_lockstep=False,
+                   seek_iteration_ladder=(75, 150), seek_net_tolerance=0.0,
+                   seek_step_tolerance=0.0, seek_max_trials=5, script_server=False):
+    '''Returns the script WBinstance.run_set writes for a 'simple' or
+    'seek' run of the named design points, with the current resources.
+    data_export is 'csv', 'binary' or 'delta'.'''
+    names = [desi.Name for desi in workbench.design_points]
+    index = dict((name, k + 1) for k, name in enumerate(names))  # MATLAB indices
+    lines = ['# encoding: utf-8\n', '# Release 17.1\n',
+             '# RUN SET (%s) - script autogenerated in Matlab.\n' % sim_type,
+             'SetScriptVersion(Version="17.1.127")\n', '\n',
+             _resource('messages_export_pre_script.py')]
+    if not script_server:
+        lines.append('Open(FilePath="%s")\n' % workbench.namespace()['Project'].GetProjectFile().replace('\\', '/'))
+
+    if sim_type == 'simple':
+        lines.append('designPointUpdateSettings1 = GetDesignPointUpdateSettings()\n')
+        lines.append('designPointUpdateSettings1.UpdateOrder = "UpdateDesignPointsInOrder"\n')
+        lines.append('designPointUpdateSettings1.PartialUpdate = "None"\n')
+        lines.append('designPoint1 = Parameters.GetDesignPoint(Name="%s")\n' % names[0])
+        lines.append('try:\n\tParameters.SetBaseDesignPoint(DesignPoint=designPoint1)\nexcept:\n\tpass\n')
+        for name in design_point_names:
+            lines.append('designPoint%d = Parameters.GetDesignPoint(Name="%s")\n' % (index[name], name))
+        lines.append('backgroundSession1 = UpdateAllDesignPoints(DesignPoints=[%s])\n'
+                     % ''.join('designPoint%d, ' % index[name] for name in design_point_names))
+    elif sim_type == 'seek':
+        input_name, output_name, iterations_name = workbench.seek_parameters
+        lines.append("resourcesPath = '%s'\n" % RESOURCES_PATH.replace('\\', '/'))
+        lines.append('import sys, os\n')
+        lines.append('if os.path.abspath(resourcesPath) not in sys.path:\n')
+        lines.append('\tsys.path.append(os.path.abspath(resourcesPath))\n')
+        lines.append('import LinAlg as la\n')
+        for name in design_point_names:
+            lines.append('designPoint%d = Parameters.GetDesignPoint(Name="%s")\n' % (index[name], name))
+        lines.append('designPoints = [%s]\n' % ''.join('designPoint%d,' % index[name] for name in design_point_names))
+        lines.append('seekPolynomial = [%s]\n' % ''.join('%.8f,' % c for c in seek_polynomial))
+        lines.append('inputParameter = Parameters.GetParameter(Name="%s")\n' % input_name)
+        lines.append('outputParameter = Parameters.GetParameter(Name="%s")\n' % output_name)
+        lines.append('iterationsParameter = Parameters.GetParameter(Name="%s")\n' % iterations_name)
+        lines.append('seekLockstep = %s\n' % bool(seek_lockstep))
+        lines.append('seekIterationLadder = [%s]\n' % ''.join('%d,' % n for n in seek_iteration_ladder))
+        lines.append('seekNetTolerance = %.8g\n' % seek_net_tolerance)
+        lines.append('seekStepTolerance = %.8g\n' % seek_step_tolerance)
+        lines.append('seekMaxTrials = %d\n' % seek_max_trials)
+        lines.append('geometryParameters = [%s]\n' % ''.join(
+            'Parameters.GetParameter(Name="%s"),' % p.Name for p in workbench.parameter_list if p.geometry))
+        lines.append('seekStart = {}\n')
+        lines.append(_resource('seeking_update_script.py'))
+    else:
+        raise ValueError('unsupported run type: %r' % sim_type)
+
+    lines.append(_resource('message_cache_script.py'))
+    lines.append(_resource('validity_parsing_script.py'))
+    if data_export == 'delta':
+        lines.append('exportSequence = 1\n')
+        lines.append('knownDesignPointCount = %d\n' % len(names))
+        lines.append('touchedDesignPointNames = [%s]\n' % ''.join('"%s",' % n for n in design_point_names))
+        lines.append(_resource('delta_export_script.py'))
+    elif data_export == 'binary':
+        lines.append(_resource('binary_export_script.py'))
+    else:
+        lines.append(_resource('data_export_script.py'))
+    lines.append(_resource('messages_export_post_script.py'))
+    lines.append(_resource('check_and_save_script.py'))
+    return ''.join(lines)
+
+
+def read_script_archive(path):
+    '''Returns the scripts in a workbenchScriptArchive.wbjn file (or the
+    single script in a .wbjn file), oldest first.'''
+    with open(path, 'r') as f:
+        text = f.read()
+    parts = re.split(r'\n############# [^\n]* #############\n\n', text)
+    return [part for part in parts if part.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run Workbench scripts on a local stand-in')
+    parser.add_argument('--script', help='Workbench script or script archive to run (default: build one)')
+    parser.add_argument('--entry', type=int, default=-1, help='script of the archive to run (default: last)')
+    parser.add_argument('--mode', choices=('simple', 'seek'), default='seek', help='run type of the built script')
+    parser.add_argument('--export', choices=('csv', 'binary', 'delta'), default='csv')
+    parser.add_argument('--lockstep', action='store_true')
+    parser.add_argument('--script-server', action='store_true', help='build the script without Open()')
+    parser.add_argument('--project', choices=('operating-point', 'function'), default=None,
+                        help='default: operating-point for seek runs, function otherwise')
+    parser.add_argument('--function', choices=sorted(FUNCTIONS), default=None)
+    parser.add_argument('--inputs', type=int, default=3, help='function inputs (or geometry inputs)')
+    parser.add_argument('--dps', type=int, default=10, help='design points to run')
+    parser.add_argument('--runs', type=int, default=1, help='times to run the script')
+    parser.add_argument('--startup', type=float, default=60.0, help='Workbench start and project load, s')
+    parser.add_argument('--overhead', type=float, default=20.0, help='design point solve overhead, s')
+    parser.add_argument('--per-iteration', type=float, default=0.5, help='solve time per iteration, s')
+    parser.add_argument('--iterations', type=int, default=100, help='iterations when not a parameter')
+    parser.add_argument('--geometry', type=float, default=30.0, help='geometry update, s')
+    parser.add_argument('--save', type=float, default=5.0, help='project save, s')
+    parser.add_argument('--slots', type=int, default=1, help='parallel design point updates')
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--crlf', action='store_true', help='write text exports with Windows line endings')
+    parser.add_argument('--history-fail', action='store_true',
+                        help='make seek history writes fail (a header for other geometry parameters)')
+    parser.add_argument('--dir', default=None, help='project directory for the exports (default: temporary)')
+    args = parser.parse_args(argv)
+
+    project = args.project
+    if project is None:
+        project = 'operating-point' if args.mode == 'seek' and args.script is None else 'function'
+    directory = args.dir
+    if directory is None:
+        import tempfile
+        directory = tempfile.mkdtemp(prefix='workbench_mock_')
+    elif not os.path.isdir(directory):
+        os.makedirs(directory)
+    options = dict(startup_sec=args.startup, solve_overhead_sec=args.overhead,
+                   per_iteration_sec=args.per_iteration, default_iterations=args.iterations,
+                   geometry_sec=args.geometry, save_sec=args.save, slots=args.slots,
+                   failure_rate=args.failure_rate, newline='\r\n' if args.crlf else None)
+    if project == 'operating-point':
+        workbench = operating_point_project(directory, args.function or 'rosenbrock', args.inputs,
+                                            args.dps, args.seed, **options)
+    else:
+        workbench = function_project(directory, args.function or 'ZDT1', args.inputs,
+                                     args.dps, args.seed, **options)
+
+    if args.history_fail:
+        with open(os.path.join(directory, 'seekHistory.csv'), 'w') as f:
+            f.write('# Seek history written by seeking_update_script.py\nDP Name,other,input,slope\n')
+
+    names = [desi.Name for desi in workbench.design_points[1:]]
+    if args.script is not None:
+        script = read_script_archive(args.script)[args.entry]
+    elif args.mode == 'seek' and project != 'operating-point':
+        parser.error('seek runs need the operating-point project')
+    else:
+        script = run_set_script(workbench, names, args.mode, args.export, seek_lockstep=args.lockstep,
+                                script_server=args.script_server)
+
+    rng = random.Random(args.seed + 1)
+    for run in range(args.runs):
+        if args.script is None and args.mode == 'simple':
+            # New inputs, as a geometry run before the simple run would set
+            for desi in workbench.design_points[1:]:
+                for para in workbench.parameter_list:
+                    if para.geometry:
+                        desi.SetParameterExpression(para, repr(rng.uniform(*workbench.bounds)))
+        report = workbench.run_script(script)
+        report['run'] = run + 1
+        debug_path = os.path.join(directory, 'operatingPointDebug.txt')
+        if os.path.exists(debug_path):
+            # Seek outcomes as the debug log parser reads them
+            from seek_replay import read_seek_histories
+            histories = read_seek_histories(debug_path)
+            report['seeks'] = len(histories)
+            report['seeks_succeeded'] = sum(1 for h in histories if h['succeeded'])
+        print(json.dumps(report, sort_keys=True))
+    print('exports in ' + directory)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())